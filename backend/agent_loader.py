@@ -0,0 +1,150 @@
+# backend/agent_loader.py
+# Lifecycle of the shared MainCoreAgent. Building it loads the embedding model, the knowledge base
+# and the GGUF model, which takes tens of seconds, so it happens in a background thread after
+# startup instead of at import time. Non-AI routes are served meanwhile; AI routes get a 503.
+# With INFERENCE_SIDECAR_SOCKET set, the agent lives in the inference sidecar process instead and
+# the loader only waits for the sidecar to report ready, then hands out a RemoteAgent.
+import asyncio
+import logging
+import os
+import time
+
+from fastapi import HTTPException
+
+from ai_core.agent import MainCoreAgent
+from ai_core.inference_client import INFERENCE_SIDECAR_SOCKET, InferenceSidecarError, RemoteAgent
+
+loader_logger = logging.getLogger(__name__)
+
+# --- Configuration ---
+# With warm-up disabled the agent is still built lazily, on the first AI request.
+AGENT_WARMUP_ON_STARTUP = os.getenv("AGENT_WARMUP_ON_STARTUP", "true").lower() == "true"
+AGENT_LOADING_RETRY_AFTER_SECONDS = int(os.getenv("AGENT_LOADING_RETRY_AFTER_SECONDS", 15))
+SIDECAR_POLL_INTERVAL_SECONDS = 1.0
+
+AGENT_LOAD_STAGES = ["embedding_model", "knowledge_base", "llm"]
+
+
+class AgentLoader:
+    """
+    Builds the MainCoreAgent in the background and reports its loading progress.
+    With `sidecar_socket` set, it waits for the inference sidecar at that path instead.
+    """
+
+    def __init__(self, sidecar_socket: str | None):
+        self.sidecar_socket = sidecar_socket
+        self.agent: MainCoreAgent | RemoteAgent | None = None
+        self.state = "not_started"  # not_started -> loading -> ready | failed
+        self.stage: str | None = None
+        self.error: str | None = None
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+        self._task: asyncio.Task | None = None
+        self._done = asyncio.Event()
+
+    @property
+    def is_ready(self) -> bool:
+        return self.state == "ready"
+
+    def start(self):
+        """Starts loading the agent in the background. Calling it again is a no-op."""
+        if self._task is not None:
+            return
+        self.state = "loading"
+        self._started_at = time.monotonic()
+        self._task = asyncio.create_task(self._load())
+        loader_logger.info("Warming up the AI agent in the background...")
+
+    async def _load(self):
+        try:
+            if self.sidecar_socket:
+                self.agent = await self._wait_for_sidecar()
+            else:
+                self.agent = await asyncio.to_thread(self._build_agent)
+            self.state = "ready"
+            loader_logger.info("AI agent ready after %.1fs.", time.monotonic() - self._started_at)
+        except Exception as e:
+            self.state = "failed"
+            self.error = str(e)
+            loader_logger.critical("AI agent failed to load: %s", e, exc_info=True)
+        finally:
+            self._finished_at = time.monotonic()
+            self._done.set()
+
+    def _build_agent(self) -> MainCoreAgent:
+        agent = MainCoreAgent(on_progress=self._set_stage)
+        agent.warm_up()
+        return agent
+
+    async def _wait_for_sidecar(self) -> RemoteAgent:
+        remote_agent = RemoteAgent(self.sidecar_socket)
+        while True:
+            try:
+                sidecar_status = await remote_agent.status()
+            except InferenceSidecarError:
+                self.stage = "connecting"  # Sidecar not started yet
+            else:
+                self.stage = sidecar_status["stage"]
+                if sidecar_status["state"] == "ready":
+                    return remote_agent
+                if sidecar_status["state"] == "failed":
+                    raise RuntimeError(f"Inference sidecar failed to load the agent: {sidecar_status['error']}")
+            await asyncio.sleep(SIDECAR_POLL_INTERVAL_SECONDS)
+
+    def _set_stage(self, stage: str):
+        # Called from the loading thread; a plain attribute write is enough for progress reporting.
+        self.stage = stage
+
+    async def wait_until_ready(self, start: bool = True) -> MainCoreAgent | RemoteAgent | None:
+        """
+        Waits for loading to finish. Returns the agent, or None if loading failed.
+        With `start=False` it only waits for a load something else starts (startup warm-up or the first AI request).
+        """
+        if start:
+            self.start()
+        await self._done.wait()
+        return self.agent
+
+    def status(self) -> dict:
+        if self.is_ready:
+            completed = list(AGENT_LOAD_STAGES)
+        elif self.stage in AGENT_LOAD_STAGES:
+            completed = AGENT_LOAD_STAGES[:AGENT_LOAD_STAGES.index(self.stage)]
+        else:
+            completed = []
+
+        if self._started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished_at or time.monotonic()) - self._started_at
+        return {
+            "ready": self.is_ready,
+            "state": self.state,
+            "stage": self.stage,
+            "completed_stages": completed,
+            "progress": len(completed) / len(AGENT_LOAD_STAGES),
+            "elapsed_seconds": round(elapsed, 1),
+            "sidecar": self.sidecar_socket or None,
+            "error": self.error,
+        }
+
+
+# --- Global loader instance ---
+agent_loader = AgentLoader(sidecar_socket=INFERENCE_SIDECAR_SOCKET or None)
+
+
+async def get_ready_agent() -> MainCoreAgent | RemoteAgent:
+    """
+    Dependency for AI routes. Returns the loaded agent, or raises 503 (with Retry-After)
+    while it is still loading. The first call starts loading if startup warm-up is disabled.
+    """
+    if agent_loader.is_ready:
+        return agent_loader.agent
+    agent_loader.start()
+    if agent_loader.state == "failed":
+        raise HTTPException(status_code=503, detail="The question generator is unavailable.")
+    raise HTTPException(
+        status_code=503,
+        detail="The question generator is still starting up. Please try again shortly.",
+        headers={"Retry-After": str(AGENT_LOADING_RETRY_AFTER_SECONDS)}
+    )
@@ -11,8 +11,6 @@ import sys
 from pathlib import Path
 import json
 import numpy as np
-import faiss
-from sentence_transformers import SentenceTransformer
 import re
 import os
 import logging
@@ -74,7 +72,17 @@ import logging
 # --- Import LLM Service cục bộ ---
 # Giả định llm_service.py nằm cùng thư mục với notebook
 try:
-    from llm_service import query_gemma_gguf, N_CTX
+    try:
+        from llm_service import (
+            query_gemma_gguf, stream_gemma_gguf, register_prompt_prefix, N_CTX,
+            get_context_window, count_tokens, count_static_tokens, truncate_to_tokens
+        )
+    except ImportError:
+        # Khi agent được import như một module của backend (ví dụ: từ routers/mcqs.py)
+        from ai_core.llm_service import (
+            query_gemma_gguf, stream_gemma_gguf, register_prompt_prefix, N_CTX,
+            get_context_window, count_tokens, count_static_tokens, truncate_to_tokens
+        )
     print("Đã import thành công query_gemma_gguf và N_CTX từ llm_service.py")
     print(f"Giá trị N_CTX: {N_CTX}")
 except ImportError as e:
@@ -83,9 +91,68 @@ except ImportError as e:
     # Cung cấp giá trị giả nếu import thất bại, để phần còn lại của notebook có thể được cấu trúc
     # Tuy nhiên, agent sẽ không hoạt động chính xác nếu không có llm_service thực tế.
     N_CTX = 2048 # Giá trị giả mặc định
-    def query_gemma_gguf(prompt: str, max_tokens: int, temperature: float, top_p=None, top_k=None, repeat_penalty=None, stop=None):
+    def query_gemma_gguf(prompt: str, max_tokens: int, temperature: float, top_p=None, top_k=None, repeat_penalty=None, stop=None, grammar=None):
         print("CẢNH BÁO: Đang sử dụng query_gemma_gguf GIẢ LẬP. Các lệnh gọi LLM sẽ không hoạt động như mong đợi.")
         return "Lỗi: LLM service chưa được import đúng cách."
+    def stream_gemma_gguf(prompt: str, max_tokens: int, temperature: float, top_p=None, top_k=None, repeat_penalty=None, stop=None, grammar=None):
+        yield query_gemma_gguf(prompt, max_tokens, temperature)
+    def register_prompt_prefix(prefix: str):
+        pass
+    def get_context_window() -> int:
+        return N_CTX
+    def count_tokens(text: str) -> int:
+        return len(text.split())
+    count_static_tokens = count_tokens
+    def truncate_to_tokens(text: str, max_tokens: int) -> str:
+        return " ".join(text.split()[:max(0, max_tokens)])
+
+# --- Executor suy luận (chạy LLM ngoài event loop của FastAPI) ---
+try:
+    from inference_executor import get_inference_executor
+except ImportError:
+    from ai_core.inference_executor import get_inference_executor
+
+# --- Cache ngữ nghĩa cho các bộ MCQ đã sinh ---
+try:
+    from semantic_cache import (
+        SemanticMCQCache, MCQ_CACHE_SIMILARITY_THRESHOLD, MCQ_CACHE_TTL_SECONDS, MCQ_CACHE_MAX_ENTRIES
+    )
+except ImportError:
+    from ai_core.semantic_cache import (
+        SemanticMCQCache, MCQ_CACHE_SIMILARITY_THRESHOLD, MCQ_CACHE_TTL_SECONDS, MCQ_CACHE_MAX_ENTRIES
+    )
+
+# --- Văn bản KB được ánh xạ bộ nhớ (memory-mapped) ---
+try:
+    from mapped_texts import MappedTexts
+except ImportError:
+    from ai_core.mapped_texts import MappedTexts
+
+# --- Chỉ mục FAISS được tuần tự hóa và ánh xạ bộ nhớ ---
+try:
+    import mapped_index
+except ImportError:
+    from ai_core import mapped_index
+
+# --- Ngân sách token đầu ra cho mỗi MCQ, học từ các lần sinh thật ---
+try:
+    from output_budget import (
+        OutputTokenBudget, MCQ_OUTPUT_TOKENS_PER_MCQ, MCQ_OUTPUT_BUDGET_PERCENTILE, MCQ_OUTPUT_BUDGET_HEADROOM,
+        MCQ_OUTPUT_BUDGET_MIN_SAMPLES, MCQ_OUTPUT_BUDGET_WINDOW
+    )
+except ImportError:
+    from ai_core.output_budget import (
+        OutputTokenBudget, MCQ_OUTPUT_TOKENS_PER_MCQ, MCQ_OUTPUT_BUDGET_PERCENTILE, MCQ_OUTPUT_BUDGET_HEADROOM,
+        MCQ_OUTPUT_BUDGET_MIN_SAMPLES, MCQ_OUTPUT_BUDGET_WINDOW
+    )
+
+# --- Tên logger cho payload (prompt/phản hồi thô), dùng chung với log_config.py của backend ---
+try:
+    from log_config import PAYLOAD_LOGGER_NAME
+except ImportError:
+    # Chạy trực tiếp từ ai_core/: log_config.py nằm ở thư mục backend bên trên
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    from log_config import PAYLOAD_LOGGER_NAME
 
 # %% [markdown]
 # ## 3. Cấu hình và Đường dẫn
@@ -100,6 +167,11 @@ NOTEBOOK_DIR = Path.cwd()
 KB_DIR = NOTEBOOK_DIR / "data"
 KB_JSON_PATH = KB_DIR / "grammar_chunks.json"
 KB_EMBEDDINGS_NPY_PATH = KB_DIR / "grammar_embeddings.npy"
+# Bản ánh xạ bộ nhớ của các đoạn văn bản trong KB_JSON_PATH, được dựng lại khi tệp JSON thay đổi
+KB_TEXTS_BLOB_PATH = KB_DIR / "grammar_chunks.texts.bin"
+KB_TEXT_OFFSETS_NPY_PATH = KB_DIR / "grammar_chunks.offsets.npy"
+# Chỉ mục FAISS dựng từ KB_EMBEDDINGS_NPY_PATH, được dựng lại khi tệp embeddings mới hơn
+KB_FAISS_INDEX_PATH = KB_DIR / "grammar_embeddings.faiss"
 
 print(f"Thư mục notebook: {NOTEBOOK_DIR}")
 print(f"Thư mục Cơ sở tri thức (KB): {KB_DIR}")
@@ -169,63 +241,277 @@ KEYWORD_TO_TOPIC_MAP = {
     "prepositions": "prepositions of time, place, and movement",
 }
 
+# %%
+# --- Phần mở đầu cố định của các prompt MCQ ---
+# Hai template prompt bắt đầu bằng cùng một khối hướng dẫn dài; chỉ phần chủ đề và CONTEXT thay đổi.
+# Phần mở đầu này được đăng ký với llm_service để trạng thái KV của nó được lưu lại và tái sử dụng,
+# nên mỗi yêu cầu chỉ cần prefill phần chủ đề và ngữ cảnh truy xuất được.
+MCQ_JSON_OUTPUT_FORMAT_STRUCTURE = """\
+[
+    {
+        "question": "The question text itself. Can be multi-line.",
+        "option_a": "Text for option A",
+        "option_b": "Text for option B",
+        "option_c": "Text for option C",
+        "option_d": "Text for option D",
+        "correct_answer_letter": "A"
+    }
+]"""
+
+MCQ_RAG_PROMPT_PREFIX = (
+    "<start_of_turn>user\n"
+    "You are an AI assistant that generates Multiple Choice Questions (MCQs). Your ONLY task is to create MCQs.\n"
+    "Use the provided CONTEXT as your primary source of information. If the context is insufficient, use general knowledge about the topic.\n"
+    "Your response MUST be a valid JSON array containing EXACTLY the number of MCQ objects requested below. Each object must conform to the structure shown in the example. The 'correct_answer_letter' field must be one of 'A', 'B', 'C', or 'D'.\n\n"
+
+    "VERY IMPORTANT JSON FORMATTING RULES - FOLLOW EXACTLY:\n"
+    "1. The entire response MUST be a single, valid JSON array, starting with '[' and ending with ']'.\n"
+    "2. Do NOT use any code block delimiters (like ```json or ```) around or inside the JSON array.\n"
+    "3. All keys (e.g., \"question\", \"option_a\") and all string values (e.g., the question text, option texts) MUST be enclosed in double quotes (\").\n"
+    "4. Do NOT use single quotes (') for JSON keys or string values.\n"
+    "5. Use standard JSON escaping (e.g., \\\" for a double quote within a string, \\\\n for a newline) ONLY when necessary. Do not add unnecessary or incorrect escape characters.\n"
+    "6. Ensure there are no trailing commas after the last element in an array or the last property in an object.\n"
+    "7. Output ONLY the JSON array. No introductory text, no explanations, no apologies, no summaries. Just the JSON.\n\n"
+
+    f"JSON Structure for each MCQ object (the response will be an array of these objects):\n{MCQ_JSON_OUTPUT_FORMAT_STRUCTURE}\n\n"
+)
+
+MCQ_BASIC_PROMPT_PREFIX = (
+    "<start_of_turn>user\n"
+    "You are an AI assistant that generates Multiple Choice Questions (MCQs). Your ONLY task is to create MCQs.\n"
+    "Generate the number of MCQs requested below for the given topic using your general knowledge of English grammar.\n"
+    "Your response MUST ONLY contain the MCQs in the specified format. No other text, preamble, or explanation.\n\n"
+
+    "OUTPUT REQUIREMENTS (VERY IMPORTANT - FOLLOW EXACTLY):\n"
+    "1. You MUST generate EXACTLY the number of MCQs requested below.\n"
+    "2. Start your response IMMEDIATELY with 'Question 1:'. DO NOT add any text before 'Question 1:'.\n"
+    "3. Each MCQ must strictly follow this format (X is the question number):\n"
+    "   Question X: [The question text itself, can be multi-line]\n"
+    "   A) [Option A text]\n"
+    "   B) [Option B text]\n"
+    "   C) [Option C text]\n"
+    "   D) [Option D text]\n"
+    "   Correct Answer: [A, B, C, or D]\n"
+    "   (A single blank line MUST follow the 'Correct Answer:' line, before the next 'Question X+1:' or the end of your response if it's the last question).\n\n"
+
+    "Example of ONE correctly formatted MCQ block (your response should contain the requested number of such blocks):\n"
+    "Question 1: What is the past simple form of 'go'?\n"
+    "A) Going\n"
+    "B) Went\n"
+    "C) Gone\n"
+    "D) Goes\n"
+    "Correct Answer: B\n"
+    "\n"
+)
+
+MCQ_REQUIRED_KEYS = ["question", "option_a", "option_b", "option_c", "option_d", "correct_answer_letter"]
+
+# --- Phần cố định bao quanh ngữ cảnh RAG và ngân sách token ---
+MCQ_RAG_CONTEXT_OPEN = (
+    "CONTEXT TO USE FOR MCQ GENERATION:\n"
+    "-------------------------------------\n"
+)
+MCQ_RAG_PROMPT_SUFFIX = (
+    "\n-------------------------------------\n\n"
+    "<end_of_turn>\n"
+    "<start_of_turn>model\n"
+)
+MCQ_CONTEXT_SEPARATOR = "\n\n--- Retrieved Context Snippet ---\n\n"
+
+# Số token của prompt được đếm bằng tokenizer GGUF thật; phần dự phòng nhỏ này chỉ bù cho token BOS
+# và việc BPE gộp token ở ranh giới giữa các đoạn được đếm riêng.
+MCQ_PROMPT_SAFETY_TOKENS = 32
+# Ngân sách đầu ra cho mỗi MCQ (khi xếp ngữ cảnh RAG) đến từ OutputTokenBudget trong output_budget.py:
+# MCQ_OUTPUT_TOKENS_PER_MCQ cho đến khi đo đủ số lần sinh thật, sau đó là phân vị cao của số token thực tế.
+MCQ_BASIC_TOKENS_PER_MCQ = 200
+MCQ_MAX_NEW_TOKENS = 4096
+
+# --- Ngữ pháp GBNF cho đầu ra JSON ---
+# Ràng buộc việc lấy mẫu của llama.cpp để mô hình chỉ có thể sinh ra một mảng JSON gồm ĐÚNG N đối tượng
+# có các khóa trong MCQ_REQUIRED_KEYS, theo đúng thứ tự, và "correct_answer_letter" là một chữ cái A-D.
+MCQ_GBNF_COMMON_RULES = r'''
+string ::= "\"" char+ "\""
+char ::= [^"\\\x7F\x00-\x1F] | "\\" (["\\/bfnrt] | "u" hex hex hex hex)
+hex ::= [0-9a-fA-F]
+ws ::= [ \t\n]*
+'''
+
+def build_mcq_array_grammar(num_questions: int) -> str:
+    """Trả về ngữ pháp GBNF cho một mảng JSON gồm đúng `num_questions` đối tượng MCQ."""
+    text_fields = [
+        f'"\\"{key}\\"" ws ":" ws string' for key in MCQ_REQUIRED_KEYS if key != "correct_answer_letter"
+    ]
+    answer_field = '"\\"correct_answer_letter\\"" ws ":" ws "\\"" [A-D] "\\""'
+    mcq_rule = 'mcq ::= "{" ws ' + ' "," ws '.join(text_fields + [answer_field]) + ' ws "}"'
+    root_rule = 'root ::= ws "[" ws mcq' + ' ws "," ws mcq' * (num_questions - 1) + ' ws "]" ws'
+    return root_rule + "\n" + mcq_rule + MCQ_GBNF_COMMON_RULES
+
 # %% [markdown]
-# ## 4. Định nghĩa lớp MainCoreAgent
+# ## 4. Bộ phân tích JSON tăng dần cho phản hồi streaming
+# Theo dõi độ sâu ngoặc và trạng thái chuỗi của mảng JSON đang được sinh ra, và trả về từng
+# đối tượng MCQ ngay khi dấu '}' đóng của nó xuất hiện.
+
+# %%
+class IncrementalMCQParser:
+    def __init__(self):
+        self.logger = logging.getLogger(__name__ + ".IncrementalMCQParser")
+        self._array_started = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._object_chars: list[str] = []
+
+    def feed(self, text: str) -> list:
+        """Nhận thêm một đoạn văn bản từ LLM; trả về danh sách các MCQ hoàn chỉnh mới."""
+        completed = []
+        for ch in text:
+            if not self._array_started:
+                self._array_started = ch == "["
+                continue
+
+            if self._depth > 0:
+                self._object_chars.append(ch)
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"' and self._depth > 0:
+                self._in_string = True
+            elif ch == "{":
+                if self._depth == 0:
+                    self._object_chars = [ch]
+                self._depth += 1
+            elif ch == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    mcq = self._parse_object("".join(self._object_chars))
+                    if mcq is not None:
+                        completed.append(mcq)
+                    self._object_chars = []
+        return completed
+
+    def _parse_object(self, object_text: str) -> dict | None:
+        try:
+            item = json.loads(object_text)
+        except json.JSONDecodeError as e:
+            self.logger.warning("AI Agent (Stream): Bỏ qua đối tượng JSON không hợp lệ: %s. Đoạn: %s", e, object_text[:100])
+            return None
+        if isinstance(item, dict) and all(k in item for k in MCQ_REQUIRED_KEYS):
+            return item
+        self.logger.warning("AI Agent (Stream): Mục JSON không tuân theo cấu trúc MCQ: %s", object_text[:100])
+        return None
+
+# %% [markdown]
+# ## 5. Định nghĩa lớp MainCoreAgent
 
 # %%
 class MainCoreAgent:
-    def __init__(self): # Sửa 'init' thành '__init__'
+    def __init__(self, on_progress=None): # Sửa 'init' thành '__init__'
+        """
+        `on_progress`, nếu có, được gọi với tên của từng bước khởi tạo trước khi bước đó bắt đầu
+        ("embedding_model", "knowledge_base"), để lớp gọi có thể báo cáo tiến độ nạp.
+        """
+        self._on_progress = on_progress or (lambda stage: None)
         self.embedding_model_name = 'all-mpnet-base-v2'
         self.query_embedding_model = None
         self.kb_texts = []
         self.kb_index = None
+        self.mcq_cache = SemanticMCQCache(
+            similarity_threshold=MCQ_CACHE_SIMILARITY_THRESHOLD,
+            ttl_seconds=MCQ_CACHE_TTL_SECONDS,
+            max_entries=MCQ_CACHE_MAX_ENTRIES,
+        )
+        # Số token đầu ra thực tế cho mỗi MCQ, đo từ các lần sinh RAG hoàn chỉnh
+        self.output_budget = OutputTokenBudget(
+            default_per_mcq=MCQ_OUTPUT_TOKENS_PER_MCQ,
+            percentile=MCQ_OUTPUT_BUDGET_PERCENTILE,
+            headroom=MCQ_OUTPUT_BUDGET_HEADROOM,
+            min_samples=MCQ_OUTPUT_BUDGET_MIN_SAMPLES,
+            window=MCQ_OUTPUT_BUDGET_WINDOW,
+        )
 
         # Lấy một logger cụ thể cho lớp này
         self.logger = logging.getLogger(__name__ + ".MainCoreAgent")
+        # Prompt và phản hồi thô của LLM; tắt trừ khi LOG_PAYLOADS=true (xem log_config.py)
+        self.payload_logger = logging.getLogger(PAYLOAD_LOGGER_NAME)
 
-        self.logger.info(f"AI Agent: Đang khởi tạo MainCoreAgent...")
+        self.logger.info("AI Agent: Đang khởi tạo MainCoreAgent...")
+        self._on_progress("embedding_model")
         try:
-            self.logger.info(f"AI Agent: Đang tải mô hình SentenceTransformer '{self.embedding_model_name}' để mã hóa truy vấn người dùng...")
+            # Import tại đây: sentence_transformers kéo theo torch, nên import nó ở cấp module
+            # làm chậm mọi lần import agent (kể cả khi chỉ cần KEYWORD_TO_TOPIC_MAP).
+            from sentence_transformers import SentenceTransformer
+            self.logger.info("AI Agent: Đang tải mô hình SentenceTransformer '%s' để mã hóa truy vấn người dùng...", self.embedding_model_name)
             self.query_embedding_model = SentenceTransformer(self.embedding_model_name)
             self.logger.info("AI Agent: Đã tải thành công mô hình SentenceTransformer cho truy vấn.")
         except Exception as e:
-            self.logger.critical(f"AI Agent: LỖI NGHIÊM TRỌNG - Không thể tải mô hình SentenceTransformer cho truy vấn: {e}. RAG sẽ không khả dụng.")
+            self.logger.critical("AI Agent: LỖI NGHIÊM TRỌNG - Không thể tải mô hình SentenceTransformer cho truy vấn: %s. RAG sẽ không khả dụng.", e)
 
+        self._on_progress("knowledge_base")
         self._load_kb_from_precomputed()
+
+        # Đăng ký phần mở đầu cố định của prompt để llm_service lưu và tái sử dụng trạng thái KV
+        register_prompt_prefix(MCQ_RAG_PROMPT_PREFIX)
+        register_prompt_prefix(MCQ_BASIC_PROMPT_PREFIX)
         self.logger.info("Hoàn tất khởi tạo MainCoreAgent.")
 
+    def warm_up(self):
+        """
+        Nạp trước mô hình GGUF bằng cách đếm token của các phần prompt cố định (kết quả được cache),
+        để yêu cầu sinh câu hỏi đầu tiên không phải chịu thời gian nạp mô hình.
+        """
+        self._on_progress("llm")
+        for fragment in (MCQ_RAG_PROMPT_PREFIX, MCQ_BASIC_PROMPT_PREFIX, MCQ_RAG_CONTEXT_OPEN, MCQ_RAG_PROMPT_SUFFIX,
+                         MCQ_JSON_OUTPUT_FORMAT_STRUCTURE, MCQ_CONTEXT_SEPARATOR):
+            count_static_tokens(fragment)
+        self.logger.info("AI Agent: Đã nạp trước mô hình LLM.")
+
     def _load_kb_from_precomputed(self):
         if not self.query_embedding_model:
             self.logger.warning("AI Agent: Mô hình embedding truy vấn chưa được tải. Bỏ qua việc tải Cơ sở tri thức (KB).")
             return
 
         if not KB_JSON_PATH.exists():
-            self.logger.critical(f"AI Agent: LỖI NGHIÊM TRỌNG - Không tìm thấy tệp JSON Cơ sở tri thức tại {KB_JSON_PATH}. RAG sẽ không khả dụng.")
+            self.logger.critical("AI Agent: LỖI NGHIÊM TRỌNG - Không tìm thấy tệp JSON Cơ sở tri thức tại %s. RAG sẽ không khả dụng.", KB_JSON_PATH)
             return
 
         if not KB_EMBEDDINGS_NPY_PATH.exists():
-            self.logger.critical(f"AI Agent: LỖI NGHIÊM TRỌNG - Không tìm thấy tệp NPY Embeddings Cơ sở tri thức tại {KB_EMBEDDINGS_NPY_PATH}. RAG sẽ không khả dụng.")
+            self.logger.critical("AI Agent: LỖI NGHIÊM TRỌNG - Không tìm thấy tệp NPY Embeddings Cơ sở tri thức tại %s. RAG sẽ không khả dụng.", KB_EMBEDDINGS_NPY_PATH)
             return
 
         try:
-            self.logger.info(f"AI Agent: Đang tải các đoạn văn bản cơ sở tri thức từ {KB_JSON_PATH}...")
-            with open(KB_JSON_PATH, "r", encoding="utf-8") as f:
-                chunks_data = json.load(f)
+            if MappedTexts.is_stale(KB_JSON_PATH, KB_TEXTS_BLOB_PATH, KB_TEXT_OFFSETS_NPY_PATH):
+                self.logger.info("AI Agent: Đang dựng tệp văn bản ánh xạ bộ nhớ từ %s...", KB_JSON_PATH)
+                with open(KB_JSON_PATH, "r", encoding="utf-8") as f:
+                    chunks_data = json.load(f)
+                texts = [chunk.get("content", "").strip() for chunk in chunks_data if chunk.get("content", "").strip()]
+                MappedTexts.build(texts, KB_TEXTS_BLOB_PATH, KB_TEXT_OFFSETS_NPY_PATH)
 
-            self.kb_texts = [chunk.get("content", "").strip() for chunk in chunks_data if chunk.get("content", "").strip()]
+            # Các đoạn văn bản được đọc theo nhu cầu từ tệp ánh xạ bộ nhớ thay vì giữ cả danh sách trong heap
+            self.kb_texts = MappedTexts(KB_TEXTS_BLOB_PATH, KB_TEXT_OFFSETS_NPY_PATH)
 
             if not self.kb_texts:
                 self.logger.warning("AI Agent: CẢNH BÁO - Không có đoạn văn bản nào được trích xuất từ JSON Cơ sở tri thức. RAG có thể không hiệu quả.")
                 return # Quan trọng: trả về nếu không có văn bản, để tránh lỗi với kb_embeddings rỗng
-            self.logger.info(f"AI Agent: Đã tải {len(self.kb_texts)} đoạn văn bản từ JSON.")
+            self.logger.info("AI Agent: Đã tải %s đoạn văn bản (ánh xạ bộ nhớ).", len(self.kb_texts))
+
+            if mapped_index.is_stale(KB_EMBEDDINGS_NPY_PATH, KB_FAISS_INDEX_PATH):
+                self.logger.info("AI Agent: Đang dựng chỉ mục FAISS từ %s...", KB_EMBEDDINGS_NPY_PATH)
+                mapped_index.build_flat_index(KB_EMBEDDINGS_NPY_PATH, KB_FAISS_INDEX_PATH)
 
-            self.logger.info(f"AI Agent: Đang tải các embedding đã tính toán trước từ {KB_EMBEDDINGS_NPY_PATH}...")
-            kb_embeddings = np.load(KB_EMBEDDINGS_NPY_PATH)
+            # Vector của chỉ mục phẳng được đọc trực tiếp từ tệp ánh xạ bộ nhớ, dùng chung giữa các tiến trình
+            kb_index, index_is_mapped = mapped_index.load_index(KB_FAISS_INDEX_PATH)
 
-            if len(self.kb_texts) != kb_embeddings.shape[0]:
+            if len(self.kb_texts) != kb_index.ntotal:
                 error_msg = (
                     f"AI Agent: LỖI NGHIÊM TRỌNG - Không khớp giữa số lượng đoạn văn bản ({len(self.kb_texts)}) "
-                    f"và embeddings ({kb_embeddings.shape[0]}) được tải từ tệp NPY. "
+                    f"và embeddings ({kb_index.ntotal}) trong chỉ mục dựng từ tệp NPY. "
                     "Đảm bảo các embedding NPY tương ứng chính xác với các đoạn JSON. KB sẽ không được tải."
                 )
                 self.logger.critical(error_msg)
@@ -233,27 +519,33 @@ class MainCoreAgent:
                 self.kb_index = None
                 return
 
-            if kb_embeddings.size == 0 : # Xử lý trường hợp tệp embeddings rỗng hoặc lỗi dẫn đến mảng rỗng
-                self.logger.critical(f"AI Agent: LỖI NGHIÊM TRỌNG - Mảng embeddings được tải từ {KB_EMBEDDINGS_NPY_PATH} bị rỗng. KB sẽ không được tải.")
-                self.kb_texts = []
-                self.kb_index = None
-                return
-
-            dimension = kb_embeddings.shape[1]
-            self.kb_index = faiss.IndexFlatL2(dimension)
-            self.kb_index.add(np.array(kb_embeddings, dtype=np.float32))
-            self.logger.info(f"AI Agent: Cơ sở tri thức đã được lập chỉ mục thành công với FAISS sử dụng {self.kb_index.ntotal} embedding đã tính toán trước có chiều {dimension}.")
+            self.kb_index = kb_index
+            self.logger.info(
+                "AI Agent: Đã tải chỉ mục FAISS với %d embedding có chiều %d (%s).",
+                kb_index.ntotal, kb_index.d, "ánh xạ bộ nhớ" if index_is_mapped else "bản sao trong bộ nhớ của tiến trình này"
+            )
 
         except json.JSONDecodeError as e:
-            self.logger.critical(f"AI Agent: LỖI NGHIÊM TRỌNG - Không thể giải mã JSON từ {KB_JSON_PATH}: {e}. KB sẽ không được tải.")
+            self.logger.critical("AI Agent: LỖI NGHIÊM TRỌNG - Không thể giải mã JSON từ %s: %s. KB sẽ không được tải.", KB_JSON_PATH, e)
             self.kb_texts = []
             self.kb_index = None
         except Exception as e:
-            self.logger.critical(f"AI Agent: LỖI NGHIÊM TRỌNG - Đã xảy ra lỗi không mong muốn khi tải/lập chỉ mục KB đã tính toán trước: {e}. KB sẽ không được tải.")
+            self.logger.critical("AI Agent: LỖI NGHIÊM TRỌNG - Đã xảy ra lỗi không mong muốn khi tải/lập chỉ mục KB đã tính toán trước: %s. KB sẽ không được tải.", e)
             self.kb_texts = []
             self.kb_index = None
 
-    def _retrieve_from_kb(self, query_text: str, top_k_retrieval: int = 3) -> str:
+    def _encode_query(self, query_text: str) -> np.ndarray | None:
+        """Mã hóa văn bản truy vấn một lần; embedding được dùng cho cả truy xuất KB lẫn cache ngữ nghĩa."""
+        if not self.query_embedding_model or not query_text.strip():
+            return None
+        try:
+            self.logger.debug("AI Agent (RAG): Đang mã hóa truy vấn: '%s...'", query_text[:70])
+            return np.array(self.query_embedding_model.encode([query_text]), dtype=np.float32)
+        except Exception as e:
+            self.logger.error("AI Agent (RAG): Lỗi khi mã hóa truy vấn: %s", e)
+            return None
+
+    def _retrieve_from_kb(self, query_text: str, top_k_retrieval: int = 3, query_embedding: np.ndarray | None = None) -> str:
         if not self.kb_index or not self.query_embedding_model or not self.kb_texts:
             self.logger.warning("AI Agent: Cơ sở tri thức (KB) hoặc mô hình embedding truy vấn không khả dụng để truy xuất. Trả về ngữ cảnh rỗng.")
             return ""
@@ -263,8 +555,10 @@ class MainCoreAgent:
             return ""
 
         try:
-            self.logger.info(f"AI Agent (RAG): Đang mã hóa truy vấn để truy xuất KB: '{query_text[:70]}...'")
-            query_embedding = self.query_embedding_model.encode([query_text])
+            if query_embedding is None:
+                query_embedding = self._encode_query(query_text)
+                if query_embedding is None:
+                    return ""
 
             distances, indices = self.kb_index.search(np.array(query_embedding, dtype=np.float32), top_k_retrieval)
 
@@ -275,15 +569,100 @@ class MainCoreAgent:
                         retrieved_docs_content.append(self.kb_texts[i])
 
             if not retrieved_docs_content:
-                self.logger.info("AI Agent (RAG): Không có tài liệu liên quan nào được truy xuất từ KB cho truy vấn.")
+                self.logger.debug("AI Agent (RAG): Không có tài liệu liên quan nào được truy xuất từ KB cho truy vấn.")
                 return ""
 
-            self.logger.info(f"AI Agent (RAG): Đã truy xuất {len(retrieved_docs_content)} tài liệu từ KB.")
-            return "\n\n--- Retrieved Context Snippet ---\n\n".join(retrieved_docs_content)
+            self.logger.debug("AI Agent (RAG): Đã truy xuất %s tài liệu từ KB.", len(retrieved_docs_content))
+            return MCQ_CONTEXT_SEPARATOR.join(retrieved_docs_content)
         except Exception as e:
-            self.logger.error(f"AI Agent (RAG): Lỗi trong quá trình truy xuất KB: {e}")
+            self.logger.error("AI Agent (RAG): Lỗi trong quá trình truy xuất KB: %s", e)
             return ""
 
+    def _pack_context(self, context_text: str, budget_tokens: int) -> str:
+        """
+        Xếp các đoạn ngữ cảnh truy xuất được vào đúng `budget_tokens` token: giữ nguyên các đoạn
+        vừa ngân sách theo thứ tự liên quan, và cắt đoạn đầu tiên không vừa tại ranh giới token.
+        """
+        if budget_tokens <= 0:
+            self.logger.warning("AI Agent (RAG): Không còn ngân sách token cho ngữ cảnh. Bỏ ngữ cảnh truy xuất.")
+            return ""
+
+        separator_tokens = count_static_tokens(MCQ_CONTEXT_SEPARATOR)
+        packed_chunks, used_tokens = [], 0
+        for chunk in context_text.split(MCQ_CONTEXT_SEPARATOR):
+            joint_tokens = separator_tokens if packed_chunks else 0
+            chunk_tokens = count_tokens(chunk)
+            if used_tokens + joint_tokens + chunk_tokens <= budget_tokens:
+                packed_chunks.append(chunk)
+                used_tokens += joint_tokens + chunk_tokens
+                continue
+
+            remaining_tokens = budget_tokens - used_tokens - joint_tokens
+            if remaining_tokens > 0:
+                packed_chunks.append(truncate_to_tokens(chunk, remaining_tokens))
+            self.logger.debug("AI Agent (RAG): Ngữ cảnh vượt ngân sách %s token; đã cắt bớt.", budget_tokens)
+            break
+        return MCQ_CONTEXT_SEPARATOR.join(packed_chunks)
+
+    def _build_rag_query(self, topic: str, num_questions: int, context_text: str) -> dict | None:
+        """
+        Dựng prompt RAG và các tham số sinh cho query_gemma_gguf. Trả về None nếu prompt quá dài so với cửa sổ ngữ cảnh.
+        Ngữ cảnh được xếp vừa đúng phần token còn lại sau phần prompt cố định và ngân sách đầu ra,
+        và max_tokens là toàn bộ phần cửa sổ còn lại sau prompt thực tế.
+        """
+        context_window = get_context_window()
+        topic_header = (
+            f"Generate EXACTLY {num_questions} MCQs for the topic: '{topic}'.\n"
+            f"Your response must be a JSON array of EXACTLY {num_questions} MCQ objects.\n"
+        )
+
+        try:
+            fixed_prompt_tokens = (
+                count_static_tokens(MCQ_RAG_PROMPT_PREFIX) +
+                count_tokens(topic_header) +
+                count_static_tokens(MCQ_RAG_CONTEXT_OPEN) +
+                count_static_tokens(MCQ_RAG_PROMPT_SUFFIX) +
+                MCQ_PROMPT_SAFETY_TOKENS
+            )
+            output_budget_tokens = num_questions * self.output_budget.per_mcq()
+            context_text = self._pack_context(context_text, context_window - fixed_prompt_tokens - output_budget_tokens)
+            prompt_tokens_rag = fixed_prompt_tokens + count_tokens(context_text)
+        except Exception as e:
+            self.logger.error("AI Agent (RAG): Không thể đếm token của prompt: %s", e)
+            return None
+
+        # Phần mở đầu cố định đi trước, để trạng thái KV đã lưu của nó được tái sử dụng
+        prompt = MCQ_RAG_PROMPT_PREFIX + topic_header + MCQ_RAG_CONTEXT_OPEN + context_text + MCQ_RAG_PROMPT_SUFFIX
+
+        rag_temperature = 0.5
+        rag_top_p = 0.7
+        rag_top_k = 30
+        rag_repeat_penalty = 1.5
+        # Ngữ pháp đảm bảo mảng kết thúc sau đúng num_questions đối tượng, nên không cần dừng ở "]"
+        # (dấu này có thể xuất hiện bên trong văn bản câu hỏi và cắt cụt mảng JSON).
+        rag_stop_sequences = ["<end_of_turn>", "User:"]
+
+        max_new_tokens_rag = min(context_window - prompt_tokens_rag, MCQ_MAX_NEW_TOKENS)
+
+        self.logger.debug("AI Agent (RAG): Số token prompt: %s, Ngân sách đầu ra: %s, Số token mới tối đa cho LLM: %s, Nhiệt độ: %s, Cửa sổ ngữ cảnh: %s", prompt_tokens_rag, output_budget_tokens, max_new_tokens_rag, rag_temperature, context_window)
+
+        if max_new_tokens_rag <= 0:
+            self.logger.error("AI Agent (RAG): max_new_tokens_rag được tính toán bằng không hoặc âm (%s). Độ dài prompt (%s) quá lớn so với cửa sổ ngữ cảnh (%s).", max_new_tokens_rag, prompt_tokens_rag, context_window)
+            return None
+
+        self.payload_logger.debug("LLM_AGENT (RAG): Toàn bộ prompt được gửi đến LLM Service:\n%s", prompt)
+        self.logger.debug("AI Agent: Đang truy vấn LLM ở chế độ RAG. Số token mới tối đa: %s, Temp: %s, Top_p: %s, Top_k: %s, Repeat Penalty: %s", max_new_tokens_rag, rag_temperature, rag_top_p, rag_top_k, rag_repeat_penalty)
+        return dict(
+            prompt=prompt,
+            max_tokens=max_new_tokens_rag,
+            temperature=rag_temperature,
+            top_p=rag_top_p,
+            top_k=rag_top_k,
+            repeat_penalty=rag_repeat_penalty,
+            stop=rag_stop_sequences,
+            grammar=build_mcq_array_grammar(num_questions)
+        )
+
     def _prompt_llm_for_mcq(self, topic: str, num_questions: int, context_text: str | None = None) -> str:
         global N_CTX # Sử dụng biến N_CTX toàn cục đã được import
         if 'N_CTX' not in globals():
@@ -291,128 +670,38 @@ class MainCoreAgent:
             N_CTX = 2048 # Giá trị dự phòng, nhưng không lý tưởng
 
         if context_text: # Chế độ RAG
-            json_output_format_structure = """\
-[
-    {
-        "question": "The question text itself. Can be multi-line.",
-        "option_a": "Text for option A",
-        "option_b": "Text for option B",
-        "option_c": "Text for option C",
-        "option_d": "Text for option D",
-        "correct_answer_letter": "A"
-    }
-]"""
-            prompt = (
-                "<start_of_turn>user\n"
-                f"You are an AI assistant that generates Multiple Choice Questions (MCQs). Your ONLY task is to create MCQs.\n"
-                f"Generate EXACTLY {num_questions} MCQs for the topic: '{topic}'.\n"
-                "Use the provided CONTEXT as your primary source of information. If the context is insufficient, use general knowledge about the topic.\n"
-                f"Your response MUST be a valid JSON array containing EXACTLY {num_questions} MCQ objects. Each object must conform to the structure shown in the example. The 'correct_answer_letter' field must be one of 'A', 'B', 'C', or 'D'.\n\n"
-                
-                "VERY IMPORTANT JSON FORMATTING RULES - FOLLOW EXACTLY:\n"
-                "1. The entire response MUST be a single, valid JSON array, starting with '[' and ending with ']'.\n"
-                "2. Do NOT use any code block delimiters (like ```json or ```) around or inside the JSON array.\n"
-                "3. All keys (e.g., \"question\", \"option_a\") and all string values (e.g., the question text, option texts) MUST be enclosed in double quotes (\").\n"
-                "4. Do NOT use single quotes (') for JSON keys or string values.\n"
-                "5. Use standard JSON escaping (e.g., \\\" for a double quote within a string, \\\\n for a newline) ONLY when necessary. Do not add unnecessary or incorrect escape characters.\n"
-                "6. Ensure there are no trailing commas after the last element in an array or the last property in an object.\n"
-                "7. Output ONLY the JSON array. No introductory text, no explanations, no apologies, no summaries. Just the JSON.\n\n"
-
-                f"JSON Structure for each MCQ object (the response will be an array of these objects):\n{json_output_format_structure}\n\n"
-                
-                f"Topic: '{topic}'\n"
-                "CONTEXT TO USE FOR MCQ GENERATION:\n"
-                "-------------------------------------\n"
-                f"{context_text}\n"
-                "-------------------------------------\n\n"
-                "<end_of_turn>\n"
-                "<start_of_turn>model\n"
-            )
-            
-            prompt_tokens_rag = len(prompt.split())
-            buffer_tokens_rag = 512 
-            available_for_generation_rag = N_CTX - prompt_tokens_rag - buffer_tokens_rag
-            
-            estimated_tokens_per_mcq_rag = 350 
-            rag_temperature = 0.5
-            rag_top_p = 0.7
-            rag_top_k = 30
-            rag_repeat_penalty = 1.5
-            rag_stop_sequences = ["]", "<end_of_turn>", "User:"]
-
-            calculated_max_tokens_rag = min(num_questions * estimated_tokens_per_mcq_rag, available_for_generation_rag)
-            max_new_tokens_rag = max(100, calculated_max_tokens_rag)
-            max_new_tokens_rag = min(max_new_tokens_rag, N_CTX - buffer_tokens_rag)
-            max_new_tokens_rag = min(max_new_tokens_rag, 4096)
-
-            self.logger.info(f"AI Agent (RAG): Số token prompt (ước tính): {prompt_tokens_rag}, Số token mới tối đa cho LLM: {max_new_tokens_rag}, Nhiệt độ: {rag_temperature}, N_CTX: {N_CTX}, Khả dụng để tạo (ước tính): {available_for_generation_rag}")
-
-            if max_new_tokens_rag <= 0:
-                self.logger.error(f"AI Agent (RAG): max_new_tokens_rag được tính toán bằng không hoặc âm ({max_new_tokens_rag}). Độ dài prompt ({prompt_tokens_rag}) có thể quá lớn so với N_CTX ({N_CTX}).")
+            rag_query = self._build_rag_query(topic, num_questions, context_text)
+            if rag_query is None:
                 return "Lỗi: Prompt quá dài hoặc N_CTX quá nhỏ cho việc tạo RAG."
-
-            self.logger.debug(f"LLM_AGENT (RAG): Toàn bộ prompt được gửi đến LLM Service:\n{prompt[:500]}...")
-            self.logger.info(f"AI Agent: Đang truy vấn LLM ở chế độ RAG. Số token mới tối đa: {max_new_tokens_rag}, Temp: {rag_temperature}, Top_p: {rag_top_p}, Top_k: {rag_top_k}, Repeat Penalty: {rag_repeat_penalty}")
-            raw_response = query_gemma_gguf(
-                prompt=prompt,
-                max_tokens=max_new_tokens_rag,
-                temperature=rag_temperature,
-                top_p=rag_top_p,
-                top_k=rag_top_k,
-                repeat_penalty=rag_repeat_penalty,
-                stop=rag_stop_sequences
-            )
+            raw_response = query_gemma_gguf(**rag_query)
 
         else: # Chế độ cơ bản (Không RAG)
             prompt = (
-                "<start_of_turn>user\n"
-                f"You are an AI assistant that generates Multiple Choice Questions (MCQs). Your ONLY task is to create MCQs.\n"
-                f"Generate EXACTLY {num_questions} MCQs for the topic: '{topic}' using your general knowledge of English grammar.\n"
-                "Your response MUST ONLY contain the MCQs in the specified format. No other text, preamble, or explanation.\n\n"
-
+                MCQ_BASIC_PROMPT_PREFIX +
                 f"Topic: '{topic}'\n"
                 f"Number of MCQs to generate: {num_questions}\n\n"
-
-                "OUTPUT REQUIREMENTS (VERY IMPORTANT - FOLLOW EXACTLY):\n"
-                f"1. You MUST generate EXACTLY {num_questions} MCQs.\n"
-                "2. Start your response IMMEDIATELY with 'Question 1:'. DO NOT add any text before 'Question 1:'.\n"
-                "3. Each MCQ must strictly follow this format (X is the question number):\n"
-                "   Question X: [The question text itself, can be multi-line]\n"
-                "   A) [Option A text]\n"
-                "   B) [Option B text]\n"
-                "   C) [Option C text]\n"
-                "   D) [Option D text]\n"
-                "   Correct Answer: [A, B, C, or D]\n"
-                "   (A single blank line MUST follow the 'Correct Answer:' line, before the next 'Question X+1:' or the end of your response if it's the last question).\n\n"
-
-                f"Example of ONE correctly formatted MCQ block (your response should contain {num_questions} such blocks):\n"
-                "Question 1: What is the past simple form of 'go'?\n"
-                "A) Going\n"
-                "B) Went\n"
-                "C) Gone\n"
-                "D) Goes\n"
-                "Correct Answer: B\n"
-                "\n"
-
                 f"Begin generating the {num_questions} MCQs now. Your entire response must start with 'Question 1:' and contain only the MCQs formatted as described.\n"
                 "<end_of_turn>\n"
                 "<start_of_turn>model\n"
             )
 
-            prompt_tokens = len(prompt.split())
-            buffer_tokens = 512
-            available_for_generation = N_CTX - prompt_tokens - buffer_tokens
-            estimated_tokens_per_mcq = 200
-
-            calculated_max_tokens = min(num_questions * estimated_tokens_per_mcq, available_for_generation)
-            max_new_tokens = max(100, calculated_max_tokens)
-            max_new_tokens = min(max_new_tokens, N_CTX - buffer_tokens)
-            max_new_tokens = min(max_new_tokens, 4096)
+            context_window = get_context_window()
+            try:
+                prompt_tokens = (
+                    count_static_tokens(MCQ_BASIC_PROMPT_PREFIX) +
+                    count_tokens(prompt[len(MCQ_BASIC_PROMPT_PREFIX):]) +
+                    MCQ_PROMPT_SAFETY_TOKENS
+                )
+            except Exception as e:
+                self.logger.error("AI Agent (Không RAG): Không thể đếm token của prompt: %s", e)
+                return "Lỗi: Không thể đếm token của prompt."
+            available_for_generation = context_window - prompt_tokens
+            max_new_tokens = min(num_questions * MCQ_BASIC_TOKENS_PER_MCQ, available_for_generation, MCQ_MAX_NEW_TOKENS)
 
-            self.logger.info(f"AI Agent (Không RAG): Số token prompt (ước tính): {prompt_tokens}, Số token mới tối đa cho LLM: {max_new_tokens}, Nhiệt độ: 0.7, N_CTX: {N_CTX}, Khả dụng để tạo (ước tính): {available_for_generation}")
+            self.logger.debug("AI Agent (Không RAG): Số token prompt: %s, Số token mới tối đa cho LLM: %s, Nhiệt độ: 0.7, Cửa sổ ngữ cảnh: %s, Khả dụng để tạo: %s", prompt_tokens, max_new_tokens, context_window, available_for_generation)
 
             if max_new_tokens <= 0:
-                self.logger.error(f"AI Agent (Không RAG): max_new_tokens được tính toán bằng không hoặc âm ({max_new_tokens}). Độ dài prompt ({prompt_tokens}) có thể quá lớn so với N_CTX ({N_CTX}).")
+                self.logger.error("AI Agent (Không RAG): max_new_tokens được tính toán bằng không hoặc âm (%s). Độ dài prompt (%s) quá lớn so với cửa sổ ngữ cảnh (%s).", max_new_tokens, prompt_tokens, context_window)
                 return "Lỗi: Prompt quá dài hoặc N_CTX quá nhỏ để tạo."
 
             stop_sequences = [
@@ -424,9 +713,9 @@ class MainCoreAgent:
                 f"Question {num_questions + 1}:"
             ]
             
-            self.logger.debug(f"LLM_AGENT (Không RAG): Toàn bộ prompt được gửi đến LLM Service:\n{prompt[:500]}...")
+            self.payload_logger.debug("LLM_AGENT (Không RAG): Toàn bộ prompt được gửi đến LLM Service:\n%s", prompt)
 
-            self.logger.info(f"AI Agent: Đang truy vấn LLM ở chế độ cơ bản. Số token mới tối đa: {max_new_tokens}, Temp: 0.7")
+            self.logger.debug("AI Agent: Đang truy vấn LLM ở chế độ cơ bản. Số token mới tối đa: %s, Temp: 0.7", max_new_tokens)
             raw_response = query_gemma_gguf(
                 prompt=prompt,
                 max_tokens=max_new_tokens,
@@ -434,7 +723,7 @@ class MainCoreAgent:
                 stop=stop_sequences
             )
         
-        self.logger.debug(f"Phản hồi thô từ LLM (300 ký tự đầu):\n{str(raw_response)[:300]}")
+        self.payload_logger.debug("Phản hồi thô từ LLM:\n%s", raw_response)
         return raw_response
 
     def _parse_mcq_via_regex(self, raw_response: str, num_questions_expected: int) -> list:
@@ -470,16 +759,16 @@ class MainCoreAgent:
             current_pos = match.end()
             
         if not mcqs:
-            self.logger.warning(f"AI Agent (Regex Parse): Không thể phân tích bất kỳ MCQ nào bằng regex từ phản hồi (200 ký tự đầu): {str(raw_response)[:200]}...")
+            self.logger.warning("AI Agent (Regex Parse): Không thể phân tích bất kỳ MCQ nào bằng regex từ phản hồi (200 ký tự đầu): %s...", str(raw_response)[:200])
         elif len(mcqs) < num_questions_expected:
-            self.logger.warning(f"AI Agent (Regex Parse): Đã phân tích {len(mcqs)} MCQ qua regex, nhưng mong đợi {num_questions_expected}.")
+            self.logger.warning("AI Agent (Regex Parse): Đã phân tích %s MCQ qua regex, nhưng mong đợi %s.", len(mcqs), num_questions_expected)
         else:
-            self.logger.info(f"AI Agent (Regex Parse): Đã phân tích thành công {len(mcqs)} MCQ qua regex.")
+            self.logger.debug("AI Agent (Regex Parse): Đã phân tích thành công %s MCQ qua regex.", len(mcqs))
             
         return mcqs[:num_questions_expected]
 
     def _parse_llm_mcq_response(self, raw_response: str, num_questions_expected: int) -> list:
-        self.logger.debug(f"AI Agent: Đang cố gắng phân tích phản hồi LLM (300 ký tự đầu): {str(raw_response)[:300]}")
+        self.logger.debug("AI Agent: Đang cố gắng phân tích phản hồi LLM (%d ký tự).", len(str(raw_response)))
         parsed_mcqs = []
 
         try:
@@ -487,13 +776,13 @@ class MainCoreAgent:
             code_block_match = re.search(r"```(?:json)?\s*(\[.*?\])\s*```", raw_response, re.DOTALL)
             if code_block_match:
                 json_str_candidate = code_block_match.group(1)
-                self.logger.debug(f"AI Agent: Tìm thấy mảng JSON trong khối mã: {json_str_candidate[:200]}...")
+                self.payload_logger.debug("AI Agent: Tìm thấy mảng JSON trong khối mã: %s", json_str_candidate)
             else:
                 json_start_index = raw_response.find('[')
                 json_end_index = raw_response.rfind(']')
                 if json_start_index != -1 and json_end_index != -1 and json_start_index < json_end_index:
                     json_str_candidate = raw_response[json_start_index : json_end_index + 1]
-                    self.logger.debug(f"AI Agent: Tìm thấy chuỗi JSON tiềm năng (thường): {json_str_candidate[:200]}...")
+                    self.payload_logger.debug("AI Agent: Tìm thấy chuỗi JSON tiềm năng (thường): %s", json_str_candidate)
             
             if json_str_candidate:
                 parsed_data = json.loads(json_str_candidate)
@@ -501,20 +790,20 @@ class MainCoreAgent:
                     valid_mcqs = []
                     for item in parsed_data:
                         if isinstance(item, dict) and \
-                           all(k in item for k in ["question", "option_a", "option_b", "option_c", "option_d", "correct_answer_letter"]):
+                           all(k in item for k in MCQ_REQUIRED_KEYS):
                             valid_mcqs.append(item)
                         else:
-                            self.logger.warning(f"AI Agent: Mục JSON không tuân theo cấu trúc MCQ: {str(item)[:100]}")
+                            self.logger.warning("AI Agent: Mục JSON không tuân theo cấu trúc MCQ: %s", str(item)[:100])
                     
                     parsed_mcqs = valid_mcqs
-                    self.logger.info(f"AI Agent: Đã phân tích thành công {len(parsed_mcqs)} MCQ dưới dạng JSON.")
+                    self.logger.debug("AI Agent: Đã phân tích thành công %s MCQ dưới dạng JSON.", len(parsed_mcqs))
                     
                     if len(parsed_mcqs) > num_questions_expected:
-                        self.logger.warning(f"AI Agent: Phân tích JSON thu được {len(parsed_mcqs)} MCQ, nhiều hơn {num_questions_expected} mong đợi. Đang cắt bớt.")
+                        self.logger.warning("AI Agent: Phân tích JSON thu được %s MCQ, nhiều hơn %s mong đợi. Đang cắt bớt.", len(parsed_mcqs), num_questions_expected)
                         return parsed_mcqs[:num_questions_expected]
                     return parsed_mcqs
                 else:
-                    self.logger.warning(f"AI Agent: JSON đã phân tích không phải là một danh sách, mà là loại {type(parsed_data)}. Nội dung: {str(parsed_data)[:200]}")
+                    self.logger.warning("AI Agent: JSON đã phân tích không phải là một danh sách, mà là loại %s. Nội dung: %s", type(parsed_data), str(parsed_data)[:200])
             else:
                 self.logger.info("AI Agent: Không thể tìm thấy cấu trúc mảng JSON rõ ràng trong phản hồi để phân tích JSON chính.")
 
@@ -528,18 +817,18 @@ class MainCoreAgent:
                  start_snip = max(0, err_pos - 30)
                  end_snip = min(len(error_context_snippet), err_pos + 30)
                  snippet = error_context_snippet[start_snip:end_snip]
-                 self.logger.warning(f"AI Agent: Phân tích JSON thất bại. Lỗi: {e}. Gần vị trí {err_pos}. Đoạn mã: ...{snippet}...")
+                 self.logger.warning("AI Agent: Phân tích JSON thất bại. Lỗi: %s. Gần vị trí %s. Đoạn mã: ...%s...", e, err_pos, snippet)
             else:
-                 self.logger.warning(f"AI Agent: Phân tích JSON thất bại. Lỗi: {e}. Đoạn phản hồi: {error_context_snippet[:100]}...")
+                 self.logger.warning("AI Agent: Phân tích JSON thất bại. Lỗi: %s. Đoạn phản hồi: %s...", e, error_context_snippet[:100])
 
         except Exception as e:
-            self.logger.error(f"AI Agent: Lỗi không mong muốn trong quá trình phân tích JSON: {e}. Phản hồi: {str(raw_response)[:200]}")
+            self.logger.error("AI Agent: Lỗi không mong muốn trong quá trình phân tích JSON: %s. Phản hồi: %s", e, str(raw_response)[:200])
         
         if not parsed_mcqs:
             self.logger.info("AI Agent: Phân tích JSON chính không mang lại MCQ hoặc thất bại. Chuyển sang phân tích dựa trên regex.")
             parsed_mcqs_regex = self._parse_mcq_via_regex(raw_response, num_questions_expected)
             if parsed_mcqs_regex:
-                 self.logger.info(f"AI Agent: Đã phân tích thành công {len(parsed_mcqs_regex)} MCQ bằng phương pháp regex dự phòng.")
+                 self.logger.debug("AI Agent: Đã phân tích thành công %s MCQ bằng phương pháp regex dự phòng.", len(parsed_mcqs_regex))
                  return parsed_mcqs_regex
             else:
                  self.logger.warning("AI Agent: Phân tích regex dự phòng cũng thất bại trong việc trích xuất MCQ.")
@@ -547,196 +836,319 @@ class MainCoreAgent:
         return parsed_mcqs
 
     def generate_mcqs_basic(self, topic: str, num_questions: int = 5) -> list:
-        self.logger.info(f"AI Agent: Đang tạo {num_questions} MCQ cơ bản cho chủ đề: '{topic}'")
+        self.logger.debug("AI Agent: Đang tạo %s MCQ cơ bản cho chủ đề: '%s'", num_questions, topic)
         raw_response = self._prompt_llm_for_mcq(topic, num_questions, context_text=None)
         
         if not isinstance(raw_response, str) or "Error:" in raw_response or "Lỗi:" in raw_response:
-            self.logger.error(f"AI Agent: Lỗi từ LLM trong quá trình tạo cơ bản: {raw_response}")
+            self.logger.error("AI Agent: Lỗi từ LLM trong quá trình tạo cơ bản: %s", raw_response)
             return []
             
         parsed_mcqs = self._parse_llm_mcq_response(raw_response, num_questions_expected=num_questions)
-        self.logger.info(f"AI Agent: Đã phân tích {len(parsed_mcqs)} MCQ cơ bản trong số {num_questions} được yêu cầu cho chủ đề '{topic}'.")
+        self.logger.debug("AI Agent: Đã phân tích %s MCQ cơ bản trong số %s được yêu cầu cho chủ đề '%s'.", len(parsed_mcqs), num_questions, topic)
         return parsed_mcqs
 
-    def generate_mcqs_with_rag(self, user_topic: str, num_questions: int = 5) -> list:
-        self.logger.info(f"AI Agent: Đang tạo {num_questions} MCQ RAG cho chủ đề người dùng: '{user_topic}'")
-        
+    def _map_topic(self, user_topic: str) -> str:
+        """Ánh xạ chủ đề người dùng sang chủ đề chính tắc."""
         mapped_topic = KEYWORD_TO_TOPIC_MAP.get(user_topic.lower().strip(), user_topic)
         if mapped_topic != user_topic:
-            self.logger.info(f"AI Agent (RAG): Đã ánh xạ chủ đề người dùng '{user_topic}' sang chủ đề chính tắc '{mapped_topic}'.")
+            self.logger.debug("AI Agent (RAG): Đã ánh xạ chủ đề người dùng '%s' sang chủ đề chính tắc '%s'.", user_topic, mapped_topic)
         else:
-            self.logger.info(f"AI Agent (RAG): Sử dụng trực tiếp chủ đề người dùng làm chủ đề chính tắc: '{mapped_topic}'.")
+            self.logger.debug("AI Agent (RAG): Sử dụng trực tiếp chủ đề người dùng làm chủ đề chính tắc: '%s'.", mapped_topic)
+        return mapped_topic
 
+    def _retrieve_context(self, mapped_topic: str, query_embedding: np.ndarray | None) -> str:
+        """Truy xuất ngữ cảnh RAG cho chủ đề chính tắc, dùng lại embedding đã mã hóa."""
         context = ""
         if self.kb_index and self.query_embedding_model and self.kb_texts:
-            context = self._retrieve_from_kb(mapped_topic, top_k_retrieval=1)
+            context = self._retrieve_from_kb(mapped_topic, top_k_retrieval=1, query_embedding=query_embedding)
             if context:
-                self.logger.info(f"AI Agent (RAG): Đã truy xuất ngữ cảnh cho '{mapped_topic}'. Xem trước (100 ký tự đầu): {context[:100]}...")
+                self.logger.debug("AI Agent (RAG): Đã truy xuất ngữ cảnh cho '%s'. Xem trước (100 ký tự đầu): %s...", mapped_topic, context[:100])
             else:
-                self.logger.info(f"AI Agent (RAG): Không có ngữ cảnh nào được truy xuất cho '{mapped_topic}'. LLM sẽ sử dụng kiến thức chung của mình cho chủ đề này.")
+                self.logger.debug("AI Agent (RAG): Không có ngữ cảnh nào được truy xuất cho '%s'. LLM sẽ sử dụng kiến thức chung của mình cho chủ đề này.", mapped_topic)
         else:
             self.logger.warning("AI Agent (RAG): Cơ sở tri thức (KB) hoặc mô hình truy vấn không hoàn toàn khả dụng. Tiếp tục mà không có ngữ cảnh RAG cụ thể.")
 
         # Prompt RAG mong đợi ngữ cảnh, ngay cả khi nó rỗng, nó sẽ sử dụng kiến thức chung.
-        raw_response = self._prompt_llm_for_mcq(mapped_topic, num_questions, context_text=context if context else "Không có ngữ cảnh cụ thể. Sử dụng kiến thức chung.")
+        return context if context else "Không có ngữ cảnh cụ thể. Sử dụng kiến thức chung."
+
+    def _lookup_cached_mcqs(self, mapped_topic: str, query_embedding: np.ndarray | None, num_questions: int) -> list | None:
+        if query_embedding is None:
+            return None
+        cached_mcqs = self.mcq_cache.lookup(query_embedding, num_questions)
+        if cached_mcqs is not None:
+            self.logger.debug("AI Agent (Cache): Trúng cache ngữ nghĩa cho '%s'. Trả về %s MCQ mà không gọi LLM.", mapped_topic, len(cached_mcqs))
+        return cached_mcqs
+
+    def _store_cached_mcqs(self, mapped_topic: str, query_embedding: np.ndarray | None, mcqs: list, num_questions: int):
+        # Chỉ lưu các bộ đầy đủ, để lần trúng cache sau luôn đủ số câu hỏi được yêu cầu
+        if query_embedding is not None and len(mcqs) >= num_questions:
+            self.mcq_cache.store(mapped_topic, query_embedding, mcqs)
+
+    def _record_output_tokens(self, completion_text: str, num_mcqs: int, num_questions: int):
+        # Chỉ các bộ đầy đủ: một phản hồi bị cắt ngắn sẽ làm số token cho mỗi MCQ thấp hơn thực tế
+        if num_mcqs < num_questions:
+            return
+        try:
+            completion_tokens = count_tokens(completion_text)
+        except Exception as e:
+            self.logger.warning("AI Agent: Không thể đếm token của phản hồi: %s", e)
+            return
+        if self.output_budget.record(completion_tokens, num_mcqs):
+            self.logger.warning(
+                "AI Agent (RAG): Phản hồi dùng %d token cho %d MCQ, vượt ngân sách đầu ra hiện tại cho mỗi MCQ.",
+                completion_tokens, num_mcqs
+            )
+
+    def generate_mcqs_with_rag(self, user_topic: str, num_questions: int = 5, use_cache: bool = True) -> list:
+        """
+        Tạo MCQ có RAG. Với use_cache=True, một chủ đề gần nghĩa với chủ đề đã sinh gần đây
+        (theo độ tương đồng cosine của embedding) được phục vụ từ cache ngữ nghĩa thay vì gọi LLM.
+        """
+        self.logger.debug("AI Agent: Đang tạo %s MCQ RAG cho chủ đề người dùng: '%s'", num_questions, user_topic)
+
+        mapped_topic = self._map_topic(user_topic)
+        query_embedding = self._encode_query(mapped_topic)
+        if use_cache:
+            cached_mcqs = self._lookup_cached_mcqs(mapped_topic, query_embedding, num_questions)
+            if cached_mcqs is not None:
+                return cached_mcqs
+
+        context = self._retrieve_context(mapped_topic, query_embedding)
+        raw_response = self._prompt_llm_for_mcq(mapped_topic, num_questions, context_text=context)
 
         if not isinstance(raw_response, str) or "Error:" in raw_response or "Lỗi:" in raw_response:
-            self.logger.error(f"AI Agent: Lỗi từ LLM trong quá trình tạo RAG: {raw_response}")
+            self.logger.error("AI Agent: Lỗi từ LLM trong quá trình tạo RAG: %s", raw_response)
             return []
 
         parsed_mcqs = self._parse_llm_mcq_response(raw_response, num_questions_expected=num_questions)
-        self.logger.info(f"AI Agent: Đã phân tích {len(parsed_mcqs)} MCQ RAG trong số {num_questions} được yêu cầu cho chủ đề người dùng '{user_topic}'.")
+        self.logger.debug("AI Agent: Đã phân tích %s MCQ RAG trong số %s được yêu cầu cho chủ đề người dùng '%s'.", len(parsed_mcqs), num_questions, user_topic)
+        self._record_output_tokens(raw_response, len(parsed_mcqs), num_questions)
+        self._store_cached_mcqs(mapped_topic, query_embedding, parsed_mcqs, num_questions)
         return parsed_mcqs
 
+    async def agenerate_mcqs_with_rag(self, user_topic: str, num_questions: int = 5, use_cache: bool = True) -> list:
+        """
+        Phiên bản bất đồng bộ của generate_mcqs_with_rag: công việc được gửi vào executor suy luận
+        và được await, nên event loop không bị chặn trong lúc LLM sinh câu hỏi.
+        Ném InferenceQueueFullError nếu hàng đợi đã đầy.
+        """
+        return await get_inference_executor().run(self.generate_mcqs_with_rag, user_topic, num_questions, use_cache)
+
+    def generate_mcqs_with_rag_stream(self, user_topic: str, num_questions: int = 5, use_cache: bool = True, should_stop=None):
+        """
+        Giống generate_mcqs_with_rag nhưng dùng LLM streaming: mỗi MCQ được yield ngay khi
+        dấu '}' đóng của nó xuất hiện trong phản hồi, thay vì đợi toàn bộ mảng JSON.
+        `should_stop` (nếu có) được kiểm tra sau mỗi đoạn văn bản; khi nó trả về True, việc sinh
+        dừng lại và chỉ các MCQ đã hoàn chỉnh được giữ.
+        """
+        self.logger.debug("AI Agent: Đang tạo (streaming) %s MCQ RAG cho chủ đề người dùng: '%s'", num_questions, user_topic)
+
+        mapped_topic = self._map_topic(user_topic)
+        query_embedding = self._encode_query(mapped_topic)
+        if use_cache:
+            cached_mcqs = self._lookup_cached_mcqs(mapped_topic, query_embedding, num_questions)
+            if cached_mcqs is not None:
+                yield from cached_mcqs
+                return
+
+        context = self._retrieve_context(mapped_topic, query_embedding)
+        rag_query = self._build_rag_query(mapped_topic, num_questions, context)
+        if rag_query is None:
+            return
+
+        parser = IncrementalMCQParser()
+        streamed_mcqs = []
+        chunks = []
+        for chunk in stream_gemma_gguf(**rag_query):
+            chunks.append(chunk)
+            for mcq in parser.feed(chunk):
+                yield mcq
+                streamed_mcqs.append(mcq)
+                if len(streamed_mcqs) >= num_questions:
+                    self._record_output_tokens("".join(chunks), len(streamed_mcqs), num_questions)
+                    self._store_cached_mcqs(mapped_topic, query_embedding, streamed_mcqs, num_questions)
+                    return
+            if should_stop is not None and should_stop():
+                self.logger.info("AI Agent: Dừng sinh (streaming) cho '%s' sau %d MCQ để nhường LLM.", user_topic, len(streamed_mcqs))
+                return
+        self.logger.debug("AI Agent: Đã stream %s MCQ RAG trong số %s được yêu cầu cho chủ đề người dùng '%s'.", len(streamed_mcqs), num_questions, user_topic)
+
+    async def astream_mcqs_with_rag(self, user_topic: str, num_questions: int = 5, background: bool = False):
+        """
+        Trả về async iterator của generate_mcqs_with_rag_stream chạy trên executor suy luận.
+        Ném InferenceQueueFullError ngay khi được await nếu hàng đợi đã đầy.
+        Với background=True (bổ sung pool chủ đề): bỏ qua cache ngữ nghĩa, chỉ chạy khi executor rảnh
+        (nếu không thì ném InferenceQueueFullError) và dừng ngay khi có yêu cầu của người dùng đến.
+        """
+        executor = get_inference_executor()
+        if background:
+            return executor.stream_background(
+                self.generate_mcqs_with_rag_stream, user_topic, num_questions,
+                use_cache=False, should_stop=executor.has_foreground_work
+            )
+        return executor.stream(self.generate_mcqs_with_rag_stream, user_topic, num_questions)
+
+    async def ametrics(self) -> dict:
+        """Bộ đếm cho người vận hành: hàng đợi suy luận và cache ngữ nghĩa."""
+        return {
+            "inference_executor": get_inference_executor().stats(),
+            "mcq_semantic_cache": self.mcq_cache.stats(),
+            "mcq_output_budget": self.output_budget.stats(),
+        }
+
 # %% [markdown]
-# ## 5. Cấu hình Logging (Chạy một lần)
-# Cấu hình logging cho notebook.
+# ## 6. Cấu hình Logging (Chạy một lần)
+# Cấu hình logging cho notebook. Chỉ khi chạy trực tiếp: khi backend import module này, log_config.py
+# cấu hình logging cho cả tiến trình (mặc định INFO, không ghi prompt).
 
 # %%
 # --- Cài đặt Logging ---
-logging.basicConfig(
-    level=logging.DEBUG, # Đặt thành INFO để ít chi tiết hơn, DEBUG để chi tiết hơn
-    format='%(asctime)s - %(levelname)s - %(name)s - %(module)s: %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout) # Đảm bảo log xuất ra output của notebook
-    ]
-)
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG, # Đặt thành INFO để ít chi tiết hơn, DEBUG để chi tiết hơn
+        format='%(asctime)s - %(levelname)s - %(name)s - %(module)s: %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout) # Đảm bảo log xuất ra output của notebook
+        ]
+    )
 
-# Bạn có thể đặt các cấp độ cụ thể cho các logger khác nhau nếu cần
-logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
+    # Bạn có thể đặt các cấp độ cụ thể cho các logger khác nhau nếu cần
+    logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
 
 # Lấy một logger cho phần notebook/script hiện tại
 notebook_logger = logging.getLogger(__name__) # __name__ sẽ là '__main__' trong script notebook cấp cao nhất
 notebook_logger.setLevel(logging.INFO)
 
 # %% [markdown]
-# ## 6. Khởi tạo Agent và Kiểm thử
-# Phần này tương ứng với khối `if __name__ == '__main__':` trong skript gốc của bạn.
+# ## 7. Khởi tạo Agent và Kiểm thử
+# Phần này nằm trong khối `if __name__ == '__main__':`, giống skript gốc của bạn.
 
 # %%
-notebook_logger.info("Khối kiểm thử AI Agent: Đang khởi tạo agent...")
-try:
-    agent = MainCoreAgent()
-    notebook_logger.info("Agent đã được khởi tạo.")
-
-    # --- Trường hợp kiểm thử 1: Tạo MCQ cơ bản (5 câu hỏi) ---
-    notebook_logger.info("\n--- Trường hợp kiểm thử 1: Tạo MCQ cơ bản (5 câu hỏi) ---")
-    topic_1 = "Present Simple Tense"
-    num_q_1 = 5 # Default is now 5
-    notebook_logger.info(f"Yêu cầu {num_q_1} MCQ cơ bản cho chủ đề: '{topic_1}'")
-    parsed_mcqs_1 = agent.generate_mcqs_basic(topic=topic_1, num_questions=num_q_1)
-
-    print(f"\n--- Các MCQ đã phân tích cho Trường hợp kiểm thử 1 ({topic_1}, {num_q_1} yêu cầu) ---")
-    print(json.dumps(parsed_mcqs_1, indent=2, ensure_ascii=False)) # ensure_ascii=False để hiển thị tiếng Việt
-    if parsed_mcqs_1 and len(parsed_mcqs_1) == num_q_1:
-        notebook_logger.info(f"THÀNH CÔNG: Số lượng MCQ ({len(parsed_mcqs_1)}) đã phân tích chính xác cho Trường hợp kiểm thử 1.")
-    else:
-        notebook_logger.warning(f"CẢNH BÁO: Mong đợi {num_q_1} MCQ, nhưng đã phân tích {len(parsed_mcqs_1) if parsed_mcqs_1 else 0} cho Trường hợp kiểm thử 1.")
-
-    # --- Trường hợp kiểm thử 2: Tạo MCQ cơ bản (5 câu hỏi) ---
-    notebook_logger.info("\n--- Trường hợp kiểm thử 2: Tạo MCQ cơ bản (5 câu hỏi) ---")
-    topic_2 = "Past Continuous Tense"
-    num_q_2 = 5
-    notebook_logger.info(f"Yêu cầu {num_q_2} MCQ cơ bản cho chủ đề: '{topic_2}'")
-    parsed_mcqs_2 = agent.generate_mcqs_basic(topic=topic_2, num_questions=num_q_2)
-
-    print(f"\n--- Các MCQ đã phân tích cho Trường hợp kiểm thử 2 ({topic_2}, {num_q_2} yêu cầu) ---")
-    print(json.dumps(parsed_mcqs_2, indent=2, ensure_ascii=False))
-    if parsed_mcqs_2 and len(parsed_mcqs_2) == num_q_2:
-        notebook_logger.info(f"THÀNH CÔNG: Số lượng MCQ ({len(parsed_mcqs_2)}) đã phân tích chính xác cho Trường hợp kiểm thử 2.")
-    else:
-        notebook_logger.warning(f"CẢNH BÁO: Mong đợi {num_q_2} MCQ, nhưng đã phân tích {len(parsed_mcqs_2) if parsed_mcqs_2 else 0} cho Trường hợp kiểm thử 2.")
-
-    # --- Trường hợp kiểm thử 3: Tạo MCQ RAG (5 câu hỏi) ---
-    notebook_logger.info("\n--- Trường hợp kiểm thử 3: Tạo MCQ RAG (5 câu hỏi) ---")
-    topic_3_user = "past simple" # Nên ánh xạ tới "past simple tense"
-    num_q_3 = 5
-    notebook_logger.info(f"Yêu cầu {num_q_3} MCQ RAG cho chủ đề người dùng: '{topic_3_user}'")
-    parsed_mcqs_3 = agent.generate_mcqs_with_rag(user_topic=topic_3_user, num_questions=num_q_3)
-
-    print(f"\n--- Các MCQ đã phân tích cho Trường hợp kiểm thử 3 (Chủ đề người dùng: '{topic_3_user}', {num_q_3} yêu cầu) ---")
-    print(json.dumps(parsed_mcqs_3, indent=2, ensure_ascii=False))
-    if parsed_mcqs_3 and len(parsed_mcqs_3) == num_q_3:
-        notebook_logger.info(f"THÀNH CÔNG: Số lượng MCQ ({len(parsed_mcqs_3)}) đã phân tích chính xác cho Trường hợp kiểm thử 3.")
-    else:
-        notebook_logger.warning(f"CẢNH BÁO: Mong đợi {num_q_3} MCQ, nhưng đã phân tích {len(parsed_mcqs_3) if parsed_mcqs_3 else 0} cho Trường hợp kiểm thử 3.")
-
-    # --- Trường hợp kiểm thử 4: Tạo MCQ RAG (chủ đề chung, 5 câu hỏi) ---
-    notebook_logger.info("\n--- Trường hợp kiểm thử 4: Tạo MCQ RAG (5 câu hỏi, chủ đề chung) ---")
-    topic_4_user = "General English Idioms"
-    num_q_4 = 5
-    notebook_logger.info(f"Yêu cầu {num_q_4} MCQ RAG cho chủ đề người dùng: '{topic_4_user}'")
-    parsed_mcqs_4 = agent.generate_mcqs_with_rag(user_topic=topic_4_user, num_questions=num_q_4)
-
-    print(f"\n--- Các MCQ đã phân tích cho Trường hợp kiểm thử 4 (Chủ đề người dùng: '{topic_4_user}', {num_q_4} yêu cầu) ---")
-    print(json.dumps(parsed_mcqs_4, indent=2, ensure_ascii=False))
-    if parsed_mcqs_4 and len(parsed_mcqs_4) == num_q_4:
-        notebook_logger.info(f"THÀNH CÔNG: Số lượng MCQ ({len(parsed_mcqs_4)}) đã phân tích chính xác cho Trường hợp kiểm thử 4.")
-    else:
-        notebook_logger.warning(f"CẢNH BÁO: Mong đợi {num_q_4} MCQ, nhưng đã phân tích {len(parsed_mcqs_4) if parsed_mcqs_4 else 0} cho Trường hợp kiểm thử 4.")
-
-    # Retry MCQ generation with a simpler prompt if parsing fails (default: 5 questions)
-    notebook_logger.info("\n--- MCQ JSON Retry Demo: If parsing fails, try a simpler prompt (default 5 questions) ---")
-    user_topic = "General English Idioms"
-    num_questions = 5  # Default is now 5
-    parsed_mcqs = agent.generate_mcqs_with_rag(user_topic=user_topic, num_questions=num_questions)
-
-    if not parsed_mcqs or len(parsed_mcqs) != num_questions:
-        notebook_logger.warning("MCQ parsing failed on first try. Retrying with a minimal prompt...")
-        # Minimal prompt: ask for a JSON array of MCQs, no context, no formatting rules
-        minimal_prompt = f"""
+# Chỉ chạy khi thực thi trực tiếp: backend import module này, và khối kiểm thử gọi LLM thật.
+if __name__ == "__main__":
+    notebook_logger.info("Khối kiểm thử AI Agent: Đang khởi tạo agent...")
+    try:
+        agent = MainCoreAgent()
+        notebook_logger.info("Agent đã được khởi tạo.")
+
+        # --- Trường hợp kiểm thử 1: Tạo MCQ cơ bản (5 câu hỏi) ---
+        notebook_logger.info("\n--- Trường hợp kiểm thử 1: Tạo MCQ cơ bản (5 câu hỏi) ---")
+        topic_1 = "Present Simple Tense"
+        num_q_1 = 5 # Default is now 5
+        notebook_logger.info("Yêu cầu %s MCQ cơ bản cho chủ đề: '%s'", num_q_1, topic_1)
+        parsed_mcqs_1 = agent.generate_mcqs_basic(topic=topic_1, num_questions=num_q_1)
+
+        print(f"\n--- Các MCQ đã phân tích cho Trường hợp kiểm thử 1 ({topic_1}, {num_q_1} yêu cầu) ---")
+        print(json.dumps(parsed_mcqs_1, indent=2, ensure_ascii=False)) # ensure_ascii=False để hiển thị tiếng Việt
+        if parsed_mcqs_1 and len(parsed_mcqs_1) == num_q_1:
+            notebook_logger.info("THÀNH CÔNG: Số lượng MCQ (%s) đã phân tích chính xác cho Trường hợp kiểm thử 1.", len(parsed_mcqs_1))
+        else:
+            notebook_logger.warning("CẢNH BÁO: Mong đợi %s MCQ, nhưng đã phân tích %s cho Trường hợp kiểm thử 1.", num_q_1, len(parsed_mcqs_1) if parsed_mcqs_1 else 0)
+
+        # --- Trường hợp kiểm thử 2: Tạo MCQ cơ bản (5 câu hỏi) ---
+        notebook_logger.info("\n--- Trường hợp kiểm thử 2: Tạo MCQ cơ bản (5 câu hỏi) ---")
+        topic_2 = "Past Continuous Tense"
+        num_q_2 = 5
+        notebook_logger.info("Yêu cầu %s MCQ cơ bản cho chủ đề: '%s'", num_q_2, topic_2)
+        parsed_mcqs_2 = agent.generate_mcqs_basic(topic=topic_2, num_questions=num_q_2)
+
+        print(f"\n--- Các MCQ đã phân tích cho Trường hợp kiểm thử 2 ({topic_2}, {num_q_2} yêu cầu) ---")
+        print(json.dumps(parsed_mcqs_2, indent=2, ensure_ascii=False))
+        if parsed_mcqs_2 and len(parsed_mcqs_2) == num_q_2:
+            notebook_logger.info("THÀNH CÔNG: Số lượng MCQ (%s) đã phân tích chính xác cho Trường hợp kiểm thử 2.", len(parsed_mcqs_2))
+        else:
+            notebook_logger.warning("CẢNH BÁO: Mong đợi %s MCQ, nhưng đã phân tích %s cho Trường hợp kiểm thử 2.", num_q_2, len(parsed_mcqs_2) if parsed_mcqs_2 else 0)
+
+        # --- Trường hợp kiểm thử 3: Tạo MCQ RAG (5 câu hỏi) ---
+        notebook_logger.info("\n--- Trường hợp kiểm thử 3: Tạo MCQ RAG (5 câu hỏi) ---")
+        topic_3_user = "past simple" # Nên ánh xạ tới "past simple tense"
+        num_q_3 = 5
+        notebook_logger.info("Yêu cầu %s MCQ RAG cho chủ đề người dùng: '%s'", num_q_3, topic_3_user)
+        parsed_mcqs_3 = agent.generate_mcqs_with_rag(user_topic=topic_3_user, num_questions=num_q_3)
+
+        print(f"\n--- Các MCQ đã phân tích cho Trường hợp kiểm thử 3 (Chủ đề người dùng: '{topic_3_user}', {num_q_3} yêu cầu) ---")
+        print(json.dumps(parsed_mcqs_3, indent=2, ensure_ascii=False))
+        if parsed_mcqs_3 and len(parsed_mcqs_3) == num_q_3:
+            notebook_logger.info("THÀNH CÔNG: Số lượng MCQ (%s) đã phân tích chính xác cho Trường hợp kiểm thử 3.", len(parsed_mcqs_3))
+        else:
+            notebook_logger.warning("CẢNH BÁO: Mong đợi %s MCQ, nhưng đã phân tích %s cho Trường hợp kiểm thử 3.", num_q_3, len(parsed_mcqs_3) if parsed_mcqs_3 else 0)
+
+        # --- Trường hợp kiểm thử 4: Tạo MCQ RAG (chủ đề chung, 5 câu hỏi) ---
+        notebook_logger.info("\n--- Trường hợp kiểm thử 4: Tạo MCQ RAG (5 câu hỏi, chủ đề chung) ---")
+        topic_4_user = "General English Idioms"
+        num_q_4 = 5
+        notebook_logger.info("Yêu cầu %s MCQ RAG cho chủ đề người dùng: '%s'", num_q_4, topic_4_user)
+        parsed_mcqs_4 = agent.generate_mcqs_with_rag(user_topic=topic_4_user, num_questions=num_q_4)
+
+        print(f"\n--- Các MCQ đã phân tích cho Trường hợp kiểm thử 4 (Chủ đề người dùng: '{topic_4_user}', {num_q_4} yêu cầu) ---")
+        print(json.dumps(parsed_mcqs_4, indent=2, ensure_ascii=False))
+        if parsed_mcqs_4 and len(parsed_mcqs_4) == num_q_4:
+            notebook_logger.info("THÀNH CÔNG: Số lượng MCQ (%s) đã phân tích chính xác cho Trường hợp kiểm thử 4.", len(parsed_mcqs_4))
+        else:
+            notebook_logger.warning("CẢNH BÁO: Mong đợi %s MCQ, nhưng đã phân tích %s cho Trường hợp kiểm thử 4.", num_q_4, len(parsed_mcqs_4) if parsed_mcqs_4 else 0)
+
+        # Retry MCQ generation with a simpler prompt if parsing fails (default: 5 questions)
+        notebook_logger.info("\n--- MCQ JSON Retry Demo: If parsing fails, try a simpler prompt (default 5 questions) ---")
+        user_topic = "General English Idioms"
+        num_questions = 5  # Default is now 5
+        parsed_mcqs = agent.generate_mcqs_with_rag(user_topic=user_topic, num_questions=num_questions)
+
+        if not parsed_mcqs or len(parsed_mcqs) != num_questions:
+            notebook_logger.warning("MCQ parsing failed on first try. Retrying with a minimal prompt...")
+            # Minimal prompt: ask for a JSON array of MCQs, no context, no formatting rules
+            minimal_prompt = f"""
 You are an AI that generates English MCQs. Output a JSON array of {num_questions} objects. Each object must have: question, option_a, option_b, option_c, option_d, correct_answer_letter (A/B/C/D). Topic: {user_topic}.
 """
+            raw_response = query_gemma_gguf(
+                prompt=minimal_prompt,
+                max_tokens=1024,
+                temperature=0.5
+            )
+            try:
+                parsed_mcqs = json.loads(raw_response)
+                notebook_logger.info("Retry succeeded: Parsed %s MCQs from minimal prompt.", len(parsed_mcqs))
+            except Exception as e:
+                notebook_logger.error("Retry failed: Could not parse MCQs from minimal prompt. Error: %s", e)
+                parsed_mcqs = []
+
+        print(f"\n--- MCQ JSON Retry Result for topic '{user_topic}' (default 5 questions) ---")
+        print(json.dumps(parsed_mcqs, indent=2, ensure_ascii=False))
+
+        # --- Strict JSON-only MCQ generation with improved prompt and model suggestion ---
+        notebook_logger.info("\n--- Strict JSON-only MCQ generation with improved prompt and model suggestion ---")
+        user_topic = "General English Idioms"
+        num_questions = 5
+        notebook_logger.info("Generating %s MCQs for topic: '%s' with strict JSON prompt.", num_questions, user_topic)
+
+        strict_json_prompt = (
+            f"Output ONLY a valid JSON array of {num_questions} MCQ objects. "
+            "Each object must have: question, option_a, option_b, option_c, option_d, correct_answer_letter (A/B/C/D). "
+            "No explanation, no extra text. "
+            f"Topic: {user_topic}"
+        )
+
         raw_response = query_gemma_gguf(
-            prompt=minimal_prompt,
+            prompt=strict_json_prompt,
             max_tokens=1024,
             temperature=0.5
         )
         try:
             parsed_mcqs = json.loads(raw_response)
-            notebook_logger.info(f"Retry succeeded: Parsed {len(parsed_mcqs)} MCQs from minimal prompt.")
+            notebook_logger.info("Strict prompt succeeded: Parsed %s MCQs.", len(parsed_mcqs))
         except Exception as e:
-            notebook_logger.error(f"Retry failed: Could not parse MCQs from minimal prompt. Error: {e}")
+            notebook_logger.error("Strict prompt failed: %s", e)
             parsed_mcqs = []
 
-    print(f"\n--- MCQ JSON Retry Result for topic '{user_topic}' (default 5 questions) ---")
-    print(json.dumps(parsed_mcqs, indent=2, ensure_ascii=False))
-
-    # --- Strict JSON-only MCQ generation with improved prompt and model suggestion ---
-    notebook_logger.info("\n--- Strict JSON-only MCQ generation with improved prompt and model suggestion ---")
-    user_topic = "General English Idioms"
-    num_questions = 5
-    notebook_logger.info(f"Generating {num_questions} MCQs for topic: '{user_topic}' with strict JSON prompt.")
+        print(f"\n--- Strict JSON MCQ Result for topic '{user_topic}' ---")
+        print(json.dumps(parsed_mcqs, indent=2, ensure_ascii=False))
 
-    strict_json_prompt = (
-        f"Output ONLY a valid JSON array of {num_questions} MCQ objects. "
-        "Each object must have: question, option_a, option_b, option_c, option_d, correct_answer_letter (A/B/C/D). "
-        "No explanation, no extra text. "
-        f"Topic: {user_topic}"
-    )
+        # NOTE: For best RAG/semantic search, set embedding model to 'all-mpnet-base-v2' in MainCoreAgent.
 
-    raw_response = query_gemma_gguf(
-        prompt=strict_json_prompt,
-        max_tokens=1024,
-        temperature=0.5
-    )
-    try:
-        parsed_mcqs = json.loads(raw_response)
-        notebook_logger.info(f"Strict prompt succeeded: Parsed {len(parsed_mcqs)} MCQs.")
     except Exception as e:
-        notebook_logger.error(f"Strict prompt failed: {e}")
-        parsed_mcqs = []
+        notebook_logger.critical("Đã xảy ra lỗi trong quá trình khởi tạo agent hoặc kiểm thử: %s", e, exc_info=True)
 
-    print(f"\n--- Strict JSON MCQ Result for topic '{user_topic}' ---")
-    print(json.dumps(parsed_mcqs, indent=2, ensure_ascii=False))
-
-    # NOTE: For best RAG/semantic search, set embedding model to 'all-mpnet-base-v2' in MainCoreAgent.
-
-except Exception as e:
-    notebook_logger.critical(f"Đã xảy ra lỗi trong quá trình khởi tạo agent hoặc kiểm thử: {e}", exc_info=True)
-
-finally:
-    notebook_logger.info("\nHoàn tất Khối kiểm thử AI Agent.")
+    finally:
+        notebook_logger.info("\nHoàn tất Khối kiểm thử AI Agent.")
 
 # %% [markdown]
 # # MCQ Generation/Parsing Issue: Debugging Notes
@@ -746,6 +1158,9 @@ finally:
 # **Observed Problems:**
 # - The LLM sometimes returns garbled or irrelevant text instead of a valid JSON array or MCQ block.
 # - The fallback regex parser also fails when the LLM output is not close to the expected format.
+#
+# **Update:** RAG generation now passes a GBNF grammar (`build_mcq_array_grammar`) to the LLM service, so llama.cpp
+# can only sample a JSON array of exactly N MCQ objects. The regex fallback remains for the basic (non-JSON) mode.
 # 
 # **Suggested Next Steps:**
 # 1. **Check LLM Prompting:**
@@ -0,0 +1,411 @@
+# backend/ai_core/batching_scheduler.py
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+
+import llama_cpp
+import numpy as np
+
+scheduler_logger = logging.getLogger(__name__)
+
+REPEAT_PENALTY_LAST_N = 64  # Same window llama.cpp uses by default for repeat_penalty
+PREFIX_MAX_TOKENS = 1024  # KV cells set aside for each cached prompt prefix
+
+
+# The KV cache helpers were renamed across llama-cpp-python releases.
+def _kv_cache_seq_rm(ctx, seq_id: int, p0: int = -1, p1: int = -1):
+    fn = getattr(llama_cpp, "llama_kv_cache_seq_rm", None) or getattr(llama_cpp, "llama_kv_self_seq_rm")
+    fn(ctx, seq_id, p0, p1)
+
+
+def _kv_cache_seq_cp(ctx, src_seq_id: int, dst_seq_id: int, p0: int, p1: int):
+    fn = getattr(llama_cpp, "llama_kv_cache_seq_cp", None) or getattr(llama_cpp, "llama_kv_self_seq_cp")
+    fn(ctx, src_seq_id, dst_seq_id, p0, p1)
+
+
+# llama_sampler_init_grammar takes the vocab in newer releases and the model in older ones.
+def _sampler_init_grammar(model, grammar: str):
+    get_vocab = getattr(llama_cpp, "llama_model_get_vocab", None)
+    sampler = llama_cpp.llama_sampler_init_grammar(
+        get_vocab(model) if get_vocab else model, grammar.encode("utf-8"), b"root"
+    )
+    if not sampler:
+        raise ValueError("Failed to parse the GBNF grammar.")
+    return sampler
+
+
+def common_prefix_length(a, b) -> int:
+    n = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        n += 1
+    return n
+
+
+class _PrefixJob:
+    """Asks the scheduler thread to evaluate a prompt prefix into a dedicated sequence."""
+
+    def __init__(self, tokens: list[int]):
+        self.tokens = tokens
+
+
+class GenerationRequest:
+    """One prompt submitted to the scheduler, plus its decoding state while it owns a sequence."""
+
+    def __init__(self, prompt_tokens: list[int], max_tokens: int, temperature: float, top_p: float,
+                 top_k: int, repeat_penalty: float, stop: list[str], on_text=None, grammar: str | None = None):
+        self.prompt_tokens = prompt_tokens
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.top_p = top_p
+        self.top_k = top_k
+        self.repeat_penalty = repeat_penalty
+        self.stop = [s for s in stop if s]
+        self.on_text = on_text  # Optional streaming callback; returning False cancels the request
+        self.grammar = grammar  # Optional GBNF grammar constraining the sampled tokens
+        self.future: Future = Future()
+
+        # Decoding state, set when the request is admitted into a sequence slot
+        self.seq_id: int | None = None
+        self.reserved_cells = 0
+        self.n_prefilled = 0
+        self.n_past = 0
+        self.logits_index: int | None = None
+        self.sampler = None
+        self.generated_tokens: list[int] = []
+        self.generated_bytes = b""
+        self.text = ""
+        self.emitted_len = 0
+
+    @property
+    def kv_cells_needed(self) -> int:
+        return len(self.prompt_tokens) + self.max_tokens
+
+
+class BatchingScheduler:
+    """
+    Continuous-batching decoder over a dedicated multi-sequence llama.cpp context.
+
+    Each admitted request gets its own sequence id in a shared KV cache. Every step packs
+    one pending token per generating sequence plus chunks of newly admitted prompts into a
+    single llama_decode call, so concurrent callers share the cost of each forward pass.
+    Requests join and leave between steps.
+
+    Registered prompt prefixes are evaluated once into sequences of their own; a request
+    whose prompt starts with one gets those KV cells shared into its sequence on admission
+    and only prefills the remainder.
+    """
+
+    def __init__(self, llm: llama_cpp.Llama, n_seq_max: int, n_ctx_per_seq: int, n_batch: int,
+                 n_prefix_slots: int = 0):
+        self.llm = llm
+        self.n_seq_max = n_seq_max
+        self.n_ctx_per_seq = n_ctx_per_seq
+        self.n_ctx = n_ctx_per_seq * n_seq_max + PREFIX_MAX_TOKENS * n_prefix_slots
+        self.n_batch = n_batch
+        self.n_vocab = llm.n_vocab()
+
+        ctx_params = llama_cpp.llama_context_default_params()
+        ctx_params.n_ctx = self.n_ctx
+        ctx_params.n_batch = n_batch
+        ctx_params.n_seq_max = n_seq_max + n_prefix_slots
+        ctx_params.n_threads = llm.context_params.n_threads
+        ctx_params.n_threads_batch = llm.context_params.n_threads_batch
+        self._ctx = llama_cpp.llama_new_context_with_model(llm.model, ctx_params)
+        if not self._ctx:
+            raise RuntimeError("Failed to create the multi-sequence llama.cpp context.")
+        self._batch = llama_cpp.llama_batch_init(n_batch, 0, n_seq_max + n_prefix_slots)
+
+        self._end_tokens = {llm.token_eos()}
+        end_of_turn = llm.tokenize(b"<end_of_turn>", add_bos=False, special=True)
+        if len(end_of_turn) == 1:
+            self._end_tokens.add(end_of_turn[0])
+
+        self._waiting: "queue.Queue[GenerationRequest | None]" = queue.Queue()
+        self._free_seq_ids = list(range(n_seq_max))
+        self._free_prefix_seq_ids = list(range(n_seq_max, n_seq_max + n_prefix_slots))
+        self._prefixes: list[tuple[int, list[int]]] = []  # (seq_id, tokens) of evaluated prefixes
+        self._active: list[GenerationRequest] = []
+        self._reserved_cells = 0
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="llm-batching-scheduler", daemon=True)
+        self._thread.start()
+        scheduler_logger.info(
+            "Batching scheduler started: n_seq_max=%d, n_ctx_per_seq=%d, n_batch=%d", n_seq_max, n_ctx_per_seq, n_batch
+        )
+
+    # --- Public API ---
+    def submit(self, prompt: str, max_tokens: int, temperature: float, top_p: float, top_k: int,
+               repeat_penalty: float, stop: list[str], on_text=None, grammar: str | None = None) -> Future:
+        """
+        Queues a prompt for generation. The returned future resolves to the generated text.
+        If `on_text` is given it is called from the scheduler thread with each new piece of text.
+        If `grammar` (GBNF, root rule "root") is given, only tokens the grammar allows are sampled.
+        """
+        prompt_tokens = self.llm.tokenize(prompt.encode("utf-8"), add_bos=True, special=True)
+        if len(prompt_tokens) >= self.n_ctx_per_seq:
+            future: Future = Future()
+            future.set_exception(ValueError(
+                f"Prompt has {len(prompt_tokens)} tokens, exceeding the per-sequence context of {self.n_ctx_per_seq}."
+            ))
+            return future
+        max_tokens = min(max_tokens, self.n_ctx_per_seq - len(prompt_tokens))
+        request = GenerationRequest(prompt_tokens, max_tokens, temperature, top_p, top_k, repeat_penalty, stop, on_text, grammar)
+        self._waiting.put(request)
+        return request.future
+
+    def add_prefix(self, prefix: str):
+        """Evaluates `prefix` once so later prompts starting with it can reuse its KV cells."""
+        tokens = self.llm.tokenize(prefix.encode("utf-8"), add_bos=True, special=True)
+        self._waiting.put(_PrefixJob(tokens))
+
+    def stop(self):
+        self._running = False
+        self._waiting.put(None)
+        self._thread.join(timeout=5)
+        if self._thread.is_alive():
+            # Still inside a decode; freeing the context under it would crash the process
+            scheduler_logger.warning("Batching scheduler did not stop within 5s; leaving its context allocated.")
+            return
+        llama_cpp.llama_batch_free(self._batch)
+        llama_cpp.llama_free(self._ctx)
+
+    # --- Scheduler loop ---
+    def _run(self):
+        pending: GenerationRequest | _PrefixJob | None = None
+        while self._running:
+            try:
+                pending = self._run_once(pending)
+            except Exception as e:
+                # Never let the thread die with callers still blocked on their futures
+                scheduler_logger.error("Batching scheduler loop failed: %s", e, exc_info=True)
+                self._fail_all(e, pending)
+                pending = None
+
+        self._fail_all(RuntimeError("Batching scheduler stopped."), pending)
+
+    def _run_once(self, pending: "GenerationRequest | _PrefixJob | None") -> "GenerationRequest | _PrefixJob | None":
+        """One scheduler iteration. Returns the request still waiting for admission, if any."""
+        # Block only when there is nothing to decode.
+        try:
+            if pending is None:
+                pending = self._waiting.get(block=not self._active)
+        except queue.Empty:
+            pending = None
+        if pending is None and not self._running:
+            return None
+        if isinstance(pending, _PrefixJob):
+            self._load_prefix(pending.tokens)
+            return None
+
+        # Admit as many waiting requests as there are free sequences and KV cells for.
+        # A prefix job stops admission; the next iteration loads it.
+        while isinstance(pending, GenerationRequest) and self._can_admit(pending):
+            self._admit(pending)
+            try:
+                pending = self._waiting.get_nowait()
+            except queue.Empty:
+                pending = None
+
+        if self._active:
+            try:
+                self._step()
+            except Exception as e:
+                scheduler_logger.error("Batched decode step failed: %s", e, exc_info=True)
+                for request in list(self._active):
+                    self._finish(request, error=e)
+        return pending
+
+    def _fail_all(self, error: Exception, pending: "GenerationRequest | _PrefixJob | None"):
+        """Fails every active request and the one waiting for admission with `error`."""
+        for request in list(self._active):
+            try:
+                self._finish(request, error=error)
+            except Exception:
+                if request in self._active:
+                    self._active.remove(request)
+                if not request.future.done():
+                    request.future.set_exception(error)
+        if isinstance(pending, GenerationRequest) and not pending.future.done():
+            pending.future.set_exception(error)
+
+    def _can_admit(self, request: GenerationRequest) -> bool:
+        return bool(self._free_seq_ids) and self._reserved_cells + request.kv_cells_needed <= self.n_ctx
+
+    def _admit(self, request: GenerationRequest):
+        try:
+            request.sampler = self._build_sampler(request)
+        except Exception as e:
+            request.future.set_exception(e)
+            return
+        request.seq_id = self._free_seq_ids.pop()
+        shared = self._attach_prefix(request)
+        request.n_prefilled = shared
+        request.n_past = shared
+        request.reserved_cells = request.kv_cells_needed - shared
+        self._reserved_cells += request.reserved_cells
+        self._active.append(request)
+
+    def _attach_prefix(self, request: GenerationRequest) -> int:
+        """Shares the longest matching cached prefix into the request's sequence. Returns its length."""
+        best_seq_id, best_len = None, 0
+        for seq_id, tokens in self._prefixes:
+            # Keep at least one prompt token to evaluate, so the request gets its own logits.
+            length = min(common_prefix_length(tokens, request.prompt_tokens), len(request.prompt_tokens) - 1)
+            if length > best_len:
+                best_seq_id, best_len = seq_id, length
+        if best_seq_id is not None:
+            _kv_cache_seq_cp(self._ctx, best_seq_id, request.seq_id, 0, best_len)
+        return best_len
+
+    def _load_prefix(self, tokens: list[int]):
+        if any(existing == tokens for _, existing in self._prefixes):
+            return
+        if not self._free_prefix_seq_ids or len(tokens) > PREFIX_MAX_TOKENS:
+            scheduler_logger.warning("Not caching prompt prefix of %d tokens (no free prefix slot or too long).", len(tokens))
+            return
+        seq_id = self._free_prefix_seq_ids.pop()
+        for start in range(0, len(tokens), self.n_batch):
+            self._batch.n_tokens = 0
+            end = min(start + self.n_batch, len(tokens))
+            for pos in range(start, end):
+                self._batch_add(tokens[pos], pos, seq_id, pos == end - 1)
+            result = llama_cpp.llama_decode(self._ctx, self._batch)
+            if result != 0:
+                scheduler_logger.error("Evaluating prompt prefix failed: llama_decode returned %s", result)
+                _kv_cache_seq_rm(self._ctx, seq_id)
+                self._free_prefix_seq_ids.append(seq_id)
+                return
+        self._prefixes.append((seq_id, tokens))
+        scheduler_logger.info("Cached prompt prefix of %d tokens in sequence %d.", len(tokens), seq_id)
+
+    def _build_sampler(self, request: GenerationRequest):
+        grammar_sampler = _sampler_init_grammar(self.llm.model, request.grammar) if request.grammar else None
+        chain = llama_cpp.llama_sampler_chain_init(llama_cpp.llama_sampler_chain_default_params())
+        if grammar_sampler is not None:
+            llama_cpp.llama_sampler_chain_add(chain, grammar_sampler)
+        if request.temperature <= 0:
+            llama_cpp.llama_sampler_chain_add(chain, llama_cpp.llama_sampler_init_greedy())
+            return chain
+        llama_cpp.llama_sampler_chain_add(chain, llama_cpp.llama_sampler_init_top_k(request.top_k))
+        llama_cpp.llama_sampler_chain_add(chain, llama_cpp.llama_sampler_init_top_p(request.top_p, 1))
+        llama_cpp.llama_sampler_chain_add(chain, llama_cpp.llama_sampler_init_temp(request.temperature))
+        llama_cpp.llama_sampler_chain_add(chain, llama_cpp.llama_sampler_init_dist(llama_cpp.LLAMA_DEFAULT_SEED))
+        return chain
+
+    def _batch_add(self, token: int, pos: int, seq_id: int, want_logits: bool) -> int:
+        i = self._batch.n_tokens
+        self._batch.token[i] = token
+        self._batch.pos[i] = pos
+        self._batch.n_seq_id[i] = 1
+        self._batch.seq_id[i][0] = seq_id
+        self._batch.logits[i] = want_logits
+        self._batch.n_tokens += 1
+        return i
+
+    def _step(self):
+        self._batch.n_tokens = 0
+        budget = self.n_batch
+
+        # 1) One token for every sequence that is already generating.
+        for request in self._active:
+            request.logits_index = None
+            if request.n_prefilled == len(request.prompt_tokens) and request.generated_tokens:
+                request.logits_index = self._batch_add(request.generated_tokens[-1], request.n_past, request.seq_id, True)
+                request.n_past += 1
+                budget -= 1
+
+        # 2) Fill the rest of the batch with prompt chunks of newly admitted sequences.
+        for request in self._active:
+            if budget <= 0:
+                break
+            remaining = len(request.prompt_tokens) - request.n_prefilled
+            if remaining <= 0:
+                continue
+            chunk = min(remaining, budget)
+            for offset in range(chunk):
+                pos = request.n_prefilled + offset
+                is_last_prompt_token = pos == len(request.prompt_tokens) - 1
+                index = self._batch_add(request.prompt_tokens[pos], pos, request.seq_id, is_last_prompt_token)
+                if is_last_prompt_token:
+                    request.logits_index = index
+            request.n_prefilled += chunk
+            request.n_past = request.n_prefilled
+            budget -= chunk
+
+        if self._batch.n_tokens == 0:
+            return
+
+        result = llama_cpp.llama_decode(self._ctx, self._batch)
+        if result != 0:
+            raise RuntimeError(f"llama_decode returned {result}")
+
+        # 3) Sample the next token for every sequence that produced logits.
+        for request in list(self._active):
+            if request.logits_index is None:
+                continue
+            token = self._sample(request)
+            self._accept_token(request, token)
+
+    def _sample(self, request: GenerationRequest) -> int:
+        if request.repeat_penalty != 1.0 and request.generated_tokens:
+            logits = np.ctypeslib.as_array(
+                llama_cpp.llama_get_logits_ith(self._ctx, request.logits_index), shape=(self.n_vocab,)
+            )
+            recent = np.unique(np.array(request.generated_tokens[-REPEAT_PENALTY_LAST_N:], dtype=np.int64))
+            values = logits[recent]
+            logits[recent] = np.where(values > 0, values / request.repeat_penalty, values * request.repeat_penalty)
+        return llama_cpp.llama_sampler_sample(request.sampler, self._ctx, request.logits_index)
+
+    def _accept_token(self, request: GenerationRequest, token: int):
+        if token in self._end_tokens:
+            self._finish(request)
+            return
+
+        request.generated_tokens.append(token)
+        request.generated_bytes += self.llm.detokenize([token])
+        previous_len = len(request.text)
+        request.text = request.generated_bytes.decode("utf-8", errors="ignore")
+
+        # Only the tail can contain a stop sequence that was not there before.
+        for stop_sequence in request.stop:
+            search_from = max(0, previous_len - len(stop_sequence) + 1)
+            stop_index = request.text.find(stop_sequence, search_from)
+            if stop_index != -1:
+                request.text = request.text[:stop_index]
+                self._finish(request)
+                return
+
+        if len(request.generated_tokens) >= request.max_tokens:
+            self._finish(request)
+            return
+
+        # Hold back text that could still turn out to be the start of a stop sequence.
+        if request.on_text is not None:
+            hold_back = max((len(s) - 1 for s in request.stop), default=0)
+            if not self._emit_text(request, len(request.text) - hold_back):
+                self._finish(request)
+
+    def _emit_text(self, request: GenerationRequest, upto: int) -> bool:
+        if upto <= request.emitted_len:
+            return True
+        piece = request.text[request.emitted_len:upto]
+        request.emitted_len = upto
+        return request.on_text(piece) is not False
+
+    def _finish(self, request: GenerationRequest, error: Exception | None = None):
+        _kv_cache_seq_rm(self._ctx, request.seq_id)
+        llama_cpp.llama_sampler_free(request.sampler)
+        self._active.remove(request)
+        self._free_seq_ids.append(request.seq_id)
+        self._reserved_cells -= request.reserved_cells
+        if request.future.done():  # Cancelled by the caller while decoding
+            return
+        if error is None and request.on_text is not None:
+            self._emit_text(request, len(request.text))
+        if error is not None:
+            request.future.set_exception(error)
+        else:
+            request.future.set_result(request.text)
@@ -0,0 +1,112 @@
+# backend/ai_core/inference_client.py
+# Client for the inference sidecar (see inference_server.py). Each uvicorn worker talks to the one
+# sidecar process over a Unix socket instead of loading its own copy of the models.
+#
+# Protocol: one request per connection, newline-delimited JSON in both directions.
+#   {"op": "status"}   -> {"type": "status", ...AgentLoader.status()}
+#   {"op": "metrics"}  -> {"type": "metrics", "inference_executor": ..., "mcq_semantic_cache": ..., "mcq_output_budget": ...}
+#   {"op": "generate", "topic": ..., "num_questions": ..., "use_cache": ...} -> {"type": "result", "mcqs": [...]}
+#   {"op": "stream", "topic": ..., "num_questions": ..., "background": ...} -> {"type": "accepted"}, {"type": "mcq", "mcq": {...}}..., {"type": "done"}
+# Any request can instead be answered with {"type": "error", "error": "queue_full" | "not_ready" | "failed", ...}.
+import asyncio
+import json
+import os
+
+from ai_core.inference_executor import InferenceQueueFullError
+
+INFERENCE_SIDECAR_SOCKET = os.getenv("INFERENCE_SIDECAR_SOCKET", "")
+DEFAULT_SIDECAR_SOCKET = "/tmp/english-agent-inference.sock"
+SIDECAR_READ_LIMIT = 4 * 1024 * 1024  # Max size of one response line
+
+
+class InferenceSidecarError(RuntimeError):
+    """Raised when the sidecar cannot be reached or answers with an error."""
+
+
+async def read_message(reader: asyncio.StreamReader) -> dict | None:
+    line = await reader.readline()
+    return json.loads(line) if line else None
+
+
+async def write_message(writer: asyncio.StreamWriter, message: dict):
+    writer.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+    await writer.drain()
+
+
+def _raise_for_error(message: dict | None):
+    if message is None:
+        raise InferenceSidecarError("Inference sidecar closed the connection.")
+    if message.get("type") != "error":
+        return
+    if message.get("error") == "queue_full":
+        raise InferenceQueueFullError(message.get("retry_after", 30))
+    raise InferenceSidecarError(message.get("detail") or message.get("error", "unknown error"))
+
+
+class RemoteAgent:
+    """Stands in for MainCoreAgent in the web workers; every call is forwarded to the sidecar."""
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+
+    async def _request(self, request: dict):
+        try:
+            reader, writer = await asyncio.open_unix_connection(self.socket_path, limit=SIDECAR_READ_LIMIT)
+        except OSError as e:
+            raise InferenceSidecarError(f"Cannot connect to the inference sidecar at {self.socket_path}: {e}") from e
+        await write_message(writer, request)
+        return reader, writer
+
+    async def _call(self, request: dict) -> dict:
+        reader, writer = await self._request(request)
+        try:
+            message = await read_message(reader)
+        finally:
+            writer.close()
+        _raise_for_error(message)
+        return message
+
+    async def status(self) -> dict:
+        message = await self._call({"op": "status"})
+        message.pop("type", None)
+        return message
+
+    async def ametrics(self) -> dict:
+        message = await self._call({"op": "metrics"})
+        message.pop("type", None)
+        return message
+
+    async def agenerate_mcqs_with_rag(self, user_topic: str, num_questions: int = 5, use_cache: bool = True) -> list:
+        message = await self._call({
+            "op": "generate", "topic": user_topic, "num_questions": num_questions, "use_cache": use_cache
+        })
+        return message["mcqs"]
+
+    async def astream_mcqs_with_rag(self, user_topic: str, num_questions: int = 5, background: bool = False):
+        """
+        Opens a streaming generation on the sidecar and returns an async iterator over the MCQs.
+        Raises InferenceQueueFullError here, before iteration, if the sidecar's queue is full
+        (or, with background=True, if the sidecar is busy with user work).
+        """
+        reader, writer = await self._request({
+            "op": "stream", "topic": user_topic, "num_questions": num_questions, "background": background
+        })
+        try:
+            _raise_for_error(await read_message(reader))
+        except BaseException:
+            writer.close()
+            raise
+
+        async def iterate():
+            try:
+                while True:
+                    message = await read_message(reader)
+                    _raise_for_error(message)
+                    if message["type"] == "done":
+                        return
+                    yield message["mcq"]
+            finally:
+                # Closing early tells the sidecar to stop generating
+                writer.close()
+
+        return iterate()
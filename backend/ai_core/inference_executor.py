@@ -0,0 +1,174 @@
+# backend/ai_core/inference_executor.py
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+executor_logger = logging.getLogger(__name__)
+
+# --- Configuration ---
+# llama.cpp releases the GIL while evaluating, so a thread pool keeps the event loop
+# free without duplicating the model in another process.
+# With continuous batching enabled (see llm_service), one job per batch sequence can run at once.
+_DEFAULT_CONCURRENCY = (
+    int(os.getenv("LLM_MAX_BATCH_SEQUENCES", 4))
+    if os.getenv("LLM_BATCHING_ENABLED", "false").lower() == "true" else 1
+)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", _DEFAULT_CONCURRENCY))
+LLM_MAX_QUEUE_DEPTH = int(os.getenv("LLM_MAX_QUEUE_DEPTH", 8))
+LLM_RETRY_AFTER_SECONDS = int(os.getenv("LLM_RETRY_AFTER_SECONDS", 30))
+
+
+class InferenceQueueFullError(RuntimeError):
+    """Raised when the inference queue cannot accept another job."""
+
+    def __init__(self, retry_after_seconds: int):
+        super().__init__(f"Inference queue is full. Retry after {retry_after_seconds}s.")
+        self.retry_after_seconds = retry_after_seconds
+
+
+class InferenceExecutor:
+    """
+    Bounded thread pool for blocking LLM work.
+    At most `max_concurrency` jobs run at once and at most `max_queue_depth` more wait;
+    anything beyond that is rejected immediately with InferenceQueueFullError.
+
+    Background work (topic pool refills, see stream_background) runs on a separate thread, one job
+    at a time, and only while no user job is running or queued. It neither takes a pool slot nor
+    counts against the queue depth, and it is expected to stop once has_foreground_work() turns true.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue_depth: int, retry_after_seconds: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue_depth = max(0, max_queue_depth)
+        self.retry_after_seconds = retry_after_seconds
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="llm-inference")
+        self._lock = threading.Lock()
+        self._in_flight = 0  # running + queued jobs
+        self._rejected = 0
+        self._background_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-background")
+        self._background_in_flight = False
+
+    @property
+    def capacity(self) -> int:
+        return self.max_concurrency + self.max_queue_depth
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Schedules `fn` on the pool, or raises InferenceQueueFullError if the queue is full."""
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                executor_logger.warning("Inference queue full (%d/%d). Rejecting job.", self._in_flight, self.capacity)
+                raise InferenceQueueFullError(self.retry_after_seconds)
+            self._in_flight += 1
+
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    async def run(self, fn, *args, **kwargs):
+        """Submits `fn` and awaits its result without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stream(self, gen_fn, *args, **kwargs):
+        """
+        Runs the blocking generator `gen_fn` on the pool and returns an async iterator over its items.
+        The queue slot is reserved immediately, so InferenceQueueFullError is raised here, not on iteration.
+        """
+        return self._stream(self.submit, gen_fn, args, kwargs)
+
+    def stream_background(self, gen_fn, *args, **kwargs):
+        """
+        Like stream(), for work no user is waiting on. Raises InferenceQueueFullError unless the executor
+        is idle. `gen_fn` should check has_foreground_work() as it goes and return early once it is true,
+        so a user job that arrives meanwhile waits for one decode step rather than the whole job.
+        """
+        with self._lock:
+            if self._in_flight > 0 or self._background_in_flight:
+                raise InferenceQueueFullError(self.retry_after_seconds)
+            self._background_in_flight = True
+
+        def submit_background(fn) -> Future:
+            try:
+                future = self._background_pool.submit(fn)
+            except Exception:
+                self._release_background()
+                raise
+            future.add_done_callback(lambda _: self._release_background())
+            return future
+
+        return self._stream(submit_background, gen_fn, args, kwargs)
+
+    def has_foreground_work(self) -> bool:
+        """Whether a user job is running or queued; background work should yield to it."""
+        with self._lock:
+            return self._in_flight > 0
+
+    def _stream(self, submit, gen_fn, args, kwargs):
+        loop = asyncio.get_running_loop()
+        items: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        consumer_gone = threading.Event()
+
+        def pump():
+            generator = gen_fn(*args, **kwargs)
+            try:
+                for item in generator:
+                    if consumer_gone.is_set():
+                        break
+                    loop.call_soon_threadsafe(items.put_nowait, item)
+            finally:
+                generator.close()
+                loop.call_soon_threadsafe(items.put_nowait, finished)
+
+        future = submit(pump)
+
+        async def iterate():
+            try:
+                while (item := await items.get()) is not finished:
+                    yield item
+                await asyncio.wrap_future(future)  # Surface errors raised by the generator
+            finally:
+                consumer_gone.set()
+
+        return iterate()
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def _release_background(self):
+        with self._lock:
+            self._background_in_flight = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": self._in_flight,
+                "max_concurrency": self.max_concurrency,
+                "max_queue_depth": self.max_queue_depth,
+                "rejected": self._rejected,
+                "background_in_flight": self._background_in_flight,
+            }
+
+    def shutdown(self):
+        executor_logger.info("Shutting down inference executor...")
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._background_pool.shutdown(wait=False, cancel_futures=True)
+
+
+# --- Global executor instance ---
+inference_executor = InferenceExecutor(
+    max_concurrency=LLM_MAX_CONCURRENCY,
+    max_queue_depth=LLM_MAX_QUEUE_DEPTH,
+    retry_after_seconds=LLM_RETRY_AFTER_SECONDS,
+)
+
+
+def get_inference_executor() -> InferenceExecutor:
+    return inference_executor
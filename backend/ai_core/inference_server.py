@@ -0,0 +1,113 @@
+# backend/ai_core/inference_server.py
+# Inference sidecar: the only process that loads the embedding model, the FAISS index and the GGUF
+# model. Web workers started with INFERENCE_SIDECAR_SOCKET set forward their AI calls here (see
+# inference_client.py), so adding uvicorn workers does not add copies of the models.
+#
+# Run from the backend directory, next to the web workers:
+#   INFERENCE_SIDECAR_SOCKET=/tmp/english-agent-inference.sock python -m ai_core.inference_server
+#   INFERENCE_SIDECAR_SOCKET=/tmp/english-agent-inference.sock uvicorn main:app --workers 4
+import asyncio
+import logging
+import os
+
+from ai_core.inference_client import (
+    INFERENCE_SIDECAR_SOCKET, DEFAULT_SIDECAR_SOCKET, read_message, write_message
+)
+from ai_core.inference_executor import InferenceQueueFullError, get_inference_executor
+from ai_core.llm_service import stop_batching_scheduler
+from agent_loader import AgentLoader, AGENT_LOADING_RETRY_AFTER_SECONDS
+from log_config import configure_logging
+
+server_logger = logging.getLogger(__name__)
+
+# The sidecar always builds the agent itself, whatever the environment says about sidecars.
+sidecar_agent_loader = AgentLoader(sidecar_socket=None)
+
+
+async def _handle_generate(writer, agent, request: dict):
+    try:
+        mcqs = await agent.agenerate_mcqs_with_rag(
+            request["topic"], request.get("num_questions", 5), request.get("use_cache", True)
+        )
+    except InferenceQueueFullError as e:
+        await write_message(writer, {"type": "error", "error": "queue_full", "retry_after": e.retry_after_seconds})
+        return
+    await write_message(writer, {"type": "result", "mcqs": mcqs})
+
+
+async def _handle_stream(writer, agent, request: dict):
+    try:
+        mcq_stream = await agent.astream_mcqs_with_rag(
+            request["topic"], request.get("num_questions", 5), request.get("background", False)
+        )
+    except InferenceQueueFullError as e:
+        await write_message(writer, {"type": "error", "error": "queue_full", "retry_after": e.retry_after_seconds})
+        return
+    await write_message(writer, {"type": "accepted"})
+    try:
+        async for mcq in mcq_stream:
+            await write_message(writer, {"type": "mcq", "mcq": mcq})
+    finally:
+        # A client that disconnected makes write_message raise; closing the stream stops generation.
+        await mcq_stream.aclose()
+    await write_message(writer, {"type": "done"})
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        request = await read_message(reader)
+        if request is None:
+            return
+        op = request.get("op")
+
+        if op == "status":
+            await write_message(writer, {"type": "status", **sidecar_agent_loader.status()})
+        elif op == "metrics":
+            if sidecar_agent_loader.is_ready:
+                metrics = await sidecar_agent_loader.agent.ametrics()
+            else:
+                metrics = {"inference_executor": get_inference_executor().stats(), "mcq_semantic_cache": None, "mcq_output_budget": None}
+            await write_message(writer, {"type": "metrics", **metrics})
+        elif op in ("generate", "stream"):
+            if not sidecar_agent_loader.is_ready:
+                await write_message(writer, {
+                    "type": "error", "error": "not_ready", "retry_after": AGENT_LOADING_RETRY_AFTER_SECONDS,
+                    "detail": f"Agent is {sidecar_agent_loader.state}."
+                })
+            elif op == "generate":
+                await _handle_generate(writer, sidecar_agent_loader.agent, request)
+            else:
+                await _handle_stream(writer, sidecar_agent_loader.agent, request)
+        else:
+            await write_message(writer, {"type": "error", "error": "failed", "detail": f"Unknown op '{op}'."})
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass  # Client went away
+    except Exception as e:
+        server_logger.exception("Error while handling request.")
+        try:
+            await write_message(writer, {"type": "error", "error": "failed", "detail": str(e)})
+        except ConnectionError:
+            pass
+    finally:
+        writer.close()
+
+
+async def serve(socket_path: str):
+    if os.path.exists(socket_path):
+        os.remove(socket_path)  # Left over from a previous run
+    sidecar_agent_loader.start()
+    server = await asyncio.start_unix_server(handle_connection, path=socket_path)
+    server_logger.info("Listening on %s", socket_path)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        stop_batching_scheduler()
+        get_inference_executor().shutdown()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(serve(INFERENCE_SIDECAR_SOCKET or DEFAULT_SIDECAR_SOCKET))
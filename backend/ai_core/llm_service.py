@@ -1,12 +1,29 @@
 # backend/ai_core/llm_service.py
-from llama_cpp import Llama
+from llama_cpp import Llama, LlamaGrammar
 from pathlib import Path
 import os
+import sys
 import logging
+import threading
+import queue
+import functools
 
-# Configure basic logging for the service
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - LLM_SERVICE: %(message)s')
+try:
+    from batching_scheduler import BatchingScheduler, common_prefix_length
+except ImportError:
+    from ai_core.batching_scheduler import BatchingScheduler, common_prefix_length
+
+try:
+    from log_config import PAYLOAD_LOGGER_NAME
+except ImportError:
+    # Run directly from ai_core/: log_config.py is in the backend directory above
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    from log_config import PAYLOAD_LOGGER_NAME
+
+# Handlers and levels are configured by the process (log_config.configure_logging), not here
 llm_service_logger = logging.getLogger(__name__)  # Create a logger specific to this module
+# Full prompts and responses; off unless LOG_PAYLOADS=true (see log_config.py)
+payload_logger = logging.getLogger(PAYLOAD_LOGGER_NAME)
 
 # --- Configuration ---
 MODEL_DIR = Path(__file__).resolve().parent.parent / "models"
@@ -16,34 +33,165 @@ MODEL_PATH_STR = str(MODEL_DIR / MODEL_BASENAME)
 N_CTX_VAL = 8192
 N_GPU_LAYERS_VAL = 0
 SEED_VAL = 42
+# The GGUF weights are mmap'd read-only, so they live in the page cache and are shared by every
+# process that opens the same file instead of being copied into each one.
+LLM_USE_MMAP = os.getenv("LLM_USE_MMAP", "true").lower() == "true"
+
+# Continuous batching: concurrent query_gemma_gguf calls are decoded together in one
+# multi-sequence context. Each sequence gets its own LLM_BATCH_CTX_PER_SEQ slice of the KV cache.
+LLM_BATCHING_ENABLED = os.getenv("LLM_BATCHING_ENABLED", "false").lower() == "true"
+LLM_MAX_BATCH_SEQUENCES = int(os.getenv("LLM_MAX_BATCH_SEQUENCES", 4))
+LLM_BATCH_CTX_PER_SEQ = int(os.getenv("LLM_BATCH_CTX_PER_SEQ", 4096))
+LLM_BATCH_SIZE = int(os.getenv("LLM_BATCH_SIZE", 512))
+LLM_MAX_PROMPT_PREFIXES = int(os.getenv("LLM_MAX_PROMPT_PREFIXES", 2))
 
 # --- Global LLM instance ---
 llm_instance = None
+# A single llama.cpp context is not thread-safe; calls coming from the inference executor
+# threads are serialized on this lock.
+_llm_lock = threading.RLock()
 
 def get_llm_instance():
+    with _llm_lock:
+        return _load_llm_instance()
+
+def _load_llm_instance():
     global llm_instance
     if llm_instance is None:
         if not os.path.exists(MODEL_PATH_STR):
-            llm_service_logger.error(f"Model file not found: {MODEL_PATH_STR}")
+            llm_service_logger.error("Model file not found: %s", MODEL_PATH_STR)
             raise FileNotFoundError(f"Model file not found: {MODEL_PATH_STR}")
         try:
-            llm_service_logger.info(f"Initializing GGUF model from {MODEL_PATH_STR} with n_ctx={N_CTX_VAL}, n_gpu_layers={N_GPU_LAYERS_VAL}, seed={SEED_VAL}, verbose=True")
+            llm_service_logger.info(
+                "Initializing GGUF model from %s with n_ctx=%s, n_gpu_layers=%s, seed=%s, verbose=True",
+                MODEL_PATH_STR, N_CTX_VAL, N_GPU_LAYERS_VAL, SEED_VAL
+            )
             llm_instance = Llama(
                 model_path=MODEL_PATH_STR,
                 n_ctx=N_CTX_VAL,
                 n_gpu_layers=N_GPU_LAYERS_VAL,
                 seed=SEED_VAL,
+                use_mmap=LLM_USE_MMAP,
+                use_mlock=False,
                 verbose=True
             )
             llm_service_logger.info("GGUF model initialized successfully.")
         except Exception as e:
-            llm_service_logger.critical(f"Failed to initialize GGUF model: {e}", exc_info=True)
+            llm_service_logger.critical("Failed to initialize GGUF model: %s", e, exc_info=True)
             raise
     return llm_instance
 
+# --- Global batching scheduler (only used when LLM_BATCHING_ENABLED) ---
+batching_scheduler = None
+
+def get_batching_scheduler():
+    """Returns the shared BatchingScheduler, creating it on first use. None if batching is unavailable."""
+    global batching_scheduler, LLM_BATCHING_ENABLED
+    with _llm_lock:
+        if batching_scheduler is None and LLM_BATCHING_ENABLED:
+            try:
+                batching_scheduler = BatchingScheduler(
+                    _load_llm_instance(),
+                    n_seq_max=LLM_MAX_BATCH_SEQUENCES,
+                    n_ctx_per_seq=min(LLM_BATCH_CTX_PER_SEQ, N_CTX_VAL),
+                    n_batch=LLM_BATCH_SIZE,
+                    n_prefix_slots=LLM_MAX_PROMPT_PREFIXES
+                )
+                for prefix in _prompt_prefixes:
+                    batching_scheduler.add_prefix(prefix)
+            except Exception as e:
+                llm_service_logger.error(
+                    "LLM_SERVICE: Could not start batching scheduler, falling back to serial generation: %s", e, exc_info=True
+                )
+                LLM_BATCHING_ENABLED = False
+        return batching_scheduler
+
+def stop_batching_scheduler():
+    """Stops the shared BatchingScheduler, failing its in-flight requests, and frees its llama context."""
+    global batching_scheduler, LLM_BATCHING_ENABLED
+    with _llm_lock:
+        scheduler, batching_scheduler = batching_scheduler, None
+        LLM_BATCHING_ENABLED = False  # Shutting down: do not start another one
+    if scheduler is not None:
+        llm_service_logger.info("LLM_SERVICE: Stopping batching scheduler...")
+        scheduler.stop()
+
+# --- Prompt prefix KV cache ---
+# Prompt templates register their fixed instruction preamble here. The evaluated KV state of
+# each preamble is kept, so a query only prefills the part of the prompt that follows it.
+_prompt_prefixes: list[str] = []
+_prefix_states = {}  # prefix text -> LlamaState after evaluating the prefix
+
+def register_prompt_prefix(prefix: str):
+    """Marks `prefix` as a shared prompt preamble whose KV state should be cached and reused."""
+    with _llm_lock:
+        if prefix in _prompt_prefixes or len(_prompt_prefixes) >= LLM_MAX_PROMPT_PREFIXES:
+            return
+        _prompt_prefixes.append(prefix)
+        if batching_scheduler is not None:
+            batching_scheduler.add_prefix(prefix)
+    llm_service_logger.info("LLM_SERVICE: Registered prompt prefix (%d chars) for KV cache reuse.", len(prefix))
+
+def _restore_prompt_prefix(llm, prompt: str):
+    """
+    Makes sure the context holds the KV state of the registered prefix `prompt` starts with.
+    Llama.__call__ then skips the tokens already in the context. Caller must hold _llm_lock.
+    """
+    prefix = next((p for p in _prompt_prefixes if prompt.startswith(p)), None)
+    if prefix is None:
+        return
+
+    state = _prefix_states.get(prefix)
+    if state is None:
+        prefix_tokens = llm.tokenize(prefix.encode("utf-8"), special=True)
+        llm_service_logger.info("LLM_SERVICE: Evaluating prompt prefix of %d tokens for the KV cache...", len(prefix_tokens))
+        llm.reset()
+        llm.eval(prefix_tokens)
+        _prefix_states[prefix] = llm.save_state()
+        return
+
+    prompt_tokens = llm.tokenize(prompt.encode("utf-8"), special=True)
+    already_in_context = common_prefix_length(llm.input_ids, prompt_tokens)
+    if common_prefix_length(state.input_ids[:state.n_tokens], prompt_tokens) > already_in_context:
+        llm_service_logger.debug("LLM_SERVICE: Restoring cached prompt prefix KV state.")
+        llm.load_state(state)
+
 MODEL_PATH = MODEL_PATH_STR
 N_CTX = N_CTX_VAL
 
+@functools.lru_cache(maxsize=16)
+def _compile_grammar(grammar: str) -> LlamaGrammar:
+    """Parses a GBNF grammar once; prompt templates reuse the same few grammars."""
+    return LlamaGrammar.from_string(grammar, verbose=False)
+
+# --- Token counting ---
+# Prompt budgets are computed with the model's own tokenizer. Counts of static prompt
+# fragments are cached, so per request only the dynamic parts need to be tokenized.
+def get_context_window() -> int:
+    """Number of context tokens a single request (prompt + generation) can use."""
+    return min(LLM_BATCH_CTX_PER_SEQ, N_CTX_VAL) if LLM_BATCHING_ENABLED else N_CTX_VAL
+
+def tokenize_text(text: str) -> list[int]:
+    """Tokenizes `text` with the GGUF vocab, without BOS, parsing special tokens such as <start_of_turn>."""
+    return get_llm_instance().tokenize(text.encode("utf-8"), add_bos=False, special=True)
+
+def count_tokens(text: str) -> int:
+    return len(tokenize_text(text))
+
+@functools.lru_cache(maxsize=128)
+def count_static_tokens(fragment: str) -> int:
+    """count_tokens for fixed prompt fragments; the result is cached per fragment."""
+    return count_tokens(fragment)
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Returns the longest prefix of `text` that is at most `max_tokens` tokens long."""
+    if max_tokens <= 0:
+        return ""
+    tokens = tokenize_text(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return get_llm_instance().detokenize(tokens[:max_tokens]).decode("utf-8", errors="ignore")
+
 def query_gemma_gguf(
     prompt: str,
     max_tokens: int = 2048,
@@ -51,8 +199,13 @@ def query_gemma_gguf(
     top_p: float = 0.95,
     top_k: int = 40,
     repeat_penalty: float = 1.1,
-    stop: list[str] | None = None
+    stop: list[str] | None = None,
+    grammar: str | None = None
 ) -> str:
+    """
+    Generates a completion for `prompt`. If `grammar` (GBNF text) is given, sampling is constrained
+    so the output always matches it. Errors are returned as an "Error: ..." string.
+    """
     global llm_instance
     if llm_instance is None:
         llm_service_logger.info("LLM_SERVICE: GGUF model not loaded. Attempting to load...")
@@ -64,12 +217,88 @@ def query_gemma_gguf(
     if stop is None:
         stop = ["<|eot_id|>", "<|end_of_turn|>"]  # Default stop tokens for Gemma if not provided
 
-    llm_service_logger.info(f"LLM_SERVICE: Preparing to query GGUF model. Max tokens: {max_tokens}, Temp: {temperature}")
-    llm_service_logger.debug(f"LLM_SERVICE: Full prompt being sent to GGUF model:\n{prompt}")  # Log the full prompt
+    llm_service_logger.debug("LLM_SERVICE: Preparing to query GGUF model. Max tokens: %d, Temp: %s", max_tokens, temperature)
+    payload_logger.debug("LLM_SERVICE: Full prompt being sent to GGUF model:\n%s", prompt)
 
     try:
-        llm_service_logger.info("LLM_SERVICE: Sending request to LlamaCPP model...")
-        output = llm_instance(
+        scheduler = get_batching_scheduler()
+        if scheduler is not None:
+            llm_service_logger.debug("LLM_SERVICE: Submitting request to the batching scheduler...")
+            response_text = scheduler.submit(
+                prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                top_k=top_k,
+                repeat_penalty=repeat_penalty,
+                stop=stop,
+                grammar=grammar
+            ).result().strip()
+            llm_service_logger.debug("LLM_SERVICE: Received response from the batching scheduler.")
+        else:
+            llm_service_logger.debug("LLM_SERVICE: Sending request to LlamaCPP model...")
+            with _llm_lock:
+                _restore_prompt_prefix(llm_instance, prompt)
+                output = llm_instance(
+                    prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    top_p=top_p,
+                    top_k=top_k,
+                    repeat_penalty=repeat_penalty,
+                    stop=stop,
+                    grammar=_compile_grammar(grammar) if grammar else None,
+                    echo=False  # Ensure echo is False to avoid prompt in output
+                )
+            llm_service_logger.debug("LLM_SERVICE: Received response from LlamaCPP model.")
+
+            # Extract the text from the response structure
+            response_text = output['choices'][0]['text'].strip() if output and output['choices'] and output['choices'][0]['text'] else ""
+        
+        payload_logger.debug("LLM_SERVICE: GGUF model raw response (full):\n%s", response_text)
+        llm_service_logger.info("LLM_SERVICE: GGUF model returned %d characters.", len(response_text))
+
+        return response_text
+    except Exception as e:
+        llm_service_logger.error("LLM_SERVICE: Error during GGUF model query: %s", e, exc_info=True)
+        # Log more details about the exception
+        if hasattr(e, 'response') and e.response is not None:
+            llm_service_logger.error("LLM_SERVICE: Exception response status: %s", e.response.status_code)
+            llm_service_logger.error("LLM_SERVICE: Exception response text: %s", e.response.text)
+        return f"Error: Exception during model query - {str(e)}"
+
+def stream_gemma_gguf(
+    prompt: str,
+    max_tokens: int = 2048,
+    temperature: float = 0.7,
+    top_p: float = 0.95,
+    top_k: int = 40,
+    repeat_penalty: float = 1.1,
+    stop: list[str] | None = None,
+    grammar: str | None = None
+):
+    """
+    Streaming counterpart of query_gemma_gguf: yields pieces of generated text as they are decoded.
+    Unlike query_gemma_gguf, errors are raised instead of being returned as an "Error:" string.
+    Closing the generator early stops the generation.
+    """
+    get_llm_instance()
+    if stop is None:
+        stop = ["<|eot_id|>", "<|end_of_turn|>"]
+
+    llm_service_logger.debug("LLM_SERVICE: Preparing to stream from GGUF model. Max tokens: %d, Temp: %s", max_tokens, temperature)
+    payload_logger.debug("LLM_SERVICE: Full prompt being sent to GGUF model:\n%s", prompt)
+
+    scheduler = get_batching_scheduler()
+    if scheduler is not None:
+        pieces = queue.Queue()
+        closed = threading.Event()
+
+        def on_text(piece: str) -> bool:
+            pieces.put(piece)
+            return not closed.is_set()
+
+        future = scheduler.submit(
             prompt,
             max_tokens=max_tokens,
             temperature=temperature,
@@ -77,30 +306,43 @@ def query_gemma_gguf(
             top_k=top_k,
             repeat_penalty=repeat_penalty,
             stop=stop,
-            echo=False  # Ensure echo is False to avoid prompt in output
+            on_text=on_text,
+            grammar=grammar
         )
-        llm_service_logger.info("LLM_SERVICE: Received response from LlamaCPP model.")
-        
-        # Extract the text from the response structure
-        response_text = output['choices'][0]['text'].strip() if output and output['choices'] and output['choices'][0]['text'] else ""
-        
-        llm_service_logger.debug(f"LLM_SERVICE: GGUF model raw response (full):\n{response_text}")  # Log the full raw response
-        llm_service_logger.info(f"LLM_SERVICE: GGUF model raw response (first 150 chars): {response_text[:150]}")
+        future.add_done_callback(lambda _: pieces.put(None))
+        try:
+            while (piece := pieces.get()) is not None:
+                yield piece
+            future.result()  # Re-raise a failed generation
+        finally:
+            closed.set()
+        return
 
-        return response_text
-    except Exception as e:
-        llm_service_logger.error(f"LLM_SERVICE: Error during GGUF model query: {e}", exc_info=True)
-        # Log more details about the exception
-        if hasattr(e, 'response') and e.response is not None:
-            llm_service_logger.error(f"LLM_SERVICE: Exception response status: {e.response.status_code}")
-            llm_service_logger.error(f"LLM_SERVICE: Exception response text: {e.response.text}")
-        return f"Error: Exception during model query - {str(e)}"
+    with _llm_lock:
+        _restore_prompt_prefix(llm_instance, prompt)
+        for output in llm_instance(
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            repeat_penalty=repeat_penalty,
+            stop=stop,
+            grammar=_compile_grammar(grammar) if grammar else None,
+            echo=False,
+            stream=True
+        ):
+            piece = output['choices'][0]['text']
+            if piece:
+                yield piece
 
 if __name__ == "__main__":
+    # Standalone test run: log everything, prompts included, straight to the console
+    logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - LLM_SERVICE: %(message)s')
     llm_service_logger.info("LLM Service Test Block: Initializing and testing query_gemma_gguf...")
     try:
         test_prompt = "What is the capital of France? Explain in one short sentence."
-        llm_service_logger.info(f"Test: Sending prompt: '{test_prompt}'")
+        llm_service_logger.info("Test: Sending prompt: '%s'", test_prompt)
         
         response_text = query_gemma_gguf(
             test_prompt,
@@ -121,9 +363,9 @@ if __name__ == "__main__":
         elif not response_text.strip():
             llm_service_logger.warning("Test: Resulted in an empty response.")
         elif len(response_text) < 10 and not any(c.isalpha() for c in response_text):
-            llm_service_logger.warning(f"Test: Response seems garbled or too short: '{response_text}'")
+            llm_service_logger.warning("Test: Response seems garbled or too short: '%s'", response_text)
         else:
             llm_service_logger.info("Test: Completed. Review output above.")
 
     except Exception as e:
-        llm_service_logger.critical(f"Test: An error occurred during the test: {e}", exc_info=True)
+        llm_service_logger.critical("Test: An error occurred during the test: %s", e, exc_info=True)
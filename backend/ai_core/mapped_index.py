@@ -0,0 +1,38 @@
+# backend/ai_core/mapped_index.py
+# The KB's FAISS index, serialized once next to the embeddings and memory-mapped on load. With
+# IO_FLAG_MMAP_IFC the flat index searches the file's pages directly, so every process that loads it
+# shares them through the OS page cache. (IO_FLAG_MMAP alone still copies the vectors into the heap.)
+from pathlib import Path
+
+import faiss
+import numpy as np
+
+try:
+    from mapped_texts import write_atomically
+except ImportError:
+    from ai_core.mapped_texts import write_atomically
+
+# Zero-copy mapping of IndexFlat vectors; older faiss builds lack it and read the index into memory
+_MMAP_FLAGS = (faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY) if hasattr(faiss, "IO_FLAG_MMAP_IFC") else None
+
+
+def is_stale(embeddings_path: Path, index_path: Path) -> bool:
+    """True if the index file is missing or older than the embeddings it was built from."""
+    return not index_path.exists() or index_path.stat().st_mtime < embeddings_path.stat().st_mtime
+
+
+def build_flat_index(embeddings_path: Path, index_path: Path):
+    """Builds an IndexFlatL2 over the .npy embeddings and writes it to `index_path` atomically."""
+    embeddings = np.load(embeddings_path).astype(np.float32, copy=False)
+    if embeddings.ndim != 2 or embeddings.shape[0] == 0:
+        raise ValueError(f"Expected a non-empty 2-D embeddings array in {embeddings_path}, got shape {embeddings.shape}")
+    index = faiss.IndexFlatL2(embeddings.shape[1])
+    index.add(embeddings)
+    write_atomically(index_path, lambda f: faiss.write_index(index, faiss.PyCallbackIOWriter(f.write)))
+
+
+def load_index(index_path: Path) -> tuple[faiss.Index, bool]:
+    """Returns the index and whether it is memory-mapped (False means this process holds its own copy)."""
+    if _MMAP_FLAGS is None:
+        return faiss.read_index(str(index_path)), False
+    return faiss.read_index(str(index_path), _MMAP_FLAGS), True
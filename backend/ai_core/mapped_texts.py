@@ -0,0 +1,73 @@
+# backend/ai_core/mapped_texts.py
+import mmap
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+
+def write_atomically(path: Path, write):
+    """
+    Calls `write(f)` on a temporary file next to `path`, then renames it into place. Processes that
+    mapped the old file keep reading it intact, and concurrent builders never see a half-written one.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class MappedTexts:
+    """
+    Read-only list of strings backed by a memory-mapped file: the UTF-8 texts are stored back to back
+    in `blob_path` and their end offsets in `offsets_path` (.npy). Every process that opens the same
+    files shares their pages through the OS page cache instead of holding its own copy.
+    """
+
+    def __init__(self, blob_path: Path, offsets_path: Path):
+        self._offsets = np.load(offsets_path, mmap_mode="r")
+        with open(blob_path, "rb") as f:
+            # mmap cannot map an empty file
+            self._blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if Path(blob_path).stat().st_size else b""
+
+    @staticmethod
+    def build(texts: list[str], blob_path: Path, offsets_path: Path):
+        """
+        Writes both files next to their targets and renames them into place, so a process that
+        already mapped the old files keeps reading them intact while several workers build at once.
+        """
+        encoded = [text.encode("utf-8") for text in texts]
+        write_atomically(blob_path, lambda f: f.writelines(encoded))
+        offsets = np.cumsum([len(data) for data in encoded], dtype=np.int64)
+        write_atomically(offsets_path, lambda f: np.save(f, offsets))
+
+    @staticmethod
+    def is_stale(source_path: Path, blob_path: Path, offsets_path: Path) -> bool:
+        """True if the mapped files are missing or older than the source they were built from."""
+        if not blob_path.exists() or not offsets_path.exists():
+            return True
+        source_mtime = source_path.stat().st_mtime
+        return blob_path.stat().st_mtime < source_mtime or offsets_path.stat().st_mtime < source_mtime
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("MappedTexts index out of range")
+        start = int(self._offsets[index - 1]) if index > 0 else 0
+        return self._blob[start:int(self._offsets[index])].decode("utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
@@ -0,0 +1,64 @@
+# backend/ai_core/output_budget.py
+import math
+import os
+import threading
+from collections import deque
+
+# --- Configuration ---
+# Output tokens reserved per MCQ until enough real completions have been measured; 350 is what the
+# RAG prompt reserved per MCQ before context packing.
+MCQ_OUTPUT_TOKENS_PER_MCQ = int(os.getenv("MCQ_OUTPUT_TOKENS_PER_MCQ", 350))
+MCQ_OUTPUT_BUDGET_PERCENTILE = float(os.getenv("MCQ_OUTPUT_BUDGET_PERCENTILE", 0.95))
+MCQ_OUTPUT_BUDGET_HEADROOM = float(os.getenv("MCQ_OUTPUT_BUDGET_HEADROOM", 1.2))
+MCQ_OUTPUT_BUDGET_MIN_SAMPLES = int(os.getenv("MCQ_OUTPUT_BUDGET_MIN_SAMPLES", 10))
+MCQ_OUTPUT_BUDGET_WINDOW = int(os.getenv("MCQ_OUTPUT_BUDGET_WINDOW", 200))
+
+
+class OutputTokenBudget:
+    """
+    Output tokens to reserve per MCQ, learned from completed generations.
+    Until `min_samples` completions have been recorded this is `default_per_mcq`. After that it is the
+    `percentile` of the per-MCQ token counts of the last `window` completions, times `headroom`.
+    A completion that needed more than the budget in force when it was recorded counts as an overrun.
+    """
+
+    def __init__(self, default_per_mcq: int, percentile: float, headroom: float, min_samples: int, window: int):
+        self.default_per_mcq = default_per_mcq
+        self.percentile = percentile
+        self.headroom = headroom
+        self.min_samples = max(1, min_samples)
+        self._samples: deque[float] = deque(maxlen=max(1, window))
+        self._lock = threading.Lock()
+        self.overruns = 0
+
+    def per_mcq(self) -> int:
+        with self._lock:
+            return self._per_mcq()
+
+    def _per_mcq(self) -> int:
+        if len(self._samples) < self.min_samples:
+            return self.default_per_mcq
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+        return math.ceil(ordered[max(0, index)] * self.headroom)
+
+    def record(self, completion_tokens: int, num_mcqs: int) -> bool:
+        """Records a completion of `num_mcqs` MCQs; returns whether it overran the current budget."""
+        if num_mcqs <= 0:
+            return False
+        tokens_per_mcq = completion_tokens / num_mcqs
+        with self._lock:
+            overran = tokens_per_mcq > self._per_mcq()
+            if overran:
+                self.overruns += 1
+            self._samples.append(tokens_per_mcq)
+        return overran
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "per_mcq": self._per_mcq(),
+                "samples": len(self._samples),
+                "max_observed_per_mcq": math.ceil(max(self._samples)) if self._samples else None,
+                "overruns": self.overruns,
+            }
@@ -0,0 +1,97 @@
+# backend/ai_core/semantic_cache.py
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+# --- Configuration ---
+MCQ_CACHE_SIMILARITY_THRESHOLD = float(os.getenv("MCQ_CACHE_SIMILARITY_THRESHOLD", 0.9))
+MCQ_CACHE_TTL_SECONDS = int(os.getenv("MCQ_CACHE_TTL_SECONDS", 3600))
+MCQ_CACHE_MAX_ENTRIES = int(os.getenv("MCQ_CACHE_MAX_ENTRIES", 256))
+
+
+class _CacheEntry:
+    def __init__(self, topic: str, unit_embedding: np.ndarray, mcqs: list):
+        self.topic = topic
+        self.unit_embedding = unit_embedding
+        self.mcqs = mcqs
+        self.created_at = time.monotonic()
+
+
+class SemanticMCQCache:
+    """
+    Cache of generated MCQ sets keyed by topic embedding.
+    A lookup hits when the cosine similarity between the query embedding and a cached topic's
+    embedding reaches the threshold, so "past simple" and "simple past" share one generation.
+    Entries expire after `ttl_seconds`; past `max_entries` the least recently used one is evicted.
+    """
+
+    def __init__(self, similarity_threshold: float, ttl_seconds: int, max_entries: int):
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _expire(self):
+        now = time.monotonic()
+        expired = [key for key, entry in self._entries.items() if now - entry.created_at > self.ttl_seconds]
+        for key in expired:
+            del self._entries[key]
+            self.evictions += 1
+
+    def lookup(self, embedding, num_questions: int) -> list | None:
+        """Returns `num_questions` MCQs sampled from the closest cached topic, or None on a miss."""
+        query = self._normalize(embedding)
+        with self._lock:
+            self._expire()
+            best_key, best_similarity = None, -1.0
+            for key, entry in self._entries.items():
+                similarity = float(np.dot(query, entry.unit_embedding))
+                if similarity > best_similarity:
+                    best_key, best_similarity = key, similarity
+
+            if best_key is None or best_similarity < self.similarity_threshold:
+                self.misses += 1
+                return None
+            entry = self._entries[best_key]
+            if len(entry.mcqs) < num_questions:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(best_key)
+            self.hits += 1
+            return random.sample(entry.mcqs, num_questions)
+
+    def store(self, topic: str, embedding, mcqs: list):
+        if not mcqs:
+            return
+        with self._lock:
+            self._entries[topic] = _CacheEntry(topic, self._normalize(embedding), list(mcqs))
+            self._entries.move_to_end(topic)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,90 @@
+# backend/answer_store.py
+# Write path for a single answered question. Recording the answer, updating the wrongdoing entry,
+# bumping the dashboard's snapshot_version and reading the user's points are one SQL statement, so
+# /answer costs one database round trip and its writes commit or fail together.
+import os
+import uuid
+from datetime import datetime, timezone
+
+from prisma import Prisma
+
+from dashboard_snapshots import dashboard_snapshots
+
+# --- Spaced repetition ---
+# Each wrong question carries SM-2 style review state: an ease factor, the current review interval and
+# next_due_at. A wrong answer makes the question due again after RETEST_RELEARN_DELAY_SECONDS and
+# lowers its ease; a correct one raises its ease and schedules the next review
+# RETEST_FIRST_INTERVAL_SECONDS later, then interval * ease later each time after that. After
+# RETEST_GRADUATION_REPETITIONS correct answers in a row the question counts as retested correctly and
+# leaves the retest queue. The defaults keep the original behaviour: a wrong question is due at once
+# and one correct retest clears it; raise RETEST_GRADUATION_REPETITIONS to opt into longer schedules.
+RETEST_RELEARN_DELAY_SECONDS = int(os.getenv("RETEST_RELEARN_DELAY_SECONDS", 0))
+RETEST_FIRST_INTERVAL_SECONDS = int(os.getenv("RETEST_FIRST_INTERVAL_SECONDS", 24 * 3600))
+RETEST_GRADUATION_REPETITIONS = max(1, int(os.getenv("RETEST_GRADUATION_REPETITIONS", 1)))
+RETEST_EASE_BONUS = 0.1
+RETEST_EASE_PENALTY = 0.2
+RETEST_MIN_EASE = 1.3
+
+# $1 user id, $2 question id, $3 selected option, $4 is correct, $5 now (UTC), $6 answer id, $7 wrongdoing id.
+#
+# The wrongdoing entry is a single conditional upsert:
+#   wrong answer   -> create the entry, or reset it to "not retested", due after the relearn delay;
+#   correct answer -> count a repetition on an existing, not yet retested entry and schedule its
+#                     next review; never create one.
+RECORD_ANSWER_SQL = f"""
+WITH "answer" AS (
+    INSERT INTO "user_answers" ("id", "user_id", "question_id", "selected_option_id", "is_correct", "timestamp")
+    VALUES ($6, $1, $2, $3, $4::boolean, $5::timestamptz AT TIME ZONE 'UTC')
+), "wrongdoing" AS (
+    INSERT INTO "user_wrongdoing_questions"
+        ("id", "user_id", "question_id", "timestamp_marked_wrong", "retested_correctly", "next_due_at")
+    SELECT
+        $7, $1, $2, $5::timestamptz AT TIME ZONE 'UTC', false,
+        ($5::timestamptz AT TIME ZONE 'UTC') + make_interval(secs => {RETEST_RELEARN_DELAY_SECONDS})
+    WHERE NOT $4::boolean OR EXISTS (
+        SELECT 1 FROM "user_wrongdoing_questions" WHERE "user_id" = $1 AND "question_id" = $2
+    )
+    ON CONFLICT ("user_id", "question_id") DO UPDATE SET
+        "timestamp_marked_wrong" = CASE
+            WHEN $4::boolean THEN "user_wrongdoing_questions"."timestamp_marked_wrong"
+            ELSE EXCLUDED."timestamp_marked_wrong"
+        END,
+        "retested_correctly" = $4::boolean
+            AND "user_wrongdoing_questions"."repetitions" + 1 >= {RETEST_GRADUATION_REPETITIONS},
+        "repetitions" = CASE WHEN $4::boolean THEN "user_wrongdoing_questions"."repetitions" + 1 ELSE 0 END,
+        "ease" = CASE
+            WHEN $4::boolean THEN "user_wrongdoing_questions"."ease" + {RETEST_EASE_BONUS}
+            ELSE GREATEST({RETEST_MIN_EASE}, "user_wrongdoing_questions"."ease" - {RETEST_EASE_PENALTY})
+        END,
+        "interval_seconds" = CASE
+            WHEN NOT $4::boolean THEN 0
+            WHEN "user_wrongdoing_questions"."interval_seconds" = 0 THEN {RETEST_FIRST_INTERVAL_SECONDS}
+            ELSE ROUND("user_wrongdoing_questions"."interval_seconds" * "user_wrongdoing_questions"."ease")::integer
+        END,
+        "next_due_at" = EXCLUDED."timestamp_marked_wrong" + make_interval(secs => CASE
+            WHEN NOT $4::boolean THEN {RETEST_RELEARN_DELAY_SECONDS}
+            WHEN "user_wrongdoing_questions"."interval_seconds" = 0 THEN {RETEST_FIRST_INTERVAL_SECONDS}
+            ELSE ROUND("user_wrongdoing_questions"."interval_seconds" * "user_wrongdoing_questions"."ease")
+        END)
+    WHERE NOT $4::boolean OR NOT "user_wrongdoing_questions"."retested_correctly"
+), "dashboard" AS (
+    UPDATE "user_dashboard_data" SET "snapshot_version" = "snapshot_version" + 1
+    WHERE "user_id" = $1
+    RETURNING "total_points"
+)
+SELECT COALESCE((SELECT "total_points" FROM "dashboard"), 0) AS "current_points"
+"""
+
+
+async def record_answer(db: Prisma, user_id: str, question_id: str, selected_option_id: str, is_correct: bool) -> int:
+    """
+    Stores the answer and updates the user's wrongdoing entry for the question in one round trip.
+    Returns the user's current total points.
+    """
+    rows = await db.query_raw(
+        RECORD_ANSWER_SQL,
+        user_id, question_id, selected_option_id, is_correct,
+        datetime.now(timezone.utc).isoformat(), uuid.uuid4().hex, uuid.uuid4().hex
+    )
+    dashboard_snapshots.invalidate(user_id)
+    return rows[0]["current_points"]
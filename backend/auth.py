@@ -1,8 +1,11 @@
 \
 # backend/auth.py
+import logging
 import os
 from fastapi import Request, HTTPException
 
+auth_logger = logging.getLogger(__name__)
+
 async def get_current_user_id_from_header(request: Request) -> str:
     """
     Placeholder: Extracts User ID from a custom header.
@@ -10,14 +13,14 @@ async def get_current_user_id_from_header(request: Request) -> str:
     """
     user_id = request.headers.get("X-User-ID")
     if not user_id:
-        print("Warning: X-User-ID header not found in request.")
+        auth_logger.warning("X-User-ID header not found in request.")
         default_test_user_id = os.getenv("DEFAULT_TEST_USER_ID")
         if default_test_user_id:
-            print(f"Using DEFAULT_TEST_USER_ID: {default_test_user_id}")
+            auth_logger.info("Using DEFAULT_TEST_USER_ID: %s", default_test_user_id)
             return default_test_user_id
         raise HTTPException(
             status_code=401,
             detail="Not authenticated: X-User-ID header is missing."
         )
-    print(f"Authenticated (placeholder) with User ID: {user_id}")
+    auth_logger.debug("Authenticated (placeholder) with User ID: %s", user_id)
     return user_id
@@ -0,0 +1,107 @@
+# backend/bench_responses.py
+# Measures per-request response serialization for the hot polling payloads. No database or server
+# is needed:
+#   python bench_responses.py               # 2000 renders of each payload
+#   python bench_responses.py --number 10000
+#
+# "default" is what FastAPI does with a returned model: build and validate it against the
+# response_model, jsonable_encoder it, then render it with the standard library JSONResponse.
+# "fast" is what the routes now do with trusted content: render the dict with FastJSONResponse.
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from responses import FastJSONResponse
+from schemas import DashboardDataResponse, WrongQuestionHistoryPage, SubmitQuizSessionResponse
+
+# A full points history: dashboard_store.MAX_POINTS_HISTORY_ITEMS, not imported since that pulls in prisma
+POINTS_HISTORY_ITEMS = 50
+
+
+def _sample_dashboard() -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "user_id": "bench-user",
+        "total_points": 1230,
+        "previous_session_points": 40,
+        "points_history": [
+            {
+                "timestamp": (now - timedelta(days=i)).isoformat(),
+                "points": 10 * (i % 6),
+                "topic_id": f"ai_topic_present_perfect_{i % 3}",
+            }
+            for i in range(POINTS_HISTORY_ITEMS)
+        ],
+        "last_5_wrong_questions": [
+            {
+                "question_id": f"question-{i}",
+                "question_text": "Choose the sentence that uses the present perfect correctly. " * 2,
+                "timestamp_marked_wrong": (now - timedelta(hours=i)).isoformat(),
+            }
+            for i in range(5)
+        ],
+    }
+
+
+def _sample_history_page() -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "items": [
+            {
+                "id": f"wrongdoing-{i}",
+                "question_id": f"question-{i}",
+                "question_text": "Which word completes the sentence: She has lived here ___ 2019?",
+                "timestamp_marked_wrong": (now - timedelta(minutes=i)).isoformat(),
+                "retested_correctly": False,
+            }
+            for i in range(20)
+        ],
+        "next_cursor": "wrongdoing-19",
+    }
+
+
+def _sample_session_submit() -> dict:
+    return {
+        "message": "Quiz session submitted successfully and dashboard updated.",
+        "session_points_earned": 40,
+        "updated_dashboard_data": {**_sample_dashboard(), "last_5_wrong_questions": []},
+    }
+
+
+PAYLOADS = [
+    ("GET /api/dashboard", DashboardDataResponse, _sample_dashboard()),
+    ("GET /api/dashboard/wrong-questions", WrongQuestionHistoryPage, _sample_history_page()),
+    ("POST /api/mcqs/session/submit", SubmitQuizSessionResponse, _sample_session_submit()),
+]
+
+
+def render_default(model_class, content: dict) -> bytes:
+    return JSONResponse(content=jsonable_encoder(model_class(**content))).body
+
+
+def render_fast(content: dict) -> bytes:
+    return FastJSONResponse(content=content).body
+
+
+def main(number: int) -> int:
+    for name, model_class, content in PAYLOADS:
+        default_body = render_default(model_class, content)
+        fast_body = render_fast(content)
+        # Both must be the same JSON document, only rendered differently
+        if FastJSONResponse(content=None).render(jsonable_encoder(model_class(**content))) != fast_body:
+            print(f"FAIL {name}: fast rendering differs from the validated model")
+            return 1
+
+        default_us = min(timeit.repeat(lambda: render_default(model_class, content), number=number, repeat=3)) / number * 1e6
+        fast_us = min(timeit.repeat(lambda: render_fast(content), number=number, repeat=3)) / number * 1e6
+        print(f"{name}: default {default_us:.1f} us, fast {fast_us:.1f} us per response "
+              f"({default_us / fast_us:.1f}x, {len(default_body)} -> {len(fast_body)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[sys.argv.index("--number") + 1]) if "--number" in sys.argv else 2000
+    sys.exit(main(number))
@@ -0,0 +1,81 @@
+# backend/dashboard_snapshots.py
+# In-process read model of GET /api/dashboard. Each user's rendered dashboard is kept with the
+# user_dashboard_data.snapshot_version it was built from. Every write that changes the dashboard
+# (answers, session submits, resets) bumps that version in the same statement, so a snapshot is
+# still current exactly when its version matches the row.
+#
+# A snapshot checked less than DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS ago is served without touching
+# the database; after that one primary-key read of the version revalidates it. Writes handled by
+# this worker drop the user's snapshot right away; the max age bounds how long another worker's
+# write can go unnoticed here (0 revalidates on every request).
+import hashlib
+import os
+import time
+from collections import OrderedDict
+
+# --- Configuration ---
+DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS = float(os.getenv("DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS", 2))
+DASHBOARD_SNAPSHOT_MAX_ENTRIES = int(os.getenv("DASHBOARD_SNAPSHOT_MAX_ENTRIES", 10000))
+
+
+def dashboard_etag(user_id: str, version: int) -> str:
+    # Includes the user so a browser shared by two accounts never revalidates one's copy with the other's tag
+    user_tag = hashlib.sha1(user_id.encode("utf-8")).hexdigest()[:12]
+    return f'"{user_tag}-{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+class DashboardSnapshot:
+    def __init__(self, user_id: str, version: int, content: dict):
+        self.user_id = user_id
+        self.version = version
+        self.content = content  # JSON-ready DashboardDataResponse
+        self.etag = dashboard_etag(user_id, version)
+        self.checked_at = time.monotonic()
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self.checked_at < DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS
+
+
+class DashboardSnapshotCache:
+    """Latest dashboard snapshot per user; past `max_entries` the least recently used one is evicted."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._snapshots: "OrderedDict[str, DashboardSnapshot]" = OrderedDict()
+        self.hits = 0
+        self.revalidations = 0
+        self.rebuilds = 0
+
+    def get(self, user_id: str) -> DashboardSnapshot | None:
+        snapshot = self._snapshots.get(user_id)
+        if snapshot is not None:
+            self._snapshots.move_to_end(user_id)
+        return snapshot
+
+    def put(self, snapshot: DashboardSnapshot):
+        self._snapshots[snapshot.user_id] = snapshot
+        self._snapshots.move_to_end(snapshot.user_id)
+        while len(self._snapshots) > self.max_entries:
+            self._snapshots.popitem(last=False)
+
+    def invalidate(self, user_id: str):
+        self._snapshots.pop(user_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._snapshots),
+            "hits": self.hits,
+            "revalidations": self.revalidations,
+            "rebuilds": self.rebuilds,
+        }
+
+
+dashboard_snapshots = DashboardSnapshotCache(DASHBOARD_SNAPSHOT_MAX_ENTRIES)
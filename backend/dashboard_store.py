@@ -0,0 +1,134 @@
+# backend/dashboard_store.py
+# Writes to UserDashboardData. Each one is a single SQL statement, so concurrent requests for the
+# same user cannot overwrite each other's points: increments are evaluated by Postgres against the
+# row it has locked, never against a value the application read earlier.
+import json
+import uuid
+from datetime import datetime, timezone
+
+from prisma import Prisma
+from prisma.partials import DashboardTotals
+
+from dashboard_snapshots import dashboard_snapshots
+
+# Points history is one PointsHistoryEntry row per finished session. Writes only insert a row;
+# readers take the newest MAX_POINTS_HISTORY_ITEMS through the (user_id, timestamp) index.
+MAX_POINTS_HISTORY_ITEMS = 50
+
+# Renders history rows `h` as the JSON array the API returns, oldest first. Timestamps are stored
+# in UTC without a zone, so the offset is spelled out for clients.
+POINTS_HISTORY_JSON_SQL = """
+COALESCE(jsonb_agg(jsonb_build_object(
+    'timestamp', to_char("h"."timestamp", 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"'),
+    'points', "h"."points",
+    'topic_id', "h"."topic_id"
+) ORDER BY "h"."timestamp"), '[]'::jsonb)::text
+"""
+
+LATEST_POINTS_HISTORY_SQL = """
+SELECT "timestamp", "points", "topic_id" FROM "points_history_entries"
+WHERE "user_id" = $1
+ORDER BY "timestamp" DESC
+LIMIT {limit}
+"""
+
+# Records the session's history entry and, on the same statement, creates the dashboard row on a
+# user's first session or adds the points to the stored total. Returns the updated row with the
+# newest history; the new entry is not yet visible to the history scan, so it is added explicitly.
+RECORD_SESSION_POINTS_SQL = f"""
+WITH "new_entry" AS (
+    INSERT INTO "points_history_entries" ("id", "user_id", "points", "topic_id", "timestamp")
+    VALUES ($3, $1, $2, $4, $5::timestamptz AT TIME ZONE 'UTC')
+    RETURNING "timestamp", "points", "topic_id"
+), "dashboard" AS (
+    INSERT INTO "user_dashboard_data" ("user_id", "total_points", "previous_session_points", "snapshot_version")
+    VALUES ($1, $2, $2, 1)
+    ON CONFLICT ("user_id") DO UPDATE SET
+        "total_points" = "user_dashboard_data"."total_points" + EXCLUDED."total_points",
+        "previous_session_points" = EXCLUDED."previous_session_points",
+        "snapshot_version" = "user_dashboard_data"."snapshot_version" + 1
+    RETURNING "user_id", "total_points", "previous_session_points"
+)
+SELECT "dashboard".*, (
+    SELECT {POINTS_HISTORY_JSON_SQL} FROM (
+        ({LATEST_POINTS_HISTORY_SQL.format(limit=MAX_POINTS_HISTORY_ITEMS - 1)})
+        UNION ALL
+        SELECT "timestamp", "points", "topic_id" FROM "new_entry"
+    ) AS "h"
+) AS "points_history"
+FROM "dashboard"
+"""
+
+FETCH_POINTS_HISTORY_SQL = f"""
+SELECT {POINTS_HISTORY_JSON_SQL} AS "points_history"
+FROM ({LATEST_POINTS_HISTORY_SQL.format(limit=MAX_POINTS_HISTORY_ITEMS)}) AS "h"
+"""
+
+CLEAR_POINTS_HISTORY_SQL = 'DELETE FROM "points_history_entries" WHERE "user_id" = $1'
+
+RESET_DASHBOARD_POINTS_SQL = """
+UPDATE "user_dashboard_data" SET
+    "total_points" = 0,
+    "previous_session_points" = 0,
+    "snapshot_version" = "snapshot_version" + 1
+WHERE "user_id" = $1
+"""
+
+# Every write that changes what GET /api/dashboard shows bumps snapshot_version (see dashboard_snapshots.py)
+DASHBOARD_VERSION_SQL = 'SELECT "snapshot_version" FROM "user_dashboard_data" WHERE "user_id" = $1'
+
+# Creates an empty row unless one exists; safe when several requests race to create it.
+ENSURE_DASHBOARD_ROW_SQL = """
+INSERT INTO "user_dashboard_data" ("user_id") VALUES ($1)
+ON CONFLICT ("user_id") DO NOTHING
+"""
+
+
+async def record_session_points(db: Prisma, user_id: str, points: int, topic_id: str | None) -> dict:
+    """
+    Adds a finished session's points to the user's dashboard in one round trip.
+    Returns the updated row (user_id, total_points, previous_session_points) with the parsed
+    points_history, oldest first.
+    """
+    rows = await db.query_raw(
+        RECORD_SESSION_POINTS_SQL,
+        user_id, points, uuid.uuid4().hex, topic_id, datetime.now(timezone.utc).isoformat()
+    )
+    dashboard_snapshots.invalidate(user_id)
+    row = rows[0]
+    row["points_history"] = json.loads(row["points_history"])
+    return row
+
+
+async def fetch_points_history(db: Prisma, user_id: str) -> list:
+    """Returns the user's newest MAX_POINTS_HISTORY_ITEMS history entries, oldest first."""
+    rows = await db.query_raw(FETCH_POINTS_HISTORY_SQL, user_id)
+    return json.loads(rows[0]["points_history"])
+
+
+async def clear_points_history(db: Prisma, user_id: str):
+    """Deletes all of the user's history entries. Pass a transaction client to make it part of a reset."""
+    await db.execute_raw(CLEAR_POINTS_HISTORY_SQL, user_id)
+
+
+async def reset_dashboard_points(db: Prisma, user_id: str):
+    """Zeroes the user's points. Pass a transaction client to make it part of a reset."""
+    await db.execute_raw(RESET_DASHBOARD_POINTS_SQL, user_id)
+
+
+async def get_dashboard_version(db: Prisma, user_id: str) -> int:
+    """Returns the user's dashboard snapshot_version, creating an empty dashboard row first if needed."""
+    rows = await db.query_raw(DASHBOARD_VERSION_SQL, user_id)
+    if not rows:
+        await db.execute_raw(ENSURE_DASHBOARD_ROW_SQL, user_id)
+        rows = await db.query_raw(DASHBOARD_VERSION_SQL, user_id)
+    return rows[0]["snapshot_version"]
+
+
+async def get_or_create_dashboard(db: Prisma, user_id: str):
+    """Returns the user's dashboard totals, creating an empty UserDashboardData first if it does not exist yet."""
+    dashboard_data = await DashboardTotals.prisma(db).find_unique(where={"userId": user_id})
+    if dashboard_data is None:
+        await db.execute_raw(ENSURE_DASHBOARD_ROW_SQL, user_id)
+        dashboard_data = await DashboardTotals.prisma(db).find_unique(where={"userId": user_id})
+    return dashboard_data
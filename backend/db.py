@@ -1,5 +1,6 @@
 # backend/db.py
 import asyncio
+import logging
 from prisma import Prisma
 from prisma.errors import PrismaError  # Import for more specific error handling if needed
 
@@ -8,16 +9,17 @@ from prisma.errors import PrismaError  # Import for more specific error handling
 # or use a context manager for requests if you prefer request-scoped sessions.
 # For simplicity with FastAPI's Depends, a global instance managed by startup/shutdown is common.
 prisma_client = Prisma(auto_register=True) # auto_register=True is helpful for some environments
+db_logger = logging.getLogger(__name__)
 
 async def connect_prisma():
     """Connects the global Prisma client if not already connected."""
     if not prisma_client.is_connected():
         try:
-            print("Attempting to connect Prisma client...")
+            db_logger.info("Attempting to connect Prisma client...")
             await prisma_client.connect()
-            print("Prisma client connected successfully.")
+            db_logger.info("Prisma client connected successfully.")
         except Exception as e:
-            print(f"Failed to connect Prisma client: {e}")
+            db_logger.error("Failed to connect Prisma client: %s", e)
             # Depending on your app's needs, you might want to raise the exception
             # or handle it in a way that allows the app to start but with DB issues flagged.
             raise # Re-raise the exception to make startup fail if DB is critical
@@ -26,11 +28,11 @@ async def disconnect_prisma():
     """Disconnects the global Prisma client if connected."""
     if prisma_client.is_connected():
         try:
-            print("Attempting to disconnect Prisma client...")
+            db_logger.info("Attempting to disconnect Prisma client...")
             await prisma_client.disconnect()
-            print("Prisma client disconnected successfully.")
+            db_logger.info("Prisma client disconnected successfully.")
         except Exception as e:
-            print(f"Error during Prisma client disconnection: {e}")
+            db_logger.error("Error during Prisma client disconnection: %s", e)
 
 async def get_db() -> Prisma:
     """
@@ -40,7 +42,7 @@ async def get_db() -> Prisma:
     if not prisma_client.is_connected():
         # This scenario should ideally be handled by the startup event,
         # but as a fallback, attempt to connect.
-        print("Prisma client not connected in get_db, attempting to connect...")
+        db_logger.warning("Prisma client not connected in get_db, attempting to connect...")
         await connect_prisma() # This might raise an error if connection fails
     return prisma_client
 
@@ -0,0 +1,134 @@
+# backend/explain_queries.py
+# Checks that every hot router query is planned onto the index meant for it.
+# Runs EXPLAIN (no ANALYZE, nothing is executed) for each query shape against the database in
+# DATABASE_URL, e.g. a local Postgres with the migrations applied:
+#   python explain_queries.py            # exit status 1 if any query misses its index
+#   python explain_queries.py --verbose  # also prints each plan
+#
+# Sequential scans are disabled for the check: on a small local database the planner would
+# otherwise prefer them, and the question here is whether a matching index exists at all.
+import asyncio
+import json
+import sys
+
+from prisma import Prisma
+
+from dashboard_store import LATEST_POINTS_HISTORY_SQL, DASHBOARD_VERSION_SQL, MAX_POINTS_HISTORY_ITEMS
+from retest_queue import NEXT_RETEST_QUESTIONS_SQL
+
+SAMPLE_USER_ID = "explain-user"
+SAMPLE_QUESTION_ID = "explain-question"
+SAMPLE_TOPIC_ID = "pool_explain"
+
+# (name, SQL as the router issues it, parameters, index the plan must use)
+# Shapes produced by Prisma calls are written out as the equivalent SQL.
+QUERY_SHAPES = [
+    (
+        "dashboard: latest wrong questions",
+        'SELECT * FROM "user_wrongdoing_questions" WHERE "user_id" = $1 '
+        'ORDER BY "timestamp_marked_wrong" DESC LIMIT 5',
+        [SAMPLE_USER_ID],
+        "user_wrongdoing_questions_user_id_timestamp_marked_wrong_idx",
+    ),
+    (
+        "dashboard: wrong-question history page",
+        'SELECT * FROM "user_wrongdoing_questions" WHERE "user_id" = $1 AND "retested_correctly" = false '
+        'ORDER BY "timestamp_marked_wrong" DESC, "id" DESC LIMIT 21',
+        [SAMPLE_USER_ID],
+        "user_wrongdoing_questions_user_id_retested_correctly_timest_idx",
+    ),
+    (
+        "dashboard: points history",
+        LATEST_POINTS_HISTORY_SQL.format(limit=MAX_POINTS_HISTORY_ITEMS),
+        [SAMPLE_USER_ID],
+        "points_history_entries_user_id_timestamp_idx",
+    ),
+    (
+        "dashboard: snapshot version",
+        DASHBOARD_VERSION_SQL,
+        [SAMPLE_USER_ID],
+        "user_dashboard_data_pkey",
+    ),
+    (
+        "retest: next due questions in the queue",
+        NEXT_RETEST_QUESTIONS_SQL,
+        [SAMPLE_USER_ID, 10, "2025-01-01T00:00:00+00:00"],
+        "user_wrongdoing_questions_user_id_retested_correctly_next_d_idx",
+    ),
+    (
+        "answer: wrongdoing upsert conflict target",
+        'SELECT * FROM "user_wrongdoing_questions" WHERE "user_id" = $1 AND "question_id" = $2',
+        [SAMPLE_USER_ID, SAMPLE_QUESTION_ID],
+        "user_wrongdoing_questions_user_id_question_id_key",
+    ),
+    (
+        "mcqs: question cache misses",
+        'SELECT * FROM "questions" WHERE "id" IN ($1, $2)',
+        [SAMPLE_QUESTION_ID, SAMPLE_QUESTION_ID + "-2"],
+        "questions_pkey",
+    ),
+    (
+        "topic pool: claim oldest questions",
+        'SELECT "id" FROM "questions" WHERE "topic_id" = $1 ORDER BY "created_at" LIMIT 5 FOR UPDATE SKIP LOCKED',
+        [SAMPLE_TOPIC_ID],
+        "questions_topic_id_created_at_idx",
+    ),
+    (
+        "topic pool: pool size",
+        'SELECT COUNT(*) FROM "questions" WHERE "topic_id" = $1',
+        [SAMPLE_TOPIC_ID],
+        "questions_topic_id_created_at_idx",
+    ),
+    (
+        "users: delete learning data",
+        'SELECT "id" FROM "user_answers" WHERE "user_id" = $1',
+        [SAMPLE_USER_ID],
+        "user_answers_user_id_idx",
+    ),
+]
+
+
+def _plan_nodes(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def explain(db: Prisma, sql: str, params: list) -> dict:
+    # SET LOCAL only lasts for the transaction, which also pins both statements to one connection
+    async with db.tx() as transaction:
+        await transaction.execute_raw("SET LOCAL enable_seqscan = off")
+        rows = await transaction.query_raw(f"EXPLAIN (FORMAT JSON) {sql}", *params)
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+async def main(verbose: bool) -> int:
+    db = Prisma()
+    await db.connect()
+    failures = 0
+    try:
+        for name, sql, params, expected_index in QUERY_SHAPES:
+            plan = await explain(db, sql, params)
+            nodes = list(_plan_nodes(plan))
+            used_indexes = {node["Index Name"] for node in nodes if "Index Name" in node}
+            seq_scans = [node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"]
+
+            ok = expected_index in used_indexes and not seq_scans
+            failures += not ok
+            print(f"{'OK  ' if ok else 'FAIL'} {name}: uses {sorted(used_indexes) or 'no index'}"
+                  + (f", seq scan on {seq_scans}" if seq_scans else "")
+                  + ("" if ok else f" (expected {expected_index})"))
+            if verbose or not ok:
+                print(json.dumps(plan, indent=2))
+    finally:
+        await db.disconnect()
+
+    print(f"{len(QUERY_SHAPES) - failures}/{len(QUERY_SHAPES)} query shapes use their index.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(verbose="--verbose" in sys.argv)))
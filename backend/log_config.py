@@ -0,0 +1,131 @@
+# backend/log_config.py
+# Logging for the backend processes. configure_logging() routes every record through a bounded
+# queue to a listener thread, so the event loop only appends to the queue: formatting and the
+# stdout write happen off the request path. Pass arguments lazily, logger.info("... %s", value),
+# rather than as f-strings, so disabled levels cost nothing; arguments must not be mutated after
+# the call, since they are formatted later on the listener thread.
+#
+# Per-request INFO and DEBUG records (routers, auth) can be sampled with LOG_REQUEST_SAMPLE_RATE;
+# warnings and errors are always kept. Prompts, model responses and answer maps are logged at
+# DEBUG on PAYLOAD_LOGGER_NAME, which stays off unless LOG_PAYLOADS=true.
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+
+# --- Configuration ---
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()  # "text" or "json" (one object per line)
+LOG_REQUEST_SAMPLE_RATE = float(os.getenv("LOG_REQUEST_SAMPLE_RATE", 1.0))
+LOG_PAYLOADS = os.getenv("LOG_PAYLOADS", "false").lower() == "true"
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10000))
+
+PAYLOAD_LOGGER_NAME = "english_agent.payloads"
+# Loggers whose records are emitted per request and so are subject to sampling
+SAMPLED_LOGGER_PREFIXES = ("routers.", "auth")
+
+_TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with any `extra=` fields alongside the message."""
+
+    _RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in self._RESERVED})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RequestSamplingFilter(logging.Filter):
+    """Keeps `rate` of the per-request records below WARNING; everything else passes."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1.0 or record.levelno >= logging.WARNING or not record.name.startswith(SAMPLED_LOGGER_PREFIXES):
+            return True
+        if random.random() < self.rate:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records as they are; drops them instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock handler formats the message here, on the caller's thread; leave it to the listener
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: logging.handlers.QueueListener | None = None
+_queue_handler: NonBlockingQueueHandler | None = None
+_sampling_filter: RequestSamplingFilter | None = None
+
+
+def configure_logging():
+    """Installs the queue handler on the root logger and starts the listener. Safe to call more than once."""
+    global _listener, _queue_handler, _sampling_filter
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else logging.Formatter(_TEXT_FORMAT))
+
+    log_queue: queue.Queue = queue.Queue(LOG_QUEUE_SIZE)
+    _sampling_filter = RequestSamplingFilter(LOG_REQUEST_SAMPLE_RATE)
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    _queue_handler.addFilter(_sampling_filter)
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = [_queue_handler]
+    root_logger.setLevel(LOG_LEVEL)
+    # Full prompts and payloads only when asked for, whatever LOG_LEVEL is
+    logging.getLogger(PAYLOAD_LOGGER_NAME).setLevel(logging.DEBUG if LOG_PAYLOADS else logging.CRITICAL + 1)
+    logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """Stops the listener after it has written out the records still queued."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def logging_stats() -> dict:
+    return {
+        "queued": _queue_handler.queue.qsize() if _queue_handler else 0,
+        "dropped": _queue_handler.dropped if _queue_handler else 0,
+        "sampled_out": _sampling_filter.sampled_out if _sampling_filter else 0,
+    }
@@ -1,4 +1,5 @@
 # backend/main.py
+import logging
 import shutil
 import os
 import uuid
@@ -17,6 +18,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv # To load .env file for BACKEND_BASE_URL if needed
 
 from db import get_db, connect_prisma, disconnect_prisma # Prisma utility functions
+from responses import FastJSONResponse
+from log_config import configure_logging, logging_stats
+from ai_core.inference_executor import get_inference_executor
+from ai_core.llm_service import stop_batching_scheduler
+from topic_pool import topic_pool_refiller
+from question_cache import question_cache
+from dashboard_snapshots import dashboard_snapshots
+from agent_loader import agent_loader, AGENT_WARMUP_ON_STARTUP
 from prisma import Prisma # Prisma client type for type hinting
 
 from auth import get_current_user_id_from_header # Added import from auth.py
@@ -28,6 +37,10 @@ from routers import users as users_router # Add this import
 # --- Load Environment Variables ---
 load_dotenv() # Load variables from .env file in the backend directory
 
+# Queue-based logging, configured before anything logs (see log_config.py)
+configure_logging()
+app_logger = logging.getLogger(__name__)
+
 # --- Configuration ---
 BACKEND_HOST = os.getenv("BACKEND_HOST", "localhost")
 BACKEND_PORT = int(os.getenv("BACKEND_PORT", 8000))
@@ -47,7 +60,8 @@ AVATARS_DIR.mkdir(parents=True, exist_ok=True)
 app = FastAPI(
     title="English MCQ Platform API",
     description="API for the Personalized English MCQ Learning Platform.",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=FastJSONResponse # orjson rendering for every route, see responses.py
 )
 
 # --- Middleware ---
@@ -74,18 +88,27 @@ app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 # --- Event Handlers for Prisma Connection ---
 @app.on_event("startup")
 async def startup_event():
-    print("FastAPI application startup...")
+    app_logger.info("FastAPI application startup...")
+    # Load the AI agent in the background; AI routes return 503 until it is ready (see /api/ready)
+    if AGENT_WARMUP_ON_STARTUP:
+        agent_loader.start()
     try:
         await connect_prisma()
+        # Keep the canonical topic question pools topped up in the background
+        topic_pool_refiller.start(await get_db(), agent_loader)
     except Exception as e:
-        print(f"CRITICAL: Database connection failed on startup: {e}")
-        # You might want to prevent the app from fully starting or log this severely
-        # For now, it will print and the app will continue starting,
+        app_logger.critical("Database connection failed on startup: %s", e)
+        # You might want to prevent the app from fully starting
+        # For now, it will log and the app will continue starting,
         # but endpoints requiring DB will fail.
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    print("FastAPI application shutdown...")
+    app_logger.info("FastAPI application shutdown...")
+    await topic_pool_refiller.stop()
+    # Fails the sequences still generating, so executor threads waiting on them return
+    stop_batching_scheduler()
+    get_inference_executor().shutdown()
     await disconnect_prisma()
 
 
@@ -96,6 +119,30 @@ async def root():
     return {"message": "Welcome to the English MCQ Platform API!"}
 
 
+@app.get("/api/ready", tags=["General"])
+async def readiness():
+    """Readiness of the AI agent, with its loading progress. Responds 503 until the agent is ready."""
+    status = agent_loader.status()
+    return FastJSONResponse(status_code=200 if status["ready"] else 503, content=status)
+
+
+@app.get("/api/metrics", tags=["General"])
+async def metrics():
+    """Operator counters for the inference queue, the in-process caches and the log queue."""
+    if agent_loader.is_ready:
+        # With an inference sidecar these are the sidecar's counters
+        agent_metrics = await agent_loader.agent.ametrics()
+    else:
+        agent_metrics = {"inference_executor": get_inference_executor().stats(), "mcq_semantic_cache": None, "mcq_output_budget": None}
+    # The question cache, dashboard snapshots and log queue live in each web worker, so these are this worker's counters
+    return {
+        **agent_metrics,
+        "question_cache": question_cache.stats(),
+        "dashboard_snapshots": dashboard_snapshots.stats(),
+        "logging": logging_stats(),
+    }
+
+
 @app.put("/api/users/me/avatar", tags=["Users"])
 async def upload_avatar(
     file: UploadFile = File(..., description="Avatar image file (PNG, JPG, GIF, WEBP)"),
@@ -106,8 +153,9 @@ async def upload_avatar(
     Uploads or updates the avatar for the authenticated user.
     The user ID is expected in the 'X-User-ID' header (for this placeholder auth).
     """
-    print(f"Received avatar upload request for user: {current_user_id}")
-    print(f"Uploaded file: {file.filename}, content type: {file.content_type}")
+    app_logger.debug(
+        "Avatar upload for user %s: %s (%s)", current_user_id, file.filename, file.content_type
+    )
 
     # Validate file type (server-side validation is important)
     allowed_content_types = ["image/jpeg", "image/png", "image/gif", "image/webp"]
@@ -134,15 +182,14 @@ async def upload_avatar(
 
     unique_filename = f"{uuid.uuid4()}{file_extension}"
     file_path_on_server = AVATARS_DIR / unique_filename
-    print(f"Attempting to save avatar to: {file_path_on_server}")
 
     try:
         # Save the file to the server
         with open(file_path_on_server, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
-        print(f"File saved successfully: {file_path_on_server}")
+        app_logger.debug("Avatar saved to %s", file_path_on_server)
     except Exception as e:
-        print(f"Error saving file: {e}")
+        app_logger.exception("Error saving avatar file %s.", file_path_on_server)
         raise HTTPException(status_code=500, detail=f"Could not save image file: {str(e)}")
     finally:
         await file.close() # Ensure the uploaded file is closed
@@ -151,7 +198,6 @@ async def upload_avatar(
     # This depends on how your static files are served and your BACKEND_BASE_URL
     # It should be /static/avatars/unique_filename because of app.mount("/static", ...)
     avatar_public_url = f"{BACKEND_BASE_URL}/static/avatars/{unique_filename}"
-    print(f"Avatar public URL: {avatar_public_url}")
 
     try:
         # Update user's avatar_url in the database
@@ -165,10 +211,10 @@ async def upload_avatar(
             # This would be unusual if current_user_id was validated, but handle defensively
             if file_path_on_server.exists():
                 os.remove(file_path_on_server) # Clean up orphaned file
-            print(f"User with ID {current_user_id} not found in database during update.")
+            app_logger.warning("User %s not found in database during avatar update.", current_user_id)
             raise HTTPException(status_code=404, detail="User not found, avatar update failed.")
 
-        print(f"Database updated successfully for user {current_user_id} with new avatar URL.")
+        app_logger.info("Updated avatar of user %s.", current_user_id)
         # Select only specific fields to return if needed, to avoid sending sensitive data
         # For now, returning the full updated_user object from Prisma is fine for testing
         return {
@@ -185,7 +231,7 @@ async def upload_avatar(
         # Clean up the saved file if database update fails to prevent orphaned files
         if file_path_on_server.exists():
             os.remove(file_path_on_server)
-        print(f"Error updating database for user {current_user_id}: {e}")
+        app_logger.exception("Error updating avatar of user %s.", current_user_id)
         # Consider more specific error handling for Prisma errors if needed
         raise HTTPException(status_code=500, detail=f"Database update failed: {str(e)}")
 
@@ -210,5 +256,5 @@ if __name__ == "__main__":
     # This block is for running directly with `python main.py` (less common for FastAPI dev)
     # Usually, you run with `uvicorn main:app --reload`
     import uvicorn
-    print(f"Starting Uvicorn server on {BACKEND_HOST}:{BACKEND_PORT}")
+    app_logger.info("Starting Uvicorn server on %s:%s", BACKEND_HOST, BACKEND_PORT)
     uvicorn.run(app, host=BACKEND_HOST, port=BACKEND_PORT)
\ No newline at end of file
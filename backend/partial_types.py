@@ -0,0 +1,22 @@
+# backend/partial_types.py
+# Partial Prisma models: typed field projections for the router queries. `prisma generate` (run from
+# the frontend directory, see partial_type_generator in schema.prisma) turns them into classes in
+# prisma_client_py/partials.py. Querying through one, e.g. `QuestionContent.prisma(db).find_many(...)`,
+# makes the query engine select and return only its fields.
+from prisma.models import Question, UserDashboardData, UserWrongdoingQuestion
+
+# What the question cache keeps: no timestamps, topic or difficulty
+Question.create_partial(
+    "QuestionContent", include={"id", "questionText", "options", "correctAnswerId", "clientPayload"}
+)
+
+# Session scoring: only the answer key, for questions not in the question cache
+Question.create_partial("QuestionAnswerKey", include={"id", "correctAnswerId"})
+
+# Dashboard totals without the legacy pointsHistory text
+UserDashboardData.create_partial("DashboardTotals", include={"userId", "totalPoints", "previousSessionPoints"})
+
+# Wrong-question lists: question text comes from the question cache, not from an include
+UserWrongdoingQuestion.create_partial(
+    "WrongdoingEntry", include={"id", "questionId", "timestampMarkedWrong", "retestedCorrectly"}
+)
@@ -1604,11 +1604,1035 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        # find the second UserDashboardData record ordered by the userId field
+        # find the second UserDashboardData record ordered by the snapshotVersion field
         userdashboarddata = await UserDashboardData.prisma().find_first_or_raise(
             skip=1,
             order={
-                'userId': 'desc',
+                'snapshotVersion': 'desc',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='find_first_or_raise',
+            model=self._model,
+            arguments={
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        )
+        return model_parse(self._model, resp['data']['result'])
+
+    async def update(
+        self,
+        data: types.UserDashboardDataUpdateInput,
+        where: types.UserDashboardDataWhereUniqueInput,
+        include: Optional[types.UserDashboardDataInclude] = None
+    ) -> Optional[_PrismaModelT]:
+        """Update a single UserDashboardData record.
+
+        Parameters
+        ----------
+        data
+            UserDashboardData record data specifying what to update
+        where
+            UserDashboardData filter to select the unique record to create / update
+        include
+            Specifies which relations should be loaded on the returned UserDashboardData model
+
+        Returns
+        -------
+        prisma.models.UserDashboardData
+            The updated UserDashboardData record
+        None
+            No record could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        userdashboarddata = await UserDashboardData.prisma().update(
+            where={
+                'userId': 'bbejhfidcb',
+            },
+            data={
+                # data to update the UserDashboardData record to
+            },
+        )
+        ```
+        """
+        try:
+            resp = await self._client._execute(
+                method='update',
+                model=self._model,
+                arguments={
+                    'data': data,
+                    'where': where,
+                    'include': include,
+                },
+            )
+        except errors.RecordNotFoundError:
+            return None
+
+        return model_parse(self._model, resp['data']['result'])
+
+    async def upsert(
+        self,
+        where: types.UserDashboardDataWhereUniqueInput,
+        data: types.UserDashboardDataUpsertInput,
+        include: Optional[types.UserDashboardDataInclude] = None,
+    ) -> _PrismaModelT:
+        """Updates an existing record or create a new one
+
+        Parameters
+        ----------
+        where
+            UserDashboardData filter to select the unique record to create / update
+        data
+            Data specifying what fields to set on create and update
+        include
+            Specifies which relations should be loaded on the returned UserDashboardData model
+
+        Returns
+        -------
+        prisma.models.UserDashboardData
+            The created or updated UserDashboardData record
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+
+        Example
+        -------
+        ```py
+        userdashboarddata = await UserDashboardData.prisma().upsert(
+            where={
+                'userId': 'bgeecijdgg',
+            },
+            data={
+                'create': {
+                    'userId': 'bgeecijdgg',
+                },
+                'update': {
+                },
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='upsert',
+            model=self._model,
+            arguments={
+                'where': where,
+                'include': include,
+                'create': data.get('create'),
+                'update': data.get('update'),
+            },
+        )
+        return model_parse(self._model, resp['data']['result'])
+
+    async def update_many(
+        self,
+        data: types.UserDashboardDataUpdateManyMutationInput,
+        where: types.UserDashboardDataWhereInput,
+    ) -> int:
+        """Update multiple UserDashboardData records
+
+        Parameters
+        ----------
+        data
+            UserDashboardData data to update the selected UserDashboardData records to
+        where
+            Filter to select the UserDashboardData records to update
+
+        Returns
+        -------
+        int
+            The total number of UserDashboardData records that were updated
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # update all UserDashboardData records
+        total = await UserDashboardData.prisma().update_many(
+            data={
+                'userId': 'bdiicjafbj'
+            },
+            where={}
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='update_many',
+            model=self._model,
+            arguments={'data': data, 'where': where,},
+            root_selection=['count'],
+        )
+        return int(resp['data']['result']['count'])
+
+    @overload
+    async def count(
+        self,
+        select: None = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.UserDashboardDataWhereInput] = None,
+        cursor: Optional[types.UserDashboardDataWhereUniqueInput] = None,
+    ) -> int:
+        """Count the number of UserDashboardData records present in the database
+
+        Parameters
+        ----------
+        select
+            Select the UserDashboardData fields to be counted
+        take
+            Limit the maximum result
+        skip
+            Ignore the first N records
+        where
+            UserDashboardData filter to find records
+        cursor
+            Specifies the position in the list to start counting results from, (typically an ID field)
+        order
+            This parameter is deprecated and will be removed in a future release
+
+        Returns
+        -------
+        int
+            The total number of records found, returned if `select` is not given
+
+        prisma.types.UserDashboardDataCountAggregateOutput
+            Data returned when `select` is used, the fields present in this dictionary will
+            match the fields passed in the `select` argument
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # total: int
+        total = await UserDashboardData.prisma().count()
+
+        # results: prisma.types.UserDashboardDataCountAggregateOutput
+        results = await UserDashboardData.prisma().count(
+            select={
+                '_all': True,
+                'totalPoints': True,
+            },
+        )
+        ```
+        """
+
+
+    @overload
+    async def count(
+        self,
+        select: types.UserDashboardDataCountAggregateInput,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.UserDashboardDataWhereInput] = None,
+        cursor: Optional[types.UserDashboardDataWhereUniqueInput] = None,
+    ) -> types.UserDashboardDataCountAggregateOutput:
+        ...
+
+    async def count(
+        self,
+        select: Optional[types.UserDashboardDataCountAggregateInput] = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.UserDashboardDataWhereInput] = None,
+        cursor: Optional[types.UserDashboardDataWhereUniqueInput] = None,
+    ) -> Union[int, types.UserDashboardDataCountAggregateOutput]:
+        """Count the number of UserDashboardData records present in the database
+
+        Parameters
+        ----------
+        select
+            Select the UserDashboardData fields to be counted
+        take
+            Limit the maximum result
+        skip
+            Ignore the first N records
+        where
+            UserDashboardData filter to find records
+        cursor
+            Specifies the position in the list to start counting results from, (typically an ID field)
+        order
+            This parameter is deprecated and will be removed in a future release
+
+        Returns
+        -------
+        int
+            The total number of records found, returned if `select` is not given
+
+        prisma.types.UserDashboardDataCountAggregateOutput
+            Data returned when `select` is used, the fields present in this dictionary will
+            match the fields passed in the `select` argument
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # total: int
+        total = await UserDashboardData.prisma().count()
+
+        # results: prisma.types.UserDashboardDataCountAggregateOutput
+        results = await UserDashboardData.prisma().count(
+            select={
+                '_all': True,
+                'previousSessionPoints': True,
+            },
+        )
+        ```
+        """
+
+        # TODO: this selection building should be moved to the QueryBuilder
+        #
+        # note the distinction between checking for `not select` here and `select is None`
+        # later is to handle the case that the given select dictionary is empty, this
+        # is a limitation of our types.
+        if not select:
+            root_selection = ['_count { _all }']
+        else:
+
+            root_selection = [
+                '_count {{ {0} }}'.format(' '.join(k for k, v in select.items() if v is True))
+            ]
+
+        resp = await self._client._execute(
+            method='count',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'cursor': cursor,
+            },
+            root_selection=root_selection,
+        )
+
+        if select is None:
+            return cast(int, resp['data']['result']['_count']['_all'])
+        else:
+            return cast(types.UserDashboardDataCountAggregateOutput, resp['data']['result']['_count'])
+
+    async def delete_many(
+        self,
+        where: Optional[types.UserDashboardDataWhereInput] = None
+    ) -> int:
+        """Delete multiple UserDashboardData records.
+
+        Parameters
+        ----------
+        where
+            Optional UserDashboardData filter to find the records to be deleted
+
+        Returns
+        -------
+        int
+            The total number of UserDashboardData records that were deleted
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # delete all UserDashboardData records
+        total = await UserDashboardData.prisma().delete_many()
+        ```
+        """
+        resp = await self._client._execute(
+            method='delete_many',
+            model=self._model,
+            arguments={'where': where},
+            root_selection=['count'],
+        )
+        return int(resp['data']['result']['count'])
+
+    # TODO: make this easier to work with safely, currently output fields are typed as
+    #       not required, we should refactor the return type
+    # TODO: consider returning a Dict where the keys are a Tuple of the `by` selection
+    # TODO: statically type that the order argument is required when take or skip are present
+    async def group_by(
+        self,
+        by: List['types.UserDashboardDataScalarFieldKeys'],
+        *,
+        where: Optional['types.UserDashboardDataWhereInput'] = None,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        avg: Optional['types.UserDashboardDataAvgAggregateInput'] = None,
+        sum: Optional['types.UserDashboardDataSumAggregateInput'] = None,
+        min: Optional['types.UserDashboardDataMinAggregateInput'] = None,
+        max: Optional['types.UserDashboardDataMaxAggregateInput'] = None,
+        having: Optional['types.UserDashboardDataScalarWhereWithAggregatesInput'] = None,
+        count: Optional[Union[bool, 'types.UserDashboardDataCountAggregateInput']] = None,
+        order: Optional[Union[Mapping['types.UserDashboardDataScalarFieldKeys', 'types.SortOrder'], List[Mapping['types.UserDashboardDataScalarFieldKeys', 'types.SortOrder']]]] = None,
+    ) -> List['types.UserDashboardDataGroupByOutput']:
+        """Group UserDashboardData records by one or more field values and perform aggregations
+        each group such as finding the average.
+
+        Parameters
+        ----------
+        by
+            List of scalar UserDashboardData fields to group records by
+        where
+            UserDashboardData filter to select records
+        take
+            Limit the maximum number of UserDashboardData records returned
+        skip
+            Ignore the first N records
+        avg
+            Adds the average of all values of the specified fields to the `_avg` field
+            in the returned data.
+        sum
+            Adds the sum of all values of the specified fields to the `_sum` field
+            in the returned data.
+        min
+            Adds the smallest available value for the specified fields to the `_min` field
+            in the returned data.
+        max
+            Adds the largest available value for the specified fields to the `_max` field
+            in the returned data.
+        count
+            Adds a count of non-fields to the `_count` field in the returned data.
+        having
+            Allows you to filter groups by an aggregate value - for example only return
+            groups having an average age less than 50.
+        order
+            Lets you order the returned list by any property that is also present in `by`.
+            Only **one** field is allowed at a time.
+
+        Returns
+        -------
+        List[prisma.types.UserDashboardDataGroupByOutput]
+            A list of dictionaries representing the UserDashboardData record,
+            this will also have additional fields present if aggregation arguments
+            are used (see the above parameters)
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # group UserDashboardData records by pointsHistory values
+        # and count how many records are in each group
+        results = await UserDashboardData.prisma().group_by(
+            ['pointsHistory'],
+            count=True,
+        )
+        ```
+        """
+        if order is None:
+            if take is not None:
+                raise TypeError('Missing argument: \'order\' which is required when \'take\' is present')
+
+            if skip is not None:
+                raise TypeError('Missing argument: \'order\' which is required when \'skip\' is present')
+
+        root_selection: List[str] = [*by]
+        if avg is not None:
+            root_selection.append(_select_fields('_avg', avg))
+
+        if min is not None:
+            root_selection.append(_select_fields('_min', min))
+
+        if sum is not None:
+            root_selection.append(_select_fields('_sum', sum))
+
+        if max is not None:
+            root_selection.append(_select_fields('_max', max))
+
+        if count is not None:
+            if count is True:
+                root_selection.append('_count { _all }')
+            elif isinstance(count, dict):
+                root_selection.append(_select_fields('_count', count))
+
+        resp = await self._client._execute(
+            method='group_by',
+            model=self._model,
+            arguments={
+                'by': by,
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'having': having,
+                'orderBy': order,
+            },
+            root_selection=root_selection,
+        )
+        return resp['data']['result']  # type: ignore[no-any-return]
+
+
+class PointsHistoryEntryActions(Generic[_PrismaModelT]):
+    __slots__ = (
+        '_client',
+        '_model',
+    )
+
+    def __init__(self, client: Prisma, model: Type[_PrismaModelT]) -> None:
+        self._client = client
+        self._model = model
+
+    async def query_raw(
+        self,
+        query: LiteralString,
+        *args: Any,
+    ) -> List[_PrismaModelT]:
+        """Execute a raw SQL query
+
+        Parameters
+        ----------
+        query
+            The raw SQL query string to be executed
+        *args
+            Parameters to be passed to the SQL query, these MUST be used over
+            string formatting to avoid an SQL injection vulnerability
+
+        Returns
+        -------
+        List[prisma.models.PointsHistoryEntry]
+            The records returned by the SQL query
+
+        Raises
+        ------
+        prisma_errors.RawQueryError
+            This could be due to invalid syntax, mismatched number of parameters or any other error
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        users = await PointsHistoryEntry.prisma().query_raw(
+            'SELECT * FROM PointsHistoryEntry WHERE id = $1',
+            'bgehebiafc',
+        )
+        ```
+        """
+        return await self._client.query_raw(query, *args, model=self._model)
+
+    async def query_first(
+        self,
+        query: LiteralString,
+        *args: Any,
+    ) -> Optional[_PrismaModelT]:
+        """Execute a raw SQL query, returning the first result
+
+        Parameters
+        ----------
+        query
+            The raw SQL query string to be executed
+        *args
+            Parameters to be passed to the SQL query, these MUST be used over
+            string formatting to avoid an SQL injection vulnerability
+
+        Returns
+        -------
+        prisma.models.PointsHistoryEntry
+            The first record returned by the SQL query
+        None
+            The raw SQL query did not return any records
+
+        Raises
+        ------
+        prisma_errors.RawQueryError
+            This could be due to invalid syntax, mismatched number of parameters or any other error
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        user = await PointsHistoryEntry.prisma().query_first(
+            'SELECT * FROM PointsHistoryEntry WHERE userId = $1',
+            'bghffegacj',
+        )
+        ```
+        """
+        return await self._client.query_first(query, *args, model=self._model)
+
+    async def create(
+        self,
+        data: types.PointsHistoryEntryCreateInput,
+        include: Optional[types.PointsHistoryEntryInclude] = None
+    ) -> _PrismaModelT:
+        """Create a new PointsHistoryEntry record.
+
+        Parameters
+        ----------
+        data
+            PointsHistoryEntry record data
+        include
+            Specifies which relations should be loaded on the returned PointsHistoryEntry model
+
+        Returns
+        -------
+        prisma.models.PointsHistoryEntry
+            The created PointsHistoryEntry record
+
+        Raises
+        ------
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # create a PointsHistoryEntry record from just the required fields
+        pointshistoryentry = await PointsHistoryEntry.prisma().create(
+            data={
+                # data to create a PointsHistoryEntry record
+                'userId': 'bhghchehcc',
+                'points': 326272115,
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='create',
+            model=self._model,
+            arguments={
+                'data': data,
+                'include': include,
+            },
+        )
+        return model_parse(self._model, resp['data']['result'])
+
+    async def create_many(
+        self,
+        data: List[types.PointsHistoryEntryCreateWithoutRelationsInput],
+        *,
+        skip_duplicates: Optional[bool] = None,
+    ) -> int:
+        """Create multiple PointsHistoryEntry records at once.
+
+        This function is *not* available when using SQLite.
+
+        Parameters
+        ----------
+        data
+            List of PointsHistoryEntry record data
+        skip_duplicates
+            Boolean flag for ignoring unique constraint errors
+
+        Returns
+        -------
+        int
+            The total number of records created
+
+        Raises
+        ------
+        prisma.errors.UnsupportedDatabaseError
+            Attempting to query when using SQLite
+        prisma.errors.UniqueViolationError
+            A unique constraint check has failed, these can be ignored with the `skip_duplicates` argument
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        total = await PointsHistoryEntry.prisma().create_many(
+            data=[
+                {
+                    # data to create a PointsHistoryEntry record
+                    'userId': 'bdedcabahc',
+                    'points': 675780521,
+                },
+                {
+                    # data to create a PointsHistoryEntry record
+                    'userId': 'heejgedji',
+                    'points': 1969681615,
+                },
+            ],
+            skip_duplicates=True,
+        )
+        ```
+        """
+        if skip_duplicates and self._client._active_provider in CREATE_MANY_SKIP_DUPLICATES_UNSUPPORTED:
+            raise errors.UnsupportedDatabaseError(self._client._active_provider, 'create_many_skip_duplicates')
+
+        resp = await self._client._execute(
+            method='create_many',
+            model=self._model,
+            arguments={
+                'data': data,
+                'skipDuplicates': skip_duplicates,
+            },
+            root_selection=['count'],
+        )
+        return int(resp['data']['result']['count'])
+
+    async def delete(
+        self,
+        where: types.PointsHistoryEntryWhereUniqueInput,
+        include: Optional[types.PointsHistoryEntryInclude] = None
+    ) -> Optional[_PrismaModelT]:
+        """Delete a single PointsHistoryEntry record.
+
+        Parameters
+        ----------
+        where
+            PointsHistoryEntry filter to select the record to be deleted, must be unique
+        include
+            Specifies which relations should be loaded on the returned PointsHistoryEntry model
+
+        Returns
+        -------
+        prisma.models.PointsHistoryEntry
+            The deleted PointsHistoryEntry record
+        None
+            Could not find a record to delete
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+
+        Example
+        -------
+        ```py
+        pointshistoryentry = await PointsHistoryEntry.prisma().delete(
+            where={
+                'id': 'bbbgbhfjge',
+            },
+        )
+        ```
+        """
+        try:
+            resp = await self._client._execute(
+                method='delete',
+                model=self._model,
+                arguments={
+                    'where': where,
+                    'include': include,
+                },
+            )
+        except errors.RecordNotFoundError:
+            return None
+
+        return model_parse(self._model, resp['data']['result'])
+
+    async def find_unique(
+        self,
+        where: types.PointsHistoryEntryWhereUniqueInput,
+        include: Optional[types.PointsHistoryEntryInclude] = None
+    ) -> Optional[_PrismaModelT]:
+        """Find a unique PointsHistoryEntry record.
+
+        Parameters
+        ----------
+        where
+            PointsHistoryEntry filter to find the record, must be unique
+        include
+            Specifies which relations should be loaded on the returned PointsHistoryEntry model
+
+        Returns
+        -------
+        prisma.models.PointsHistoryEntry
+            The found PointsHistoryEntry record
+        None
+            No record matching the given input could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+
+        Example
+        -------
+        ```py
+        pointshistoryentry = await PointsHistoryEntry.prisma().find_unique(
+            where={
+                'id': 'igbehcbab',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='find_unique',
+            model=self._model,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+        )
+        result = resp['data']['result']
+        if result is None:
+            return None
+        return model_parse(self._model, result)
+
+    async def find_unique_or_raise(
+        self,
+        where: types.PointsHistoryEntryWhereUniqueInput,
+        include: Optional[types.PointsHistoryEntryInclude] = None
+    ) -> _PrismaModelT:
+        """Find a unique PointsHistoryEntry record. Raises `RecordNotFoundError` if no record is found.
+
+        Parameters
+        ----------
+        where
+            PointsHistoryEntry filter to find the record, must be unique
+        include
+            Specifies which relations should be loaded on the returned PointsHistoryEntry model
+
+        Returns
+        -------
+        prisma.models.PointsHistoryEntry
+            The found PointsHistoryEntry record
+
+        Raises
+        ------
+        prisma.errors.RecordNotFoundError
+            No record was found
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+        prisma.errors.MissingRequiredValueError
+            Value is required but was not found
+
+        Example
+        -------
+        ```py
+        pointshistoryentry = await PointsHistoryEntry.prisma().find_unique_or_raise(
+            where={
+                'id': 'bdadaadhag',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='find_unique_or_raise',
+            model=self._model,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+        )
+        return model_parse(self._model, resp['data']['result'])
+
+    async def find_many(
+        self,
+        take: Optional[int] = None,
+        skip: Optional[int] = None,
+        where: Optional[types.PointsHistoryEntryWhereInput] = None,
+        cursor: Optional[types.PointsHistoryEntryWhereUniqueInput] = None,
+        include: Optional[types.PointsHistoryEntryInclude] = None,
+        order: Optional[Union[types.PointsHistoryEntryOrderByInput, List[types.PointsHistoryEntryOrderByInput]]] = None,
+        distinct: Optional[List[types.PointsHistoryEntryScalarFieldKeys]] = None,
+    ) -> List[_PrismaModelT]:
+        """Find multiple PointsHistoryEntry records.
+
+        An empty list is returned if no records could be found.
+
+        Parameters
+        ----------
+        take
+            Limit the maximum number of PointsHistoryEntry records returned
+        skip
+            Ignore the first N results
+        where
+            PointsHistoryEntry filter to select records
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned PointsHistoryEntry model
+        order
+            Order the returned PointsHistoryEntry records by any field
+        distinct
+            Filter PointsHistoryEntry records by either a single distinct field or distinct combinations of fields
+
+        Returns
+        -------
+        List[prisma.models.PointsHistoryEntry]
+            The list of all PointsHistoryEntry records that could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # find the first 10 PointsHistoryEntry records
+        pointshistoryentrys = await PointsHistoryEntry.prisma().find_many(take=10)
+
+        # find the first 5 PointsHistoryEntry records ordered by the points field
+        pointshistoryentrys = await PointsHistoryEntry.prisma().find_many(
+            take=5,
+            order={
+                'points': 'desc',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='find_many',
+            model=self._model,
+            arguments={
+                'take': take,
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        )
+        return [model_parse(self._model, r) for r in resp['data']['result']]
+
+    async def find_first(
+        self,
+        skip: Optional[int] = None,
+        where: Optional[types.PointsHistoryEntryWhereInput] = None,
+        cursor: Optional[types.PointsHistoryEntryWhereUniqueInput] = None,
+        include: Optional[types.PointsHistoryEntryInclude] = None,
+        order: Optional[Union[types.PointsHistoryEntryOrderByInput, List[types.PointsHistoryEntryOrderByInput]]] = None,
+        distinct: Optional[List[types.PointsHistoryEntryScalarFieldKeys]] = None,
+    ) -> Optional[_PrismaModelT]:
+        """Find a single PointsHistoryEntry record.
+
+        Parameters
+        ----------
+        skip
+            Ignore the first N records
+        where
+            PointsHistoryEntry filter to select the record
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned PointsHistoryEntry model
+        order
+            Order the returned PointsHistoryEntry records by any field
+        distinct
+            Filter PointsHistoryEntry records by either a single distinct field or distinct combinations of fields
+
+        Returns
+        -------
+        prisma.models.PointsHistoryEntry
+            The first PointsHistoryEntry record found, matching the given arguments
+        None
+            No record could be found
+
+        Raises
+        ------
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # find the second PointsHistoryEntry record ordered by the topicId field
+        pointshistoryentry = await PointsHistoryEntry.prisma().find_first(
+            skip=1,
+            order={
+                'topicId': 'desc',
+            },
+        )
+        ```
+        """
+        resp = await self._client._execute(
+            method='find_first',
+            model=self._model,
+            arguments={
+                'skip': skip,
+                'where': where,
+                'order_by': order,
+                'cursor': cursor,
+                'include': include,
+                'distinct': distinct,
+            },
+        )
+        result = resp['data']['result']
+        if result is None:
+            return None
+
+        return model_parse(self._model, result)
+
+    async def find_first_or_raise(
+        self,
+        skip: Optional[int] = None,
+        where: Optional[types.PointsHistoryEntryWhereInput] = None,
+        cursor: Optional[types.PointsHistoryEntryWhereUniqueInput] = None,
+        include: Optional[types.PointsHistoryEntryInclude] = None,
+        order: Optional[Union[types.PointsHistoryEntryOrderByInput, List[types.PointsHistoryEntryOrderByInput]]] = None,
+        distinct: Optional[List[types.PointsHistoryEntryScalarFieldKeys]] = None,
+    ) -> _PrismaModelT:
+        """Find a single PointsHistoryEntry record. Raises `RecordNotFoundError` if no record was found.
+
+        Parameters
+        ----------
+        skip
+            Ignore the first N records
+        where
+            PointsHistoryEntry filter to select the record
+        cursor
+            Specifies the position in the list to start returning results from, (typically an ID field)
+        include
+            Specifies which relations should be loaded on the returned PointsHistoryEntry model
+        order
+            Order the returned PointsHistoryEntry records by any field
+        distinct
+            Filter PointsHistoryEntry records by either a single distinct field or distinct combinations of fields
+
+        Returns
+        -------
+        prisma.models.PointsHistoryEntry
+            The first PointsHistoryEntry record found, matching the given arguments
+
+        Raises
+        ------
+        prisma.errors.RecordNotFoundError
+            No record was found
+        prisma.errors.PrismaError
+            Catch all for every exception raised by Prisma Client Python
+
+        Example
+        -------
+        ```py
+        # find the second PointsHistoryEntry record ordered by the timestamp field
+        pointshistoryentry = await PointsHistoryEntry.prisma().find_first_or_raise(
+            skip=1,
+            order={
+                'timestamp': 'desc',
             },
         )
         ```
@@ -1629,25 +2653,25 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
 
     async def update(
         self,
-        data: types.UserDashboardDataUpdateInput,
-        where: types.UserDashboardDataWhereUniqueInput,
-        include: Optional[types.UserDashboardDataInclude] = None
+        data: types.PointsHistoryEntryUpdateInput,
+        where: types.PointsHistoryEntryWhereUniqueInput,
+        include: Optional[types.PointsHistoryEntryInclude] = None
     ) -> Optional[_PrismaModelT]:
-        """Update a single UserDashboardData record.
+        """Update a single PointsHistoryEntry record.
 
         Parameters
         ----------
         data
-            UserDashboardData record data specifying what to update
+            PointsHistoryEntry record data specifying what to update
         where
-            UserDashboardData filter to select the unique record to create / update
+            PointsHistoryEntry filter to select the unique record to create / update
         include
-            Specifies which relations should be loaded on the returned UserDashboardData model
+            Specifies which relations should be loaded on the returned PointsHistoryEntry model
 
         Returns
         -------
-        prisma.models.UserDashboardData
-            The updated UserDashboardData record
+        prisma.models.PointsHistoryEntry
+            The updated PointsHistoryEntry record
         None
             No record could be found
 
@@ -1659,12 +2683,12 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        userdashboarddata = await UserDashboardData.prisma().update(
+        pointshistoryentry = await PointsHistoryEntry.prisma().update(
             where={
-                'userId': 'bbejhfidcb',
+                'id': 'bgiggdidbf',
             },
             data={
-                # data to update the UserDashboardData record to
+                # data to update the PointsHistoryEntry record to
             },
         )
         ```
@@ -1686,25 +2710,25 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
 
     async def upsert(
         self,
-        where: types.UserDashboardDataWhereUniqueInput,
-        data: types.UserDashboardDataUpsertInput,
-        include: Optional[types.UserDashboardDataInclude] = None,
+        where: types.PointsHistoryEntryWhereUniqueInput,
+        data: types.PointsHistoryEntryUpsertInput,
+        include: Optional[types.PointsHistoryEntryInclude] = None,
     ) -> _PrismaModelT:
         """Updates an existing record or create a new one
 
         Parameters
         ----------
         where
-            UserDashboardData filter to select the unique record to create / update
+            PointsHistoryEntry filter to select the unique record to create / update
         data
             Data specifying what fields to set on create and update
         include
-            Specifies which relations should be loaded on the returned UserDashboardData model
+            Specifies which relations should be loaded on the returned PointsHistoryEntry model
 
         Returns
         -------
-        prisma.models.UserDashboardData
-            The created or updated UserDashboardData record
+        prisma.models.PointsHistoryEntry
+            The created or updated PointsHistoryEntry record
 
         Raises
         ------
@@ -1716,15 +2740,19 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        userdashboarddata = await UserDashboardData.prisma().upsert(
+        pointshistoryentry = await PointsHistoryEntry.prisma().upsert(
             where={
-                'userId': 'bgeecijdgg',
+                'id': 'caaaedabfc',
             },
             data={
                 'create': {
-                    'userId': 'bgeecijdgg',
+                    'id': 'caaaedabfc',
+                    'userId': 'heejgedji',
+                    'points': 1969681615,
                 },
                 'update': {
+                    'userId': 'heejgedji',
+                    'points': 1969681615,
                 },
             },
         )
@@ -1744,22 +2772,22 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
 
     async def update_many(
         self,
-        data: types.UserDashboardDataUpdateManyMutationInput,
-        where: types.UserDashboardDataWhereInput,
+        data: types.PointsHistoryEntryUpdateManyMutationInput,
+        where: types.PointsHistoryEntryWhereInput,
     ) -> int:
-        """Update multiple UserDashboardData records
+        """Update multiple PointsHistoryEntry records
 
         Parameters
         ----------
         data
-            UserDashboardData data to update the selected UserDashboardData records to
+            PointsHistoryEntry data to update the selected PointsHistoryEntry records to
         where
-            Filter to select the UserDashboardData records to update
+            Filter to select the PointsHistoryEntry records to update
 
         Returns
         -------
         int
-            The total number of UserDashboardData records that were updated
+            The total number of PointsHistoryEntry records that were updated
 
         Raises
         ------
@@ -1769,10 +2797,10 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        # update all UserDashboardData records
-        total = await UserDashboardData.prisma().update_many(
+        # update all PointsHistoryEntry records
+        total = await PointsHistoryEntry.prisma().update_many(
             data={
-                'totalPoints': 1388290519
+                'id': 'bigibebcib'
             },
             where={}
         )
@@ -1792,21 +2820,21 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
         select: None = None,
         take: Optional[int] = None,
         skip: Optional[int] = None,
-        where: Optional[types.UserDashboardDataWhereInput] = None,
-        cursor: Optional[types.UserDashboardDataWhereUniqueInput] = None,
+        where: Optional[types.PointsHistoryEntryWhereInput] = None,
+        cursor: Optional[types.PointsHistoryEntryWhereUniqueInput] = None,
     ) -> int:
-        """Count the number of UserDashboardData records present in the database
+        """Count the number of PointsHistoryEntry records present in the database
 
         Parameters
         ----------
         select
-            Select the UserDashboardData fields to be counted
+            Select the PointsHistoryEntry fields to be counted
         take
             Limit the maximum result
         skip
             Ignore the first N records
         where
-            UserDashboardData filter to find records
+            PointsHistoryEntry filter to find records
         cursor
             Specifies the position in the list to start counting results from, (typically an ID field)
         order
@@ -1817,7 +2845,7 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
         int
             The total number of records found, returned if `select` is not given
 
-        prisma.types.UserDashboardDataCountAggregateOutput
+        prisma.types.PointsHistoryEntryCountAggregateOutput
             Data returned when `select` is used, the fields present in this dictionary will
             match the fields passed in the `select` argument
 
@@ -1830,13 +2858,13 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
         -------
         ```py
         # total: int
-        total = await UserDashboardData.prisma().count()
+        total = await PointsHistoryEntry.prisma().count()
 
-        # results: prisma.types.UserDashboardDataCountAggregateOutput
-        results = await UserDashboardData.prisma().count(
+        # results: prisma.types.PointsHistoryEntryCountAggregateOutput
+        results = await PointsHistoryEntry.prisma().count(
             select={
                 '_all': True,
-                'previousSessionPoints': True,
+                'userId': True,
             },
         )
         ```
@@ -1846,34 +2874,34 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
     @overload
     async def count(
         self,
-        select: types.UserDashboardDataCountAggregateInput,
+        select: types.PointsHistoryEntryCountAggregateInput,
         take: Optional[int] = None,
         skip: Optional[int] = None,
-        where: Optional[types.UserDashboardDataWhereInput] = None,
-        cursor: Optional[types.UserDashboardDataWhereUniqueInput] = None,
-    ) -> types.UserDashboardDataCountAggregateOutput:
+        where: Optional[types.PointsHistoryEntryWhereInput] = None,
+        cursor: Optional[types.PointsHistoryEntryWhereUniqueInput] = None,
+    ) -> types.PointsHistoryEntryCountAggregateOutput:
         ...
 
     async def count(
         self,
-        select: Optional[types.UserDashboardDataCountAggregateInput] = None,
+        select: Optional[types.PointsHistoryEntryCountAggregateInput] = None,
         take: Optional[int] = None,
         skip: Optional[int] = None,
-        where: Optional[types.UserDashboardDataWhereInput] = None,
-        cursor: Optional[types.UserDashboardDataWhereUniqueInput] = None,
-    ) -> Union[int, types.UserDashboardDataCountAggregateOutput]:
-        """Count the number of UserDashboardData records present in the database
+        where: Optional[types.PointsHistoryEntryWhereInput] = None,
+        cursor: Optional[types.PointsHistoryEntryWhereUniqueInput] = None,
+    ) -> Union[int, types.PointsHistoryEntryCountAggregateOutput]:
+        """Count the number of PointsHistoryEntry records present in the database
 
         Parameters
         ----------
         select
-            Select the UserDashboardData fields to be counted
+            Select the PointsHistoryEntry fields to be counted
         take
             Limit the maximum result
         skip
             Ignore the first N records
         where
-            UserDashboardData filter to find records
+            PointsHistoryEntry filter to find records
         cursor
             Specifies the position in the list to start counting results from, (typically an ID field)
         order
@@ -1884,7 +2912,7 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
         int
             The total number of records found, returned if `select` is not given
 
-        prisma.types.UserDashboardDataCountAggregateOutput
+        prisma.types.PointsHistoryEntryCountAggregateOutput
             Data returned when `select` is used, the fields present in this dictionary will
             match the fields passed in the `select` argument
 
@@ -1897,13 +2925,13 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
         -------
         ```py
         # total: int
-        total = await UserDashboardData.prisma().count()
+        total = await PointsHistoryEntry.prisma().count()
 
-        # results: prisma.types.UserDashboardDataCountAggregateOutput
-        results = await UserDashboardData.prisma().count(
+        # results: prisma.types.PointsHistoryEntryCountAggregateOutput
+        results = await PointsHistoryEntry.prisma().count(
             select={
                 '_all': True,
-                'pointsHistory': True,
+                'points': True,
             },
         )
         ```
@@ -1937,23 +2965,23 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
         if select is None:
             return cast(int, resp['data']['result']['_count']['_all'])
         else:
-            return cast(types.UserDashboardDataCountAggregateOutput, resp['data']['result']['_count'])
+            return cast(types.PointsHistoryEntryCountAggregateOutput, resp['data']['result']['_count'])
 
     async def delete_many(
         self,
-        where: Optional[types.UserDashboardDataWhereInput] = None
+        where: Optional[types.PointsHistoryEntryWhereInput] = None
     ) -> int:
-        """Delete multiple UserDashboardData records.
+        """Delete multiple PointsHistoryEntry records.
 
         Parameters
         ----------
         where
-            Optional UserDashboardData filter to find the records to be deleted
+            Optional PointsHistoryEntry filter to find the records to be deleted
 
         Returns
         -------
         int
-            The total number of UserDashboardData records that were deleted
+            The total number of PointsHistoryEntry records that were deleted
 
         Raises
         ------
@@ -1963,8 +2991,8 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        # delete all UserDashboardData records
-        total = await UserDashboardData.prisma().delete_many()
+        # delete all PointsHistoryEntry records
+        total = await PointsHistoryEntry.prisma().delete_many()
         ```
         """
         resp = await self._client._execute(
@@ -1981,30 +3009,30 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
     # TODO: statically type that the order argument is required when take or skip are present
     async def group_by(
         self,
-        by: List['types.UserDashboardDataScalarFieldKeys'],
+        by: List['types.PointsHistoryEntryScalarFieldKeys'],
         *,
-        where: Optional['types.UserDashboardDataWhereInput'] = None,
+        where: Optional['types.PointsHistoryEntryWhereInput'] = None,
         take: Optional[int] = None,
         skip: Optional[int] = None,
-        avg: Optional['types.UserDashboardDataAvgAggregateInput'] = None,
-        sum: Optional['types.UserDashboardDataSumAggregateInput'] = None,
-        min: Optional['types.UserDashboardDataMinAggregateInput'] = None,
-        max: Optional['types.UserDashboardDataMaxAggregateInput'] = None,
-        having: Optional['types.UserDashboardDataScalarWhereWithAggregatesInput'] = None,
-        count: Optional[Union[bool, 'types.UserDashboardDataCountAggregateInput']] = None,
-        order: Optional[Union[Mapping['types.UserDashboardDataScalarFieldKeys', 'types.SortOrder'], List[Mapping['types.UserDashboardDataScalarFieldKeys', 'types.SortOrder']]]] = None,
-    ) -> List['types.UserDashboardDataGroupByOutput']:
-        """Group UserDashboardData records by one or more field values and perform aggregations
+        avg: Optional['types.PointsHistoryEntryAvgAggregateInput'] = None,
+        sum: Optional['types.PointsHistoryEntrySumAggregateInput'] = None,
+        min: Optional['types.PointsHistoryEntryMinAggregateInput'] = None,
+        max: Optional['types.PointsHistoryEntryMaxAggregateInput'] = None,
+        having: Optional['types.PointsHistoryEntryScalarWhereWithAggregatesInput'] = None,
+        count: Optional[Union[bool, 'types.PointsHistoryEntryCountAggregateInput']] = None,
+        order: Optional[Union[Mapping['types.PointsHistoryEntryScalarFieldKeys', 'types.SortOrder'], List[Mapping['types.PointsHistoryEntryScalarFieldKeys', 'types.SortOrder']]]] = None,
+    ) -> List['types.PointsHistoryEntryGroupByOutput']:
+        """Group PointsHistoryEntry records by one or more field values and perform aggregations
         each group such as finding the average.
 
         Parameters
         ----------
         by
-            List of scalar UserDashboardData fields to group records by
+            List of scalar PointsHistoryEntry fields to group records by
         where
-            UserDashboardData filter to select records
+            PointsHistoryEntry filter to select records
         take
-            Limit the maximum number of UserDashboardData records returned
+            Limit the maximum number of PointsHistoryEntry records returned
         skip
             Ignore the first N records
         avg
@@ -2030,8 +3058,8 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
 
         Returns
         -------
-        List[prisma.types.UserDashboardDataGroupByOutput]
-            A list of dictionaries representing the UserDashboardData record,
+        List[prisma.types.PointsHistoryEntryGroupByOutput]
+            A list of dictionaries representing the PointsHistoryEntry record,
             this will also have additional fields present if aggregation arguments
             are used (see the above parameters)
 
@@ -2043,10 +3071,10 @@ class UserDashboardDataActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        # group UserDashboardData records by userId values
+        # group PointsHistoryEntry records by topicId values
         # and count how many records are in each group
-        results = await UserDashboardData.prisma().group_by(
-            ['userId'],
+        results = await PointsHistoryEntry.prisma().group_by(
+            ['topicId'],
             count=True,
         )
         ```
@@ -2135,7 +3163,7 @@ class AccountActions(Generic[_PrismaModelT]):
         ```py
         users = await Account.prisma().query_raw(
             'SELECT * FROM Account WHERE id = $1',
-            'bgehebiafc',
+            'bigaiehgcc',
         )
         ```
         """
@@ -2175,7 +3203,7 @@ class AccountActions(Generic[_PrismaModelT]):
         ```py
         user = await Account.prisma().query_first(
             'SELECT * FROM Account WHERE userId = $1',
-            'bghffegacj',
+            'beeifcbebf',
         )
         ```
         """
@@ -2214,10 +3242,10 @@ class AccountActions(Generic[_PrismaModelT]):
         account = await Account.prisma().create(
             data={
                 # data to create a Account record
-                'userId': 'bhghchehcc',
-                'type': 'dcgchcbbf',
-                'provider': 'bdedcabahc',
-                'providerAccountId': 'ghfhiafcb',
+                'userId': 'bgcigfahea',
+                'type': 'bcejgaggif',
+                'provider': 'idfjadbcc',
+                'providerAccountId': 'hgdhbjhhj',
             },
         )
         ```
@@ -2272,17 +3300,17 @@ class AccountActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a Account record
-                    'userId': 'heejgedji',
-                    'type': 'bjgjgibgbf',
-                    'provider': 'bbbgbhfjge',
-                    'providerAccountId': 'igbehcbab',
+                    'userId': 'ecjjjfbae',
+                    'type': 'bhhfibbigf',
+                    'provider': 'ijdbeffgg',
+                    'providerAccountId': 'jjfeafhfj',
                 },
                 {
                     # data to create a Account record
-                    'userId': 'bdadaadhag',
-                    'type': 'bgiggdidbf',
-                    'provider': 'caaaedabfc',
-                    'providerAccountId': 'bigibebcib',
+                    'userId': 'cbachdgfce',
+                    'type': 'chbfcacbd',
+                    'provider': 'efggddide',
+                    'providerAccountId': 'caficfigfb',
                 },
             ],
             skip_duplicates=True,
@@ -2336,7 +3364,7 @@ class AccountActions(Generic[_PrismaModelT]):
         ```py
         account = await Account.prisma().delete(
             where={
-                'id': 'bigaiehgcc',
+                'id': 'bfidgijfjc',
             },
         )
         ```
@@ -2388,7 +3416,7 @@ class AccountActions(Generic[_PrismaModelT]):
         ```py
         account = await Account.prisma().find_unique(
             where={
-                'id': 'beeifcbebf',
+                'id': 'ihieecagf',
             },
         )
         ```
@@ -2439,7 +3467,7 @@ class AccountActions(Generic[_PrismaModelT]):
         ```py
         account = await Account.prisma().find_unique_or_raise(
             where={
-                'id': 'bgcigfahea',
+                'id': 'bghfciaafe',
             },
         )
         ```
@@ -2691,7 +3719,7 @@ class AccountActions(Generic[_PrismaModelT]):
         ```py
         account = await Account.prisma().update(
             where={
-                'id': 'bcejgaggif',
+                'id': 'bgchfhgceh',
             },
             data={
                 # data to update the Account record to
@@ -2748,21 +3776,21 @@ class AccountActions(Generic[_PrismaModelT]):
         ```py
         account = await Account.prisma().upsert(
             where={
-                'id': 'idfjadbcc',
+                'id': 'cafeiaccbc',
             },
             data={
                 'create': {
-                    'id': 'idfjadbcc',
-                    'userId': 'bdadaadhag',
-                    'type': 'bgiggdidbf',
-                    'provider': 'caaaedabfc',
-                    'providerAccountId': 'bigibebcib',
+                    'id': 'cafeiaccbc',
+                    'userId': 'cbachdgfce',
+                    'type': 'chbfcacbd',
+                    'provider': 'efggddide',
+                    'providerAccountId': 'caficfigfb',
                 },
                 'update': {
-                    'userId': 'bdadaadhag',
-                    'type': 'bgiggdidbf',
-                    'provider': 'caaaedabfc',
-                    'providerAccountId': 'bigibebcib',
+                    'userId': 'cbachdgfce',
+                    'type': 'chbfcacbd',
+                    'provider': 'efggddide',
+                    'providerAccountId': 'caficfigfb',
                 },
             },
         )
@@ -2810,7 +3838,7 @@ class AccountActions(Generic[_PrismaModelT]):
         # update all Account records
         total = await Account.prisma().update_many(
             data={
-                'refresh_token': 'hgdhbjhhj'
+                'refresh_token': 'gaddfhfh'
             },
             where={}
         )
@@ -3173,7 +4201,7 @@ class SessionActions(Generic[_PrismaModelT]):
         ```py
         users = await Session.prisma().query_raw(
             'SELECT * FROM Session WHERE id = $1',
-            'ecjjjfbae',
+            'gieegcbeg',
         )
         ```
         """
@@ -3213,7 +4241,7 @@ class SessionActions(Generic[_PrismaModelT]):
         ```py
         user = await Session.prisma().query_first(
             'SELECT * FROM Session WHERE sessionToken = $1',
-            'bhhfibbigf',
+            'bgcffadich',
         )
         ```
         """
@@ -3252,8 +4280,8 @@ class SessionActions(Generic[_PrismaModelT]):
         session = await Session.prisma().create(
             data={
                 # data to create a Session record
-                'sessionToken': 'ijdbeffgg',
-                'userId': 'jjfeafhfj',
+                'sessionToken': 'fcbichhci',
+                'userId': 'bcggadccgf',
                 'expires': datetime.datetime.utcnow(),
             },
         )
@@ -3309,14 +4337,14 @@ class SessionActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a Session record
-                    'sessionToken': 'cbachdgfce',
-                    'userId': 'chbfcacbd',
+                    'sessionToken': 'jdcfdcgc',
+                    'userId': 'cafdaehjid',
                     'expires': datetime.datetime.utcnow(),
                 },
                 {
                     # data to create a Session record
-                    'sessionToken': 'efggddide',
-                    'userId': 'caficfigfb',
+                    'sessionToken': 'gifdddbia',
+                    'userId': 'bchehecef',
                     'expires': datetime.datetime.utcnow(),
                 },
             ],
@@ -3371,7 +4399,7 @@ class SessionActions(Generic[_PrismaModelT]):
         ```py
         session = await Session.prisma().delete(
             where={
-                'id': 'bfidgijfjc',
+                'id': 'jeijcbhfe',
             },
         )
         ```
@@ -3423,7 +4451,7 @@ class SessionActions(Generic[_PrismaModelT]):
         ```py
         session = await Session.prisma().find_unique(
             where={
-                'id': 'ihieecagf',
+                'id': 'bjgejjabff',
             },
         )
         ```
@@ -3474,7 +4502,7 @@ class SessionActions(Generic[_PrismaModelT]):
         ```py
         session = await Session.prisma().find_unique_or_raise(
             where={
-                'id': 'bghfciaafe',
+                'id': 'bcciijbibg',
             },
         )
         ```
@@ -3726,7 +4754,7 @@ class SessionActions(Generic[_PrismaModelT]):
         ```py
         session = await Session.prisma().update(
             where={
-                'id': 'bgchfhgceh',
+                'id': 'cffcachfd',
             },
             data={
                 # data to update the Session record to
@@ -3783,18 +4811,18 @@ class SessionActions(Generic[_PrismaModelT]):
         ```py
         session = await Session.prisma().upsert(
             where={
-                'id': 'cafeiaccbc',
+                'id': 'bccdfhdigc',
             },
             data={
                 'create': {
-                    'id': 'cafeiaccbc',
-                    'sessionToken': 'efggddide',
-                    'userId': 'caficfigfb',
+                    'id': 'bccdfhdigc',
+                    'sessionToken': 'gifdddbia',
+                    'userId': 'bchehecef',
                     'expires': datetime.datetime.utcnow(),
                 },
                 'update': {
-                    'sessionToken': 'efggddide',
-                    'userId': 'caficfigfb',
+                    'sessionToken': 'gifdddbia',
+                    'userId': 'bchehecef',
                     'expires': datetime.datetime.utcnow(),
                 },
             },
@@ -3843,7 +4871,7 @@ class SessionActions(Generic[_PrismaModelT]):
         # update all Session records
         total = await Session.prisma().update_many(
             data={
-                'sessionToken': 'gaddfhfh'
+                'sessionToken': 'febcgjbfj'
             },
             where={}
         )
@@ -4206,7 +5234,7 @@ class VerificationTokenActions(Generic[_PrismaModelT]):
         ```py
         users = await VerificationToken.prisma().query_raw(
             'SELECT * FROM VerificationToken WHERE identifier = $1',
-            'gieegcbeg',
+            'bageiegghg',
         )
         ```
         """
@@ -4246,7 +5274,7 @@ class VerificationTokenActions(Generic[_PrismaModelT]):
         ```py
         user = await VerificationToken.prisma().query_first(
             'SELECT * FROM VerificationToken WHERE token = $1',
-            'bgcffadich',
+            'faidicegb',
         )
         ```
         """
@@ -4285,8 +5313,8 @@ class VerificationTokenActions(Generic[_PrismaModelT]):
         verificationtoken = await VerificationToken.prisma().create(
             data={
                 # data to create a VerificationToken record
-                'identifier': 'fcbichhci',
-                'token': 'bcggadccgf',
+                'identifier': 'bacecgfhbe',
+                'token': 'ihcahiead',
                 'expires': datetime.datetime.utcnow(),
             },
         )
@@ -4342,14 +5370,14 @@ class VerificationTokenActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a VerificationToken record
-                    'identifier': 'jdcfdcgc',
-                    'token': 'cafdaehjid',
+                    'identifier': 'biheheiajg',
+                    'token': 'jbgijghgb',
                     'expires': datetime.datetime.utcnow(),
                 },
                 {
                     # data to create a VerificationToken record
-                    'identifier': 'gifdddbia',
-                    'token': 'bchehecef',
+                    'identifier': 'hgjcghfbi',
+                    'token': 'icadbcehj',
                     'expires': datetime.datetime.utcnow(),
                 },
             ],
@@ -4404,7 +5432,7 @@ class VerificationTokenActions(Generic[_PrismaModelT]):
         ```py
         verificationtoken = await VerificationToken.prisma().delete(
             where={
-                'token': 'jeijcbhfe',
+                'token': 'jchciaee',
             },
         )
         ```
@@ -4456,7 +5484,7 @@ class VerificationTokenActions(Generic[_PrismaModelT]):
         ```py
         verificationtoken = await VerificationToken.prisma().find_unique(
             where={
-                'token': 'bjgejjabff',
+                'token': 'deeificjd',
             },
         )
         ```
@@ -4507,7 +5535,7 @@ class VerificationTokenActions(Generic[_PrismaModelT]):
         ```py
         verificationtoken = await VerificationToken.prisma().find_unique_or_raise(
             where={
-                'token': 'bcciijbibg',
+                'token': 'bbcbhebbda',
             },
         )
         ```
@@ -4759,7 +5787,7 @@ class VerificationTokenActions(Generic[_PrismaModelT]):
         ```py
         verificationtoken = await VerificationToken.prisma().update(
             where={
-                'token': 'cffcachfd',
+                'token': 'bejfijgcfb',
             },
             data={
                 # data to update the VerificationToken record to
@@ -4816,16 +5844,16 @@ class VerificationTokenActions(Generic[_PrismaModelT]):
         ```py
         verificationtoken = await VerificationToken.prisma().upsert(
             where={
-                'token': 'bccdfhdigc',
+                'token': 'caifcbgii',
             },
             data={
                 'create': {
-                    'token': 'bccdfhdigc',
-                    'identifier': 'gifdddbia',
+                    'token': 'caifcbgii',
+                    'identifier': 'hgjcghfbi',
                     'expires': datetime.datetime.utcnow(),
                 },
                 'update': {
-                    'identifier': 'gifdddbia',
+                    'identifier': 'hgjcghfbi',
                     'expires': datetime.datetime.utcnow(),
                 },
             },
@@ -5237,7 +6265,7 @@ class QuestionActions(Generic[_PrismaModelT]):
         ```py
         users = await Question.prisma().query_raw(
             'SELECT * FROM Question WHERE id = $1',
-            'febcgjbfj',
+            'igaibbfgj',
         )
         ```
         """
@@ -5277,7 +6305,7 @@ class QuestionActions(Generic[_PrismaModelT]):
         ```py
         user = await Question.prisma().query_first(
             'SELECT * FROM Question WHERE questionText = $1',
-            'bageiegghg',
+            'bggajdcbbi',
         )
         ```
         """
@@ -5316,9 +6344,9 @@ class QuestionActions(Generic[_PrismaModelT]):
         question = await Question.prisma().create(
             data={
                 # data to create a Question record
-                'questionText': 'faidicegb',
-                'options': Json({'bacecgfhbe': True}),
-                'correctAnswerId': 'ihcahiead',
+                'questionText': 'fcfhgbjed',
+                'options': Json({'hdgcajhjg': True}),
+                'correctAnswerId': 'ejdjahicb',
             },
         )
         ```
@@ -5373,15 +6401,15 @@ class QuestionActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a Question record
-                    'questionText': 'biheheiajg',
-                    'options': Json({'jbgijghgb': True}),
-                    'correctAnswerId': 'hgjcghfbi',
+                    'questionText': 'gdjgigfgc',
+                    'options': Json({'gfeaahdeh': True}),
+                    'correctAnswerId': 'bjafcgbffc',
                 },
                 {
                     # data to create a Question record
-                    'questionText': 'icadbcehj',
-                    'options': Json({'jchciaee': True}),
-                    'correctAnswerId': 'deeificjd',
+                    'questionText': 'hihegjif',
+                    'options': Json({'bdjidcidac': True}),
+                    'correctAnswerId': 'ifgaaagff',
                 },
             ],
             skip_duplicates=True,
@@ -5435,7 +6463,7 @@ class QuestionActions(Generic[_PrismaModelT]):
         ```py
         question = await Question.prisma().delete(
             where={
-                'id': 'bbcbhebbda',
+                'id': 'befcddgjce',
             },
         )
         ```
@@ -5487,7 +6515,7 @@ class QuestionActions(Generic[_PrismaModelT]):
         ```py
         question = await Question.prisma().find_unique(
             where={
-                'id': 'bejfijgcfb',
+                'id': 'bfhdbjjgfd',
             },
         )
         ```
@@ -5538,7 +6566,7 @@ class QuestionActions(Generic[_PrismaModelT]):
         ```py
         question = await Question.prisma().find_unique_or_raise(
             where={
-                'id': 'caifcbgii',
+                'id': 'cabdjadaji',
             },
         )
         ```
@@ -5790,7 +6818,7 @@ class QuestionActions(Generic[_PrismaModelT]):
         ```py
         question = await Question.prisma().update(
             where={
-                'id': 'igaibbfgj',
+                'id': 'faajgfadf',
             },
             data={
                 # data to update the Question record to
@@ -5847,19 +6875,19 @@ class QuestionActions(Generic[_PrismaModelT]):
         ```py
         question = await Question.prisma().upsert(
             where={
-                'id': 'bggajdcbbi',
+                'id': 'biaagcedjc',
             },
             data={
                 'create': {
-                    'id': 'bggajdcbbi',
-                    'questionText': 'icadbcehj',
-                    'options': Json({'jchciaee': True}),
-                    'correctAnswerId': 'deeificjd',
+                    'id': 'biaagcedjc',
+                    'questionText': 'hihegjif',
+                    'options': Json({'bdjidcidac': True}),
+                    'correctAnswerId': 'ifgaaagff',
                 },
                 'update': {
-                    'questionText': 'icadbcehj',
-                    'options': Json({'jchciaee': True}),
-                    'correctAnswerId': 'deeificjd',
+                    'questionText': 'hihegjif',
+                    'options': Json({'bdjidcidac': True}),
+                    'correctAnswerId': 'ifgaaagff',
                 },
             },
         )
@@ -5907,7 +6935,7 @@ class QuestionActions(Generic[_PrismaModelT]):
         # update all Question records
         total = await Question.prisma().update_many(
             data={
-                'difficultyLevel': 'fcfhgbjed'
+                'difficultyLevel': 'cahhaghecf'
             },
             where={}
         )
@@ -6178,10 +7206,10 @@ class QuestionActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        # group Question records by id values
+        # group Question records by clientPayload values
         # and count how many records are in each group
         results = await Question.prisma().group_by(
-            ['id'],
+            ['clientPayload'],
             count=True,
         )
         ```
@@ -6270,7 +7298,7 @@ class UserAnswerActions(Generic[_PrismaModelT]):
         ```py
         users = await UserAnswer.prisma().query_raw(
             'SELECT * FROM UserAnswer WHERE id = $1',
-            'hdgcajhjg',
+            'bghcbbcidi',
         )
         ```
         """
@@ -6310,7 +7338,7 @@ class UserAnswerActions(Generic[_PrismaModelT]):
         ```py
         user = await UserAnswer.prisma().query_first(
             'SELECT * FROM UserAnswer WHERE userId = $1',
-            'ejdjahicb',
+            'jcgghhgdj',
         )
         ```
         """
@@ -6349,9 +7377,9 @@ class UserAnswerActions(Generic[_PrismaModelT]):
         useranswer = await UserAnswer.prisma().create(
             data={
                 # data to create a UserAnswer record
-                'userId': 'gdjgigfgc',
-                'questionId': 'gfeaahdeh',
-                'selectedOptionId': 'bjafcgbffc',
+                'userId': 'beehgcebbg',
+                'questionId': 'bhdiaidiaf',
+                'selectedOptionId': 'deajegcfi',
                 'isCorrect': False,
             },
         )
@@ -6407,16 +7435,16 @@ class UserAnswerActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a UserAnswer record
-                    'userId': 'bdjidcidac',
-                    'questionId': 'ifgaaagff',
-                    'selectedOptionId': 'befcddgjce',
+                    'userId': 'cjagadcjg',
+                    'questionId': 'bifficggej',
+                    'selectedOptionId': 'bgbbaajbic',
                     'isCorrect': False,
                 },
                 {
                     # data to create a UserAnswer record
-                    'userId': 'cabdjadaji',
-                    'questionId': 'faajgfadf',
-                    'selectedOptionId': 'biaagcedjc',
+                    'userId': 'daafgidjg',
+                    'questionId': 'gdcgcgagj',
+                    'selectedOptionId': 'bhceabbgja',
                     'isCorrect': False,
                 },
             ],
@@ -6471,7 +7499,7 @@ class UserAnswerActions(Generic[_PrismaModelT]):
         ```py
         useranswer = await UserAnswer.prisma().delete(
             where={
-                'id': 'bghcbbcidi',
+                'id': 'bcajcajjbc',
             },
         )
         ```
@@ -6523,7 +7551,7 @@ class UserAnswerActions(Generic[_PrismaModelT]):
         ```py
         useranswer = await UserAnswer.prisma().find_unique(
             where={
-                'id': 'jcgghhgdj',
+                'id': 'bfdgheeegf',
             },
         )
         ```
@@ -6574,7 +7602,7 @@ class UserAnswerActions(Generic[_PrismaModelT]):
         ```py
         useranswer = await UserAnswer.prisma().find_unique_or_raise(
             where={
-                'id': 'beehgcebbg',
+                'id': 'ececbijji',
             },
         )
         ```
@@ -6826,7 +7854,7 @@ class UserAnswerActions(Generic[_PrismaModelT]):
         ```py
         useranswer = await UserAnswer.prisma().update(
             where={
-                'id': 'bhdiaidiaf',
+                'id': 'cbcfgdcdhf',
             },
             data={
                 # data to update the UserAnswer record to
@@ -6883,20 +7911,20 @@ class UserAnswerActions(Generic[_PrismaModelT]):
         ```py
         useranswer = await UserAnswer.prisma().upsert(
             where={
-                'id': 'deajegcfi',
+                'id': 'fdgjfbhia',
             },
             data={
                 'create': {
-                    'id': 'deajegcfi',
-                    'userId': 'cabdjadaji',
-                    'questionId': 'faajgfadf',
-                    'selectedOptionId': 'biaagcedjc',
+                    'id': 'fdgjfbhia',
+                    'userId': 'daafgidjg',
+                    'questionId': 'gdcgcgagj',
+                    'selectedOptionId': 'bhceabbgja',
                     'isCorrect': False,
                 },
                 'update': {
-                    'userId': 'cabdjadaji',
-                    'questionId': 'faajgfadf',
-                    'selectedOptionId': 'biaagcedjc',
+                    'userId': 'daafgidjg',
+                    'questionId': 'gdcgcgagj',
+                    'selectedOptionId': 'bhceabbgja',
                     'isCorrect': False,
                 },
             },
@@ -7308,7 +8336,7 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
         ```py
         users = await UserWrongdoingQuestion.prisma().query_raw(
             'SELECT * FROM UserWrongdoingQuestion WHERE id = $1',
-            'gabahhhjf',
+            'jcehcdchh',
         )
         ```
         """
@@ -7348,7 +8376,7 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
         ```py
         user = await UserWrongdoingQuestion.prisma().query_first(
             'SELECT * FROM UserWrongdoingQuestion WHERE userId = $1',
-            'cjagadcjg',
+            'bgcbjdhjcc',
         )
         ```
         """
@@ -7387,8 +8415,8 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
         userwrongdoingquestion = await UserWrongdoingQuestion.prisma().create(
             data={
                 # data to create a UserWrongdoingQuestion record
-                'userId': 'bifficggej',
-                'questionId': 'bgbbaajbic',
+                'userId': 'bieiidcabj',
+                'questionId': 'bjcbfcieaa',
             },
         )
         ```
@@ -7443,13 +8471,13 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
             data=[
                 {
                     # data to create a UserWrongdoingQuestion record
-                    'userId': 'eegghdhjb',
-                    'questionId': 'daafgidjg',
+                    'userId': 'cbaaechiej',
+                    'questionId': 'iejbeaaeg',
                 },
                 {
                     # data to create a UserWrongdoingQuestion record
-                    'userId': 'gdcgcgagj',
-                    'questionId': 'bhceabbgja',
+                    'userId': 'jcibfcbhf',
+                    'questionId': 'chdadcaga',
                 },
             ],
             skip_duplicates=True,
@@ -7503,7 +8531,7 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
         ```py
         userwrongdoingquestion = await UserWrongdoingQuestion.prisma().delete(
             where={
-                'id': 'ehabfhegh',
+                'id': 'jicieifbh',
             },
         )
         ```
@@ -7555,7 +8583,7 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
         ```py
         userwrongdoingquestion = await UserWrongdoingQuestion.prisma().find_unique(
             where={
-                'id': 'bcajcajjbc',
+                'id': 'fbahdheji',
             },
         )
         ```
@@ -7606,7 +8634,7 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
         ```py
         userwrongdoingquestion = await UserWrongdoingQuestion.prisma().find_unique_or_raise(
             where={
-                'id': 'bfdgheeegf',
+                'id': 'cbbheiicgh',
             },
         )
         ```
@@ -7858,7 +8886,7 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
         ```py
         userwrongdoingquestion = await UserWrongdoingQuestion.prisma().update(
             where={
-                'id': 'ececbijji',
+                'id': 'beabjeejdg',
             },
             data={
                 # data to update the UserWrongdoingQuestion record to
@@ -7915,17 +8943,17 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
         ```py
         userwrongdoingquestion = await UserWrongdoingQuestion.prisma().upsert(
             where={
-                'id': 'cbcfgdcdhf',
+                'id': 'bcjhgahffd',
             },
             data={
                 'create': {
-                    'id': 'cbcfgdcdhf',
-                    'userId': 'gdcgcgagj',
-                    'questionId': 'bhceabbgja',
+                    'id': 'bcjhgahffd',
+                    'userId': 'jcibfcbhf',
+                    'questionId': 'chdadcaga',
                 },
                 'update': {
-                    'userId': 'gdcgcgagj',
-                    'questionId': 'bhceabbgja',
+                    'userId': 'jcibfcbhf',
+                    'questionId': 'chdadcaga',
                 },
             },
         )
@@ -7973,7 +9001,7 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
         # update all UserWrongdoingQuestion records
         total = await UserWrongdoingQuestion.prisma().update_many(
             data={
-                'id': 'fdgjfbhia'
+                'nextDueAt': datetime.datetime.utcnow()
             },
             where={}
         )
@@ -8037,7 +9065,7 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
         results = await UserWrongdoingQuestion.prisma().count(
             select={
                 '_all': True,
-                'userId': True,
+                'intervalSeconds': True,
             },
         )
         ```
@@ -8104,7 +9132,7 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
         results = await UserWrongdoingQuestion.prisma().count(
             select={
                 '_all': True,
-                'questionId': True,
+                'ease': True,
             },
         )
         ```
@@ -8244,10 +9272,10 @@ class UserWrongdoingQuestionActions(Generic[_PrismaModelT]):
         Example
         -------
         ```py
-        # group UserWrongdoingQuestion records by timestampMarkedWrong values
+        # group UserWrongdoingQuestion records by repetitions values
         # and count how many records are in each group
         results = await UserWrongdoingQuestion.prisma().group_by(
-            ['timestampMarkedWrong'],
+            ['repetitions'],
             count=True,
         )
         ```
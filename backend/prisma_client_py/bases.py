@@ -94,6 +94,16 @@ class BaseUserDashboardData(_PrismaModel):
         return actions.UserDashboardDataActions[_PrismaModelT](client or get_client(), cls)
 
 
+class BasePointsHistoryEntry(_PrismaModel):
+    __prisma_model__: ClassVar[Literal['PointsHistoryEntry']] = 'PointsHistoryEntry'  # pyright: ignore[reportIncompatibleVariableOverride]
+
+    @classmethod
+    def prisma(cls: Type[_PrismaModelT], client: Optional['Prisma'] = None) -> 'actions.PointsHistoryEntryActions[_PrismaModelT]':
+        from .client import get_client
+
+        return actions.PointsHistoryEntryActions[_PrismaModelT](client or get_client(), cls)
+
+
 class BaseAccount(_PrismaModel):
     __prisma_model__: ClassVar[Literal['Account']] = 'Account'  # pyright: ignore[reportIncompatibleVariableOverride]
 
@@ -96,6 +96,7 @@ class Prisma(AsyncBasePrisma):
     # https://prisma-client-py.readthedocs.io/en/stable/reference/schema-extensions/#instance_name
     user: 'actions.UserActions[models.User]'
     userdashboarddata: 'actions.UserDashboardDataActions[models.UserDashboardData]'
+    pointshistoryentry: 'actions.PointsHistoryEntryActions[models.PointsHistoryEntry]'
     account: 'actions.AccountActions[models.Account]'
     session: 'actions.SessionActions[models.Session]'
     verificationtoken: 'actions.VerificationTokenActions[models.VerificationToken]'
@@ -106,6 +107,7 @@ class Prisma(AsyncBasePrisma):
     __slots__ = (
         'user',
         'userdashboarddata',
+        'pointshistoryentry',
         'account',
         'session',
         'verificationtoken',
@@ -144,6 +146,7 @@ class Prisma(AsyncBasePrisma):
 
         self.user = actions.UserActions[models.User](self, models.User)
         self.userdashboarddata = actions.UserDashboardDataActions[models.UserDashboardData](self, models.UserDashboardData)
+        self.pointshistoryentry = actions.PointsHistoryEntryActions[models.PointsHistoryEntry](self, models.PointsHistoryEntry)
         self.account = actions.AccountActions[models.Account](self, models.Account)
         self.session = actions.SessionActions[models.Session](self, models.Session)
         self.verificationtoken = actions.VerificationTokenActions[models.VerificationToken](self, models.VerificationToken)
@@ -302,6 +305,7 @@ TransactionManager = AsyncTransactionManager[Prisma]
 class Batch:
     user: 'UserBatchActions'
     userdashboarddata: 'UserDashboardDataBatchActions'
+    pointshistoryentry: 'PointsHistoryEntryBatchActions'
     account: 'AccountBatchActions'
     session: 'SessionBatchActions'
     verificationtoken: 'VerificationTokenBatchActions'
@@ -315,6 +319,7 @@ class Batch:
         self._active_provider = client._active_provider
         self.user = UserBatchActions(self)
         self.userdashboarddata = UserDashboardDataBatchActions(self)
+        self.pointshistoryentry = PointsHistoryEntryBatchActions(self)
         self.account = AccountBatchActions(self)
         self.session = SessionBatchActions(self)
         self.verificationtoken = VerificationTokenBatchActions(self)
@@ -595,6 +600,117 @@ class UserDashboardDataBatchActions:
 
 
 
+# NOTE: some arguments are meaningless in this context but are included
+# for completeness sake
+class PointsHistoryEntryBatchActions:
+    def __init__(self, batcher: Batch) -> None:
+        self._batcher = batcher
+
+    def create(
+        self,
+        data: types.PointsHistoryEntryCreateInput,
+        include: Optional[types.PointsHistoryEntryInclude] = None
+    ) -> None:
+        self._batcher._add(
+            method='create',
+            model=models.PointsHistoryEntry,
+            arguments={
+                'data': data,
+                'include': include,
+            },
+        )
+
+    def create_many(
+        self,
+        data: List[types.PointsHistoryEntryCreateWithoutRelationsInput],
+        *,
+        skip_duplicates: Optional[bool] = None,
+    ) -> None:
+        if skip_duplicates and self._batcher._active_provider in CREATE_MANY_SKIP_DUPLICATES_UNSUPPORTED:
+            raise errors.UnsupportedDatabaseError(self._batcher._active_provider, 'create_many_skip_duplicates')
+
+        self._batcher._add(
+            method='create_many',
+            model=models.PointsHistoryEntry,
+            arguments={
+                'data': data,
+                'skipDuplicates': skip_duplicates,
+            },
+            root_selection=['count'],
+        )
+
+    def delete(
+        self,
+        where: types.PointsHistoryEntryWhereUniqueInput,
+        include: Optional[types.PointsHistoryEntryInclude] = None,
+    ) -> None:
+        self._batcher._add(
+            method='delete',
+            model=models.PointsHistoryEntry,
+            arguments={
+                'where': where,
+                'include': include,
+            },
+        )
+
+    def update(
+        self,
+        data: types.PointsHistoryEntryUpdateInput,
+        where: types.PointsHistoryEntryWhereUniqueInput,
+        include: Optional[types.PointsHistoryEntryInclude] = None
+    ) -> None:
+        self._batcher._add(
+            method='update',
+            model=models.PointsHistoryEntry,
+            arguments={
+                'data': data,
+                'where': where,
+                'include': include,
+            },
+        )
+
+    def upsert(
+        self,
+        where: types.PointsHistoryEntryWhereUniqueInput,
+        data: types.PointsHistoryEntryUpsertInput,
+        include: Optional[types.PointsHistoryEntryInclude] = None,
+    ) -> None:
+        self._batcher._add(
+            method='upsert',
+            model=models.PointsHistoryEntry,
+            arguments={
+                'where': where,
+                'include': include,
+                'create': data.get('create'),
+                'update': data.get('update'),
+            },
+        )
+
+    def update_many(
+        self,
+        data: types.PointsHistoryEntryUpdateManyMutationInput,
+        where: types.PointsHistoryEntryWhereInput,
+    ) -> None:
+        self._batcher._add(
+            method='update_many',
+            model=models.PointsHistoryEntry,
+            arguments={'data': data, 'where': where,},
+            root_selection=['count'],
+        )
+
+    def delete_many(
+        self,
+        where: Optional[types.PointsHistoryEntryWhereInput] = None,
+    ) -> None:
+        self._batcher._add(
+            method='delete_many',
+            model=models.PointsHistoryEntry,
+            arguments={'where': where},
+            root_selection=['count'],
+        )
+
+
+
 # NOTE: some arguments are meaningless in this context but are included
 # for completeness sake
 class AccountBatchActions:
@@ -8,6 +8,7 @@ from __future__ import annotations
 PRISMA_MODELS: set[str] = {
     'User',
     'UserDashboardData',
+    'PointsHistoryEntry',
     'Account',
     'Session',
     'VerificationToken',
@@ -23,10 +24,14 @@ RELATIONAL_FIELD_MAPPINGS: dict[str, dict[str, str]] = {
         'userAnswers': 'UserAnswer',
         'wrongdoingQuestions': 'UserWrongdoingQuestion',
         'dashboard': 'UserDashboardData',
+        'pointsHistory': 'PointsHistoryEntry',
     },
     'UserDashboardData': {
         'user': 'User',
     },
+    'PointsHistoryEntry': {
+        'user': 'User',
+    },
     'Account': {
         'user': 'User',
     },
@@ -72,6 +72,7 @@ class User(bases.BaseUser):
     userAnswers: Optional[List['models.UserAnswer']] = None
     wrongdoingQuestions: Optional[List['models.UserWrongdoingQuestion']] = None
     dashboard: Optional['models.UserDashboardData'] = None
+    pointsHistory: Optional[List['models.PointsHistoryEntry']] = None
 
     # take *args and **kwargs so that other metaclasses can define arguments
     def __init_subclass__(
@@ -203,6 +204,7 @@ class UserDashboardData(bases.BaseUserDashboardData):
     totalPoints: _int
     previousSessionPoints: _int
     pointsHistory: _str
+    snapshotVersion: _int
     user: Optional['models.User'] = None
 
     # take *args and **kwargs so that other metaclasses can define arguments
@@ -328,6 +330,139 @@ class UserDashboardData(bases.BaseUserDashboardData):
         _created_partial_types.add(name)
 
 
+class PointsHistoryEntry(bases.BasePointsHistoryEntry):
+    """Represents a PointsHistoryEntry record"""
+
+    id: _str
+    userId: _str
+    points: _int
+    topicId: Optional[_str] = None
+    timestamp: datetime.datetime
+    user: Optional['models.User'] = None
+
+    # take *args and **kwargs so that other metaclasses can define arguments
+    def __init_subclass__(
+        cls,
+        *args: Any,
+        warn_subclass: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init_subclass__()
+        if warn_subclass is not None:
+            warnings.warn(
+                'The `warn_subclass` argument is deprecated as it is no longer necessary and will be removed in the next release',
+                DeprecationWarning,
+                stacklevel=3,
+            )
+
+
+    @staticmethod
+    def create_partial(
+        name: str,
+        include: Optional[Iterable['types.PointsHistoryEntryKeys']] = None,
+        exclude: Optional[Iterable['types.PointsHistoryEntryKeys']] = None,
+        required: Optional[Iterable['types.PointsHistoryEntryKeys']] = None,
+        optional: Optional[Iterable['types.PointsHistoryEntryKeys']] = None,
+        relations: Optional[Mapping['types.PointsHistoryEntryRelationalFieldKeys', str]] = None,
+        exclude_relational_fields: bool = False,
+    ) -> None:
+        if not os.environ.get('PRISMA_GENERATOR_INVOCATION'):
+            raise RuntimeError(
+                'Attempted to create a partial type outside of client generation.'
+            )
+
+        if name in _created_partial_types:
+            raise ValueError(f'Partial type "{name}" has already been created.')
+
+        if include is not None:
+            if exclude is not None:
+                raise TypeError('Exclude and include are mutually exclusive.')
+            if exclude_relational_fields is True:
+                raise TypeError('Include and exclude_relational_fields=True are mutually exclusive.')
+
+        if required and optional:
+            shared = set(required) & set(optional)
+            if shared:
+                raise ValueError(f'Cannot make the same field(s) required and optional {shared}')
+
+        if exclude_relational_fields and relations:
+            raise ValueError(
+                'exclude_relational_fields and relations are mutually exclusive'
+            )
+
+        fields: Dict['types.PointsHistoryEntryKeys', PartialModelField] = OrderedDict()
+
+        try:
+            if include:
+                for field in include:
+                    fields[field] = _PointsHistoryEntry_fields[field].copy()
+            elif exclude:
+                for field in exclude:
+                    if field not in _PointsHistoryEntry_fields:
+                        raise KeyError(field)
+
+                fields = {
+                    key: data.copy()
+                    for key, data in _PointsHistoryEntry_fields.items()
+                    if key not in exclude
+                }
+            else:
+                fields = {
+                    key: data.copy()
+                    for key, data in _PointsHistoryEntry_fields.items()
+                }
+
+            if required:
+                for field in required:
+                    fields[field]['optional'] = False
+
+            if optional:
+                for field in optional:
+                    fields[field]['optional'] = True
+
+            if exclude_relational_fields:
+                fields = {
+                    key: data
+                    for key, data in fields.items()
+                    if key not in _PointsHistoryEntry_relational_fields
+                }
+
+            if relations:
+                for field, type_ in relations.items():
+                    if field not in _PointsHistoryEntry_relational_fields:
+                        raise errors.UnknownRelationalFieldError('PointsHistoryEntry', field)
+
+                    # TODO: this method of validating types is not ideal
+                    # as it means we cannot two create partial types that
+                    # reference each other
+                    if type_ not in _created_partial_types:
+                        raise ValueError(
+                            f'Unknown partial type: "{type_}". '
+                            f'Did you remember to generate the {type_} type before this one?'
+                        )
+
+                    # TODO: support non prisma.partials models
+                    info = fields[field]
+                    if info['is_list']:
+                        info['type'] = f'List[\'partials.{type_}\']'
+                    else:
+                        info['type'] = f'\'partials.{type_}\''
+        except KeyError as exc:
+            raise ValueError(
+                f'{exc.args[0]} is not a valid PointsHistoryEntry / {name} field.'
+            ) from None
+
+        models = partial_models_ctx.get()
+        models.append(
+            {
+                'name': name,
+                'fields': cast(Mapping[str, PartialModelField], fields),
+                'from_model': 'PointsHistoryEntry',
+            }
+        )
+        _created_partial_types.add(name)
+
+
 class Account(bases.BaseAccount):
     """Represents a Account record"""
 
@@ -717,6 +852,7 @@ class Question(bases.BaseQuestion):
     difficultyLevel: Optional[_str] = None
     createdAt: datetime.datetime
     updatedAt: datetime.datetime
+    clientPayload: Optional[_str] = None
     userAnswers: Optional[List['models.UserAnswer']] = None
     wrongdoingQuestions: Optional[List['models.UserWrongdoingQuestion']] = None
 
@@ -987,6 +1123,10 @@ class UserWrongdoingQuestion(bases.BaseUserWrongdoingQuestion):
     questionId: _str
     timestampMarkedWrong: datetime.datetime
     retestedCorrectly: _bool
+    nextDueAt: datetime.datetime
+    intervalSeconds: _int
+    ease: _float
+    repetitions: _int
     user: Optional['models.User'] = None
     question: Optional['models.Question'] = None
 
@@ -1120,6 +1260,7 @@ _User_relational_fields: Set[str] = {
         'userAnswers',
         'wrongdoingQuestions',
         'dashboard',
+        'pointsHistory',
     }
 _User_fields: Dict['types.UserKeys', PartialModelField] = OrderedDict(
     [
@@ -1227,6 +1368,14 @@ _User_fields: Dict['types.UserKeys', PartialModelField] = OrderedDict(
             'is_relational': True,
             'documentation': None,
         }),
+        ('pointsHistory', {
+            'name': 'pointsHistory',
+            'is_list': True,
+            'optional': True,
+            'type': 'List[\'models.PointsHistoryEntry\']',
+            'is_relational': True,
+            'documentation': None,
+        }),
     ],
 )
 
@@ -1267,6 +1416,70 @@ _UserDashboardData_fields: Dict['types.UserDashboardDataKeys', PartialModelField
             'is_relational': False,
             'documentation': None,
         }),
+        ('snapshotVersion', {
+            'name': 'snapshotVersion',
+            'is_list': False,
+            'optional': False,
+            'type': '_int',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('user', {
+            'name': 'user',
+            'is_list': False,
+            'optional': True,
+            'type': 'models.User',
+            'is_relational': True,
+            'documentation': None,
+        }),
+    ],
+)
+
+_PointsHistoryEntry_relational_fields: Set[str] = {
+        'user',
+    }
+_PointsHistoryEntry_fields: Dict['types.PointsHistoryEntryKeys', PartialModelField] = OrderedDict(
+    [
+        ('id', {
+            'name': 'id',
+            'is_list': False,
+            'optional': False,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('userId', {
+            'name': 'userId',
+            'is_list': False,
+            'optional': False,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('points', {
+            'name': 'points',
+            'is_list': False,
+            'optional': False,
+            'type': '_int',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('topicId', {
+            'name': 'topicId',
+            'is_list': False,
+            'optional': True,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('timestamp', {
+            'name': 'timestamp',
+            'is_list': False,
+            'optional': False,
+            'type': 'datetime.datetime',
+            'is_relational': False,
+            'documentation': None,
+        }),
         ('user', {
             'name': 'user',
             'is_list': False,
@@ -1538,6 +1751,14 @@ _Question_fields: Dict['types.QuestionKeys', PartialModelField] = OrderedDict(
             'is_relational': False,
             'documentation': None,
         }),
+        ('clientPayload', {
+            'name': 'clientPayload',
+            'is_list': False,
+            'optional': True,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
         ('userAnswers', {
             'name': 'userAnswers',
             'is_list': True,
@@ -1684,6 +1905,38 @@ _UserWrongdoingQuestion_fields: Dict['types.UserWrongdoingQuestionKeys', Partial
             'is_relational': False,
             'documentation': None,
         }),
+        ('nextDueAt', {
+            'name': 'nextDueAt',
+            'is_list': False,
+            'optional': False,
+            'type': 'datetime.datetime',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('intervalSeconds', {
+            'name': 'intervalSeconds',
+            'is_list': False,
+            'optional': False,
+            'type': '_int',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('ease', {
+            'name': 'ease',
+            'is_list': False,
+            'optional': False,
+            'type': '_float',
+            'is_relational': False,
+            'documentation': None,
+        }),
+        ('repetitions', {
+            'name': 'repetitions',
+            'is_list': False,
+            'optional': False,
+            'type': '_int',
+            'is_relational': False,
+            'documentation': None,
+        }),
         ('user', {
             'name': 'user',
             'is_list': False,
@@ -1712,6 +1965,7 @@ from . import models, actions
 # required to support relationships between models
 model_rebuild(User)
 model_rebuild(UserDashboardData)
+model_rebuild(PointsHistoryEntry)
 model_rebuild(Account)
 model_rebuild(Session)
 model_rebuild(VerificationToken)
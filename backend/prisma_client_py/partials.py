@@ -42,10 +42,44 @@ from . import types, fields, enums, actions, models, bases
 from ._compat import model_rebuild, field_validator
 
 
+class QuestionContent(bases.BaseQuestion):
+    id: _str
+    options: fields.Json
+    clientPayload: Optional[_str] = None
+    questionText: _str
+    correctAnswerId: _str
+
+
+
+class QuestionAnswerKey(bases.BaseQuestion):
+    id: _str
+    correctAnswerId: _str
+
+
+
+class DashboardTotals(bases.BaseUserDashboardData):
+    userId: _str
+    previousSessionPoints: _int
+    totalPoints: _int
+
+
+
+class WrongdoingEntry(bases.BaseUserWrongdoingQuestion):
+    timestampMarkedWrong: datetime.datetime
+    id: _str
+    questionId: _str
+    retestedCorrectly: _bool
+
+
+
 
 # users can modify relational types which are then namespaced to partials.
 # so we have to import ourselves in order to resolve forward references
 from . import partials
 
+model_rebuild(QuestionContent)
+model_rebuild(QuestionAnswerKey)
+model_rebuild(DashboardTotals)
+model_rebuild(WrongdoingEntry)
 
 # fmt: on
@@ -1157,6 +1157,7 @@ class UserOptionalCreateInput(TypedDict, total=False):
     userAnswers: 'UserAnswerCreateManyNestedWithoutRelationsInput'
     wrongdoingQuestions: 'UserWrongdoingQuestionCreateManyNestedWithoutRelationsInput'
     dashboard: 'UserDashboardDataCreateNestedWithoutRelationsInput'
+    pointsHistory: 'PointsHistoryEntryCreateManyNestedWithoutRelationsInput'
 
 
 class UserCreateInput(UserOptionalCreateInput):
@@ -1242,6 +1243,7 @@ class UserUpdateInput(TypedDict, total=False):
     userAnswers: 'UserAnswerUpdateManyWithoutRelationsInput'
     wrongdoingQuestions: 'UserWrongdoingQuestionUpdateManyWithoutRelationsInput'
     dashboard: 'UserDashboardDataUpdateOneWithoutRelationsInput'
+    pointsHistory: 'PointsHistoryEntryUpdateManyWithoutRelationsInput'
 
 
 class UserUpdateManyMutationInput(TypedDict, total=False):
@@ -1415,6 +1417,7 @@ class UserInclude(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUser']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUser']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUser']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUser']
 
 
     
@@ -1426,6 +1429,7 @@ class UserIncludeFromUser(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserRecursive1']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserRecursive1']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserRecursive1']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserRecursive1']
 
 
 class UserIncludeFromUserRecursive1(TypedDict, total=False):
@@ -1435,6 +1439,7 @@ class UserIncludeFromUserRecursive1(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserRecursive2']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserRecursive2']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserRecursive2']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserRecursive2']
 
 
 class UserIncludeFromUserRecursive2(TypedDict, total=False):
@@ -1444,6 +1449,7 @@ class UserIncludeFromUserRecursive2(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserRecursive3']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserRecursive3']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserRecursive3']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserRecursive3']
 
 
 class UserIncludeFromUserRecursive3(TypedDict, total=False):
@@ -1453,6 +1459,7 @@ class UserIncludeFromUserRecursive3(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserRecursive4']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserRecursive4']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserRecursive4']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserRecursive4']
 
 
 class UserIncludeFromUserRecursive4(TypedDict, total=False):
@@ -1645,6 +1652,111 @@ class FindManyUserDashboardDataArgsFromUserRecursive4(TypedDict, total=False):
     
     
 
+class PointsHistoryEntryIncludeFromUser(TypedDict, total=False):
+    """Relational arguments for User"""
+    user: Union[bool, 'UserArgsFromUserRecursive1']
+
+
+class PointsHistoryEntryIncludeFromUserRecursive1(TypedDict, total=False):
+    """Relational arguments for User"""
+    user: Union[bool, 'UserArgsFromUserRecursive2']
+
+
+class PointsHistoryEntryIncludeFromUserRecursive2(TypedDict, total=False):
+    """Relational arguments for User"""
+    user: Union[bool, 'UserArgsFromUserRecursive3']
+
+
+class PointsHistoryEntryIncludeFromUserRecursive3(TypedDict, total=False):
+    """Relational arguments for User"""
+    user: Union[bool, 'UserArgsFromUserRecursive4']
+
+
+class PointsHistoryEntryIncludeFromUserRecursive4(TypedDict, total=False):
+    """Relational arguments for User"""
+
+    
+
+class PointsHistoryEntryArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class PointsHistoryEntryArgsFromUserRecursive1(TypedDict, total=False):
+    """Arguments for User"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class PointsHistoryEntryArgsFromUserRecursive2(TypedDict, total=False):
+    """Arguments for User"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class PointsHistoryEntryArgsFromUserRecursive3(TypedDict, total=False):
+    """Arguments for User"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class PointsHistoryEntryArgsFromUserRecursive4(TypedDict, total=False):
+    """Arguments for User"""
+    
+    
+
+class FindManyPointsHistoryEntryArgsFromUser(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class FindManyPointsHistoryEntryArgsFromUserRecursive1(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class FindManyPointsHistoryEntryArgsFromUserRecursive2(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class FindManyPointsHistoryEntryArgsFromUserRecursive3(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class FindManyPointsHistoryEntryArgsFromUserRecursive4(TypedDict, total=False):
+    """Arguments for User"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    
+    
+
 class AccountIncludeFromUser(TypedDict, total=False):
     """Relational arguments for User"""
     user: Union[bool, 'UserArgsFromUserRecursive1']
@@ -2304,6 +2416,7 @@ class UserWhereInput(TypedDict, total=False):
     userAnswers: 'UserAnswerListRelationFilter'
     wrongdoingQuestions: 'UserWrongdoingQuestionListRelationFilter'
     dashboard: 'UserDashboardDataRelationFilter'
+    pointsHistory: 'PointsHistoryEntryListRelationFilter'
 
     # should be noted that AND and NOT should be Union['UserWhereInputRecursive1', List['UserWhereInputRecursive1']]
     # but this causes mypy to hang :/
@@ -2327,6 +2440,7 @@ class UserWhereInputRecursive1(TypedDict, total=False):
     userAnswers: 'UserAnswerListRelationFilter'
     wrongdoingQuestions: 'UserWrongdoingQuestionListRelationFilter'
     dashboard: 'UserDashboardDataRelationFilter'
+    pointsHistory: 'PointsHistoryEntryListRelationFilter'
 
     # should be noted that AND and NOT should be Union['UserWhereInputRecursive2', List['UserWhereInputRecursive2']]
     # but this causes mypy to hang :/
@@ -2350,6 +2464,7 @@ class UserWhereInputRecursive2(TypedDict, total=False):
     userAnswers: 'UserAnswerListRelationFilter'
     wrongdoingQuestions: 'UserWrongdoingQuestionListRelationFilter'
     dashboard: 'UserDashboardDataRelationFilter'
+    pointsHistory: 'PointsHistoryEntryListRelationFilter'
 
     # should be noted that AND and NOT should be Union['UserWhereInputRecursive3', List['UserWhereInputRecursive3']]
     # but this causes mypy to hang :/
@@ -2373,6 +2488,7 @@ class UserWhereInputRecursive3(TypedDict, total=False):
     userAnswers: 'UserAnswerListRelationFilter'
     wrongdoingQuestions: 'UserWrongdoingQuestionListRelationFilter'
     dashboard: 'UserDashboardDataRelationFilter'
+    pointsHistory: 'PointsHistoryEntryListRelationFilter'
 
     # should be noted that AND and NOT should be Union['UserWhereInputRecursive4', List['UserWhereInputRecursive4']]
     # but this causes mypy to hang :/
@@ -2396,6 +2512,7 @@ class UserWhereInputRecursive4(TypedDict, total=False):
     userAnswers: 'UserAnswerListRelationFilter'
     wrongdoingQuestions: 'UserWrongdoingQuestionListRelationFilter'
     dashboard: 'UserDashboardDataRelationFilter'
+    pointsHistory: 'PointsHistoryEntryListRelationFilter'
 
 
 
@@ -2600,6 +2717,7 @@ UserKeys = Literal[
     'userAnswers',
     'wrongdoingQuestions',
     'dashboard',
+    'pointsHistory',
 ]
 UserScalarFieldKeys = Literal[
     'id',
@@ -2619,6 +2737,7 @@ UserRelationalFieldKeys = Literal[
         'userAnswers',
         'wrongdoingQuestions',
         'dashboard',
+        'pointsHistory',
     ]
 
 # UserDashboardData types
@@ -2629,6 +2748,7 @@ class UserDashboardDataOptionalCreateInput(TypedDict, total=False):
     totalPoints: _int
     previousSessionPoints: _int
     pointsHistory: _str
+    snapshotVersion: _int
     user: 'UserCreateNestedWithoutRelationsInput'
 
 
@@ -2645,6 +2765,7 @@ class UserDashboardDataOptionalCreateWithoutRelationsInput(TypedDict, total=Fals
     totalPoints: _int
     previousSessionPoints: _int
     pointsHistory: _str
+    snapshotVersion: _int
 
 
 class UserDashboardDataCreateWithoutRelationsInput(UserDashboardDataOptionalCreateWithoutRelationsInput):
@@ -2681,6 +2802,7 @@ class UserDashboardDataUpdateInput(TypedDict, total=False):
     totalPoints: Union[AtomicIntInput, _int]
     previousSessionPoints: Union[AtomicIntInput, _int]
     pointsHistory: _str
+    snapshotVersion: Union[AtomicIntInput, _int]
     user: 'UserUpdateOneWithoutRelationsInput'
 
 
@@ -2689,6 +2811,7 @@ class UserDashboardDataUpdateManyMutationInput(TypedDict, total=False):
     totalPoints: Union[AtomicIntInput, _int]
     previousSessionPoints: Union[AtomicIntInput, _int]
     pointsHistory: _str
+    snapshotVersion: Union[AtomicIntInput, _int]
 
 
 class UserDashboardDataUpdateManyWithoutRelationsInput(TypedDict, total=False):
@@ -2755,6 +2878,14 @@ _UserDashboardData_pointsHistory_OrderByInput = TypedDict(
     total=True
 )
 
+_UserDashboardData_snapshotVersion_OrderByInput = TypedDict(
+    '_UserDashboardData_snapshotVersion_OrderByInput',
+    {
+        'snapshotVersion': 'SortOrder',
+    },
+    total=True
+)
+
 _UserDashboardData_RelevanceInner = TypedDict(
     '_UserDashboardData_RelevanceInner',
     {
@@ -2778,6 +2909,7 @@ UserDashboardDataOrderByInput = Union[
     '_UserDashboardData_totalPoints_OrderByInput',
     '_UserDashboardData_previousSessionPoints_OrderByInput',
     '_UserDashboardData_pointsHistory_OrderByInput',
+    '_UserDashboardData_snapshotVersion_OrderByInput',
     '_UserDashboardData_RelevanceOrderByInput',
 ]
 
@@ -2821,6 +2953,7 @@ class UserIncludeFromUserDashboardData(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserDashboardDataRecursive1']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserDashboardDataRecursive1']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserDashboardDataRecursive1']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserDashboardDataRecursive1']
 
 
 class UserIncludeFromUserDashboardDataRecursive1(TypedDict, total=False):
@@ -2830,6 +2963,7 @@ class UserIncludeFromUserDashboardDataRecursive1(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserDashboardDataRecursive2']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserDashboardDataRecursive2']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserDashboardDataRecursive2']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserDashboardDataRecursive2']
 
 
 class UserIncludeFromUserDashboardDataRecursive2(TypedDict, total=False):
@@ -2839,6 +2973,7 @@ class UserIncludeFromUserDashboardDataRecursive2(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserDashboardDataRecursive3']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserDashboardDataRecursive3']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserDashboardDataRecursive3']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserDashboardDataRecursive3']
 
 
 class UserIncludeFromUserDashboardDataRecursive3(TypedDict, total=False):
@@ -2848,6 +2983,7 @@ class UserIncludeFromUserDashboardDataRecursive3(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserDashboardDataRecursive4']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserDashboardDataRecursive4']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserDashboardDataRecursive4']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserDashboardDataRecursive4']
 
 
 class UserIncludeFromUserDashboardDataRecursive4(TypedDict, total=False):
@@ -3040,6 +3176,111 @@ class FindManyUserDashboardDataArgsFromUserDashboardDataRecursive4(TypedDict, to
     
     
 
+class PointsHistoryEntryIncludeFromUserDashboardData(TypedDict, total=False):
+    """Relational arguments for UserDashboardData"""
+    user: Union[bool, 'UserArgsFromUserDashboardDataRecursive1']
+
+
+class PointsHistoryEntryIncludeFromUserDashboardDataRecursive1(TypedDict, total=False):
+    """Relational arguments for UserDashboardData"""
+    user: Union[bool, 'UserArgsFromUserDashboardDataRecursive2']
+
+
+class PointsHistoryEntryIncludeFromUserDashboardDataRecursive2(TypedDict, total=False):
+    """Relational arguments for UserDashboardData"""
+    user: Union[bool, 'UserArgsFromUserDashboardDataRecursive3']
+
+
+class PointsHistoryEntryIncludeFromUserDashboardDataRecursive3(TypedDict, total=False):
+    """Relational arguments for UserDashboardData"""
+    user: Union[bool, 'UserArgsFromUserDashboardDataRecursive4']
+
+
+class PointsHistoryEntryIncludeFromUserDashboardDataRecursive4(TypedDict, total=False):
+    """Relational arguments for UserDashboardData"""
+
+    
+
+class PointsHistoryEntryArgsFromUserDashboardData(TypedDict, total=False):
+    """Arguments for UserDashboardData"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class PointsHistoryEntryArgsFromUserDashboardDataRecursive1(TypedDict, total=False):
+    """Arguments for UserDashboardData"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class PointsHistoryEntryArgsFromUserDashboardDataRecursive2(TypedDict, total=False):
+    """Arguments for UserDashboardData"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class PointsHistoryEntryArgsFromUserDashboardDataRecursive3(TypedDict, total=False):
+    """Arguments for UserDashboardData"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class PointsHistoryEntryArgsFromUserDashboardDataRecursive4(TypedDict, total=False):
+    """Arguments for UserDashboardData"""
+    
+    
+
+class FindManyPointsHistoryEntryArgsFromUserDashboardData(TypedDict, total=False):
+    """Arguments for UserDashboardData"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class FindManyPointsHistoryEntryArgsFromUserDashboardDataRecursive1(TypedDict, total=False):
+    """Arguments for UserDashboardData"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class FindManyPointsHistoryEntryArgsFromUserDashboardDataRecursive2(TypedDict, total=False):
+    """Arguments for UserDashboardData"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class FindManyPointsHistoryEntryArgsFromUserDashboardDataRecursive3(TypedDict, total=False):
+    """Arguments for UserDashboardData"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class FindManyPointsHistoryEntryArgsFromUserDashboardDataRecursive4(TypedDict, total=False):
+    """Arguments for UserDashboardData"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    
+    
+
 class AccountIncludeFromUserDashboardData(TypedDict, total=False):
     """Relational arguments for UserDashboardData"""
     user: Union[bool, 'UserArgsFromUserDashboardDataRecursive1']
@@ -3690,6 +3931,7 @@ class UserDashboardDataWhereInput(TypedDict, total=False):
     totalPoints: Union[_int, 'types.IntFilter']
     previousSessionPoints: Union[_int, 'types.IntFilter']
     pointsHistory: Union[_str, 'types.StringFilter']
+    snapshotVersion: Union[_int, 'types.IntFilter']
     user: 'UserRelationFilter'
 
     # should be noted that AND and NOT should be Union['UserDashboardDataWhereInputRecursive1', List['UserDashboardDataWhereInputRecursive1']]
@@ -3705,6 +3947,7 @@ class UserDashboardDataWhereInputRecursive1(TypedDict, total=False):
     totalPoints: Union[_int, 'types.IntFilter']
     previousSessionPoints: Union[_int, 'types.IntFilter']
     pointsHistory: Union[_str, 'types.StringFilter']
+    snapshotVersion: Union[_int, 'types.IntFilter']
     user: 'UserRelationFilter'
 
     # should be noted that AND and NOT should be Union['UserDashboardDataWhereInputRecursive2', List['UserDashboardDataWhereInputRecursive2']]
@@ -3720,6 +3963,7 @@ class UserDashboardDataWhereInputRecursive2(TypedDict, total=False):
     totalPoints: Union[_int, 'types.IntFilter']
     previousSessionPoints: Union[_int, 'types.IntFilter']
     pointsHistory: Union[_str, 'types.StringFilter']
+    snapshotVersion: Union[_int, 'types.IntFilter']
     user: 'UserRelationFilter'
 
     # should be noted that AND and NOT should be Union['UserDashboardDataWhereInputRecursive3', List['UserDashboardDataWhereInputRecursive3']]
@@ -3735,6 +3979,7 @@ class UserDashboardDataWhereInputRecursive3(TypedDict, total=False):
     totalPoints: Union[_int, 'types.IntFilter']
     previousSessionPoints: Union[_int, 'types.IntFilter']
     pointsHistory: Union[_str, 'types.StringFilter']
+    snapshotVersion: Union[_int, 'types.IntFilter']
     user: 'UserRelationFilter'
 
     # should be noted that AND and NOT should be Union['UserDashboardDataWhereInputRecursive4', List['UserDashboardDataWhereInputRecursive4']]
@@ -3750,6 +3995,7 @@ class UserDashboardDataWhereInputRecursive4(TypedDict, total=False):
     totalPoints: Union[_int, 'types.IntFilter']
     previousSessionPoints: Union[_int, 'types.IntFilter']
     pointsHistory: Union[_str, 'types.StringFilter']
+    snapshotVersion: Union[_int, 'types.IntFilter']
     user: 'UserRelationFilter'
 
 
@@ -3765,6 +4011,7 @@ class UserDashboardDataScalarWhereWithAggregatesInput(TypedDict, total=False):
     totalPoints: Union[_int, 'types.IntWithAggregatesFilter']
     previousSessionPoints: Union[_int, 'types.IntWithAggregatesFilter']
     pointsHistory: Union[_str, 'types.StringWithAggregatesFilter']
+    snapshotVersion: Union[_int, 'types.IntWithAggregatesFilter']
 
     AND: List['UserDashboardDataScalarWhereWithAggregatesInputRecursive1']
     OR: List['UserDashboardDataScalarWhereWithAggregatesInputRecursive1']
@@ -3777,6 +4024,7 @@ class UserDashboardDataScalarWhereWithAggregatesInputRecursive1(TypedDict, total
     totalPoints: Union[_int, 'types.IntWithAggregatesFilter']
     previousSessionPoints: Union[_int, 'types.IntWithAggregatesFilter']
     pointsHistory: Union[_str, 'types.StringWithAggregatesFilter']
+    snapshotVersion: Union[_int, 'types.IntWithAggregatesFilter']
 
     AND: List['UserDashboardDataScalarWhereWithAggregatesInputRecursive2']
     OR: List['UserDashboardDataScalarWhereWithAggregatesInputRecursive2']
@@ -3789,6 +4037,7 @@ class UserDashboardDataScalarWhereWithAggregatesInputRecursive2(TypedDict, total
     totalPoints: Union[_int, 'types.IntWithAggregatesFilter']
     previousSessionPoints: Union[_int, 'types.IntWithAggregatesFilter']
     pointsHistory: Union[_str, 'types.StringWithAggregatesFilter']
+    snapshotVersion: Union[_int, 'types.IntWithAggregatesFilter']
 
     AND: List['UserDashboardDataScalarWhereWithAggregatesInputRecursive3']
     OR: List['UserDashboardDataScalarWhereWithAggregatesInputRecursive3']
@@ -3801,6 +4050,7 @@ class UserDashboardDataScalarWhereWithAggregatesInputRecursive3(TypedDict, total
     totalPoints: Union[_int, 'types.IntWithAggregatesFilter']
     previousSessionPoints: Union[_int, 'types.IntWithAggregatesFilter']
     pointsHistory: Union[_str, 'types.StringWithAggregatesFilter']
+    snapshotVersion: Union[_int, 'types.IntWithAggregatesFilter']
 
     AND: List['UserDashboardDataScalarWhereWithAggregatesInputRecursive4']
     OR: List['UserDashboardDataScalarWhereWithAggregatesInputRecursive4']
@@ -3813,6 +4063,7 @@ class UserDashboardDataScalarWhereWithAggregatesInputRecursive4(TypedDict, total
     totalPoints: Union[_int, 'types.IntWithAggregatesFilter']
     previousSessionPoints: Union[_int, 'types.IntWithAggregatesFilter']
     pointsHistory: Union[_str, 'types.StringWithAggregatesFilter']
+    snapshotVersion: Union[_int, 'types.IntWithAggregatesFilter']
 
 
 
@@ -3821,6 +4072,7 @@ class UserDashboardDataGroupByOutput(TypedDict, total=False):
     totalPoints: _int
     previousSessionPoints: _int
     pointsHistory: _str
+    snapshotVersion: _int
     _sum: 'UserDashboardDataSumAggregateOutput'
     _avg: 'UserDashboardDataAvgAggregateOutput'
     _min: 'UserDashboardDataMinAggregateOutput'
@@ -3832,12 +4084,14 @@ class UserDashboardDataAvgAggregateOutput(TypedDict, total=False):
     """UserDashboardData output for aggregating averages"""
     totalPoints: float
     previousSessionPoints: float
+    snapshotVersion: float
 
 
 class UserDashboardDataSumAggregateOutput(TypedDict, total=False):
     """UserDashboardData output for aggregating sums"""
     totalPoints: _int
     previousSessionPoints: _int
+    snapshotVersion: _int
 
 
 class UserDashboardDataScalarAggregateOutput(TypedDict, total=False):
@@ -3846,6 +4100,7 @@ class UserDashboardDataScalarAggregateOutput(TypedDict, total=False):
     totalPoints: _int
     previousSessionPoints: _int
     pointsHistory: _str
+    snapshotVersion: _int
 
 
 UserDashboardDataMinAggregateOutput = UserDashboardDataScalarAggregateOutput
@@ -3858,6 +4113,7 @@ class UserDashboardDataMaxAggregateInput(TypedDict, total=False):
     totalPoints: bool
     previousSessionPoints: bool
     pointsHistory: bool
+    snapshotVersion: bool
 
 
 class UserDashboardDataMinAggregateInput(TypedDict, total=False):
@@ -3866,12 +4122,14 @@ class UserDashboardDataMinAggregateInput(TypedDict, total=False):
     totalPoints: bool
     previousSessionPoints: bool
     pointsHistory: bool
+    snapshotVersion: bool
 
 
 class UserDashboardDataNumberAggregateInput(TypedDict, total=False):
     """UserDashboardData input for aggregating numbers"""
     totalPoints: bool
     previousSessionPoints: bool
+    snapshotVersion: bool
 
 
 UserDashboardDataAvgAggregateInput = UserDashboardDataNumberAggregateInput
@@ -3882,43 +4140,1485 @@ UserDashboardDataCountAggregateInput = TypedDict(
     'UserDashboardDataCountAggregateInput',
     {
         'userId': bool,
-        'totalPoints': bool,
-        'previousSessionPoints': bool,
-        'pointsHistory': bool,
+        'totalPoints': bool,
+        'previousSessionPoints': bool,
+        'pointsHistory': bool,
+        'snapshotVersion': bool,
+        '_all': bool,
+    },
+    total=False,
+)
+
+UserDashboardDataCountAggregateOutput = TypedDict(
+    'UserDashboardDataCountAggregateOutput',
+    {
+        'userId': int,
+        'totalPoints': int,
+        'previousSessionPoints': int,
+        'pointsHistory': int,
+        'snapshotVersion': int,
+        '_all': int,
+    },
+    total=False,
+)
+
+
+UserDashboardDataKeys = Literal[
+    'userId',
+    'totalPoints',
+    'previousSessionPoints',
+    'pointsHistory',
+    'snapshotVersion',
+    'user',
+]
+UserDashboardDataScalarFieldKeys = Literal[
+    'userId',
+    'totalPoints',
+    'previousSessionPoints',
+    'pointsHistory',
+    'snapshotVersion',
+]
+UserDashboardDataScalarFieldKeysT = TypeVar('UserDashboardDataScalarFieldKeysT', bound=UserDashboardDataScalarFieldKeys)
+
+UserDashboardDataRelationalFieldKeys = Literal[
+        'user',
+    ]
+
+# PointsHistoryEntry types
+
+class PointsHistoryEntryOptionalCreateInput(TypedDict, total=False):
+    """Optional arguments to the PointsHistoryEntry create method"""
+    id: _str
+    userId: _str
+    topicId: Optional[_str]
+    timestamp: datetime.datetime
+    user: 'UserCreateNestedWithoutRelationsInput'
+
+
+class PointsHistoryEntryCreateInput(PointsHistoryEntryOptionalCreateInput):
+    """Required arguments to the PointsHistoryEntry create method"""
+    points: _int
+
+
+# TODO: remove this in favour of without explicit relations
+# e.g. PostCreateWithoutAuthorInput
+
+class PointsHistoryEntryOptionalCreateWithoutRelationsInput(TypedDict, total=False):
+    """Optional arguments to the PointsHistoryEntry create method, without relations"""
+    id: _str
+    userId: _str
+    topicId: Optional[_str]
+    timestamp: datetime.datetime
+
+
+class PointsHistoryEntryCreateWithoutRelationsInput(PointsHistoryEntryOptionalCreateWithoutRelationsInput):
+    """Required arguments to the PointsHistoryEntry create method, without relations"""
+    points: _int
+
+class PointsHistoryEntryConnectOrCreateWithoutRelationsInput(TypedDict):
+    create: 'PointsHistoryEntryCreateWithoutRelationsInput'
+    where: 'PointsHistoryEntryWhereUniqueInput'
+
+class PointsHistoryEntryCreateNestedWithoutRelationsInput(TypedDict, total=False):
+    create: 'PointsHistoryEntryCreateWithoutRelationsInput'
+    connect: 'PointsHistoryEntryWhereUniqueInput'
+    connect_or_create: 'PointsHistoryEntryConnectOrCreateWithoutRelationsInput'
+
+
+class PointsHistoryEntryCreateManyNestedWithoutRelationsInput(TypedDict, total=False):
+    create: Union['PointsHistoryEntryCreateWithoutRelationsInput', List['PointsHistoryEntryCreateWithoutRelationsInput']]
+    connect: Union['PointsHistoryEntryWhereUniqueInput', List['PointsHistoryEntryWhereUniqueInput']]
+    connect_or_create: Union['PointsHistoryEntryConnectOrCreateWithoutRelationsInput', List['PointsHistoryEntryConnectOrCreateWithoutRelationsInput']]
+
+_PointsHistoryEntryWhereUnique_id_Input = TypedDict(
+    '_PointsHistoryEntryWhereUnique_id_Input',
+    {
+        'id': '_str',
+    },
+    total=True
+)
+
+PointsHistoryEntryWhereUniqueInput = _PointsHistoryEntryWhereUnique_id_Input
+
+
+class PointsHistoryEntryUpdateInput(TypedDict, total=False):
+    """Optional arguments for updating a record"""
+    id: _str
+    points: Union[AtomicIntInput, _int]
+    topicId: Optional[_str]
+    timestamp: datetime.datetime
+    user: 'UserUpdateOneWithoutRelationsInput'
+
+
+class PointsHistoryEntryUpdateManyMutationInput(TypedDict, total=False):
+    """Arguments for updating many records"""
+    id: _str
+    points: Union[AtomicIntInput, _int]
+    topicId: Optional[_str]
+    timestamp: datetime.datetime
+
+
+class PointsHistoryEntryUpdateManyWithoutRelationsInput(TypedDict, total=False):
+    create: List['PointsHistoryEntryCreateWithoutRelationsInput']
+    connect: List['PointsHistoryEntryWhereUniqueInput']
+    connect_or_create: List['PointsHistoryEntryConnectOrCreateWithoutRelationsInput']
+    set: List['PointsHistoryEntryWhereUniqueInput']
+    disconnect: List['PointsHistoryEntryWhereUniqueInput']
+    delete: List['PointsHistoryEntryWhereUniqueInput']
+
+    # TODO
+    # update: List['PointsHistoryEntryUpdateWithWhereUniqueWithoutRelationsInput']
+    # updateMany: List['PointsHistoryEntryUpdateManyWithWhereUniqueWithoutRelationsInput']
+    # deleteMany: List['PointsHistoryEntryScalarWhereInput']
+    # upsert: List['PointsHistoryEntryUpserteWithWhereUniqueWithoutRelationsInput']
+
+
+class PointsHistoryEntryUpdateOneWithoutRelationsInput(TypedDict, total=False):
+    create: 'PointsHistoryEntryCreateWithoutRelationsInput'
+    connect: 'PointsHistoryEntryWhereUniqueInput'
+    connect_or_create: 'PointsHistoryEntryConnectOrCreateWithoutRelationsInput'
+    disconnect: bool
+    delete: bool
+
+    # TODO
+    # update: 'PointsHistoryEntryUpdateInput'
+    # upsert: 'PointsHistoryEntryUpsertWithoutRelationsInput'
+
+
+class PointsHistoryEntryUpsertInput(TypedDict):
+    create: 'PointsHistoryEntryCreateInput'
+    update: 'PointsHistoryEntryUpdateInput'  # pyright: ignore[reportIncompatibleMethodOverride]
+
+
+_PointsHistoryEntry_id_OrderByInput = TypedDict(
+    '_PointsHistoryEntry_id_OrderByInput',
+    {
+        'id': 'SortOrder',
+    },
+    total=True
+)
+
+_PointsHistoryEntry_userId_OrderByInput = TypedDict(
+    '_PointsHistoryEntry_userId_OrderByInput',
+    {
+        'userId': 'SortOrder',
+    },
+    total=True
+)
+
+_PointsHistoryEntry_points_OrderByInput = TypedDict(
+    '_PointsHistoryEntry_points_OrderByInput',
+    {
+        'points': 'SortOrder',
+    },
+    total=True
+)
+
+_PointsHistoryEntry_topicId_OrderByInput = TypedDict(
+    '_PointsHistoryEntry_topicId_OrderByInput',
+    {
+        'topicId': 'SortOrder',
+    },
+    total=True
+)
+
+_PointsHistoryEntry_timestamp_OrderByInput = TypedDict(
+    '_PointsHistoryEntry_timestamp_OrderByInput',
+    {
+        'timestamp': 'SortOrder',
+    },
+    total=True
+)
+
+_PointsHistoryEntry_RelevanceInner = TypedDict(
+    '_PointsHistoryEntry_RelevanceInner',
+    {
+        'fields': 'List[PointsHistoryEntryScalarFieldKeys]',
+        'search': 'str',
+        'sort': 'SortOrder',
+    },
+    total=True
+)
+
+_PointsHistoryEntry_RelevanceOrderByInput = TypedDict(
+    '_PointsHistoryEntry_RelevanceOrderByInput',
+    {
+        '_relevance': '_PointsHistoryEntry_RelevanceInner',
+    },
+    total=True
+)
+
+PointsHistoryEntryOrderByInput = Union[
+    '_PointsHistoryEntry_id_OrderByInput',
+    '_PointsHistoryEntry_userId_OrderByInput',
+    '_PointsHistoryEntry_points_OrderByInput',
+    '_PointsHistoryEntry_topicId_OrderByInput',
+    '_PointsHistoryEntry_timestamp_OrderByInput',
+    '_PointsHistoryEntry_RelevanceOrderByInput',
+]
+
+
+
+# recursive PointsHistoryEntry types
+# TODO: cleanup these types
+
+
+# Dict[str, Any] is a mypy limitation
+# see https://github.com/RobertCraigie/prisma-client-py/issues/45
+# switch to pyright for improved types, see https://prisma-client-py.readthedocs.io/en/stable/reference/limitations/
+
+PointsHistoryEntryRelationFilter = TypedDict(
+    'PointsHistoryEntryRelationFilter',
+    {
+        'is': 'Dict[str, Any]',
+        'is_not': 'Dict[str, Any]',
+    },
+    total=False,
+)
+
+
+class PointsHistoryEntryListRelationFilter(TypedDict, total=False):
+    some: 'Dict[str, Any]'
+    none: 'Dict[str, Any]'
+    every: 'Dict[str, Any]'
+
+
+class PointsHistoryEntryInclude(TypedDict, total=False):
+    """PointsHistoryEntry relational arguments"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntry']
+
+
+    
+
+class UserIncludeFromPointsHistoryEntry(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    accounts: Union[bool, 'FindManyAccountArgsFromPointsHistoryEntryRecursive1']
+    sessions: Union[bool, 'FindManySessionArgsFromPointsHistoryEntryRecursive1']
+    userAnswers: Union[bool, 'FindManyUserAnswerArgsFromPointsHistoryEntryRecursive1']
+    wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive1']
+    dashboard: Union[bool, 'UserDashboardDataArgsFromPointsHistoryEntryRecursive1']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromPointsHistoryEntryRecursive1']
+
+
+class UserIncludeFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    accounts: Union[bool, 'FindManyAccountArgsFromPointsHistoryEntryRecursive2']
+    sessions: Union[bool, 'FindManySessionArgsFromPointsHistoryEntryRecursive2']
+    userAnswers: Union[bool, 'FindManyUserAnswerArgsFromPointsHistoryEntryRecursive2']
+    wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive2']
+    dashboard: Union[bool, 'UserDashboardDataArgsFromPointsHistoryEntryRecursive2']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromPointsHistoryEntryRecursive2']
+
+
+class UserIncludeFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    accounts: Union[bool, 'FindManyAccountArgsFromPointsHistoryEntryRecursive3']
+    sessions: Union[bool, 'FindManySessionArgsFromPointsHistoryEntryRecursive3']
+    userAnswers: Union[bool, 'FindManyUserAnswerArgsFromPointsHistoryEntryRecursive3']
+    wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive3']
+    dashboard: Union[bool, 'UserDashboardDataArgsFromPointsHistoryEntryRecursive3']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromPointsHistoryEntryRecursive3']
+
+
+class UserIncludeFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    accounts: Union[bool, 'FindManyAccountArgsFromPointsHistoryEntryRecursive4']
+    sessions: Union[bool, 'FindManySessionArgsFromPointsHistoryEntryRecursive4']
+    userAnswers: Union[bool, 'FindManyUserAnswerArgsFromPointsHistoryEntryRecursive4']
+    wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive4']
+    dashboard: Union[bool, 'UserDashboardDataArgsFromPointsHistoryEntryRecursive4']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromPointsHistoryEntryRecursive4']
+
+
+class UserIncludeFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+    
+
+class UserArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserIncludeFromUserRecursive1'
+
+
+class UserArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserIncludeFromUserRecursive2'
+
+
+class UserArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserIncludeFromUserRecursive3'
+
+
+class UserArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserIncludeFromUserRecursive4'
+
+
+class UserArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    
+    
+
+class FindManyUserArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive1'
+
+
+class FindManyUserArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive2'
+
+
+class FindManyUserArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive3'
+
+
+class FindManyUserArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    include: 'UserIncludeFromUserRecursive4'
+
+
+class FindManyUserArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserOrderByInput', List['UserOrderByInput']]
+    where: 'UserWhereInput'
+    cursor: 'UserWhereUniqueInput'
+    distinct: List['UserScalarFieldKeys']
+    
+    
+
+class UserDashboardDataIncludeFromPointsHistoryEntry(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive1']
+
+
+class UserDashboardDataIncludeFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive2']
+
+
+class UserDashboardDataIncludeFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive3']
+
+
+class UserDashboardDataIncludeFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive4']
+
+
+class UserDashboardDataIncludeFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+    
+
+class UserDashboardDataArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive1'
+
+
+class UserDashboardDataArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive2'
+
+
+class UserDashboardDataArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive3'
+
+
+class UserDashboardDataArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive4'
+
+
+class UserDashboardDataArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    
+    
+
+class FindManyUserDashboardDataArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
+    where: 'UserDashboardDataWhereInput'
+    cursor: 'UserDashboardDataWhereUniqueInput'
+    distinct: List['UserDashboardDataScalarFieldKeys']
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive1'
+
+
+class FindManyUserDashboardDataArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
+    where: 'UserDashboardDataWhereInput'
+    cursor: 'UserDashboardDataWhereUniqueInput'
+    distinct: List['UserDashboardDataScalarFieldKeys']
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive2'
+
+
+class FindManyUserDashboardDataArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
+    where: 'UserDashboardDataWhereInput'
+    cursor: 'UserDashboardDataWhereUniqueInput'
+    distinct: List['UserDashboardDataScalarFieldKeys']
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive3'
+
+
+class FindManyUserDashboardDataArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
+    where: 'UserDashboardDataWhereInput'
+    cursor: 'UserDashboardDataWhereUniqueInput'
+    distinct: List['UserDashboardDataScalarFieldKeys']
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive4'
+
+
+class FindManyUserDashboardDataArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
+    where: 'UserDashboardDataWhereInput'
+    cursor: 'UserDashboardDataWhereUniqueInput'
+    distinct: List['UserDashboardDataScalarFieldKeys']
+    
+    
+
+class PointsHistoryEntryIncludeFromPointsHistoryEntry(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive1']
+
+
+class PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive2']
+
+
+class PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive3']
+
+
+class PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive4']
+
+
+class PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+    
+
+class PointsHistoryEntryArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class PointsHistoryEntryArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class PointsHistoryEntryArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class PointsHistoryEntryArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class PointsHistoryEntryArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    
+    
+
+class FindManyPointsHistoryEntryArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class FindManyPointsHistoryEntryArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class FindManyPointsHistoryEntryArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class FindManyPointsHistoryEntryArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class FindManyPointsHistoryEntryArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    
+    
+
+class AccountIncludeFromPointsHistoryEntry(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive1']
+
+
+class AccountIncludeFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive2']
+
+
+class AccountIncludeFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive3']
+
+
+class AccountIncludeFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive4']
+
+
+class AccountIncludeFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+    
+
+class AccountArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'AccountIncludeFromAccountRecursive1'
+
+
+class AccountArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'AccountIncludeFromAccountRecursive2'
+
+
+class AccountArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'AccountIncludeFromAccountRecursive3'
+
+
+class AccountArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'AccountIncludeFromAccountRecursive4'
+
+
+class AccountArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    
+    
+
+class FindManyAccountArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['AccountOrderByInput', List['AccountOrderByInput']]
+    where: 'AccountWhereInput'
+    cursor: 'AccountWhereUniqueInput'
+    distinct: List['AccountScalarFieldKeys']
+    include: 'AccountIncludeFromAccountRecursive1'
+
+
+class FindManyAccountArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['AccountOrderByInput', List['AccountOrderByInput']]
+    where: 'AccountWhereInput'
+    cursor: 'AccountWhereUniqueInput'
+    distinct: List['AccountScalarFieldKeys']
+    include: 'AccountIncludeFromAccountRecursive2'
+
+
+class FindManyAccountArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['AccountOrderByInput', List['AccountOrderByInput']]
+    where: 'AccountWhereInput'
+    cursor: 'AccountWhereUniqueInput'
+    distinct: List['AccountScalarFieldKeys']
+    include: 'AccountIncludeFromAccountRecursive3'
+
+
+class FindManyAccountArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['AccountOrderByInput', List['AccountOrderByInput']]
+    where: 'AccountWhereInput'
+    cursor: 'AccountWhereUniqueInput'
+    distinct: List['AccountScalarFieldKeys']
+    include: 'AccountIncludeFromAccountRecursive4'
+
+
+class FindManyAccountArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['AccountOrderByInput', List['AccountOrderByInput']]
+    where: 'AccountWhereInput'
+    cursor: 'AccountWhereUniqueInput'
+    distinct: List['AccountScalarFieldKeys']
+    
+    
+
+class SessionIncludeFromPointsHistoryEntry(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive1']
+
+
+class SessionIncludeFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive2']
+
+
+class SessionIncludeFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive3']
+
+
+class SessionIncludeFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive4']
+
+
+class SessionIncludeFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+    
+
+class SessionArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'SessionIncludeFromSessionRecursive1'
+
+
+class SessionArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'SessionIncludeFromSessionRecursive2'
+
+
+class SessionArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'SessionIncludeFromSessionRecursive3'
+
+
+class SessionArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'SessionIncludeFromSessionRecursive4'
+
+
+class SessionArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    
+    
+
+class FindManySessionArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['SessionOrderByInput', List['SessionOrderByInput']]
+    where: 'SessionWhereInput'
+    cursor: 'SessionWhereUniqueInput'
+    distinct: List['SessionScalarFieldKeys']
+    include: 'SessionIncludeFromSessionRecursive1'
+
+
+class FindManySessionArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['SessionOrderByInput', List['SessionOrderByInput']]
+    where: 'SessionWhereInput'
+    cursor: 'SessionWhereUniqueInput'
+    distinct: List['SessionScalarFieldKeys']
+    include: 'SessionIncludeFromSessionRecursive2'
+
+
+class FindManySessionArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['SessionOrderByInput', List['SessionOrderByInput']]
+    where: 'SessionWhereInput'
+    cursor: 'SessionWhereUniqueInput'
+    distinct: List['SessionScalarFieldKeys']
+    include: 'SessionIncludeFromSessionRecursive3'
+
+
+class FindManySessionArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['SessionOrderByInput', List['SessionOrderByInput']]
+    where: 'SessionWhereInput'
+    cursor: 'SessionWhereUniqueInput'
+    distinct: List['SessionScalarFieldKeys']
+    include: 'SessionIncludeFromSessionRecursive4'
+
+
+class FindManySessionArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['SessionOrderByInput', List['SessionOrderByInput']]
+    where: 'SessionWhereInput'
+    cursor: 'SessionWhereUniqueInput'
+    distinct: List['SessionScalarFieldKeys']
+    
+    
+
+class VerificationTokenIncludeFromPointsHistoryEntry(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+
+class VerificationTokenIncludeFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+
+class VerificationTokenIncludeFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+
+class VerificationTokenIncludeFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+
+class VerificationTokenIncludeFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+    
+
+class VerificationTokenArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'VerificationTokenIncludeFromVerificationTokenRecursive1'
+
+
+class VerificationTokenArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'VerificationTokenIncludeFromVerificationTokenRecursive2'
+
+
+class VerificationTokenArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'VerificationTokenIncludeFromVerificationTokenRecursive3'
+
+
+class VerificationTokenArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'VerificationTokenIncludeFromVerificationTokenRecursive4'
+
+
+class VerificationTokenArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    
+    
+
+class FindManyVerificationTokenArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['VerificationTokenOrderByInput', List['VerificationTokenOrderByInput']]
+    where: 'VerificationTokenWhereInput'
+    cursor: 'VerificationTokenWhereUniqueInput'
+    distinct: List['VerificationTokenScalarFieldKeys']
+    include: 'VerificationTokenIncludeFromVerificationTokenRecursive1'
+
+
+class FindManyVerificationTokenArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['VerificationTokenOrderByInput', List['VerificationTokenOrderByInput']]
+    where: 'VerificationTokenWhereInput'
+    cursor: 'VerificationTokenWhereUniqueInput'
+    distinct: List['VerificationTokenScalarFieldKeys']
+    include: 'VerificationTokenIncludeFromVerificationTokenRecursive2'
+
+
+class FindManyVerificationTokenArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['VerificationTokenOrderByInput', List['VerificationTokenOrderByInput']]
+    where: 'VerificationTokenWhereInput'
+    cursor: 'VerificationTokenWhereUniqueInput'
+    distinct: List['VerificationTokenScalarFieldKeys']
+    include: 'VerificationTokenIncludeFromVerificationTokenRecursive3'
+
+
+class FindManyVerificationTokenArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['VerificationTokenOrderByInput', List['VerificationTokenOrderByInput']]
+    where: 'VerificationTokenWhereInput'
+    cursor: 'VerificationTokenWhereUniqueInput'
+    distinct: List['VerificationTokenScalarFieldKeys']
+    include: 'VerificationTokenIncludeFromVerificationTokenRecursive4'
+
+
+class FindManyVerificationTokenArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['VerificationTokenOrderByInput', List['VerificationTokenOrderByInput']]
+    where: 'VerificationTokenWhereInput'
+    cursor: 'VerificationTokenWhereUniqueInput'
+    distinct: List['VerificationTokenScalarFieldKeys']
+    
+    
+
+class QuestionIncludeFromPointsHistoryEntry(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    userAnswers: Union[bool, 'FindManyUserAnswerArgsFromPointsHistoryEntryRecursive1']
+    wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive1']
+
+
+class QuestionIncludeFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    userAnswers: Union[bool, 'FindManyUserAnswerArgsFromPointsHistoryEntryRecursive2']
+    wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive2']
+
+
+class QuestionIncludeFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    userAnswers: Union[bool, 'FindManyUserAnswerArgsFromPointsHistoryEntryRecursive3']
+    wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive3']
+
+
+class QuestionIncludeFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    userAnswers: Union[bool, 'FindManyUserAnswerArgsFromPointsHistoryEntryRecursive4']
+    wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive4']
+
+
+class QuestionIncludeFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+    
+
+class QuestionArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'QuestionIncludeFromQuestionRecursive1'
+
+
+class QuestionArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'QuestionIncludeFromQuestionRecursive2'
+
+
+class QuestionArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'QuestionIncludeFromQuestionRecursive3'
+
+
+class QuestionArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'QuestionIncludeFromQuestionRecursive4'
+
+
+class QuestionArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    
+    
+
+class FindManyQuestionArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['QuestionOrderByInput', List['QuestionOrderByInput']]
+    where: 'QuestionWhereInput'
+    cursor: 'QuestionWhereUniqueInput'
+    distinct: List['QuestionScalarFieldKeys']
+    include: 'QuestionIncludeFromQuestionRecursive1'
+
+
+class FindManyQuestionArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['QuestionOrderByInput', List['QuestionOrderByInput']]
+    where: 'QuestionWhereInput'
+    cursor: 'QuestionWhereUniqueInput'
+    distinct: List['QuestionScalarFieldKeys']
+    include: 'QuestionIncludeFromQuestionRecursive2'
+
+
+class FindManyQuestionArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['QuestionOrderByInput', List['QuestionOrderByInput']]
+    where: 'QuestionWhereInput'
+    cursor: 'QuestionWhereUniqueInput'
+    distinct: List['QuestionScalarFieldKeys']
+    include: 'QuestionIncludeFromQuestionRecursive3'
+
+
+class FindManyQuestionArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['QuestionOrderByInput', List['QuestionOrderByInput']]
+    where: 'QuestionWhereInput'
+    cursor: 'QuestionWhereUniqueInput'
+    distinct: List['QuestionScalarFieldKeys']
+    include: 'QuestionIncludeFromQuestionRecursive4'
+
+
+class FindManyQuestionArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['QuestionOrderByInput', List['QuestionOrderByInput']]
+    where: 'QuestionWhereInput'
+    cursor: 'QuestionWhereUniqueInput'
+    distinct: List['QuestionScalarFieldKeys']
+    
+    
+
+class UserAnswerIncludeFromPointsHistoryEntry(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive1']
+    question: Union[bool, 'QuestionArgsFromPointsHistoryEntryRecursive1']
+
+
+class UserAnswerIncludeFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive2']
+    question: Union[bool, 'QuestionArgsFromPointsHistoryEntryRecursive2']
+
+
+class UserAnswerIncludeFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive3']
+    question: Union[bool, 'QuestionArgsFromPointsHistoryEntryRecursive3']
+
+
+class UserAnswerIncludeFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive4']
+    question: Union[bool, 'QuestionArgsFromPointsHistoryEntryRecursive4']
+
+
+class UserAnswerIncludeFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+    
+
+class UserAnswerArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserAnswerIncludeFromUserAnswerRecursive1'
+
+
+class UserAnswerArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserAnswerIncludeFromUserAnswerRecursive2'
+
+
+class UserAnswerArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserAnswerIncludeFromUserAnswerRecursive3'
+
+
+class UserAnswerArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserAnswerIncludeFromUserAnswerRecursive4'
+
+
+class UserAnswerArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    
+    
+
+class FindManyUserAnswerArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserAnswerOrderByInput', List['UserAnswerOrderByInput']]
+    where: 'UserAnswerWhereInput'
+    cursor: 'UserAnswerWhereUniqueInput'
+    distinct: List['UserAnswerScalarFieldKeys']
+    include: 'UserAnswerIncludeFromUserAnswerRecursive1'
+
+
+class FindManyUserAnswerArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserAnswerOrderByInput', List['UserAnswerOrderByInput']]
+    where: 'UserAnswerWhereInput'
+    cursor: 'UserAnswerWhereUniqueInput'
+    distinct: List['UserAnswerScalarFieldKeys']
+    include: 'UserAnswerIncludeFromUserAnswerRecursive2'
+
+
+class FindManyUserAnswerArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserAnswerOrderByInput', List['UserAnswerOrderByInput']]
+    where: 'UserAnswerWhereInput'
+    cursor: 'UserAnswerWhereUniqueInput'
+    distinct: List['UserAnswerScalarFieldKeys']
+    include: 'UserAnswerIncludeFromUserAnswerRecursive3'
+
+
+class FindManyUserAnswerArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserAnswerOrderByInput', List['UserAnswerOrderByInput']]
+    where: 'UserAnswerWhereInput'
+    cursor: 'UserAnswerWhereUniqueInput'
+    distinct: List['UserAnswerScalarFieldKeys']
+    include: 'UserAnswerIncludeFromUserAnswerRecursive4'
+
+
+class FindManyUserAnswerArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserAnswerOrderByInput', List['UserAnswerOrderByInput']]
+    where: 'UserAnswerWhereInput'
+    cursor: 'UserAnswerWhereUniqueInput'
+    distinct: List['UserAnswerScalarFieldKeys']
+    
+    
+
+class UserWrongdoingQuestionIncludeFromPointsHistoryEntry(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive1']
+    question: Union[bool, 'QuestionArgsFromPointsHistoryEntryRecursive1']
+
+
+class UserWrongdoingQuestionIncludeFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive2']
+    question: Union[bool, 'QuestionArgsFromPointsHistoryEntryRecursive2']
+
+
+class UserWrongdoingQuestionIncludeFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive3']
+    question: Union[bool, 'QuestionArgsFromPointsHistoryEntryRecursive3']
+
+
+class UserWrongdoingQuestionIncludeFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+    user: Union[bool, 'UserArgsFromPointsHistoryEntryRecursive4']
+    question: Union[bool, 'QuestionArgsFromPointsHistoryEntryRecursive4']
+
+
+class UserWrongdoingQuestionIncludeFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Relational arguments for PointsHistoryEntry"""
+
+    
+
+class UserWrongdoingQuestionArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserWrongdoingQuestionIncludeFromUserWrongdoingQuestionRecursive1'
+
+
+class UserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserWrongdoingQuestionIncludeFromUserWrongdoingQuestionRecursive2'
+
+
+class UserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserWrongdoingQuestionIncludeFromUserWrongdoingQuestionRecursive3'
+
+
+class UserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    include: 'UserWrongdoingQuestionIncludeFromUserWrongdoingQuestionRecursive4'
+
+
+class UserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    
+    
+
+class FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntry(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserWrongdoingQuestionOrderByInput', List['UserWrongdoingQuestionOrderByInput']]
+    where: 'UserWrongdoingQuestionWhereInput'
+    cursor: 'UserWrongdoingQuestionWhereUniqueInput'
+    distinct: List['UserWrongdoingQuestionScalarFieldKeys']
+    include: 'UserWrongdoingQuestionIncludeFromUserWrongdoingQuestionRecursive1'
+
+
+class FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive1(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserWrongdoingQuestionOrderByInput', List['UserWrongdoingQuestionOrderByInput']]
+    where: 'UserWrongdoingQuestionWhereInput'
+    cursor: 'UserWrongdoingQuestionWhereUniqueInput'
+    distinct: List['UserWrongdoingQuestionScalarFieldKeys']
+    include: 'UserWrongdoingQuestionIncludeFromUserWrongdoingQuestionRecursive2'
+
+
+class FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive2(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserWrongdoingQuestionOrderByInput', List['UserWrongdoingQuestionOrderByInput']]
+    where: 'UserWrongdoingQuestionWhereInput'
+    cursor: 'UserWrongdoingQuestionWhereUniqueInput'
+    distinct: List['UserWrongdoingQuestionScalarFieldKeys']
+    include: 'UserWrongdoingQuestionIncludeFromUserWrongdoingQuestionRecursive3'
+
+
+class FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive3(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserWrongdoingQuestionOrderByInput', List['UserWrongdoingQuestionOrderByInput']]
+    where: 'UserWrongdoingQuestionWhereInput'
+    cursor: 'UserWrongdoingQuestionWhereUniqueInput'
+    distinct: List['UserWrongdoingQuestionScalarFieldKeys']
+    include: 'UserWrongdoingQuestionIncludeFromUserWrongdoingQuestionRecursive4'
+
+
+class FindManyUserWrongdoingQuestionArgsFromPointsHistoryEntryRecursive4(TypedDict, total=False):
+    """Arguments for PointsHistoryEntry"""
+    take: int
+    skip: int
+    order_by: Union['UserWrongdoingQuestionOrderByInput', List['UserWrongdoingQuestionOrderByInput']]
+    where: 'UserWrongdoingQuestionWhereInput'
+    cursor: 'UserWrongdoingQuestionWhereUniqueInput'
+    distinct: List['UserWrongdoingQuestionScalarFieldKeys']
+    
+
+
+FindManyPointsHistoryEntryArgs = FindManyPointsHistoryEntryArgsFromPointsHistoryEntry
+FindFirstPointsHistoryEntryArgs = FindManyPointsHistoryEntryArgsFromPointsHistoryEntry
+
+
+    
+
+class PointsHistoryEntryWhereInput(TypedDict, total=False):
+    """PointsHistoryEntry arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    userId: Union[_str, 'types.StringFilter']
+    points: Union[_int, 'types.IntFilter']
+    topicId: Union[None, _str, 'types.StringFilter']
+    timestamp: Union[datetime.datetime, 'types.DateTimeFilter']
+    user: 'UserRelationFilter'
+
+    # should be noted that AND and NOT should be Union['PointsHistoryEntryWhereInputRecursive1', List['PointsHistoryEntryWhereInputRecursive1']]
+    # but this causes mypy to hang :/
+    AND: List['PointsHistoryEntryWhereInputRecursive1']
+    OR: List['PointsHistoryEntryWhereInputRecursive1']
+    NOT: List['PointsHistoryEntryWhereInputRecursive1']
+
+
+class PointsHistoryEntryWhereInputRecursive1(TypedDict, total=False):
+    """PointsHistoryEntry arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    userId: Union[_str, 'types.StringFilter']
+    points: Union[_int, 'types.IntFilter']
+    topicId: Union[None, _str, 'types.StringFilter']
+    timestamp: Union[datetime.datetime, 'types.DateTimeFilter']
+    user: 'UserRelationFilter'
+
+    # should be noted that AND and NOT should be Union['PointsHistoryEntryWhereInputRecursive2', List['PointsHistoryEntryWhereInputRecursive2']]
+    # but this causes mypy to hang :/
+    AND: List['PointsHistoryEntryWhereInputRecursive2']
+    OR: List['PointsHistoryEntryWhereInputRecursive2']
+    NOT: List['PointsHistoryEntryWhereInputRecursive2']
+
+
+class PointsHistoryEntryWhereInputRecursive2(TypedDict, total=False):
+    """PointsHistoryEntry arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    userId: Union[_str, 'types.StringFilter']
+    points: Union[_int, 'types.IntFilter']
+    topicId: Union[None, _str, 'types.StringFilter']
+    timestamp: Union[datetime.datetime, 'types.DateTimeFilter']
+    user: 'UserRelationFilter'
+
+    # should be noted that AND and NOT should be Union['PointsHistoryEntryWhereInputRecursive3', List['PointsHistoryEntryWhereInputRecursive3']]
+    # but this causes mypy to hang :/
+    AND: List['PointsHistoryEntryWhereInputRecursive3']
+    OR: List['PointsHistoryEntryWhereInputRecursive3']
+    NOT: List['PointsHistoryEntryWhereInputRecursive3']
+
+
+class PointsHistoryEntryWhereInputRecursive3(TypedDict, total=False):
+    """PointsHistoryEntry arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    userId: Union[_str, 'types.StringFilter']
+    points: Union[_int, 'types.IntFilter']
+    topicId: Union[None, _str, 'types.StringFilter']
+    timestamp: Union[datetime.datetime, 'types.DateTimeFilter']
+    user: 'UserRelationFilter'
+
+    # should be noted that AND and NOT should be Union['PointsHistoryEntryWhereInputRecursive4', List['PointsHistoryEntryWhereInputRecursive4']]
+    # but this causes mypy to hang :/
+    AND: List['PointsHistoryEntryWhereInputRecursive4']
+    OR: List['PointsHistoryEntryWhereInputRecursive4']
+    NOT: List['PointsHistoryEntryWhereInputRecursive4']
+
+
+class PointsHistoryEntryWhereInputRecursive4(TypedDict, total=False):
+    """PointsHistoryEntry arguments for searching"""
+    id: Union[_str, 'types.StringFilter']
+    userId: Union[_str, 'types.StringFilter']
+    points: Union[_int, 'types.IntFilter']
+    topicId: Union[None, _str, 'types.StringFilter']
+    timestamp: Union[datetime.datetime, 'types.DateTimeFilter']
+    user: 'UserRelationFilter'
+
+
+
+# aggregate PointsHistoryEntry types
+
+
+    
+
+class PointsHistoryEntryScalarWhereWithAggregatesInput(TypedDict, total=False):
+    """PointsHistoryEntry arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    userId: Union[_str, 'types.StringWithAggregatesFilter']
+    points: Union[_int, 'types.IntWithAggregatesFilter']
+    topicId: Union[_str, 'types.StringWithAggregatesFilter']
+    timestamp: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['PointsHistoryEntryScalarWhereWithAggregatesInputRecursive1']
+    OR: List['PointsHistoryEntryScalarWhereWithAggregatesInputRecursive1']
+    NOT: List['PointsHistoryEntryScalarWhereWithAggregatesInputRecursive1']
+
+
+class PointsHistoryEntryScalarWhereWithAggregatesInputRecursive1(TypedDict, total=False):
+    """PointsHistoryEntry arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    userId: Union[_str, 'types.StringWithAggregatesFilter']
+    points: Union[_int, 'types.IntWithAggregatesFilter']
+    topicId: Union[_str, 'types.StringWithAggregatesFilter']
+    timestamp: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['PointsHistoryEntryScalarWhereWithAggregatesInputRecursive2']
+    OR: List['PointsHistoryEntryScalarWhereWithAggregatesInputRecursive2']
+    NOT: List['PointsHistoryEntryScalarWhereWithAggregatesInputRecursive2']
+
+
+class PointsHistoryEntryScalarWhereWithAggregatesInputRecursive2(TypedDict, total=False):
+    """PointsHistoryEntry arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    userId: Union[_str, 'types.StringWithAggregatesFilter']
+    points: Union[_int, 'types.IntWithAggregatesFilter']
+    topicId: Union[_str, 'types.StringWithAggregatesFilter']
+    timestamp: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['PointsHistoryEntryScalarWhereWithAggregatesInputRecursive3']
+    OR: List['PointsHistoryEntryScalarWhereWithAggregatesInputRecursive3']
+    NOT: List['PointsHistoryEntryScalarWhereWithAggregatesInputRecursive3']
+
+
+class PointsHistoryEntryScalarWhereWithAggregatesInputRecursive3(TypedDict, total=False):
+    """PointsHistoryEntry arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    userId: Union[_str, 'types.StringWithAggregatesFilter']
+    points: Union[_int, 'types.IntWithAggregatesFilter']
+    topicId: Union[_str, 'types.StringWithAggregatesFilter']
+    timestamp: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+    AND: List['PointsHistoryEntryScalarWhereWithAggregatesInputRecursive4']
+    OR: List['PointsHistoryEntryScalarWhereWithAggregatesInputRecursive4']
+    NOT: List['PointsHistoryEntryScalarWhereWithAggregatesInputRecursive4']
+
+
+class PointsHistoryEntryScalarWhereWithAggregatesInputRecursive4(TypedDict, total=False):
+    """PointsHistoryEntry arguments for searching"""
+    id: Union[_str, 'types.StringWithAggregatesFilter']
+    userId: Union[_str, 'types.StringWithAggregatesFilter']
+    points: Union[_int, 'types.IntWithAggregatesFilter']
+    topicId: Union[_str, 'types.StringWithAggregatesFilter']
+    timestamp: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+
+
+
+class PointsHistoryEntryGroupByOutput(TypedDict, total=False):
+    id: _str
+    userId: _str
+    points: _int
+    topicId: _str
+    timestamp: datetime.datetime
+    _sum: 'PointsHistoryEntrySumAggregateOutput'
+    _avg: 'PointsHistoryEntryAvgAggregateOutput'
+    _min: 'PointsHistoryEntryMinAggregateOutput'
+    _max: 'PointsHistoryEntryMaxAggregateOutput'
+    _count: 'PointsHistoryEntryCountAggregateOutput'
+
+
+class PointsHistoryEntryAvgAggregateOutput(TypedDict, total=False):
+    """PointsHistoryEntry output for aggregating averages"""
+    points: float
+
+
+class PointsHistoryEntrySumAggregateOutput(TypedDict, total=False):
+    """PointsHistoryEntry output for aggregating sums"""
+    points: _int
+
+
+class PointsHistoryEntryScalarAggregateOutput(TypedDict, total=False):
+    """PointsHistoryEntry output including scalar fields"""
+    id: _str
+    userId: _str
+    points: _int
+    topicId: _str
+    timestamp: datetime.datetime
+
+
+PointsHistoryEntryMinAggregateOutput = PointsHistoryEntryScalarAggregateOutput
+PointsHistoryEntryMaxAggregateOutput = PointsHistoryEntryScalarAggregateOutput
+
+
+class PointsHistoryEntryMaxAggregateInput(TypedDict, total=False):
+    """PointsHistoryEntry input for aggregating by max"""
+    id: bool
+    userId: bool
+    points: bool
+    topicId: bool
+    timestamp: bool
+
+
+class PointsHistoryEntryMinAggregateInput(TypedDict, total=False):
+    """PointsHistoryEntry input for aggregating by min"""
+    id: bool
+    userId: bool
+    points: bool
+    topicId: bool
+    timestamp: bool
+
+
+class PointsHistoryEntryNumberAggregateInput(TypedDict, total=False):
+    """PointsHistoryEntry input for aggregating numbers"""
+    points: bool
+
+
+PointsHistoryEntryAvgAggregateInput = PointsHistoryEntryNumberAggregateInput
+PointsHistoryEntrySumAggregateInput = PointsHistoryEntryNumberAggregateInput
+
+
+PointsHistoryEntryCountAggregateInput = TypedDict(
+    'PointsHistoryEntryCountAggregateInput',
+    {
+        'id': bool,
+        'userId': bool,
+        'points': bool,
+        'topicId': bool,
+        'timestamp': bool,
         '_all': bool,
     },
     total=False,
 )
 
-UserDashboardDataCountAggregateOutput = TypedDict(
-    'UserDashboardDataCountAggregateOutput',
+PointsHistoryEntryCountAggregateOutput = TypedDict(
+    'PointsHistoryEntryCountAggregateOutput',
     {
+        'id': int,
         'userId': int,
-        'totalPoints': int,
-        'previousSessionPoints': int,
-        'pointsHistory': int,
+        'points': int,
+        'topicId': int,
+        'timestamp': int,
         '_all': int,
     },
     total=False,
 )
 
 
-UserDashboardDataKeys = Literal[
+PointsHistoryEntryKeys = Literal[
+    'id',
     'userId',
-    'totalPoints',
-    'previousSessionPoints',
-    'pointsHistory',
+    'points',
+    'topicId',
+    'timestamp',
     'user',
 ]
-UserDashboardDataScalarFieldKeys = Literal[
+PointsHistoryEntryScalarFieldKeys = Literal[
+    'id',
     'userId',
-    'totalPoints',
-    'previousSessionPoints',
-    'pointsHistory',
+    'points',
+    'topicId',
+    'timestamp',
 ]
-UserDashboardDataScalarFieldKeysT = TypeVar('UserDashboardDataScalarFieldKeysT', bound=UserDashboardDataScalarFieldKeys)
+PointsHistoryEntryScalarFieldKeysT = TypeVar('PointsHistoryEntryScalarFieldKeysT', bound=PointsHistoryEntryScalarFieldKeys)
 
-UserDashboardDataRelationalFieldKeys = Literal[
+PointsHistoryEntryRelationalFieldKeys = Literal[
         'user',
     ]
 
@@ -4246,6 +5946,7 @@ class UserIncludeFromAccount(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromAccountRecursive1']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromAccountRecursive1']
     dashboard: Union[bool, 'UserDashboardDataArgsFromAccountRecursive1']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromAccountRecursive1']
 
 
 class UserIncludeFromAccountRecursive1(TypedDict, total=False):
@@ -4255,6 +5956,7 @@ class UserIncludeFromAccountRecursive1(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromAccountRecursive2']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromAccountRecursive2']
     dashboard: Union[bool, 'UserDashboardDataArgsFromAccountRecursive2']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromAccountRecursive2']
 
 
 class UserIncludeFromAccountRecursive2(TypedDict, total=False):
@@ -4264,6 +5966,7 @@ class UserIncludeFromAccountRecursive2(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromAccountRecursive3']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromAccountRecursive3']
     dashboard: Union[bool, 'UserDashboardDataArgsFromAccountRecursive3']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromAccountRecursive3']
 
 
 class UserIncludeFromAccountRecursive3(TypedDict, total=False):
@@ -4273,6 +5976,7 @@ class UserIncludeFromAccountRecursive3(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromAccountRecursive4']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromAccountRecursive4']
     dashboard: Union[bool, 'UserDashboardDataArgsFromAccountRecursive4']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromAccountRecursive4']
 
 
 class UserIncludeFromAccountRecursive4(TypedDict, total=False):
@@ -4465,6 +6169,111 @@ class FindManyUserDashboardDataArgsFromAccountRecursive4(TypedDict, total=False)
     
     
 
+class PointsHistoryEntryIncludeFromAccount(TypedDict, total=False):
+    """Relational arguments for Account"""
+    user: Union[bool, 'UserArgsFromAccountRecursive1']
+
+
+class PointsHistoryEntryIncludeFromAccountRecursive1(TypedDict, total=False):
+    """Relational arguments for Account"""
+    user: Union[bool, 'UserArgsFromAccountRecursive2']
+
+
+class PointsHistoryEntryIncludeFromAccountRecursive2(TypedDict, total=False):
+    """Relational arguments for Account"""
+    user: Union[bool, 'UserArgsFromAccountRecursive3']
+
+
+class PointsHistoryEntryIncludeFromAccountRecursive3(TypedDict, total=False):
+    """Relational arguments for Account"""
+    user: Union[bool, 'UserArgsFromAccountRecursive4']
+
+
+class PointsHistoryEntryIncludeFromAccountRecursive4(TypedDict, total=False):
+    """Relational arguments for Account"""
+
+    
+
+class PointsHistoryEntryArgsFromAccount(TypedDict, total=False):
+    """Arguments for Account"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class PointsHistoryEntryArgsFromAccountRecursive1(TypedDict, total=False):
+    """Arguments for Account"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class PointsHistoryEntryArgsFromAccountRecursive2(TypedDict, total=False):
+    """Arguments for Account"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class PointsHistoryEntryArgsFromAccountRecursive3(TypedDict, total=False):
+    """Arguments for Account"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class PointsHistoryEntryArgsFromAccountRecursive4(TypedDict, total=False):
+    """Arguments for Account"""
+    
+    
+
+class FindManyPointsHistoryEntryArgsFromAccount(TypedDict, total=False):
+    """Arguments for Account"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class FindManyPointsHistoryEntryArgsFromAccountRecursive1(TypedDict, total=False):
+    """Arguments for Account"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class FindManyPointsHistoryEntryArgsFromAccountRecursive2(TypedDict, total=False):
+    """Arguments for Account"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class FindManyPointsHistoryEntryArgsFromAccountRecursive3(TypedDict, total=False):
+    """Arguments for Account"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class FindManyPointsHistoryEntryArgsFromAccountRecursive4(TypedDict, total=False):
+    """Arguments for Account"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    
+    
+
 class AccountIncludeFromAccount(TypedDict, total=False):
     """Relational arguments for Account"""
     user: Union[bool, 'UserArgsFromAccountRecursive1']
@@ -5699,6 +7508,7 @@ class UserIncludeFromSession(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromSessionRecursive1']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromSessionRecursive1']
     dashboard: Union[bool, 'UserDashboardDataArgsFromSessionRecursive1']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromSessionRecursive1']
 
 
 class UserIncludeFromSessionRecursive1(TypedDict, total=False):
@@ -5708,6 +7518,7 @@ class UserIncludeFromSessionRecursive1(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromSessionRecursive2']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromSessionRecursive2']
     dashboard: Union[bool, 'UserDashboardDataArgsFromSessionRecursive2']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromSessionRecursive2']
 
 
 class UserIncludeFromSessionRecursive2(TypedDict, total=False):
@@ -5717,6 +7528,7 @@ class UserIncludeFromSessionRecursive2(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromSessionRecursive3']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromSessionRecursive3']
     dashboard: Union[bool, 'UserDashboardDataArgsFromSessionRecursive3']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromSessionRecursive3']
 
 
 class UserIncludeFromSessionRecursive3(TypedDict, total=False):
@@ -5726,6 +7538,7 @@ class UserIncludeFromSessionRecursive3(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromSessionRecursive4']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromSessionRecursive4']
     dashboard: Union[bool, 'UserDashboardDataArgsFromSessionRecursive4']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromSessionRecursive4']
 
 
 class UserIncludeFromSessionRecursive4(TypedDict, total=False):
@@ -5918,6 +7731,111 @@ class FindManyUserDashboardDataArgsFromSessionRecursive4(TypedDict, total=False)
     
     
 
+class PointsHistoryEntryIncludeFromSession(TypedDict, total=False):
+    """Relational arguments for Session"""
+    user: Union[bool, 'UserArgsFromSessionRecursive1']
+
+
+class PointsHistoryEntryIncludeFromSessionRecursive1(TypedDict, total=False):
+    """Relational arguments for Session"""
+    user: Union[bool, 'UserArgsFromSessionRecursive2']
+
+
+class PointsHistoryEntryIncludeFromSessionRecursive2(TypedDict, total=False):
+    """Relational arguments for Session"""
+    user: Union[bool, 'UserArgsFromSessionRecursive3']
+
+
+class PointsHistoryEntryIncludeFromSessionRecursive3(TypedDict, total=False):
+    """Relational arguments for Session"""
+    user: Union[bool, 'UserArgsFromSessionRecursive4']
+
+
+class PointsHistoryEntryIncludeFromSessionRecursive4(TypedDict, total=False):
+    """Relational arguments for Session"""
+
+    
+
+class PointsHistoryEntryArgsFromSession(TypedDict, total=False):
+    """Arguments for Session"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class PointsHistoryEntryArgsFromSessionRecursive1(TypedDict, total=False):
+    """Arguments for Session"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class PointsHistoryEntryArgsFromSessionRecursive2(TypedDict, total=False):
+    """Arguments for Session"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class PointsHistoryEntryArgsFromSessionRecursive3(TypedDict, total=False):
+    """Arguments for Session"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class PointsHistoryEntryArgsFromSessionRecursive4(TypedDict, total=False):
+    """Arguments for Session"""
+    
+    
+
+class FindManyPointsHistoryEntryArgsFromSession(TypedDict, total=False):
+    """Arguments for Session"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class FindManyPointsHistoryEntryArgsFromSessionRecursive1(TypedDict, total=False):
+    """Arguments for Session"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class FindManyPointsHistoryEntryArgsFromSessionRecursive2(TypedDict, total=False):
+    """Arguments for Session"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class FindManyPointsHistoryEntryArgsFromSessionRecursive3(TypedDict, total=False):
+    """Arguments for Session"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class FindManyPointsHistoryEntryArgsFromSessionRecursive4(TypedDict, total=False):
+    """Arguments for Session"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    
+    
+
 class AccountIncludeFromSession(TypedDict, total=False):
     """Relational arguments for Session"""
     user: Union[bool, 'UserArgsFromSessionRecursive1']
@@ -7000,6 +8918,7 @@ class UserIncludeFromVerificationToken(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromVerificationTokenRecursive1']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromVerificationTokenRecursive1']
     dashboard: Union[bool, 'UserDashboardDataArgsFromVerificationTokenRecursive1']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromVerificationTokenRecursive1']
 
 
 class UserIncludeFromVerificationTokenRecursive1(TypedDict, total=False):
@@ -7009,6 +8928,7 @@ class UserIncludeFromVerificationTokenRecursive1(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromVerificationTokenRecursive2']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromVerificationTokenRecursive2']
     dashboard: Union[bool, 'UserDashboardDataArgsFromVerificationTokenRecursive2']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromVerificationTokenRecursive2']
 
 
 class UserIncludeFromVerificationTokenRecursive2(TypedDict, total=False):
@@ -7018,6 +8938,7 @@ class UserIncludeFromVerificationTokenRecursive2(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromVerificationTokenRecursive3']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromVerificationTokenRecursive3']
     dashboard: Union[bool, 'UserDashboardDataArgsFromVerificationTokenRecursive3']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromVerificationTokenRecursive3']
 
 
 class UserIncludeFromVerificationTokenRecursive3(TypedDict, total=False):
@@ -7027,6 +8948,7 @@ class UserIncludeFromVerificationTokenRecursive3(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromVerificationTokenRecursive4']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromVerificationTokenRecursive4']
     dashboard: Union[bool, 'UserDashboardDataArgsFromVerificationTokenRecursive4']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromVerificationTokenRecursive4']
 
 
 class UserIncludeFromVerificationTokenRecursive4(TypedDict, total=False):
@@ -7114,108 +9036,213 @@ class FindManyUserArgsFromVerificationTokenRecursive4(TypedDict, total=False):
     
     
 
-class UserDashboardDataIncludeFromVerificationToken(TypedDict, total=False):
+class UserDashboardDataIncludeFromVerificationToken(TypedDict, total=False):
+    """Relational arguments for VerificationToken"""
+    user: Union[bool, 'UserArgsFromVerificationTokenRecursive1']
+
+
+class UserDashboardDataIncludeFromVerificationTokenRecursive1(TypedDict, total=False):
+    """Relational arguments for VerificationToken"""
+    user: Union[bool, 'UserArgsFromVerificationTokenRecursive2']
+
+
+class UserDashboardDataIncludeFromVerificationTokenRecursive2(TypedDict, total=False):
+    """Relational arguments for VerificationToken"""
+    user: Union[bool, 'UserArgsFromVerificationTokenRecursive3']
+
+
+class UserDashboardDataIncludeFromVerificationTokenRecursive3(TypedDict, total=False):
+    """Relational arguments for VerificationToken"""
+    user: Union[bool, 'UserArgsFromVerificationTokenRecursive4']
+
+
+class UserDashboardDataIncludeFromVerificationTokenRecursive4(TypedDict, total=False):
+    """Relational arguments for VerificationToken"""
+
+    
+
+class UserDashboardDataArgsFromVerificationToken(TypedDict, total=False):
+    """Arguments for VerificationToken"""
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive1'
+
+
+class UserDashboardDataArgsFromVerificationTokenRecursive1(TypedDict, total=False):
+    """Arguments for VerificationToken"""
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive2'
+
+
+class UserDashboardDataArgsFromVerificationTokenRecursive2(TypedDict, total=False):
+    """Arguments for VerificationToken"""
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive3'
+
+
+class UserDashboardDataArgsFromVerificationTokenRecursive3(TypedDict, total=False):
+    """Arguments for VerificationToken"""
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive4'
+
+
+class UserDashboardDataArgsFromVerificationTokenRecursive4(TypedDict, total=False):
+    """Arguments for VerificationToken"""
+    
+    
+
+class FindManyUserDashboardDataArgsFromVerificationToken(TypedDict, total=False):
+    """Arguments for VerificationToken"""
+    take: int
+    skip: int
+    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
+    where: 'UserDashboardDataWhereInput'
+    cursor: 'UserDashboardDataWhereUniqueInput'
+    distinct: List['UserDashboardDataScalarFieldKeys']
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive1'
+
+
+class FindManyUserDashboardDataArgsFromVerificationTokenRecursive1(TypedDict, total=False):
+    """Arguments for VerificationToken"""
+    take: int
+    skip: int
+    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
+    where: 'UserDashboardDataWhereInput'
+    cursor: 'UserDashboardDataWhereUniqueInput'
+    distinct: List['UserDashboardDataScalarFieldKeys']
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive2'
+
+
+class FindManyUserDashboardDataArgsFromVerificationTokenRecursive2(TypedDict, total=False):
+    """Arguments for VerificationToken"""
+    take: int
+    skip: int
+    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
+    where: 'UserDashboardDataWhereInput'
+    cursor: 'UserDashboardDataWhereUniqueInput'
+    distinct: List['UserDashboardDataScalarFieldKeys']
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive3'
+
+
+class FindManyUserDashboardDataArgsFromVerificationTokenRecursive3(TypedDict, total=False):
+    """Arguments for VerificationToken"""
+    take: int
+    skip: int
+    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
+    where: 'UserDashboardDataWhereInput'
+    cursor: 'UserDashboardDataWhereUniqueInput'
+    distinct: List['UserDashboardDataScalarFieldKeys']
+    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive4'
+
+
+class FindManyUserDashboardDataArgsFromVerificationTokenRecursive4(TypedDict, total=False):
+    """Arguments for VerificationToken"""
+    take: int
+    skip: int
+    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
+    where: 'UserDashboardDataWhereInput'
+    cursor: 'UserDashboardDataWhereUniqueInput'
+    distinct: List['UserDashboardDataScalarFieldKeys']
+    
+    
+
+class PointsHistoryEntryIncludeFromVerificationToken(TypedDict, total=False):
     """Relational arguments for VerificationToken"""
     user: Union[bool, 'UserArgsFromVerificationTokenRecursive1']
 
 
-class UserDashboardDataIncludeFromVerificationTokenRecursive1(TypedDict, total=False):
+class PointsHistoryEntryIncludeFromVerificationTokenRecursive1(TypedDict, total=False):
     """Relational arguments for VerificationToken"""
     user: Union[bool, 'UserArgsFromVerificationTokenRecursive2']
 
 
-class UserDashboardDataIncludeFromVerificationTokenRecursive2(TypedDict, total=False):
+class PointsHistoryEntryIncludeFromVerificationTokenRecursive2(TypedDict, total=False):
     """Relational arguments for VerificationToken"""
     user: Union[bool, 'UserArgsFromVerificationTokenRecursive3']
 
 
-class UserDashboardDataIncludeFromVerificationTokenRecursive3(TypedDict, total=False):
+class PointsHistoryEntryIncludeFromVerificationTokenRecursive3(TypedDict, total=False):
     """Relational arguments for VerificationToken"""
     user: Union[bool, 'UserArgsFromVerificationTokenRecursive4']
 
 
-class UserDashboardDataIncludeFromVerificationTokenRecursive4(TypedDict, total=False):
+class PointsHistoryEntryIncludeFromVerificationTokenRecursive4(TypedDict, total=False):
     """Relational arguments for VerificationToken"""
 
     
 
-class UserDashboardDataArgsFromVerificationToken(TypedDict, total=False):
+class PointsHistoryEntryArgsFromVerificationToken(TypedDict, total=False):
     """Arguments for VerificationToken"""
-    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive1'
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
 
 
-class UserDashboardDataArgsFromVerificationTokenRecursive1(TypedDict, total=False):
+class PointsHistoryEntryArgsFromVerificationTokenRecursive1(TypedDict, total=False):
     """Arguments for VerificationToken"""
-    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive2'
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
 
 
-class UserDashboardDataArgsFromVerificationTokenRecursive2(TypedDict, total=False):
+class PointsHistoryEntryArgsFromVerificationTokenRecursive2(TypedDict, total=False):
     """Arguments for VerificationToken"""
-    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive3'
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
 
 
-class UserDashboardDataArgsFromVerificationTokenRecursive3(TypedDict, total=False):
+class PointsHistoryEntryArgsFromVerificationTokenRecursive3(TypedDict, total=False):
     """Arguments for VerificationToken"""
-    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive4'
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
 
 
-class UserDashboardDataArgsFromVerificationTokenRecursive4(TypedDict, total=False):
+class PointsHistoryEntryArgsFromVerificationTokenRecursive4(TypedDict, total=False):
     """Arguments for VerificationToken"""
     
     
 
-class FindManyUserDashboardDataArgsFromVerificationToken(TypedDict, total=False):
+class FindManyPointsHistoryEntryArgsFromVerificationToken(TypedDict, total=False):
     """Arguments for VerificationToken"""
     take: int
     skip: int
-    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
-    where: 'UserDashboardDataWhereInput'
-    cursor: 'UserDashboardDataWhereUniqueInput'
-    distinct: List['UserDashboardDataScalarFieldKeys']
-    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive1'
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
 
 
-class FindManyUserDashboardDataArgsFromVerificationTokenRecursive1(TypedDict, total=False):
+class FindManyPointsHistoryEntryArgsFromVerificationTokenRecursive1(TypedDict, total=False):
     """Arguments for VerificationToken"""
     take: int
     skip: int
-    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
-    where: 'UserDashboardDataWhereInput'
-    cursor: 'UserDashboardDataWhereUniqueInput'
-    distinct: List['UserDashboardDataScalarFieldKeys']
-    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive2'
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
 
 
-class FindManyUserDashboardDataArgsFromVerificationTokenRecursive2(TypedDict, total=False):
+class FindManyPointsHistoryEntryArgsFromVerificationTokenRecursive2(TypedDict, total=False):
     """Arguments for VerificationToken"""
     take: int
     skip: int
-    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
-    where: 'UserDashboardDataWhereInput'
-    cursor: 'UserDashboardDataWhereUniqueInput'
-    distinct: List['UserDashboardDataScalarFieldKeys']
-    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive3'
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
 
 
-class FindManyUserDashboardDataArgsFromVerificationTokenRecursive3(TypedDict, total=False):
+class FindManyPointsHistoryEntryArgsFromVerificationTokenRecursive3(TypedDict, total=False):
     """Arguments for VerificationToken"""
     take: int
     skip: int
-    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
-    where: 'UserDashboardDataWhereInput'
-    cursor: 'UserDashboardDataWhereUniqueInput'
-    distinct: List['UserDashboardDataScalarFieldKeys']
-    include: 'UserDashboardDataIncludeFromUserDashboardDataRecursive4'
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
 
 
-class FindManyUserDashboardDataArgsFromVerificationTokenRecursive4(TypedDict, total=False):
+class FindManyPointsHistoryEntryArgsFromVerificationTokenRecursive4(TypedDict, total=False):
     """Arguments for VerificationToken"""
     take: int
     skip: int
-    order_by: Union['UserDashboardDataOrderByInput', List['UserDashboardDataOrderByInput']]
-    where: 'UserDashboardDataWhereInput'
-    cursor: 'UserDashboardDataWhereUniqueInput'
-    distinct: List['UserDashboardDataScalarFieldKeys']
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
     
     
 
@@ -8078,6 +10105,7 @@ class QuestionOptionalCreateInput(TypedDict, total=False):
     difficultyLevel: Optional[_str]
     createdAt: datetime.datetime
     updatedAt: datetime.datetime
+    clientPayload: Optional[_str]
     userAnswers: 'UserAnswerCreateManyNestedWithoutRelationsInput'
     wrongdoingQuestions: 'UserWrongdoingQuestionCreateManyNestedWithoutRelationsInput'
 
@@ -8099,6 +10127,7 @@ class QuestionOptionalCreateWithoutRelationsInput(TypedDict, total=False):
     difficultyLevel: Optional[_str]
     createdAt: datetime.datetime
     updatedAt: datetime.datetime
+    clientPayload: Optional[_str]
 
 
 class QuestionCreateWithoutRelationsInput(QuestionOptionalCreateWithoutRelationsInput):
@@ -8143,6 +10172,7 @@ class QuestionUpdateInput(TypedDict, total=False):
     difficultyLevel: Optional[_str]
     createdAt: datetime.datetime
     updatedAt: datetime.datetime
+    clientPayload: Optional[_str]
     userAnswers: 'UserAnswerUpdateManyWithoutRelationsInput'
     wrongdoingQuestions: 'UserWrongdoingQuestionUpdateManyWithoutRelationsInput'
 
@@ -8157,6 +10187,7 @@ class QuestionUpdateManyMutationInput(TypedDict, total=False):
     difficultyLevel: Optional[_str]
     createdAt: datetime.datetime
     updatedAt: datetime.datetime
+    clientPayload: Optional[_str]
 
 
 class QuestionUpdateManyWithoutRelationsInput(TypedDict, total=False):
@@ -8255,6 +10286,14 @@ _Question_updatedAt_OrderByInput = TypedDict(
     total=True
 )
 
+_Question_clientPayload_OrderByInput = TypedDict(
+    '_Question_clientPayload_OrderByInput',
+    {
+        'clientPayload': 'SortOrder',
+    },
+    total=True
+)
+
 _Question_RelevanceInner = TypedDict(
     '_Question_RelevanceInner',
     {
@@ -8282,6 +10321,7 @@ QuestionOrderByInput = Union[
     '_Question_difficultyLevel_OrderByInput',
     '_Question_createdAt_OrderByInput',
     '_Question_updatedAt_OrderByInput',
+    '_Question_clientPayload_OrderByInput',
     '_Question_RelevanceOrderByInput',
 ]
 
@@ -8326,6 +10366,7 @@ class UserIncludeFromQuestion(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromQuestionRecursive1']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromQuestionRecursive1']
     dashboard: Union[bool, 'UserDashboardDataArgsFromQuestionRecursive1']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromQuestionRecursive1']
 
 
 class UserIncludeFromQuestionRecursive1(TypedDict, total=False):
@@ -8335,6 +10376,7 @@ class UserIncludeFromQuestionRecursive1(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromQuestionRecursive2']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromQuestionRecursive2']
     dashboard: Union[bool, 'UserDashboardDataArgsFromQuestionRecursive2']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromQuestionRecursive2']
 
 
 class UserIncludeFromQuestionRecursive2(TypedDict, total=False):
@@ -8344,6 +10386,7 @@ class UserIncludeFromQuestionRecursive2(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromQuestionRecursive3']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromQuestionRecursive3']
     dashboard: Union[bool, 'UserDashboardDataArgsFromQuestionRecursive3']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromQuestionRecursive3']
 
 
 class UserIncludeFromQuestionRecursive3(TypedDict, total=False):
@@ -8353,6 +10396,7 @@ class UserIncludeFromQuestionRecursive3(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromQuestionRecursive4']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromQuestionRecursive4']
     dashboard: Union[bool, 'UserDashboardDataArgsFromQuestionRecursive4']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromQuestionRecursive4']
 
 
 class UserIncludeFromQuestionRecursive4(TypedDict, total=False):
@@ -8545,6 +10589,111 @@ class FindManyUserDashboardDataArgsFromQuestionRecursive4(TypedDict, total=False
     
     
 
+class PointsHistoryEntryIncludeFromQuestion(TypedDict, total=False):
+    """Relational arguments for Question"""
+    user: Union[bool, 'UserArgsFromQuestionRecursive1']
+
+
+class PointsHistoryEntryIncludeFromQuestionRecursive1(TypedDict, total=False):
+    """Relational arguments for Question"""
+    user: Union[bool, 'UserArgsFromQuestionRecursive2']
+
+
+class PointsHistoryEntryIncludeFromQuestionRecursive2(TypedDict, total=False):
+    """Relational arguments for Question"""
+    user: Union[bool, 'UserArgsFromQuestionRecursive3']
+
+
+class PointsHistoryEntryIncludeFromQuestionRecursive3(TypedDict, total=False):
+    """Relational arguments for Question"""
+    user: Union[bool, 'UserArgsFromQuestionRecursive4']
+
+
+class PointsHistoryEntryIncludeFromQuestionRecursive4(TypedDict, total=False):
+    """Relational arguments for Question"""
+
+    
+
+class PointsHistoryEntryArgsFromQuestion(TypedDict, total=False):
+    """Arguments for Question"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class PointsHistoryEntryArgsFromQuestionRecursive1(TypedDict, total=False):
+    """Arguments for Question"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class PointsHistoryEntryArgsFromQuestionRecursive2(TypedDict, total=False):
+    """Arguments for Question"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class PointsHistoryEntryArgsFromQuestionRecursive3(TypedDict, total=False):
+    """Arguments for Question"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class PointsHistoryEntryArgsFromQuestionRecursive4(TypedDict, total=False):
+    """Arguments for Question"""
+    
+    
+
+class FindManyPointsHistoryEntryArgsFromQuestion(TypedDict, total=False):
+    """Arguments for Question"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class FindManyPointsHistoryEntryArgsFromQuestionRecursive1(TypedDict, total=False):
+    """Arguments for Question"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class FindManyPointsHistoryEntryArgsFromQuestionRecursive2(TypedDict, total=False):
+    """Arguments for Question"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class FindManyPointsHistoryEntryArgsFromQuestionRecursive3(TypedDict, total=False):
+    """Arguments for Question"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class FindManyPointsHistoryEntryArgsFromQuestionRecursive4(TypedDict, total=False):
+    """Arguments for Question"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    
+    
+
 class AccountIncludeFromQuestion(TypedDict, total=False):
     """Relational arguments for Question"""
     user: Union[bool, 'UserArgsFromQuestionRecursive1']
@@ -9199,6 +11348,7 @@ class QuestionWhereInput(TypedDict, total=False):
     difficultyLevel: Union[None, _str, 'types.StringFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
     updatedAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    clientPayload: Union[None, _str, 'types.StringFilter']
     userAnswers: 'UserAnswerListRelationFilter'
     wrongdoingQuestions: 'UserWrongdoingQuestionListRelationFilter'
 
@@ -9219,6 +11369,7 @@ class QuestionWhereInputRecursive1(TypedDict, total=False):
     difficultyLevel: Union[None, _str, 'types.StringFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
     updatedAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    clientPayload: Union[None, _str, 'types.StringFilter']
     userAnswers: 'UserAnswerListRelationFilter'
     wrongdoingQuestions: 'UserWrongdoingQuestionListRelationFilter'
 
@@ -9239,6 +11390,7 @@ class QuestionWhereInputRecursive2(TypedDict, total=False):
     difficultyLevel: Union[None, _str, 'types.StringFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
     updatedAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    clientPayload: Union[None, _str, 'types.StringFilter']
     userAnswers: 'UserAnswerListRelationFilter'
     wrongdoingQuestions: 'UserWrongdoingQuestionListRelationFilter'
 
@@ -9259,6 +11411,7 @@ class QuestionWhereInputRecursive3(TypedDict, total=False):
     difficultyLevel: Union[None, _str, 'types.StringFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
     updatedAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    clientPayload: Union[None, _str, 'types.StringFilter']
     userAnswers: 'UserAnswerListRelationFilter'
     wrongdoingQuestions: 'UserWrongdoingQuestionListRelationFilter'
 
@@ -9279,6 +11432,7 @@ class QuestionWhereInputRecursive4(TypedDict, total=False):
     difficultyLevel: Union[None, _str, 'types.StringFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
     updatedAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    clientPayload: Union[None, _str, 'types.StringFilter']
     userAnswers: 'UserAnswerListRelationFilter'
     wrongdoingQuestions: 'UserWrongdoingQuestionListRelationFilter'
 
@@ -9299,6 +11453,7 @@ class QuestionScalarWhereWithAggregatesInput(TypedDict, total=False):
     difficultyLevel: Union[_str, 'types.StringWithAggregatesFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
     updatedAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    clientPayload: Union[_str, 'types.StringWithAggregatesFilter']
 
     AND: List['QuestionScalarWhereWithAggregatesInputRecursive1']
     OR: List['QuestionScalarWhereWithAggregatesInputRecursive1']
@@ -9315,6 +11470,7 @@ class QuestionScalarWhereWithAggregatesInputRecursive1(TypedDict, total=False):
     difficultyLevel: Union[_str, 'types.StringWithAggregatesFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
     updatedAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    clientPayload: Union[_str, 'types.StringWithAggregatesFilter']
 
     AND: List['QuestionScalarWhereWithAggregatesInputRecursive2']
     OR: List['QuestionScalarWhereWithAggregatesInputRecursive2']
@@ -9331,6 +11487,7 @@ class QuestionScalarWhereWithAggregatesInputRecursive2(TypedDict, total=False):
     difficultyLevel: Union[_str, 'types.StringWithAggregatesFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
     updatedAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    clientPayload: Union[_str, 'types.StringWithAggregatesFilter']
 
     AND: List['QuestionScalarWhereWithAggregatesInputRecursive3']
     OR: List['QuestionScalarWhereWithAggregatesInputRecursive3']
@@ -9347,6 +11504,7 @@ class QuestionScalarWhereWithAggregatesInputRecursive3(TypedDict, total=False):
     difficultyLevel: Union[_str, 'types.StringWithAggregatesFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
     updatedAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    clientPayload: Union[_str, 'types.StringWithAggregatesFilter']
 
     AND: List['QuestionScalarWhereWithAggregatesInputRecursive4']
     OR: List['QuestionScalarWhereWithAggregatesInputRecursive4']
@@ -9363,6 +11521,7 @@ class QuestionScalarWhereWithAggregatesInputRecursive4(TypedDict, total=False):
     difficultyLevel: Union[_str, 'types.StringWithAggregatesFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
     updatedAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    clientPayload: Union[_str, 'types.StringWithAggregatesFilter']
 
 
 
@@ -9375,6 +11534,7 @@ class QuestionGroupByOutput(TypedDict, total=False):
     difficultyLevel: _str
     createdAt: datetime.datetime
     updatedAt: datetime.datetime
+    clientPayload: _str
     _sum: 'QuestionSumAggregateOutput'
     _avg: 'QuestionAvgAggregateOutput'
     _min: 'QuestionMinAggregateOutput'
@@ -9400,6 +11560,7 @@ class QuestionScalarAggregateOutput(TypedDict, total=False):
     difficultyLevel: _str
     createdAt: datetime.datetime
     updatedAt: datetime.datetime
+    clientPayload: _str
 
 
 QuestionMinAggregateOutput = QuestionScalarAggregateOutput
@@ -9416,6 +11577,7 @@ class QuestionMaxAggregateInput(TypedDict, total=False):
     difficultyLevel: bool
     createdAt: bool
     updatedAt: bool
+    clientPayload: bool
 
 
 class QuestionMinAggregateInput(TypedDict, total=False):
@@ -9428,6 +11590,7 @@ class QuestionMinAggregateInput(TypedDict, total=False):
     difficultyLevel: bool
     createdAt: bool
     updatedAt: bool
+    clientPayload: bool
 
 
 class QuestionNumberAggregateInput(TypedDict, total=False):
@@ -9449,6 +11612,7 @@ QuestionCountAggregateInput = TypedDict(
         'difficultyLevel': bool,
         'createdAt': bool,
         'updatedAt': bool,
+        'clientPayload': bool,
         '_all': bool,
     },
     total=False,
@@ -9465,6 +11629,7 @@ QuestionCountAggregateOutput = TypedDict(
         'difficultyLevel': int,
         'createdAt': int,
         'updatedAt': int,
+        'clientPayload': int,
         '_all': int,
     },
     total=False,
@@ -9480,6 +11645,7 @@ QuestionKeys = Literal[
     'difficultyLevel',
     'createdAt',
     'updatedAt',
+    'clientPayload',
     'userAnswers',
     'wrongdoingQuestions',
 ]
@@ -9492,6 +11658,7 @@ QuestionScalarFieldKeys = Literal[
     'difficultyLevel',
     'createdAt',
     'updatedAt',
+    'clientPayload',
 ]
 QuestionScalarFieldKeysT = TypeVar('QuestionScalarFieldKeysT', bound=QuestionScalarFieldKeys)
 
@@ -9740,6 +11907,7 @@ class UserIncludeFromUserAnswer(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserAnswerRecursive1']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserAnswerRecursive1']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserAnswerRecursive1']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserAnswerRecursive1']
 
 
 class UserIncludeFromUserAnswerRecursive1(TypedDict, total=False):
@@ -9749,6 +11917,7 @@ class UserIncludeFromUserAnswerRecursive1(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserAnswerRecursive2']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserAnswerRecursive2']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserAnswerRecursive2']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserAnswerRecursive2']
 
 
 class UserIncludeFromUserAnswerRecursive2(TypedDict, total=False):
@@ -9758,6 +11927,7 @@ class UserIncludeFromUserAnswerRecursive2(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserAnswerRecursive3']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserAnswerRecursive3']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserAnswerRecursive3']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserAnswerRecursive3']
 
 
 class UserIncludeFromUserAnswerRecursive3(TypedDict, total=False):
@@ -9767,6 +11937,7 @@ class UserIncludeFromUserAnswerRecursive3(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserAnswerRecursive4']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserAnswerRecursive4']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserAnswerRecursive4']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserAnswerRecursive4']
 
 
 class UserIncludeFromUserAnswerRecursive4(TypedDict, total=False):
@@ -9959,6 +12130,111 @@ class FindManyUserDashboardDataArgsFromUserAnswerRecursive4(TypedDict, total=Fal
     
     
 
+class PointsHistoryEntryIncludeFromUserAnswer(TypedDict, total=False):
+    """Relational arguments for UserAnswer"""
+    user: Union[bool, 'UserArgsFromUserAnswerRecursive1']
+
+
+class PointsHistoryEntryIncludeFromUserAnswerRecursive1(TypedDict, total=False):
+    """Relational arguments for UserAnswer"""
+    user: Union[bool, 'UserArgsFromUserAnswerRecursive2']
+
+
+class PointsHistoryEntryIncludeFromUserAnswerRecursive2(TypedDict, total=False):
+    """Relational arguments for UserAnswer"""
+    user: Union[bool, 'UserArgsFromUserAnswerRecursive3']
+
+
+class PointsHistoryEntryIncludeFromUserAnswerRecursive3(TypedDict, total=False):
+    """Relational arguments for UserAnswer"""
+    user: Union[bool, 'UserArgsFromUserAnswerRecursive4']
+
+
+class PointsHistoryEntryIncludeFromUserAnswerRecursive4(TypedDict, total=False):
+    """Relational arguments for UserAnswer"""
+
+    
+
+class PointsHistoryEntryArgsFromUserAnswer(TypedDict, total=False):
+    """Arguments for UserAnswer"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class PointsHistoryEntryArgsFromUserAnswerRecursive1(TypedDict, total=False):
+    """Arguments for UserAnswer"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class PointsHistoryEntryArgsFromUserAnswerRecursive2(TypedDict, total=False):
+    """Arguments for UserAnswer"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class PointsHistoryEntryArgsFromUserAnswerRecursive3(TypedDict, total=False):
+    """Arguments for UserAnswer"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class PointsHistoryEntryArgsFromUserAnswerRecursive4(TypedDict, total=False):
+    """Arguments for UserAnswer"""
+    
+    
+
+class FindManyPointsHistoryEntryArgsFromUserAnswer(TypedDict, total=False):
+    """Arguments for UserAnswer"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class FindManyPointsHistoryEntryArgsFromUserAnswerRecursive1(TypedDict, total=False):
+    """Arguments for UserAnswer"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class FindManyPointsHistoryEntryArgsFromUserAnswerRecursive2(TypedDict, total=False):
+    """Arguments for UserAnswer"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class FindManyPointsHistoryEntryArgsFromUserAnswerRecursive3(TypedDict, total=False):
+    """Arguments for UserAnswer"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class FindManyPointsHistoryEntryArgsFromUserAnswerRecursive4(TypedDict, total=False):
+    """Arguments for UserAnswer"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    
+    
+
 class AccountIncludeFromUserAnswer(TypedDict, total=False):
     """Relational arguments for UserAnswer"""
     user: Union[bool, 'UserArgsFromUserAnswerRecursive1']
@@ -10905,6 +13181,10 @@ class UserWrongdoingQuestionOptionalCreateInput(TypedDict, total=False):
     questionId: _str
     timestampMarkedWrong: datetime.datetime
     retestedCorrectly: _bool
+    nextDueAt: datetime.datetime
+    intervalSeconds: _int
+    ease: _float
+    repetitions: _int
     user: 'UserCreateNestedWithoutRelationsInput'
     question: 'QuestionCreateNestedWithoutRelationsInput'
 
@@ -10923,6 +13203,10 @@ class UserWrongdoingQuestionOptionalCreateWithoutRelationsInput(TypedDict, total
     questionId: _str
     timestampMarkedWrong: datetime.datetime
     retestedCorrectly: _bool
+    nextDueAt: datetime.datetime
+    intervalSeconds: _int
+    ease: _float
+    repetitions: _int
 
 
 class UserWrongdoingQuestionCreateWithoutRelationsInput(UserWrongdoingQuestionOptionalCreateWithoutRelationsInput):
@@ -10979,6 +13263,10 @@ class UserWrongdoingQuestionUpdateInput(TypedDict, total=False):
     id: _str
     timestampMarkedWrong: datetime.datetime
     retestedCorrectly: _bool
+    nextDueAt: datetime.datetime
+    intervalSeconds: Union[AtomicIntInput, _int]
+    ease: Union[AtomicFloatInput, _float]
+    repetitions: Union[AtomicIntInput, _int]
     user: 'UserUpdateOneWithoutRelationsInput'
     question: 'QuestionUpdateOneWithoutRelationsInput'
 
@@ -10988,6 +13276,10 @@ class UserWrongdoingQuestionUpdateManyMutationInput(TypedDict, total=False):
     id: _str
     timestampMarkedWrong: datetime.datetime
     retestedCorrectly: _bool
+    nextDueAt: datetime.datetime
+    intervalSeconds: Union[AtomicIntInput, _int]
+    ease: Union[AtomicFloatInput, _float]
+    repetitions: Union[AtomicIntInput, _int]
 
 
 class UserWrongdoingQuestionUpdateManyWithoutRelationsInput(TypedDict, total=False):
@@ -11062,6 +13354,38 @@ _UserWrongdoingQuestion_retestedCorrectly_OrderByInput = TypedDict(
     total=True
 )
 
+_UserWrongdoingQuestion_nextDueAt_OrderByInput = TypedDict(
+    '_UserWrongdoingQuestion_nextDueAt_OrderByInput',
+    {
+        'nextDueAt': 'SortOrder',
+    },
+    total=True
+)
+
+_UserWrongdoingQuestion_intervalSeconds_OrderByInput = TypedDict(
+    '_UserWrongdoingQuestion_intervalSeconds_OrderByInput',
+    {
+        'intervalSeconds': 'SortOrder',
+    },
+    total=True
+)
+
+_UserWrongdoingQuestion_ease_OrderByInput = TypedDict(
+    '_UserWrongdoingQuestion_ease_OrderByInput',
+    {
+        'ease': 'SortOrder',
+    },
+    total=True
+)
+
+_UserWrongdoingQuestion_repetitions_OrderByInput = TypedDict(
+    '_UserWrongdoingQuestion_repetitions_OrderByInput',
+    {
+        'repetitions': 'SortOrder',
+    },
+    total=True
+)
+
 _UserWrongdoingQuestion_RelevanceInner = TypedDict(
     '_UserWrongdoingQuestion_RelevanceInner',
     {
@@ -11086,6 +13410,10 @@ UserWrongdoingQuestionOrderByInput = Union[
     '_UserWrongdoingQuestion_questionId_OrderByInput',
     '_UserWrongdoingQuestion_timestampMarkedWrong_OrderByInput',
     '_UserWrongdoingQuestion_retestedCorrectly_OrderByInput',
+    '_UserWrongdoingQuestion_nextDueAt_OrderByInput',
+    '_UserWrongdoingQuestion_intervalSeconds_OrderByInput',
+    '_UserWrongdoingQuestion_ease_OrderByInput',
+    '_UserWrongdoingQuestion_repetitions_OrderByInput',
     '_UserWrongdoingQuestion_RelevanceOrderByInput',
 ]
 
@@ -11130,6 +13458,7 @@ class UserIncludeFromUserWrongdoingQuestion(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserWrongdoingQuestionRecursive1']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserWrongdoingQuestionRecursive1']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserWrongdoingQuestionRecursive1']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserWrongdoingQuestionRecursive1']
 
 
 class UserIncludeFromUserWrongdoingQuestionRecursive1(TypedDict, total=False):
@@ -11139,6 +13468,7 @@ class UserIncludeFromUserWrongdoingQuestionRecursive1(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserWrongdoingQuestionRecursive2']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserWrongdoingQuestionRecursive2']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserWrongdoingQuestionRecursive2']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserWrongdoingQuestionRecursive2']
 
 
 class UserIncludeFromUserWrongdoingQuestionRecursive2(TypedDict, total=False):
@@ -11148,6 +13478,7 @@ class UserIncludeFromUserWrongdoingQuestionRecursive2(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserWrongdoingQuestionRecursive3']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserWrongdoingQuestionRecursive3']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserWrongdoingQuestionRecursive3']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserWrongdoingQuestionRecursive3']
 
 
 class UserIncludeFromUserWrongdoingQuestionRecursive3(TypedDict, total=False):
@@ -11157,6 +13488,7 @@ class UserIncludeFromUserWrongdoingQuestionRecursive3(TypedDict, total=False):
     userAnswers: Union[bool, 'FindManyUserAnswerArgsFromUserWrongdoingQuestionRecursive4']
     wrongdoingQuestions: Union[bool, 'FindManyUserWrongdoingQuestionArgsFromUserWrongdoingQuestionRecursive4']
     dashboard: Union[bool, 'UserDashboardDataArgsFromUserWrongdoingQuestionRecursive4']
+    pointsHistory: Union[bool, 'FindManyPointsHistoryEntryArgsFromUserWrongdoingQuestionRecursive4']
 
 
 class UserIncludeFromUserWrongdoingQuestionRecursive4(TypedDict, total=False):
@@ -11349,6 +13681,111 @@ class FindManyUserDashboardDataArgsFromUserWrongdoingQuestionRecursive4(TypedDic
     
     
 
+class PointsHistoryEntryIncludeFromUserWrongdoingQuestion(TypedDict, total=False):
+    """Relational arguments for UserWrongdoingQuestion"""
+    user: Union[bool, 'UserArgsFromUserWrongdoingQuestionRecursive1']
+
+
+class PointsHistoryEntryIncludeFromUserWrongdoingQuestionRecursive1(TypedDict, total=False):
+    """Relational arguments for UserWrongdoingQuestion"""
+    user: Union[bool, 'UserArgsFromUserWrongdoingQuestionRecursive2']
+
+
+class PointsHistoryEntryIncludeFromUserWrongdoingQuestionRecursive2(TypedDict, total=False):
+    """Relational arguments for UserWrongdoingQuestion"""
+    user: Union[bool, 'UserArgsFromUserWrongdoingQuestionRecursive3']
+
+
+class PointsHistoryEntryIncludeFromUserWrongdoingQuestionRecursive3(TypedDict, total=False):
+    """Relational arguments for UserWrongdoingQuestion"""
+    user: Union[bool, 'UserArgsFromUserWrongdoingQuestionRecursive4']
+
+
+class PointsHistoryEntryIncludeFromUserWrongdoingQuestionRecursive4(TypedDict, total=False):
+    """Relational arguments for UserWrongdoingQuestion"""
+
+    
+
+class PointsHistoryEntryArgsFromUserWrongdoingQuestion(TypedDict, total=False):
+    """Arguments for UserWrongdoingQuestion"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class PointsHistoryEntryArgsFromUserWrongdoingQuestionRecursive1(TypedDict, total=False):
+    """Arguments for UserWrongdoingQuestion"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class PointsHistoryEntryArgsFromUserWrongdoingQuestionRecursive2(TypedDict, total=False):
+    """Arguments for UserWrongdoingQuestion"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class PointsHistoryEntryArgsFromUserWrongdoingQuestionRecursive3(TypedDict, total=False):
+    """Arguments for UserWrongdoingQuestion"""
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class PointsHistoryEntryArgsFromUserWrongdoingQuestionRecursive4(TypedDict, total=False):
+    """Arguments for UserWrongdoingQuestion"""
+    
+    
+
+class FindManyPointsHistoryEntryArgsFromUserWrongdoingQuestion(TypedDict, total=False):
+    """Arguments for UserWrongdoingQuestion"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive1'
+
+
+class FindManyPointsHistoryEntryArgsFromUserWrongdoingQuestionRecursive1(TypedDict, total=False):
+    """Arguments for UserWrongdoingQuestion"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive2'
+
+
+class FindManyPointsHistoryEntryArgsFromUserWrongdoingQuestionRecursive2(TypedDict, total=False):
+    """Arguments for UserWrongdoingQuestion"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive3'
+
+
+class FindManyPointsHistoryEntryArgsFromUserWrongdoingQuestionRecursive3(TypedDict, total=False):
+    """Arguments for UserWrongdoingQuestion"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    include: 'PointsHistoryEntryIncludeFromPointsHistoryEntryRecursive4'
+
+
+class FindManyPointsHistoryEntryArgsFromUserWrongdoingQuestionRecursive4(TypedDict, total=False):
+    """Arguments for UserWrongdoingQuestion"""
+    take: int
+    skip: int
+    order_by: Union['PointsHistoryEntryOrderByInput', List['PointsHistoryEntryOrderByInput']]
+    where: 'PointsHistoryEntryWhereInput'
+    cursor: 'PointsHistoryEntryWhereUniqueInput'
+    distinct: List['PointsHistoryEntryScalarFieldKeys']
+    
+    
+
 class AccountIncludeFromUserWrongdoingQuestion(TypedDict, total=False):
     """Relational arguments for UserWrongdoingQuestion"""
     user: Union[bool, 'UserArgsFromUserWrongdoingQuestionRecursive1']
@@ -12000,6 +14437,10 @@ class UserWrongdoingQuestionWhereInput(TypedDict, total=False):
     questionId: Union[_str, 'types.StringFilter']
     timestampMarkedWrong: Union[datetime.datetime, 'types.DateTimeFilter']
     retestedCorrectly: Union[_bool, 'types.BooleanFilter']
+    nextDueAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    intervalSeconds: Union[_int, 'types.IntFilter']
+    ease: Union[_float, 'types.FloatFilter']
+    repetitions: Union[_int, 'types.IntFilter']
     user: 'UserRelationFilter'
     question: 'QuestionRelationFilter'
 
@@ -12017,6 +14458,10 @@ class UserWrongdoingQuestionWhereInputRecursive1(TypedDict, total=False):
     questionId: Union[_str, 'types.StringFilter']
     timestampMarkedWrong: Union[datetime.datetime, 'types.DateTimeFilter']
     retestedCorrectly: Union[_bool, 'types.BooleanFilter']
+    nextDueAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    intervalSeconds: Union[_int, 'types.IntFilter']
+    ease: Union[_float, 'types.FloatFilter']
+    repetitions: Union[_int, 'types.IntFilter']
     user: 'UserRelationFilter'
     question: 'QuestionRelationFilter'
 
@@ -12034,6 +14479,10 @@ class UserWrongdoingQuestionWhereInputRecursive2(TypedDict, total=False):
     questionId: Union[_str, 'types.StringFilter']
     timestampMarkedWrong: Union[datetime.datetime, 'types.DateTimeFilter']
     retestedCorrectly: Union[_bool, 'types.BooleanFilter']
+    nextDueAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    intervalSeconds: Union[_int, 'types.IntFilter']
+    ease: Union[_float, 'types.FloatFilter']
+    repetitions: Union[_int, 'types.IntFilter']
     user: 'UserRelationFilter'
     question: 'QuestionRelationFilter'
 
@@ -12051,6 +14500,10 @@ class UserWrongdoingQuestionWhereInputRecursive3(TypedDict, total=False):
     questionId: Union[_str, 'types.StringFilter']
     timestampMarkedWrong: Union[datetime.datetime, 'types.DateTimeFilter']
     retestedCorrectly: Union[_bool, 'types.BooleanFilter']
+    nextDueAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    intervalSeconds: Union[_int, 'types.IntFilter']
+    ease: Union[_float, 'types.FloatFilter']
+    repetitions: Union[_int, 'types.IntFilter']
     user: 'UserRelationFilter'
     question: 'QuestionRelationFilter'
 
@@ -12068,6 +14521,10 @@ class UserWrongdoingQuestionWhereInputRecursive4(TypedDict, total=False):
     questionId: Union[_str, 'types.StringFilter']
     timestampMarkedWrong: Union[datetime.datetime, 'types.DateTimeFilter']
     retestedCorrectly: Union[_bool, 'types.BooleanFilter']
+    nextDueAt: Union[datetime.datetime, 'types.DateTimeFilter']
+    intervalSeconds: Union[_int, 'types.IntFilter']
+    ease: Union[_float, 'types.FloatFilter']
+    repetitions: Union[_int, 'types.IntFilter']
     user: 'UserRelationFilter'
     question: 'QuestionRelationFilter'
 
@@ -12085,6 +14542,10 @@ class UserWrongdoingQuestionScalarWhereWithAggregatesInput(TypedDict, total=Fals
     questionId: Union[_str, 'types.StringWithAggregatesFilter']
     timestampMarkedWrong: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
     retestedCorrectly: Union[_bool, 'types.BooleanWithAggregatesFilter']
+    nextDueAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    intervalSeconds: Union[_int, 'types.IntWithAggregatesFilter']
+    ease: Union[_float, 'types.FloatWithAggregatesFilter']
+    repetitions: Union[_int, 'types.IntWithAggregatesFilter']
 
     AND: List['UserWrongdoingQuestionScalarWhereWithAggregatesInputRecursive1']
     OR: List['UserWrongdoingQuestionScalarWhereWithAggregatesInputRecursive1']
@@ -12098,6 +14559,10 @@ class UserWrongdoingQuestionScalarWhereWithAggregatesInputRecursive1(TypedDict,
     questionId: Union[_str, 'types.StringWithAggregatesFilter']
     timestampMarkedWrong: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
     retestedCorrectly: Union[_bool, 'types.BooleanWithAggregatesFilter']
+    nextDueAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    intervalSeconds: Union[_int, 'types.IntWithAggregatesFilter']
+    ease: Union[_float, 'types.FloatWithAggregatesFilter']
+    repetitions: Union[_int, 'types.IntWithAggregatesFilter']
 
     AND: List['UserWrongdoingQuestionScalarWhereWithAggregatesInputRecursive2']
     OR: List['UserWrongdoingQuestionScalarWhereWithAggregatesInputRecursive2']
@@ -12111,6 +14576,10 @@ class UserWrongdoingQuestionScalarWhereWithAggregatesInputRecursive2(TypedDict,
     questionId: Union[_str, 'types.StringWithAggregatesFilter']
     timestampMarkedWrong: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
     retestedCorrectly: Union[_bool, 'types.BooleanWithAggregatesFilter']
+    nextDueAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    intervalSeconds: Union[_int, 'types.IntWithAggregatesFilter']
+    ease: Union[_float, 'types.FloatWithAggregatesFilter']
+    repetitions: Union[_int, 'types.IntWithAggregatesFilter']
 
     AND: List['UserWrongdoingQuestionScalarWhereWithAggregatesInputRecursive3']
     OR: List['UserWrongdoingQuestionScalarWhereWithAggregatesInputRecursive3']
@@ -12124,6 +14593,10 @@ class UserWrongdoingQuestionScalarWhereWithAggregatesInputRecursive3(TypedDict,
     questionId: Union[_str, 'types.StringWithAggregatesFilter']
     timestampMarkedWrong: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
     retestedCorrectly: Union[_bool, 'types.BooleanWithAggregatesFilter']
+    nextDueAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    intervalSeconds: Union[_int, 'types.IntWithAggregatesFilter']
+    ease: Union[_float, 'types.FloatWithAggregatesFilter']
+    repetitions: Union[_int, 'types.IntWithAggregatesFilter']
 
     AND: List['UserWrongdoingQuestionScalarWhereWithAggregatesInputRecursive4']
     OR: List['UserWrongdoingQuestionScalarWhereWithAggregatesInputRecursive4']
@@ -12137,6 +14610,10 @@ class UserWrongdoingQuestionScalarWhereWithAggregatesInputRecursive4(TypedDict,
     questionId: Union[_str, 'types.StringWithAggregatesFilter']
     timestampMarkedWrong: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
     retestedCorrectly: Union[_bool, 'types.BooleanWithAggregatesFilter']
+    nextDueAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
+    intervalSeconds: Union[_int, 'types.IntWithAggregatesFilter']
+    ease: Union[_float, 'types.FloatWithAggregatesFilter']
+    repetitions: Union[_int, 'types.IntWithAggregatesFilter']
 
 
 
@@ -12146,6 +14623,10 @@ class UserWrongdoingQuestionGroupByOutput(TypedDict, total=False):
     questionId: _str
     timestampMarkedWrong: datetime.datetime
     retestedCorrectly: _bool
+    nextDueAt: datetime.datetime
+    intervalSeconds: _int
+    ease: _float
+    repetitions: _int
     _sum: 'UserWrongdoingQuestionSumAggregateOutput'
     _avg: 'UserWrongdoingQuestionAvgAggregateOutput'
     _min: 'UserWrongdoingQuestionMinAggregateOutput'
@@ -12155,10 +14636,16 @@ class UserWrongdoingQuestionGroupByOutput(TypedDict, total=False):
 
 class UserWrongdoingQuestionAvgAggregateOutput(TypedDict, total=False):
     """UserWrongdoingQuestion output for aggregating averages"""
+    intervalSeconds: float
+    ease: float
+    repetitions: float
 
 
 class UserWrongdoingQuestionSumAggregateOutput(TypedDict, total=False):
     """UserWrongdoingQuestion output for aggregating sums"""
+    intervalSeconds: _int
+    ease: _float
+    repetitions: _int
 
 
 class UserWrongdoingQuestionScalarAggregateOutput(TypedDict, total=False):
@@ -12168,6 +14655,10 @@ class UserWrongdoingQuestionScalarAggregateOutput(TypedDict, total=False):
     questionId: _str
     timestampMarkedWrong: datetime.datetime
     retestedCorrectly: _bool
+    nextDueAt: datetime.datetime
+    intervalSeconds: _int
+    ease: _float
+    repetitions: _int
 
 
 UserWrongdoingQuestionMinAggregateOutput = UserWrongdoingQuestionScalarAggregateOutput
@@ -12181,6 +14672,10 @@ class UserWrongdoingQuestionMaxAggregateInput(TypedDict, total=False):
     questionId: bool
     timestampMarkedWrong: bool
     retestedCorrectly: bool
+    nextDueAt: bool
+    intervalSeconds: bool
+    ease: bool
+    repetitions: bool
 
 
 class UserWrongdoingQuestionMinAggregateInput(TypedDict, total=False):
@@ -12190,10 +14685,17 @@ class UserWrongdoingQuestionMinAggregateInput(TypedDict, total=False):
     questionId: bool
     timestampMarkedWrong: bool
     retestedCorrectly: bool
+    nextDueAt: bool
+    intervalSeconds: bool
+    ease: bool
+    repetitions: bool
 
 
 class UserWrongdoingQuestionNumberAggregateInput(TypedDict, total=False):
     """UserWrongdoingQuestion input for aggregating numbers"""
+    intervalSeconds: bool
+    ease: bool
+    repetitions: bool
 
 
 UserWrongdoingQuestionAvgAggregateInput = UserWrongdoingQuestionNumberAggregateInput
@@ -12208,6 +14710,10 @@ UserWrongdoingQuestionCountAggregateInput = TypedDict(
         'questionId': bool,
         'timestampMarkedWrong': bool,
         'retestedCorrectly': bool,
+        'nextDueAt': bool,
+        'intervalSeconds': bool,
+        'ease': bool,
+        'repetitions': bool,
         '_all': bool,
     },
     total=False,
@@ -12221,6 +14727,10 @@ UserWrongdoingQuestionCountAggregateOutput = TypedDict(
         'questionId': int,
         'timestampMarkedWrong': int,
         'retestedCorrectly': int,
+        'nextDueAt': int,
+        'intervalSeconds': int,
+        'ease': int,
+        'repetitions': int,
         '_all': int,
     },
     total=False,
@@ -12233,6 +14743,10 @@ UserWrongdoingQuestionKeys = Literal[
     'questionId',
     'timestampMarkedWrong',
     'retestedCorrectly',
+    'nextDueAt',
+    'intervalSeconds',
+    'ease',
+    'repetitions',
     'user',
     'question',
 ]
@@ -12242,6 +14756,10 @@ UserWrongdoingQuestionScalarFieldKeys = Literal[
     'questionId',
     'timestampMarkedWrong',
     'retestedCorrectly',
+    'nextDueAt',
+    'intervalSeconds',
+    'ease',
+    'repetitions',
 ]
 UserWrongdoingQuestionScalarFieldKeysT = TypeVar('UserWrongdoingQuestionScalarFieldKeysT', bound=UserWrongdoingQuestionScalarFieldKeys)
 
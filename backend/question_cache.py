@@ -0,0 +1,100 @@
+# backend/question_cache.py
+# Question rows as the quiz routes need them. A question's text, options and correct option never
+# change after it is created, so they are kept in process and /answer, /session/submit and
+# /retest/generate do not read the same rows again on every request.
+import json
+import os
+import time
+from collections import OrderedDict
+
+# --- Configuration ---
+QUESTION_CACHE_MAX_ENTRIES = int(os.getenv("QUESTION_CACHE_MAX_ENTRIES", 10000))
+# The web workers never delete questions; this bounds how long a delete made elsewhere (seed.py,
+# manual cleanup) can go unnoticed, which is the only staleness the cache can have
+QUESTION_CACHE_TTL_SECONDS = int(os.getenv("QUESTION_CACHE_TTL_SECONDS", 3600))
+
+
+def serialize_client_question(question_id: str, question_text: str, options: list) -> bytes:
+    """
+    The client-facing question as QuestionResponse JSON, without the answer key. Stored with the
+    question when it is created and sent to clients as is. Malformed options are skipped.
+    """
+    client_options = [
+        {"id": str(opt["id"]), "text": str(opt["text"])}
+        for opt in options
+        if isinstance(opt, dict) and "id" in opt and "text" in opt
+    ]
+    return json.dumps(
+        {"id": question_id, "question_text": question_text, "options": client_options},
+        ensure_ascii=False
+    ).encode("utf-8")
+
+
+class CachedQuestion:
+    def __init__(
+        self, question_id: str, question_text: str, options: list, correct_answer_id: str,
+        client_payload: bytes | None = None
+    ):
+        self.id = question_id
+        self.question_text = question_text
+        self.options = options
+        self.correct_answer_id = correct_answer_id
+        self.created_at = time.monotonic()
+        # Rows created before the payload column existed, or by seed.py, have none stored
+        self.client_payload = client_payload or serialize_client_question(question_id, question_text, options)
+
+    @property
+    def correct_answer_text(self) -> str:
+        for opt in self.options:
+            if isinstance(opt, dict) and opt.get("id") == self.correct_answer_id:
+                return opt.get("text", "")
+        return ""
+
+
+class QuestionCache:
+    """
+    Questions by id. Entries expire after `ttl_seconds`; past `max_entries` the least recently used
+    one is evicted. Single-threaded: it is only used from the event loop.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, CachedQuestion]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, question_id: str) -> CachedQuestion | None:
+        question = self._entries.get(question_id)
+        if question is not None and time.monotonic() - question.created_at > self.ttl_seconds:
+            del self._entries[question_id]
+            self.evictions += 1
+            question = None
+        if question is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(question_id)
+        self.hits += 1
+        return question
+
+    def put(self, question: CachedQuestion):
+        self._entries[question.id] = question
+        self._entries.move_to_end(question.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+question_cache = QuestionCache(QUESTION_CACHE_MAX_ENTRIES, QUESTION_CACHE_TTL_SECONDS)
@@ -0,0 +1,173 @@
+# backend/question_store.py
+# Helpers for turning AI-generated MCQs into Question rows, shared by the MCQ router and the topic pool.
+import json
+import logging
+import uuid
+from typing import Dict, List
+
+from prisma import Prisma
+from prisma.partials import QuestionAnswerKey, QuestionContent
+
+from question_cache import CachedQuestion, question_cache
+
+store_logger = logging.getLogger(__name__)
+
+
+def load_options(raw_options) -> list:
+    """Question.options may come back as a parsed list or as the JSON string it was written as."""
+    if isinstance(raw_options, str):
+        try:
+            raw_options = json.loads(raw_options)
+        except json.JSONDecodeError:
+            return []
+    return raw_options if isinstance(raw_options, list) else []
+
+
+def new_question_id() -> str:
+    """Question ids are generated client-side so bulk inserts do not need to read the rows back."""
+    return uuid.uuid4().hex
+
+
+def normalize_generated_mcq(raw_mcq: dict):
+    """
+    Returns (question_text, options, correct_option_id) for an MCQ produced by the agent, or None if malformed.
+    Accepts both the agent's flat shape (question/option_a..d/correct_answer_letter) and the
+    question_text/options/correct_option_id shape.
+    """
+    if "question" in raw_mcq:
+        question_text = raw_mcq.get("question")
+        options_data = [
+            {"id": letter, "text": raw_mcq.get(f"option_{letter.lower()}")}
+            for letter in ("A", "B", "C", "D")
+            if raw_mcq.get(f"option_{letter.lower()}")
+        ]
+        correct_option_id = str(raw_mcq.get("correct_answer_letter", "")).strip().upper()
+    else:
+        question_text = raw_mcq.get("question_text")
+        options_data = raw_mcq.get("options", [])
+        correct_option_id = raw_mcq.get("correct_option_id")
+
+    if not (question_text and options_data and correct_option_id and len(options_data) > 0):
+        return None
+    if correct_option_id not in {opt.get("id") for opt in options_data}:
+        return None
+    return question_text, options_data, correct_option_id
+
+
+def client_questions_body(payloads: List[bytes], **fields) -> bytes:
+    """
+    Joins stored client payloads into a {"questions": [...], **fields} JSON body, e.g. a
+    GenerateMCQsResponse, without building a model per question.
+    """
+    extra = b"".join(b"," + json.dumps(key).encode() + b":" + json.dumps(value).encode() for key, value in fields.items())
+    return b'{"questions":[' + b",".join(payloads) + b"]" + extra + b"}"
+
+
+async def save_generated_questions(db: Prisma, raw_mcqs: List[dict], topic_id: str) -> List[CachedQuestion]:
+    """
+    Persists generated MCQs with a single create_many round trip and returns the saved questions.
+    Ids are assigned here rather than by the database, so they are known without reading the rows back.
+    Each row stores its client payload, so serving it later needs no serialization. Malformed MCQs are skipped.
+    """
+    rows = []
+    cached_questions: List[CachedQuestion] = []
+    for raw_mcq in raw_mcqs:
+        normalized = normalize_generated_mcq(raw_mcq)
+        if normalized is None:
+            store_logger.warning("Skipping a malformed MCQ from AI (missing data): %s", raw_mcq)
+            continue
+        question_text, options_data, correct_option_id = normalized
+
+        question = CachedQuestion(new_question_id(), question_text, options_data, correct_option_id)
+        rows.append({
+            "id": question.id,
+            "questionText": question_text,
+            "options": json.dumps(options_data), # Explicitly serialize to JSON string
+            "correctAnswerId": correct_option_id,
+            "topicId": topic_id,
+            "clientPayload": question.client_payload.decode("utf-8")
+        })
+        cached_questions.append(question)
+
+    if not rows:
+        return []
+
+    try:
+        await db.question.create_many(data=rows)
+        store_logger.info("Saved %d questions to DB in one batch for topic %r.", len(rows), topic_id)
+        for question in cached_questions:
+            question_cache.put(question)
+        return cached_questions
+    except Exception:
+        store_logger.exception("Error saving questions to DB for topic %r.", topic_id)
+        return []
+
+
+async def save_generated_question(db: Prisma, raw_mcq: dict, topic_id: str) -> CachedQuestion | None:
+    """Persists one generated MCQ, e.g. while streaming, and returns it, or None if it was skipped."""
+    saved = await save_generated_questions(db, [raw_mcq], topic_id)
+    return saved[0] if saved else None
+
+
+def _cached_question_from_row(db_question) -> CachedQuestion:
+    client_payload = db_question.clientPayload.encode("utf-8") if db_question.clientPayload else None
+    return CachedQuestion(
+        db_question.id, db_question.questionText, load_options(db_question.options), db_question.correctAnswerId,
+        client_payload
+    )
+
+
+async def get_question(db: Prisma, question_id: str) -> CachedQuestion | None:
+    """Returns the question, reading it only on a cache miss. None if it does not exist."""
+    question = question_cache.get(question_id)
+    if question is not None:
+        return question
+    db_question = await QuestionContent.prisma(db).find_unique(where={"id": question_id})
+    if db_question is None:
+        return None
+    question = _cached_question_from_row(db_question)
+    question_cache.put(question)
+    return question
+
+
+async def get_questions(db: Prisma, question_ids: List[str]) -> Dict[str, CachedQuestion]:
+    """
+    Returns the questions that exist among `question_ids`, by id. Cache misses are read with a
+    single find_many.
+    """
+    questions: Dict[str, CachedQuestion] = {}
+    missing_ids = []
+    for question_id in dict.fromkeys(question_ids):
+        question = question_cache.get(question_id)
+        if question is not None:
+            questions[question_id] = question
+        else:
+            missing_ids.append(question_id)
+
+    if missing_ids:
+        for db_question in await QuestionContent.prisma(db).find_many(where={"id": {"in": missing_ids}}):
+            question = _cached_question_from_row(db_question)
+            question_cache.put(question)
+            questions[question.id] = question
+    return questions
+
+
+async def get_correct_answer_ids(db: Prisma, question_ids: List[str]) -> Dict[str, str]:
+    """
+    Returns the correct option id of each question that exists among `question_ids`, by id.
+    Cache misses are read with a single find_many of just the answer key; they are not cached,
+    since scoring does not need the question text, options or client payload.
+    """
+    correct_answer_ids: Dict[str, str] = {}
+    missing_ids = []
+    for question_id in dict.fromkeys(question_ids):
+        question = question_cache.get(question_id)
+        if question is not None:
+            correct_answer_ids[question_id] = question.correct_answer_id
+        else:
+            missing_ids.append(question_id)
+
+    if missing_ids:
+        for answer_key in await QuestionAnswerKey.prisma(db).find_many(where={"id": {"in": missing_ids}}):
+            correct_answer_ids[answer_key.id] = answer_key.correctAnswerId
+    return correct_answer_ids
@@ -0,0 +1,35 @@
+# backend/retest_queue.py
+# A user's retest queue is their not yet retested UserWrongdoingQuestion rows that are due for review
+# (next_due_at <= now, see the spaced-repetition state in answer_store.py), most overdue first. /answer
+# keeps it up to date one answer at a time and the (user_id, retested_correctly, next_due_at) index
+# keeps it in order, so starting a retest is a single bounded, indexed read of question ids. The
+# questions themselves are the question cache's pre-serialized payloads.
+import logging
+from datetime import datetime, timezone
+from typing import List
+
+from prisma import Prisma
+
+from question_store import get_questions
+
+queue_logger = logging.getLogger(__name__)
+
+NEXT_RETEST_QUESTIONS_SQL = """
+SELECT "question_id" FROM "user_wrongdoing_questions"
+WHERE "user_id" = $1 AND "retested_correctly" = false
+  AND "next_due_at" <= $3::timestamptz AT TIME ZONE 'UTC'
+ORDER BY "next_due_at"
+LIMIT $2
+"""
+
+
+async def next_retest_payloads(db: Prisma, user_id: str, limit: int) -> List[bytes]:
+    """Returns the client payloads (QuestionResponse JSON) of the next `limit` due questions in the user's queue."""
+    rows = await db.query_raw(NEXT_RETEST_QUESTIONS_SQL, user_id, limit, datetime.now(timezone.utc).isoformat())
+    question_ids = [row["question_id"] for row in rows]
+    questions_by_id = await get_questions(db, question_ids)
+
+    missing_ids = [question_id for question_id in question_ids if question_id not in questions_by_id]
+    if missing_ids:
+        queue_logger.warning("Question data not found for queued retest questions %s of user %s", missing_ids, user_id)
+    return [questions_by_id[question_id].client_payload for question_id in question_ids if question_id in questions_by_id]
@@ -1,12 +1,21 @@
 # backend/routers/dashboard.py
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List, Dict
-import json
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Response
+from typing import List, Optional
+import logging
+import time
 from datetime import datetime # For type hinting if needed
 
-from schemas import DashboardDataResponse, WrongdoingQuestionInfo # Adjust import if schemas.py is elsewhere
+from schemas import DashboardDataResponse, WrongQuestionHistoryPage # Adjust import if schemas.py is elsewhere
 from db import get_db
+from responses import FastJSONResponse
+from dashboard_store import (
+    get_or_create_dashboard, get_dashboard_version, fetch_points_history, clear_points_history,
+    reset_dashboard_points
+)
+from dashboard_snapshots import DashboardSnapshot, dashboard_snapshots, etag_matches
+from question_store import get_questions
 from prisma import Prisma
+from prisma.partials import WrongdoingEntry
 # from ..auth import get_current_user_id_from_header # Adjust import for auth.py
 import sys
 if ".." not in sys.path: sys.path.append("..")
@@ -14,64 +23,78 @@ from auth import get_current_user_id_from_header
 
 
 router = APIRouter()
+dashboard_logger = logging.getLogger(__name__)
+
+MAX_WRONG_QUESTIONS_PAGE_SIZE = 100
+
+def _snapshot_response(snapshot: DashboardSnapshot, if_none_match: str | None) -> Response:
+    # no-cache: browsers keep the copy but revalidate it with If-None-Match on every load
+    headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return FastJSONResponse(content=snapshot.content, headers=headers)
+
 
 @router.get("/", response_model=DashboardDataResponse, tags=["Dashboard"])
 async def get_user_dashboard(
     db: Prisma = Depends(get_db),
-    current_user_id: str = Depends(get_current_user_id_from_header)
+    current_user_id: str = Depends(get_current_user_id_from_header),
+    if_none_match: str | None = Header(None)
 ):
     """
     Fetches all data required for the user's dashboard.
+    Served from the user's snapshot while it is current (see dashboard_snapshots.py); responds 304
+    when the client's If-None-Match still matches it.
     """
-    print(f"Fetching dashboard data for user: {current_user_id}")
-
-    # 1. Fetch UserDashboardData
-    dashboard_data_db = await db.userdashboarddata.find_unique(where={"userId": current_user_id})
-
-    if not dashboard_data_db:
-        # If no dashboard data exists, create a default one (or handle as error)
-        # This should ideally be created upon user registration.
-        print(f"No dashboard data for user {current_user_id}. Returning default/empty.")
-        # For now, let's return default values if not found, but you might want to ensure it always exists.
-        # Or, you could create it here if that's your app's logic.
-        # For this example, if it's missing, we'll raise an error or provide defaults.
-        # To be robust, let's try creating it if it's missing.
-        try:
-            dashboard_data_db = await db.userdashboarddata.create(
-                data={
-                    "userId": current_user_id,
-                    "totalPoints": 0,
-                    "previousSessionPoints": 0,
-                    "pointsHistory": "[]"
-                }
-            )
-            print(f"Created default dashboard data for user {current_user_id}")
-        except Exception as e_create:
-            print(f"Failed to create default dashboard data for {current_user_id}: {e_create}")
-            raise HTTPException(status_code=404, detail=f"Dashboard data not found for user and could not be created.")
-
-
-    # Parse pointsHistory from JSON string
+    # Checked moments ago: no database access at all
+    snapshot = dashboard_snapshots.get(current_user_id)
+    if snapshot is not None and snapshot.is_fresh:
+        dashboard_snapshots.hits += 1
+        return _snapshot_response(snapshot, if_none_match)
+
+    # Otherwise a primary-key read of the version tells whether the snapshot is still current.
+    # It is read before the data below, so a write racing the rebuild only makes the snapshot look older.
     try:
-        points_history_parsed = json.loads(dashboard_data_db.pointsHistory)
-    except json.JSONDecodeError:
-        print(f"Warning: Could not parse pointsHistory for user {current_user_id}. Using empty list.")
-        points_history_parsed = []
-
-    # 2. Fetch Last 5 Wrongdoing Questions
-    # We need to join with the Question table to get question_text
-    wrong_questions_db = await db.userwrongdoingquestion.find_many(
-        where={"userId": current_user_id},
+        version = await get_dashboard_version(db, current_user_id)
+    except Exception as e_create:
+        dashboard_logger.error("Failed to create default dashboard data for %s: %s", current_user_id, e_create)
+        raise HTTPException(status_code=404, detail=f"Dashboard data not found for user and could not be created.")
+
+    if snapshot is not None and snapshot.version == version:
+        snapshot.checked_at = time.monotonic()
+        dashboard_snapshots.revalidations += 1
+        return _snapshot_response(snapshot, if_none_match)
+
+    dashboard_logger.debug("Building dashboard data for user %s.", current_user_id)
+    dashboard_data = await _build_dashboard(db, current_user_id)
+    snapshot = DashboardSnapshot(current_user_id, version, dashboard_data)
+    dashboard_snapshots.put(snapshot)
+    dashboard_snapshots.rebuilds += 1
+    return _snapshot_response(snapshot, if_none_match)
+
+
+async def _build_dashboard(db: Prisma, user_id: str) -> dict:
+    """The user's dashboard as JSON-ready DashboardDataResponse content, built from trusted rows without a model."""
+    # 1. Fetch UserDashboardData (the row exists: get_dashboard_version created it if needed)
+    dashboard_data_db = await get_or_create_dashboard(db, user_id)
+
+    # Newest history entries only, read through the (user_id, timestamp) index
+    points_history_parsed = await fetch_points_history(db, user_id)
+
+    # 2. Fetch Last 5 Wrongdoing Questions; their text comes from the question cache
+    wrong_questions_db = await WrongdoingEntry.prisma(db).find_many(
+        where={"userId": user_id},
         order={"timestampMarkedWrong": "desc"},  # Corrected: Prisma uses 'order'
-        take=5,
-        include={"question": True}  # Assuming you want to include question details
+        take=5
     )
+    questions_by_id = await get_questions(db, [wq.questionId for wq in wrong_questions_db])
 
-    last_5_wrong_questions_info: List[WrongdoingQuestionInfo] = []
+    last_5_wrong_questions_info: List[dict] = []
     for wq in wrong_questions_db:
-        if wq.question: # Ensure the related question object exists
+        question = questions_by_id.get(wq.questionId)
+        if question: # Ensure the related question exists
             # Provide a default if questionText is None
-            question_text_val = wq.question.questionText if wq.question.questionText is not None else "Question text not available"
+            question_text_val = question.question_text if question.question_text is not None else "Question text not available"
             
             timestamp_marked_wrong_val = "Timestamp not available"
             if wq.timestampMarkedWrong:
@@ -79,26 +102,70 @@ async def get_user_dashboard(
                     timestamp_marked_wrong_val = wq.timestampMarkedWrong.isoformat()
                 except AttributeError:
                     # Log if timestampMarkedWrong is not a datetime object, though Prisma should handle types
-                    print(f"Warning: UserWrongdoingQuestion id {wq.id} has invalid timestampMarkedWrong type.")
+                    dashboard_logger.warning("UserWrongdoingQuestion id %s has invalid timestampMarkedWrong type.", wq.id)
             
-            last_5_wrong_questions_info.append(
-                WrongdoingQuestionInfo(
-                    question_id=wq.questionId, # Assuming wq.questionId is always valid
-                    question_text=question_text_val,
-                    timestamp_marked_wrong=timestamp_marked_wrong_val
-                )
-            )
+            last_5_wrong_questions_info.append({
+                "question_id": wq.questionId, # Assuming wq.questionId is always valid
+                "question_text": question_text_val,
+                "timestamp_marked_wrong": timestamp_marked_wrong_val
+            })
         else:
-            print(f"Warning: Wrongdoing question entry {wq.id} for user {current_user_id} has no associated question data.")
-
-
-    return DashboardDataResponse(
-        user_id=dashboard_data_db.userId,
-        total_points=dashboard_data_db.totalPoints,
-        previous_session_points=dashboard_data_db.previousSessionPoints,
-        points_history=points_history_parsed,
-        last_5_wrong_questions=last_5_wrong_questions_info
+            dashboard_logger.warning("Wrongdoing question entry %s for user %s has no associated question data.", wq.id, user_id)
+
+
+    return {
+        "user_id": dashboard_data_db.userId,
+        "total_points": dashboard_data_db.totalPoints,
+        "previous_session_points": dashboard_data_db.previousSessionPoints,
+        "points_history": points_history_parsed,
+        "last_5_wrong_questions": last_5_wrong_questions_info
+    }
+
+@router.get("/wrong-questions", response_model=WrongQuestionHistoryPage, tags=["Dashboard"])
+async def get_wrong_question_history(
+    limit: int = Query(20, ge=1, le=MAX_WRONG_QUESTIONS_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    retested: bool = Query(False, description="True for questions already retested correctly"),
+    db: Prisma = Depends(get_db),
+    current_user_id: str = Depends(get_current_user_id_from_header)
+):
+    """
+    Pages through the user's wrong questions, most recently missed first.
+    Keyset pagination: each page continues from the cursor row through the
+    (user_id, retested_correctly, timestamp_marked_wrong) index, so deep pages cost the same as the first.
+    """
+    page_query = {"cursor": {"id": cursor}, "skip": 1} if cursor else {}
+    wrong_questions_db = await WrongdoingEntry.prisma(db).find_many(
+        where={"userId": current_user_id, "retestedCorrectly": retested},
+        order=[{"timestampMarkedWrong": "desc"}, {"id": "desc"}],  # id breaks timestamp ties
+        take=limit + 1,  # One extra row tells whether there is a next page
+        **page_query
     )
+    has_next_page = len(wrong_questions_db) > limit
+    wrong_questions_db = wrong_questions_db[:limit]
+
+    questions_by_id = await get_questions(db, [wq.questionId for wq in wrong_questions_db])
+    items: List[dict] = []
+    for wq in wrong_questions_db:
+        question = questions_by_id.get(wq.questionId)
+        if not question:
+            dashboard_logger.warning(
+                "Wrongdoing question entry %s for user %s has no associated question data.", wq.id, current_user_id
+            )
+            continue
+        items.append({
+            "id": wq.id,
+            "question_id": wq.questionId,
+            "question_text": question.question_text,
+            "timestamp_marked_wrong": wq.timestampMarkedWrong.isoformat(),
+            "retested_correctly": wq.retestedCorrectly
+        })
+
+    # Built from trusted rows in the WrongQuestionHistoryPage shape, so it skips response_model validation
+    return FastJSONResponse(content={
+        "items": items,
+        "next_cursor": wrong_questions_db[-1].id if has_next_page else None
+    })
 
 @router.post("/reset", tags=["Dashboard"])
 async def reset_user_dashboard(
@@ -108,29 +175,22 @@ async def reset_user_dashboard(
     """
     Resets the user's dashboard data, including points, history, and wrongdoing questions.
     """
-    print(f"Resetting dashboard data for user: {current_user_id}")
-
-    # 1. Update UserDashboardData
-    await db.userdashboarddata.update(
-        where={"userId": current_user_id},
-        data={
-            "totalPoints": 0,
-            "previousSessionPoints": 0,
-            "pointsHistory": "[]"
-        }
-    )
-    print(f"Reset UserDashboardData for user {current_user_id}")
-
-    # 2. Delete UserAnswer records
-    await db.useranswer.delete_many(
-        where={"userId": current_user_id}
-    )
-    print(f"Deleted UserAnswer records for user {current_user_id}")
-
-    # 3. Delete UserWrongdoingQuestion records
-    await db.userwrongdoingquestion.delete_many(
-        where={"userId": current_user_id}
-    )
-    print(f"Deleted UserWrongdoingQuestion records for user {current_user_id}")
-
+    # All three steps run in one transaction, so a concurrent quiz submit cannot land between them
+    async with db.tx() as transaction:
+        # 1. Update UserDashboardData
+        await reset_dashboard_points(transaction, current_user_id)
+        await clear_points_history(transaction, current_user_id)
+
+        # 2. Delete UserAnswer records
+        await transaction.useranswer.delete_many(
+            where={"userId": current_user_id}
+        )
+
+        # 3. Delete UserWrongdoingQuestion records
+        await transaction.userwrongdoingquestion.delete_many(
+            where={"userId": current_user_id}
+        )
+
+    dashboard_snapshots.invalidate(current_user_id)
+    dashboard_logger.info("Reset dashboard data for user %s.", current_user_id)
     return {"message": "Dashboard data reset successfully."}
\ No newline at end of file
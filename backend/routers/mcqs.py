@@ -1,15 +1,17 @@
 # backend/routers/mcqs.py
-from fastapi import APIRouter, Depends, HTTPException, Body
-from typing import List, Dict
+from fastapi import APIRouter, Depends, HTTPException, Body, Response
+from fastapi.responses import StreamingResponse
 import json
-from datetime import datetime, timezone
+import logging
 
 from schemas import (
-    GenerateMCQsRequest, GenerateMCQsResponse, QuestionResponse, MCQOption,
+    GenerateMCQsRequest, GenerateMCQsResponse,
     SubmitAnswerRequest, SubmitAnswerResponse,
-    SubmitQuizSessionRequest, SubmitQuizSessionResponse, DashboardDataResponse
+    SubmitQuizSessionRequest, SubmitQuizSessionResponse
 )
 from db import get_db
+from responses import FastJSONResponse
+from log_config import PAYLOAD_LOGGER_NAME
 from prisma import Prisma
 
 import sys
@@ -17,9 +19,23 @@ if ".." not in sys.path: sys.path.append("..")
 from auth import get_current_user_id_from_header
 
 from ai_core.agent import MainCoreAgent
+from ai_core.inference_executor import InferenceQueueFullError
+from ai_core.inference_client import InferenceSidecarError
+from agent_loader import get_ready_agent
+from question_store import (
+    save_generated_question, save_generated_questions, get_question, get_correct_answer_ids, client_questions_body
+)
+from answer_store import record_answer
+from dashboard_store import record_session_points
+from topic_pool import canonical_topic_for, take_pooled_questions
 
 router = APIRouter()
-agent_instance = MainCoreAgent()
+mcqs_logger = logging.getLogger(__name__)
+payload_logger = logging.getLogger(PAYLOAD_LOGGER_NAME)
+
+
+def _topic_id_for(topic_string: str) -> str:
+    return f"ai_topic_{topic_string.lower().strip().replace(' ', '_')}"
 
 @router.post("/generate", response_model=GenerateMCQsResponse, tags=["MCQs"])
 async def generate_mcqs_endpoint(
@@ -29,60 +45,108 @@ async def generate_mcqs_endpoint(
     topic_string = payload.topic_string
     fixed_num_questions = 5 
     
-    print(f"API: Request to generate {fixed_num_questions} MCQs for topic: '{topic_string}' using AI Agent with RAG.")
+    mcqs_logger.info("Request to generate %d MCQs for topic %r.", fixed_num_questions, topic_string)
+
+    # Canonical topics are served from their pre-generated pool when it can cover the whole quiz
+    generated_topic_id = _topic_id_for(topic_string)
+    canonical_topic = canonical_topic_for(topic_string)
+    if canonical_topic:
+        pooled_payloads = await take_pooled_questions(db, canonical_topic, fixed_num_questions, generated_topic_id)
+        if pooled_payloads:
+            # Stored payloads are sent as is; same JSON as GenerateMCQsResponse
+            return Response(
+                content=client_questions_body(pooled_payloads, topic_id=generated_topic_id),
+                media_type="application/json"
+            )
 
-    # Call the RAG-enabled method from the agent, always with 5 questions
-    ai_generated_mcqs_raw = agent_instance.generate_mcqs_with_rag(
-        user_topic=topic_string,
-        num_questions=fixed_num_questions
-    )
+    # Only now is the model needed: pooled topics are served even while the agent is still loading.
+    # Raises 503 (with Retry-After) until it is ready, like the dependency on the other AI routes.
+    agent: MainCoreAgent = await get_ready_agent()
 
-    client_questions: List[QuestionResponse] = []
-    generated_topic_id = f"ai_topic_{topic_string.lower().strip().replace(' ', '_')}"
+    # Call the RAG-enabled method from the agent, always with 5 questions.
+    # Generation runs on the inference executor so other requests keep being served meanwhile.
+    try:
+        ai_generated_mcqs_raw = await agent.agenerate_mcqs_with_rag(
+            user_topic=topic_string,
+            num_questions=fixed_num_questions
+        )
+    except InferenceQueueFullError as e:
+        mcqs_logger.warning("Inference queue full, rejecting generation request for topic %r.", topic_string)
+        raise HTTPException(
+            status_code=503,
+            detail="The question generator is busy. Please try again shortly.",
+            headers={"Retry-After": str(e.retry_after_seconds)}
+        )
+    except InferenceSidecarError as e:
+        mcqs_logger.error("Inference sidecar unavailable for topic %r: %s", topic_string, e)
+        raise HTTPException(status_code=503, detail="The question generator is unavailable.")
 
     if not ai_generated_mcqs_raw:
-        print(f"API: AI agent returned no structured questions for topic '{topic_string}'.")
+        mcqs_logger.warning("AI agent returned no structured questions for topic %r.", topic_string)
         return GenerateMCQsResponse(questions=[], topic_id=f"{generated_topic_id}_no_questions_generated")
 
-    for raw_mcq in ai_generated_mcqs_raw:
-        question_text = raw_mcq.get("question_text")
-        options_data = raw_mcq.get("options", [])
-        correct_option_id = raw_mcq.get("correct_option_id")
+    saved_questions = await save_generated_questions(db, ai_generated_mcqs_raw, generated_topic_id)
 
-        if not (question_text and options_data and correct_option_id and len(options_data) > 0):
-            print(f"API: Warning - Skipping a malformed MCQ from AI (missing data): {raw_mcq}")
-            continue
-            
-        try:
-            new_db_question = await db.question.create(
-                data={
-                    "questionText": question_text,
-                    "options": json.dumps(options_data), # Explicitly serialize to JSON string
-                    "correctAnswerId": correct_option_id,
-                    "topicId": generated_topic_id
-                }
-            )
-            print(f"API: Saved question to DB with ID: {new_db_question.id}")
-
-            client_options = [MCQOption(id=opt["id"], text=opt["text"]) for opt in options_data]
-            
-            client_questions.append(QuestionResponse(
-                id=new_db_question.id,
-                question_text=new_db_question.questionText,
-                options=client_options
-            ))
-        except Exception as e:
-            print(f"API: Error saving question to DB or preparing client response: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
-
-    if not client_questions and fixed_num_questions > 0 and ai_generated_mcqs_raw:
-         print(f"API: No valid questions could be saved/processed from AI output for topic '{topic_string}'.")
+    if not saved_questions and fixed_num_questions > 0 and ai_generated_mcqs_raw:
+         mcqs_logger.warning("No valid questions could be saved/processed from AI output for topic %r.", topic_string)
          return GenerateMCQsResponse(questions=[], topic_id=f"{generated_topic_id}_processing_failed_for_all")
     
-    print(f"API: Successfully generated and saved {len(client_questions)} MCQs for topic '{topic_string}'.")
-    return GenerateMCQsResponse(questions=client_questions, topic_id=generated_topic_id)
+    mcqs_logger.info("Generated and saved %d MCQs for topic %r.", len(saved_questions), topic_string)
+    return Response(
+        content=client_questions_body([q.client_payload for q in saved_questions], topic_id=generated_topic_id),
+        media_type="application/json"
+    )
+
+
+@router.post("/generate/stream", tags=["MCQs"])
+async def generate_mcqs_stream_endpoint(
+    payload: GenerateMCQsRequest = Body(...),
+    db: Prisma = Depends(get_db),
+    agent: MainCoreAgent = Depends(get_ready_agent)
+):
+    """
+    Streaming variant of /generate. Responds with newline-delimited JSON:
+    one {"type": "question", "question": {...}} line per MCQ as soon as it is generated and saved,
+    then a final {"type": "done", "topic_id": ..., "count": ...} line.
+    """
+    topic_string = payload.topic_string
+    fixed_num_questions = 5
+    generated_topic_id = _topic_id_for(topic_string)
+
+    mcqs_logger.info("Request to stream %d MCQs for topic %r.", fixed_num_questions, topic_string)
+
+    # Reserve the inference slot before the response starts, so a full queue is still a proper 503.
+    try:
+        mcq_stream = await agent.astream_mcqs_with_rag(
+            user_topic=topic_string,
+            num_questions=fixed_num_questions
+        )
+    except InferenceQueueFullError as e:
+        mcqs_logger.warning("Inference queue full, rejecting streaming request for topic %r.", topic_string)
+        raise HTTPException(
+            status_code=503,
+            detail="The question generator is busy. Please try again shortly.",
+            headers={"Retry-After": str(e.retry_after_seconds)}
+        )
+    except InferenceSidecarError as e:
+        mcqs_logger.error("Inference sidecar unavailable for topic %r: %s", topic_string, e)
+        raise HTTPException(status_code=503, detail="The question generator is unavailable.")
+
+    async def ndjson_lines():
+        saved_count = 0
+        try:
+            async for raw_mcq in mcq_stream:
+                saved_question = await save_generated_question(db, raw_mcq, generated_topic_id)
+                if saved_question:
+                    saved_count += 1
+                    yield b'{"type": "question", "question": ' + saved_question.client_payload + b"}\n"
+        except Exception:
+            mcqs_logger.exception("Error while streaming MCQs for topic %r.", topic_string)
+            yield json.dumps({"type": "error", "detail": "Question generation failed."}).encode() + b"\n"
+        mcqs_logger.info("Streamed and saved %d MCQs for topic %r.", saved_count, topic_string)
+        yield json.dumps({"type": "done", "topic_id": generated_topic_id, "count": saved_count}).encode() + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
 
 
 @router.post("/answer", response_model=SubmitAnswerResponse, tags=["MCQs"])
@@ -91,80 +155,35 @@ async def submit_answer_endpoint(
     db: Prisma = Depends(get_db),
     current_user_id: str = Depends(get_current_user_id_from_header)
 ):
-    print(f"User '{current_user_id}' submitted answer for Q: '{payload.question_id}', Selected: '{payload.selected_answer_id}'")
+    mcqs_logger.debug("User %s submitted answer %s for question %s.", current_user_id, payload.selected_answer_id, payload.question_id)
 
-    db_question = await db.question.find_unique(where={"id": payload.question_id})
+    # Questions never change, so this reads the question only if it is not cached yet
+    question = await get_question(db, payload.question_id)
 
-    if not db_question:
-        print(f"Error: Question with ID '{payload.question_id}' not found in database.")
+    if not question:
+        mcqs_logger.warning("Question %s not found in database.", payload.question_id)
         raise HTTPException(status_code=404, detail=f"Question with ID {payload.question_id} not found.")
 
-    is_correct = (db_question.correctAnswerId == payload.selected_answer_id)
-    correct_option_text = ""
-    
-    if isinstance(db_question.options, list):
-        for opt in db_question.options:
-            if isinstance(opt, dict) and opt.get("id") == db_question.correctAnswerId:
-                correct_option_text = opt.get("text", "")
-                break
-    
-    print(f"Q: '{payload.question_id}' - DB Correct ID: '{db_question.correctAnswerId}', User Selected: '{payload.selected_answer_id}', IsCorrect: {is_correct}")
+    is_correct = (question.correct_answer_id == payload.selected_answer_id)
 
     try:
-        print(f"Attempting to save UserAnswer for user '{current_user_id}', q_id '{payload.question_id}'")
-        await db.useranswer.create(
-            data={
-                "userId": current_user_id,
-                "questionId": payload.question_id,
-                "selectedOptionId": payload.selected_answer_id,
-                "isCorrect": is_correct,
-            }
-        )
-        print(f"UserAnswer saved for q_id: {payload.question_id}")
-
-        if not is_correct:
-            print(f"Attempting to save/update UserWrongdoingQuestion for user '{current_user_id}', q_id '{payload.question_id}'")
-            await db.userwrongdoingquestion.upsert(
-                where={"userId_questionId": {"userId": current_user_id, "questionId": payload.question_id}},
-                data={
-                    "create": {
-                        "userId": current_user_id,
-                        "questionId": payload.question_id,
-                        "retestedCorrectly": False,
-                        "timestampMarkedWrong": datetime.now(timezone.utc)
-                    },
-                    "update": {
-                        "timestampMarkedWrong": datetime.now(timezone.utc),
-                        "retestedCorrectly": False
-                    }
-                }
-            )
-            print(f"UserWrongdoingQuestion saved/updated for q_id: '{payload.question_id}'.")
-        elif is_correct: 
-            existing_wrongdoing_entry = await db.userwrongdoingquestion.find_unique(
-                where={"userId_questionId": {"userId": current_user_id, "questionId": payload.question_id}}
-            )
-            if existing_wrongdoing_entry and not existing_wrongdoing_entry.retestedCorrectly:
-                await db.userwrongdoingquestion.update(
-                    where={"id": existing_wrongdoing_entry.id},
-                    data={"retestedCorrectly": True}
-                )
-                print(f"UserWrongdoingQuestion for q_id: '{payload.question_id}' marked as retestedCorrectly.")
-        
-        user_dashboard = await db.userdashboarddata.find_unique(where={"userId": current_user_id})
-        current_total_points = user_dashboard.totalPoints if user_dashboard else 0
-
-        return SubmitAnswerResponse(
-            is_correct=is_correct,
-            correct_answer_id=db_question.correctAnswerId,
-            correct_answer_text=correct_option_text,
-            current_points=current_total_points
+        # One statement: saves the UserAnswer, upserts the UserWrongdoingQuestion
+        # (marked wrong, or retested correctly) and reads the user's current points.
+        current_total_points = await record_answer(
+            db, current_user_id, payload.question_id, payload.selected_answer_id, is_correct
         )
+        mcqs_logger.debug("Answer to question %s saved (correct: %s).", payload.question_id, is_correct)
+
+        # SubmitAnswerResponse content built from trusted values, so it skips response_model validation
+        return FastJSONResponse(content={
+            "is_correct": is_correct,
+            "correct_answer_id": question.correct_answer_id,
+            "correct_answer_text": question.correct_answer_text,
+            "current_points": current_total_points
+        })
 
     except Exception as e:
-        print(f"Error during answer processing for user '{current_user_id}', Q: '{payload.question_id}': {e}")
-        import traceback
-        traceback.print_exc()
+        mcqs_logger.exception("Error during answer processing for user %s, question %s.", current_user_id, payload.question_id)
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
 
 @router.post("/session/submit", response_model=SubmitQuizSessionResponse, tags=["MCQs Quiz Session"])
@@ -173,90 +192,49 @@ async def submit_quiz_session_endpoint(
     db: Prisma = Depends(get_db),
     current_user_id: str = Depends(get_current_user_id_from_header)
 ):
-    print(f"--- SUBMIT QUIZ SESSION START ---")
-    print(f"User {current_user_id} submitted quiz session. Topic: {payload.topic_id}")
-    print(f"Received answers_map: {payload.answers_map}")
+    mcqs_logger.debug("User %s submitted a quiz session for topic %s.", current_user_id, payload.topic_id)
+    payload_logger.debug("answers_map for user %s: %s", current_user_id, payload.answers_map)
 
     session_points_earned = 0
     points_per_correct_answer = 10 
 
+    # Answer keys come from the question cache; at most one query, of just id and correctAnswerId, for the rest
+    question_ids = list(payload.answers_map.keys())
+    correct_answer_by_id = await get_correct_answer_ids(db, question_ids)
+
     for question_id, selected_option_id in payload.answers_map.items():
-        print(f"Processing Q_ID: {question_id}, Selected_Option_ID: {selected_option_id}")
-        
-        db_question = await db.question.find_unique(where={"id": question_id})
-        
-        if not db_question:
-            print(f"  WARNING: Question with ID '{question_id}' NOT FOUND in database. Skipping.")
+        correct_answer_id = correct_answer_by_id.get(question_id)
+        if correct_answer_id is None:
+            mcqs_logger.warning("Question %s not found in database. Skipping.", question_id)
             continue
-
-        print(f"  Found DB question: ID={db_question.id}, CorrectOptionID={db_question.correctAnswerId}")
-        if db_question.correctAnswerId == selected_option_id:
+        if correct_answer_id == selected_option_id:
             session_points_earned += points_per_correct_answer
-            print(f"  CORRECT. Points for this question: {points_per_correct_answer}. Current session_points_earned: {session_points_earned}")
-        else:
-            print(f"  INCORRECT. Points for this question: 0. Current session_points_earned: {session_points_earned}")
     
-    print(f"Total session points earned for user {current_user_id}: {session_points_earned}")
-    print(f"--- END OF POINTS CALCULATION ---")
+    mcqs_logger.info(
+        "User %s earned %d session points (%d/%d questions found).",
+        current_user_id, session_points_earned, len(correct_answer_by_id), len(question_ids)
+    )
 
     try:
-        dashboard_data = await db.userdashboarddata.find_unique(where={"userId": current_user_id})
-
-        new_history_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "points": session_points_earned,
-            "topic_id": payload.topic_id or "unknown_topic"
-        }
-
-        if not dashboard_data:
-            print(f"No dashboard data found for user {current_user_id}, creating new record.")
-            dashboard_data = await db.userdashboarddata.create(
-                data={
-                    "userId": current_user_id,
-                    "totalPoints": session_points_earned,
-                    "previousSessionPoints": session_points_earned,
-                    "pointsHistory": json.dumps([new_history_entry])
-                }
-            )
-        else:
-            try:
-                current_history = json.loads(dashboard_data.pointsHistory) if dashboard_data.pointsHistory else []
-            except json.JSONDecodeError:
-                print(f"Warning: Could not parse pointsHistory for user {current_user_id}. Resetting history.")
-                current_history = []
-
-            current_history.append(new_history_entry)
-            max_history_items = 50 
-            if len(current_history) > max_history_items:
-                current_history = current_history[-max_history_items:]
-
-            dashboard_data = await db.userdashboarddata.update(
-                where={"userId": current_user_id},
-                data={
-                    "totalPoints": dashboard_data.totalPoints + session_points_earned,
-                    "previousSessionPoints": session_points_earned,
-                    "pointsHistory": json.dumps(current_history)
-                }
-            )
-        
-        print(f"Dashboard data updated for user {current_user_id}.")
-        
-        response_dashboard_data = DashboardDataResponse(
-            user_id=dashboard_data.userId,
-            total_points=dashboard_data.totalPoints,
-            previous_session_points=dashboard_data.previousSessionPoints,
-            points_history=json.loads(dashboard_data.pointsHistory),
-            last_5_wrong_questions=[]
+        # Single atomic statement: inserts the history entry and creates the row or increments the total.
+        # Concurrent submits for the same user each add their points; none is lost.
+        dashboard_row = await record_session_points(
+            db, current_user_id, session_points_earned, payload.topic_id or "unknown_topic"
         )
 
-        return SubmitQuizSessionResponse(
-            message="Quiz session submitted successfully and dashboard updated.",
-            session_points_earned=session_points_earned,
-            updated_dashboard_data=response_dashboard_data
-        )
+        # SubmitQuizSessionResponse content built from the returned row, so it skips response_model validation
+        return FastJSONResponse(content={
+            "message": "Quiz session submitted successfully and dashboard updated.",
+            "session_points_earned": session_points_earned,
+            "updated_dashboard_data": {
+                "user_id": dashboard_row["user_id"],
+                "total_points": dashboard_row["total_points"],
+                "previous_session_points": dashboard_row["previous_session_points"],
+                "points_history": dashboard_row["points_history"],
+                "last_5_wrong_questions": []
+            }
+        })
 
     except Exception as e:
-        print(f"Error updating dashboard data for user {current_user_id}: {e}")
-        import traceback
-        traceback.print_exc()
+        mcqs_logger.exception("Error updating dashboard data for user %s.", current_user_id)
         raise HTTPException(status_code=500, detail=f"Failed to update dashboard: {str(e)}")
\ No newline at end of file
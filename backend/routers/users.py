@@ -1,9 +1,14 @@
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException
 from prisma import Prisma
 from db import get_db
+from dashboard_store import clear_points_history, reset_dashboard_points
+from dashboard_snapshots import dashboard_snapshots
 from auth import get_current_user_id_from_header
 
 router = APIRouter()
+users_logger = logging.getLogger(__name__)
 
 @router.delete("/me/data", status_code=200, tags=["Users"])
 async def delete_user_learning_data(
@@ -24,29 +29,21 @@ async def delete_user_learning_data(
             await transaction.useranswer.delete_many(
                 where={"userId": current_user_id}
             )
-            print(f"Deleted UserAnswers for user {current_user_id}")
 
             # Delete UserWrongdoingQuestions
             await transaction.userwrongdoingquestion.delete_many(
                 where={"userId": current_user_id}
             )
-            print(f"Deleted UserWrongdoingQuestions for user {current_user_id}")
 
             # Reset UserDashboardData
-            await transaction.userdashboarddata.update(
-                where={"userId": current_user_id},
-                data={
-                    "totalPoints": 0,
-                    "previousSessionPoints": 0,
-                    "pointsHistory": "[]",  # Reset to an empty JSON array as a string
-                }
-            )
-            print(f"Reset UserDashboardData for user {current_user_id}")
+            await reset_dashboard_points(transaction, current_user_id)
+            await clear_points_history(transaction, current_user_id)
             
+        dashboard_snapshots.invalidate(current_user_id)
+        users_logger.info("Deleted learning data for user %s.", current_user_id)
         return {"message": "Personalized learning data successfully deleted."}
 
     except Exception as e:
-        print(f"Error deleting learning data for user {current_user_id}: {e}")
-        # Log the exception e
+        users_logger.exception("Error deleting learning data for user %s.", current_user_id)
         raise HTTPException(status_code=500, detail=f"An error occurred while deleting data: {str(e)}")
 
@@ -54,6 +54,14 @@ class WrongdoingQuestionInfo(BaseModel):
     # selected_incorrect_answer: Optional[str] = None
     # correct_answer: Optional[str] = None
 
+class WrongQuestionHistoryItem(WrongdoingQuestionInfo):
+    id: str # UserWrongdoingQuestion id; also what the next page's cursor refers to
+    retested_correctly: bool
+
+class WrongQuestionHistoryPage(BaseModel):
+    items: List[WrongQuestionHistoryItem]
+    next_cursor: Optional[str] = None # Pass back as ?cursor= for the next page; None on the last page
+
 class DashboardDataResponse(BaseModel):
     user_id: str
     total_points: int
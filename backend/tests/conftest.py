@@ -0,0 +1,9 @@
+# backend/tests/conftest.py
+# Run from the backend directory: python -m pytest tests
+# Tests that need PostgreSQL run only when TEST_DATABASE_URL points at a migrated, disposable database.
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
@@ -0,0 +1,163 @@
+# backend/tests/test_caches.py
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import question_cache as question_cache_module
+from ai_core import semantic_cache as semantic_cache_module
+from ai_core.semantic_cache import SemanticMCQCache
+from question_cache import CachedQuestion, QuestionCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(question_cache_module, "time", SimpleNamespace(monotonic=fake))
+    monkeypatch.setattr(semantic_cache_module, "time", SimpleNamespace(monotonic=fake))
+    return fake
+
+
+def _question(question_id: str) -> CachedQuestion:
+    return CachedQuestion(question_id, f"Text of {question_id}", [{"id": "A", "text": "a"}], "A")
+
+
+# --- QuestionCache ---
+
+def test_question_cache_counts_hits_and_misses(clock):
+    cache = QuestionCache(max_entries=10, ttl_seconds=60)
+    cache.put(_question("q1"))
+
+    assert cache.get("q1").question_text == "Text of q1"
+    assert cache.get("q2") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_question_cache_evicts_the_least_recently_used_entry(clock):
+    cache = QuestionCache(max_entries=2, ttl_seconds=60)
+    cache.put(_question("q1"))
+    cache.put(_question("q2"))
+    cache.get("q1")  # q2 is now the least recently used
+    cache.put(_question("q3"))
+
+    assert cache.get("q2") is None
+    assert cache.get("q1") is not None
+    assert cache.get("q3") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_question_cache_put_of_an_existing_id_refreshes_it(clock):
+    cache = QuestionCache(max_entries=2, ttl_seconds=60)
+    cache.put(_question("q1"))
+    cache.put(_question("q2"))
+    cache.put(_question("q1"))
+    cache.put(_question("q3"))
+
+    assert cache.get("q1") is not None
+    assert cache.get("q2") is None
+
+
+def test_question_cache_entries_expire_after_the_ttl(clock):
+    cache = QuestionCache(max_entries=10, ttl_seconds=60)
+    cache.put(_question("q1"))
+
+    clock.now += 60
+    assert cache.get("q1") is not None
+    clock.now += 1
+    assert cache.get("q1") is None
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["evictions"] == 1
+
+
+def test_question_cache_hits_do_not_extend_the_ttl(clock):
+    cache = QuestionCache(max_entries=10, ttl_seconds=60)
+    cache.put(_question("q1"))
+
+    clock.now += 50
+    assert cache.get("q1") is not None
+    clock.now += 20
+    assert cache.get("q1") is None
+
+
+# --- SemanticMCQCache ---
+
+def _mcqs(topic: str, count: int) -> list:
+    return [{"question": f"{topic} {i}"} for i in range(count)]
+
+
+def test_semantic_cache_hits_on_a_similar_embedding(clock):
+    cache = SemanticMCQCache(similarity_threshold=0.9, ttl_seconds=60, max_entries=10)
+    cache.store("past simple", [1.0, 0.0, 0.0], _mcqs("past simple", 5))
+
+    # Not normalized and not identical: cosine similarity ~0.995
+    mcqs = cache.lookup([2.0, 0.2, 0.0], 3)
+
+    assert len(mcqs) == 3
+    assert all(mcq in _mcqs("past simple", 5) for mcq in mcqs)
+    assert len({mcq["question"] for mcq in mcqs}) == 3
+    assert cache.stats()["hits"] == 1
+
+
+def test_semantic_cache_misses_below_the_threshold(clock):
+    cache = SemanticMCQCache(similarity_threshold=0.9, ttl_seconds=60, max_entries=10)
+    cache.store("past simple", [1.0, 0.0], _mcqs("past simple", 5))
+
+    assert cache.lookup([1.0, 1.0], 3) is None  # cosine similarity ~0.707
+    assert cache.stats()["misses"] == 1
+
+
+def test_semantic_cache_picks_the_closest_topic(clock):
+    cache = SemanticMCQCache(similarity_threshold=0.5, ttl_seconds=60, max_entries=10)
+    cache.store("past simple", [1.0, 0.0], _mcqs("past simple", 3))
+    cache.store("articles", [0.6, 0.8], _mcqs("articles", 3))
+
+    mcqs = cache.lookup(np.array([0.5, 0.9]), 3)
+
+    assert sorted(mcq["question"] for mcq in mcqs) == sorted(mcq["question"] for mcq in _mcqs("articles", 3))
+
+
+def test_semantic_cache_misses_when_the_entry_has_too_few_mcqs(clock):
+    cache = SemanticMCQCache(similarity_threshold=0.9, ttl_seconds=60, max_entries=10)
+    cache.store("past simple", [1.0, 0.0], _mcqs("past simple", 2))
+
+    assert cache.lookup([1.0, 0.0], 3) is None
+    assert len(cache.lookup([1.0, 0.0], 2)) == 2
+
+
+def test_semantic_cache_entries_expire_after_the_ttl(clock):
+    cache = SemanticMCQCache(similarity_threshold=0.9, ttl_seconds=60, max_entries=10)
+    cache.store("past simple", [1.0, 0.0], _mcqs("past simple", 3))
+
+    clock.now += 61
+    assert cache.lookup([1.0, 0.0], 3) is None
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["evictions"] == 1
+
+
+def test_semantic_cache_evicts_the_least_recently_used_topic(clock):
+    cache = SemanticMCQCache(similarity_threshold=0.99, ttl_seconds=60, max_entries=2)
+    cache.store("a", [1.0, 0.0, 0.0], _mcqs("a", 1))
+    cache.store("b", [0.0, 1.0, 0.0], _mcqs("b", 1))
+    cache.lookup([1.0, 0.0, 0.0], 1)  # "b" is now the least recently used
+    cache.store("c", [0.0, 0.0, 1.0], _mcqs("c", 1))
+
+    assert cache.lookup([0.0, 1.0, 0.0], 1) is None
+    assert cache.lookup([1.0, 0.0, 0.0], 1) is not None
+    assert cache.lookup([0.0, 0.0, 1.0], 1) is not None
+
+
+def test_semantic_cache_ignores_empty_sets(clock):
+    cache = SemanticMCQCache(similarity_threshold=0.9, ttl_seconds=60, max_entries=10)
+    cache.store("past simple", [1.0, 0.0], [])
+
+    assert cache.stats()["entries"] == 0
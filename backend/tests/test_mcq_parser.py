@@ -0,0 +1,102 @@
+# backend/tests/test_mcq_parser.py
+import json
+
+import pytest
+
+from ai_core.agent import IncrementalMCQParser, MCQ_REQUIRED_KEYS, build_mcq_array_grammar
+
+
+def _mcq(n: int, **overrides) -> dict:
+    mcq = {
+        "question": f"Question {n}?",
+        "option_a": "a", "option_b": "b", "option_c": "c", "option_d": "d",
+        "correct_answer_letter": "A",
+    }
+    mcq.update(overrides)
+    return mcq
+
+
+def _feed_in_chunks(parser: IncrementalMCQParser, text: str, size: int) -> list:
+    completed = []
+    for start in range(0, len(text), size):
+        completed.extend(parser.feed(text[start:start + size]))
+    return completed
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_parser_yields_each_mcq_whatever_the_chunking(chunk_size):
+    mcqs = [_mcq(1), _mcq(2), _mcq(3)]
+    text = json.dumps(mcqs, indent=2)
+
+    assert _feed_in_chunks(IncrementalMCQParser(), text, chunk_size) == mcqs
+
+
+def test_parser_yields_an_mcq_as_soon_as_its_object_closes():
+    parser = IncrementalMCQParser()
+    first = json.dumps(_mcq(1))
+
+    assert parser.feed("[" + first[:-1]) == []
+    assert parser.feed("}") == [_mcq(1)]
+    assert parser.feed(", {") == []
+
+
+def test_parser_ignores_text_before_the_array():
+    text = 'Here are the questions: {"not": "an mcq"}\n' + json.dumps([_mcq(1)])
+
+    assert IncrementalMCQParser().feed(text) == [_mcq(1)]
+
+
+def test_parser_is_not_confused_by_braces_and_quotes_inside_strings():
+    tricky = _mcq(1, question='Which is right: "{a}" or \\"}\\" [x]?', option_b="} ] {")
+    text = json.dumps([tricky, _mcq(2)])
+
+    assert _feed_in_chunks(IncrementalMCQParser(), text, 1) == [tricky, _mcq(2)]
+
+
+def test_parser_skips_objects_that_are_not_mcqs():
+    incomplete = {key: "x" for key in MCQ_REQUIRED_KEYS[:-1]}
+    text = json.dumps([_mcq(1), incomplete, _mcq(2)])
+
+    assert IncrementalMCQParser().feed(text) == [_mcq(1), _mcq(2)]
+
+
+def test_parser_skips_invalid_json_and_keeps_going():
+    text = '[{"question": "broken" "option_a": "a"}, ' + json.dumps(_mcq(2)) + "]"
+
+    assert IncrementalMCQParser().feed(text) == [_mcq(2)]
+
+
+def test_parser_keeps_nested_objects_inside_an_mcq():
+    nested = _mcq(1, explanation={"rule": "past simple"})
+
+    assert IncrementalMCQParser().feed(json.dumps([nested])) == [nested]
+
+
+@pytest.mark.parametrize("num_questions", [1, 2, 5])
+def test_grammar_root_requires_exactly_num_questions_mcqs(num_questions):
+    grammar = build_mcq_array_grammar(num_questions)
+    root_rule = next(line for line in grammar.splitlines() if line.startswith("root ::="))
+
+    assert root_rule.count("mcq") == num_questions
+
+
+def test_grammar_mcq_rule_lists_the_required_keys_in_order():
+    grammar = build_mcq_array_grammar(1)
+    mcq_rule = next(line for line in grammar.splitlines() if line.startswith("mcq ::="))
+
+    positions = [mcq_rule.index(f'\\"{key}\\"') for key in MCQ_REQUIRED_KEYS]
+    assert positions == sorted(positions)
+    assert '"\\"" [A-D] "\\""' in mcq_rule
+
+
+def test_grammar_defines_every_rule_it_uses():
+    grammar = build_mcq_array_grammar(3)
+    defined = {line.split("::=")[0].strip() for line in grammar.splitlines() if "::=" in line}
+
+    assert {"root", "mcq", "string", "char", "hex", "ws"} <= defined
+
+
+def test_grammar_is_accepted_by_llama_cpp():
+    llama_cpp = pytest.importorskip("llama_cpp")
+
+    assert llama_cpp.LlamaGrammar.from_string(build_mcq_array_grammar(3), verbose=False) is not None
@@ -0,0 +1,49 @@
+# backend/tests/test_output_budget.py
+from ai_core.output_budget import OutputTokenBudget
+
+
+def _budget(**overrides) -> OutputTokenBudget:
+    settings = {"default_per_mcq": 350, "percentile": 0.9, "headroom": 1.2, "min_samples": 3, "window": 10}
+    settings.update(overrides)
+    return OutputTokenBudget(**settings)
+
+
+def test_default_is_used_until_enough_samples():
+    budget = _budget()
+    budget.record(200, 2)
+    budget.record(200, 2)
+
+    assert budget.per_mcq() == 350
+
+
+def test_budget_is_the_percentile_of_measured_completions_with_headroom():
+    budget = _budget(min_samples=10)
+    for tokens_per_mcq in range(110, 210, 10):  # 110 .. 200
+        budget.record(tokens_per_mcq * 5, 5)
+
+    # 90th percentile of ten samples is the 9th smallest: 190 tokens per MCQ
+    assert budget.per_mcq() == 228
+
+
+def test_only_the_latest_window_counts():
+    budget = _budget(min_samples=1, window=2, headroom=1.0, percentile=1.0)
+    budget.record(1000, 1)
+    budget.record(100, 1)
+    budget.record(100, 1)
+
+    assert budget.per_mcq() == 100
+
+
+def test_overruns_are_counted_against_the_budget_in_force():
+    budget = _budget()
+
+    assert budget.record(400, 1) is True
+    assert budget.record(300, 1) is False
+    assert budget.stats() == {"per_mcq": 350, "samples": 2, "max_observed_per_mcq": 400, "overruns": 1}
+
+
+def test_empty_completions_are_ignored():
+    budget = _budget()
+
+    assert budget.record(100, 0) is False
+    assert budget.stats()["samples"] == 0
@@ -0,0 +1,162 @@
+# backend/tests/test_review_scheduling.py
+# Review-state transitions of the /answer upsert (RECORD_ANSWER_SQL). These run the real statement,
+# so they need PostgreSQL: set TEST_DATABASE_URL to a migrated, disposable database.
+import asyncio
+import importlib
+import json
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import answer_store
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+
+INITIAL_EASE = 2.5  # Column default for a newly queued question
+
+
+def _run(scenario, store=answer_store):
+    """Runs `scenario(db, answer, entry)` against a fresh user and question, then removes them."""
+    from prisma import Prisma
+
+    async def main():
+        db = Prisma(datasource={"url": TEST_DATABASE_URL})
+        await db.connect()
+        user = await db.user.create(data={"email": f"review-{uuid.uuid4().hex}@example.com"})
+        question = await db.question.create(data={
+            "questionText": "Pick one.",
+            "options": json.dumps([{"id": "A", "text": "a"}, {"id": "B", "text": "b"}]),
+            "correctAnswerId": "A",
+        })
+        await db.userdashboarddata.create(data={"userId": user.id})
+
+        async def answer(is_correct: bool) -> datetime:
+            before = datetime.now(timezone.utc)
+            await store.record_answer(db, user.id, question.id, "A" if is_correct else "B", is_correct)
+            return before
+
+        async def entry():
+            return await db.userwrongdoingquestion.find_unique(
+                where={"userId_questionId": {"userId": user.id, "questionId": question.id}}
+            )
+
+        try:
+            await scenario(db, answer, entry)
+        finally:
+            await db.user.delete(where={"id": user.id})
+            await db.question.delete(where={"id": question.id})
+            await db.disconnect()
+
+    asyncio.run(main())
+
+
+def _assert_due_after(row, answered_at: datetime, seconds: int):
+    expected = answered_at + timedelta(seconds=seconds)
+    assert abs((row.nextDueAt - expected).total_seconds()) < 5
+
+
+def test_correct_answer_to_an_unqueued_question_creates_no_entry():
+    async def scenario(db, answer, entry):
+        await answer(True)
+        assert await entry() is None
+
+    _run(scenario)
+
+
+def test_wrong_answer_queues_the_question_due_after_the_relearn_delay():
+    async def scenario(db, answer, entry):
+        answered_at = await answer(False)
+        row = await entry()
+        assert row.retestedCorrectly is False
+        assert row.repetitions == 0
+        assert row.intervalSeconds == 0
+        assert row.ease == pytest.approx(INITIAL_EASE)
+        _assert_due_after(row, answered_at, answer_store.RETEST_RELEARN_DELAY_SECONDS)
+
+    _run(scenario)
+
+
+def test_one_correct_retest_clears_the_question_by_default():
+    async def scenario(db, answer, entry):
+        await answer(False)
+        answered_at = await answer(True)
+        row = await entry()
+        assert row.retestedCorrectly is True
+        assert row.repetitions == 1
+        assert row.intervalSeconds == answer_store.RETEST_FIRST_INTERVAL_SECONDS
+        assert row.ease == pytest.approx(INITIAL_EASE + answer_store.RETEST_EASE_BONUS)
+        _assert_due_after(row, answered_at, answer_store.RETEST_FIRST_INTERVAL_SECONDS)
+
+    _run(scenario)
+
+
+def test_correct_answer_leaves_a_retested_entry_unchanged():
+    async def scenario(db, answer, entry):
+        await answer(False)
+        await answer(True)
+        retested = await entry()
+        await answer(True)
+        assert await entry() == retested
+
+    _run(scenario)
+
+
+def test_wrong_answer_requeues_a_retested_question():
+    async def scenario(db, answer, entry):
+        await answer(False)
+        await answer(True)
+        answered_at = await answer(False)
+        row = await entry()
+        assert row.retestedCorrectly is False
+        assert row.repetitions == 0
+        assert row.intervalSeconds == 0
+        assert row.ease == pytest.approx(
+            INITIAL_EASE + answer_store.RETEST_EASE_BONUS - answer_store.RETEST_EASE_PENALTY
+        )
+        _assert_due_after(row, answered_at, answer_store.RETEST_RELEARN_DELAY_SECONDS)
+
+    _run(scenario)
+
+
+def test_ease_never_drops_below_the_minimum():
+    async def scenario(db, answer, entry):
+        for _ in range(10):
+            await answer(False)
+        assert (await entry()).ease == pytest.approx(answer_store.RETEST_MIN_EASE)
+
+    _run(scenario)
+
+
+@pytest.fixture
+def two_step_store(monkeypatch):
+    monkeypatch.setenv("RETEST_GRADUATION_REPETITIONS", "2")
+    yield importlib.reload(answer_store)
+    monkeypatch.delenv("RETEST_GRADUATION_REPETITIONS")
+    importlib.reload(answer_store)
+
+
+def test_longer_schedules_grow_the_interval_by_the_ease(two_step_store):
+    store = two_step_store
+
+    async def scenario(db, answer, entry):
+        await answer(False)
+        first_at = await answer(True)
+        first = await entry()
+        assert first.retestedCorrectly is False
+        assert first.repetitions == 1
+        assert first.intervalSeconds == store.RETEST_FIRST_INTERVAL_SECONDS
+        _assert_due_after(first, first_at, store.RETEST_FIRST_INTERVAL_SECONDS)
+
+        second_at = await answer(True)
+        second = await entry()
+        expected_interval = round(store.RETEST_FIRST_INTERVAL_SECONDS * first.ease)
+        assert second.retestedCorrectly is True
+        assert second.repetitions == 2
+        assert second.intervalSeconds == expected_interval
+        assert second.ease == pytest.approx(first.ease + store.RETEST_EASE_BONUS)
+        _assert_due_after(second, second_at, expected_interval)
+
+    _run(scenario, store)
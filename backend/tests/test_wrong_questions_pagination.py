@@ -0,0 +1,121 @@
+# backend/tests/test_wrong_questions_pagination.py
+# Pages through /dashboard/wrong-questions against an in-memory stand-in for the
+# user_wrongdoing_questions table that applies Prisma's cursor/skip/take semantics.
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from question_cache import CachedQuestion
+from routers import dashboard
+
+USER_ID = "user-1"
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeWrongdoingActions:
+    def __init__(self, rows: list):
+        self.rows = rows
+        self.calls: list = []
+
+    async def find_many(self, where: dict, order: list, take: int, cursor: dict | None = None, skip: int = 0):
+        self.calls.append({"take": take, "cursor": cursor, "skip": skip})
+        assert order == [{"timestampMarkedWrong": "desc"}, {"id": "desc"}]
+        matching = [
+            row for row in self.rows
+            if row.userId == where["userId"] and row.retestedCorrectly == where["retestedCorrectly"]
+        ]
+        matching.sort(key=lambda row: (row.timestampMarkedWrong, row.id), reverse=True)
+        start = 0
+        if cursor is not None:
+            start = next(i for i, row in enumerate(matching) if row.id == cursor["id"])
+        return matching[start + skip:start + skip + take]
+
+
+def _entry(entry_id: str, minutes: int, user_id: str = USER_ID, retested: bool = False):
+    return SimpleNamespace(
+        id=entry_id, userId=user_id, questionId=f"q-{entry_id}",
+        timestampMarkedWrong=START + timedelta(minutes=minutes), retestedCorrectly=retested
+    )
+
+
+@pytest.fixture
+def table(monkeypatch):
+    # Two pairs of entries share a timestamp, so the id tie-break decides their order
+    rows = [
+        _entry("e01", 1), _entry("e02", 2), _entry("e03", 3), _entry("e04", 3),
+        _entry("e05", 5), _entry("e06", 6), _entry("e07", 6),
+        _entry("x01", 4, user_id="user-2"), _entry("r01", 7, retested=True),
+    ]
+    actions = FakeWrongdoingActions(rows)
+
+    async def fake_get_questions(db, question_ids):
+        return {qid: CachedQuestion(qid, f"Text of {qid}", [], "A") for qid in question_ids}
+
+    monkeypatch.setattr(dashboard, "WrongdoingEntry", SimpleNamespace(prisma=lambda db: actions))
+    monkeypatch.setattr(dashboard, "get_questions", fake_get_questions)
+    return actions
+
+
+def _page(limit: int, cursor: str | None = None, retested: bool = False) -> dict:
+    response = asyncio.run(dashboard.get_wrong_question_history(
+        limit=limit, cursor=cursor, retested=retested, db=None, current_user_id=USER_ID
+    ))
+    return json.loads(response.body)
+
+
+def test_pages_cover_every_entry_once_newest_first(table):
+    seen, cursor = [], None
+    while True:
+        page = _page(limit=3, cursor=cursor)
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == ["e07", "e06", "e05", "e04", "e03", "e02", "e01"]
+
+
+def test_next_cursor_is_the_last_item_of_a_full_page(table):
+    page = _page(limit=2)
+
+    assert [item["id"] for item in page["items"]] == ["e07", "e06"]
+    assert page["next_cursor"] == "e06"
+    assert table.calls[-1] == {"take": 3, "cursor": None, "skip": 0}
+
+
+def test_following_page_starts_after_the_cursor_row(table):
+    page = _page(limit=2, cursor="e06")
+
+    assert [item["id"] for item in page["items"]] == ["e05", "e04"]
+    assert table.calls[-1] == {"take": 3, "cursor": {"id": "e06"}, "skip": 1}
+
+
+def test_last_page_has_no_next_cursor(table):
+    # Exactly `limit` rows remain: the extra row fetched to detect a next page is absent
+    page = _page(limit=2, cursor="e03")
+
+    assert [item["id"] for item in page["items"]] == ["e02", "e01"]
+    assert page["next_cursor"] is None
+
+
+def test_retested_filter_pages_separately(table):
+    page = _page(limit=5, retested=True)
+
+    assert [item["id"] for item in page["items"]] == ["r01"]
+    assert page["items"][0]["retested_correctly"] is True
+    assert page["next_cursor"] is None
+
+
+def test_items_carry_the_question_text(table):
+    item = _page(limit=1)["items"][0]
+
+    assert item == {
+        "id": "e07",
+        "question_id": "q-e07",
+        "question_text": "Text of q-e07",
+        "timestamp_marked_wrong": (START + timedelta(minutes=6)).isoformat(),
+        "retested_correctly": False,
+    }
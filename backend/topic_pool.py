@@ -0,0 +1,213 @@
+# backend/topic_pool.py
+# Pre-generated question pools for the canonical topics in KEYWORD_TO_TOPIC_MAP.
+# Pool questions live in the questions table under a "pool_..." topicId. Serving a quiz re-tags
+# a batch of them to the requester's topic id, and a background worker tops the pool back up,
+# so LLM generation for popular topics happens off the request path.
+# Every web worker starts a refiller, but only the one holding a Postgres advisory lock refills;
+# the others take over if its connection goes away.
+import asyncio
+import logging
+import os
+from typing import List
+
+from prisma import Prisma
+
+from question_cache import serialize_client_question
+from question_store import load_options, save_generated_questions
+from ai_core.agent import KEYWORD_TO_TOPIC_MAP
+from ai_core.inference_executor import InferenceQueueFullError
+
+pool_logger = logging.getLogger(__name__)
+
+# --- Configuration ---
+TOPIC_POOL_ENABLED = os.getenv("TOPIC_POOL_ENABLED", "true").lower() == "true"
+TOPIC_POOL_LOW_WATER = int(os.getenv("TOPIC_POOL_LOW_WATER", 10))
+TOPIC_POOL_TARGET = int(os.getenv("TOPIC_POOL_TARGET", 25))
+TOPIC_POOL_REFILL_INTERVAL_SECONDS = int(os.getenv("TOPIC_POOL_REFILL_INTERVAL_SECONDS", 60))
+TOPIC_POOL_BATCH_SIZE = 5
+
+# Session-level advisory lock (two int4 keys) held by the one refiller that is allowed to generate
+REFILL_LOCK_KEYS = (1886351212, 1)  # "pool", 1
+TRY_REFILL_LOCK_SQL = f"SELECT pg_try_advisory_lock({REFILL_LOCK_KEYS[0]}, {REFILL_LOCK_KEYS[1]}) AS \"locked\""
+# Whether this session still holds it; the two-key form is stored with objsubid 2
+HOLDS_REFILL_LOCK_SQL = f"""
+SELECT EXISTS (
+    SELECT 1 FROM pg_locks
+    WHERE "locktype" = 'advisory' AND "pid" = pg_backend_pid() AND "granted"
+      AND "classid" = {REFILL_LOCK_KEYS[0]} AND "objid" = {REFILL_LOCK_KEYS[1]} AND "objsubid" = 2
+) AS "held"
+"""
+
+CANONICAL_TOPICS = sorted(set(KEYWORD_TO_TOPIC_MAP.values()))
+
+# Claims up to $3 pool questions in one statement. SKIP LOCKED keeps two concurrent requests
+# from being handed the same rows.
+CLAIM_POOL_QUESTIONS_SQL = """
+UPDATE "questions" SET "topic_id" = $1, "updated_at" = NOW()
+WHERE "id" IN (
+    SELECT "id" FROM "questions"
+    WHERE "topic_id" = $2
+    ORDER BY "created_at"
+    LIMIT $3
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING "id", "question_text", "options", "client_payload"
+"""
+
+
+def canonical_topic_for(topic_string: str) -> str | None:
+    """Returns the canonical topic for a user topic string, or None if it is not one of the pooled topics."""
+    return KEYWORD_TO_TOPIC_MAP.get(topic_string.lower().strip())
+
+
+def pool_topic_id_for(canonical_topic: str) -> str:
+    return f"pool_{canonical_topic.lower().strip().replace(' ', '_')}"
+
+
+async def take_pooled_questions(db: Prisma, canonical_topic: str, num_questions: int, served_topic_id: str) -> List[bytes]:
+    """
+    Hands out `num_questions` pooled questions for `canonical_topic`, re-tagged to `served_topic_id`,
+    as their client payloads (QuestionResponse JSON).
+    Returns an empty list (and leaves the pool untouched) if the pool cannot fill the whole quiz.
+    """
+    pool_topic_id = pool_topic_id_for(canonical_topic)
+    claimed_rows = await db.query_raw(CLAIM_POOL_QUESTIONS_SQL, served_topic_id, pool_topic_id, num_questions)
+    topic_pool_refiller.request_refill(canonical_topic)
+
+    if len(claimed_rows) < num_questions:
+        if claimed_rows:
+            await _return_to_pool(db, [row["id"] for row in claimed_rows], pool_topic_id)
+        pool_logger.info("Pool for %r has fewer than %d questions. Falling back to generation.", canonical_topic, num_questions)
+        return []
+
+    pool_logger.info("Served %d pooled questions for %r.", len(claimed_rows), canonical_topic)
+    return [
+        row["client_payload"].encode("utf-8") if row["client_payload"]
+        else serialize_client_question(row["id"], row["question_text"], load_options(row["options"]))
+        for row in claimed_rows
+    ]
+
+
+async def _return_to_pool(db: Prisma, question_ids: List[str], pool_topic_id: str):
+    placeholders = ", ".join(f"${i + 2}" for i in range(len(question_ids)))
+    await db.execute_raw(
+        f'UPDATE "questions" SET "topic_id" = $1 WHERE "id" IN ({placeholders})',
+        pool_topic_id, *question_ids
+    )
+
+
+class TopicPoolRefiller:
+    """
+    Background task that keeps every canonical topic pool between the low-water mark and the target.
+    Generation runs in the inference executor's background lane: it only starts while no user job is
+    running or queued, and stops after the current decode step once one arrives, keeping the questions
+    completed so far. A user request therefore waits for at most one decode step, never a pool batch.
+    It only refills while it holds the refill advisory lock, so one process refills however many workers run.
+    """
+
+    def __init__(self):
+        self._task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        self._drawn_topics: set[str] = set()
+        self._agent = None
+        self._agent_loader = None
+        self._db: Prisma | None = None
+        # Single-connection client, so the session that takes the advisory lock is the one that keeps it
+        self._lock_db: Prisma | None = None
+
+    def start(self, db: Prisma, agent_loader):
+        """
+        Starts the worker. It waits for the agent that `agent_loader` loads before refilling, but never
+        starts loading it itself, so AGENT_WARMUP_ON_STARTUP=false still defers the load to the first AI request.
+        """
+        if not TOPIC_POOL_ENABLED or self._task is not None:
+            return
+        self._db = db
+        self._agent_loader = agent_loader
+        self._task = asyncio.create_task(self._run())
+        pool_logger.info("Refill worker started for %d canonical topics.", len(CANONICAL_TOPICS))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._lock_db is not None and self._lock_db.is_connected():
+            await self._lock_db.disconnect()  # Ends the session, releasing the lock
+
+    def request_refill(self, canonical_topic: str):
+        """Wakes the worker early and checks `canonical_topic` first, e.g. right after its pool was drawn from."""
+        self._drawn_topics.add(canonical_topic)
+        self._wakeup.set()
+
+    async def _run(self):
+        self._agent = await self._agent_loader.wait_until_ready(start=False)
+        if self._agent is None:
+            pool_logger.error("AI agent failed to load. Refill worker stopped.")
+            return
+        while True:
+            self._wakeup.clear()
+            try:
+                if not await self._hold_refill_lock():
+                    # Another process refills; check again later in case it goes away
+                    await asyncio.sleep(TOPIC_POOL_REFILL_INTERVAL_SECONDS)
+                    continue
+                drawn_first = sorted(self._drawn_topics)
+                self._drawn_topics.clear()
+                for canonical_topic in drawn_first + [t for t in CANONICAL_TOPICS if t not in drawn_first]:
+                    await self._refill_topic(canonical_topic)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pool_logger.exception("Error during pool refill.")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=TOPIC_POOL_REFILL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _hold_refill_lock(self) -> bool:
+        """Returns whether this process holds the refill lock, taking it if it is free."""
+        if self._lock_db is None:
+            database_url = os.environ["DATABASE_URL"]
+            separator = "&" if "?" in database_url else "?"
+            self._lock_db = Prisma(datasource={"url": f"{database_url}{separator}connection_limit=1"})
+        if not self._lock_db.is_connected():
+            await self._lock_db.connect()
+
+        rows = await self._lock_db.query_raw(HOLDS_REFILL_LOCK_SQL)
+        if rows[0]["held"]:
+            return True
+        rows = await self._lock_db.query_raw(TRY_REFILL_LOCK_SQL)
+        if rows[0]["locked"]:
+            pool_logger.info("Took the refill lock; this process refills the topic pools.")
+        return rows[0]["locked"]
+
+    async def _refill_topic(self, canonical_topic: str):
+        pool_topic_id = pool_topic_id_for(canonical_topic)
+        pool_size = await self._db.question.count(where={"topicId": pool_topic_id})
+        if pool_size >= TOPIC_POOL_LOW_WATER:
+            return
+
+        pool_logger.info(
+            "Pool for %r has %d questions (low water %d). Refilling to %d.",
+            canonical_topic, pool_size, TOPIC_POOL_LOW_WATER, TOPIC_POOL_TARGET
+        )
+        while pool_size < TOPIC_POOL_TARGET:
+            try:
+                # Background lane: bypasses the semantic cache (the pool needs fresh questions) and yields to users
+                mcq_stream = await self._agent.astream_mcqs_with_rag(canonical_topic, TOPIC_POOL_BATCH_SIZE, background=True)
+            except InferenceQueueFullError:
+                return  # Users are on the LLM; try again on the next pass.
+            generated = [mcq async for mcq in mcq_stream]
+            if generated:
+                pool_size += len(await save_generated_questions(self._db, generated, pool_topic_id))
+            if len(generated) < TOPIC_POOL_BATCH_SIZE:
+                return  # Stopped for a user request (or the model produced fewer); resume on the next pass.
+
+
+# --- Global refiller instance ---
+topic_pool_refiller = TopicPoolRefiller()
@@ -0,0 +1,35 @@
+-- CreateTable
+CREATE TABLE "points_history_entries" (
+    "id" TEXT NOT NULL,
+    "user_id" TEXT NOT NULL,
+    "points" INTEGER NOT NULL,
+    "topic_id" TEXT,
+    "timestamp" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "points_history_entries_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "points_history_entries_user_id_timestamp_idx" ON "points_history_entries"("user_id", "timestamp");
+
+-- AddForeignKey
+ALTER TABLE "points_history_entries" ADD CONSTRAINT "points_history_entries_user_id_fkey" FOREIGN KEY ("user_id") REFERENCES "User"("id") ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- MoveData: one row per entry of the JSON history blobs ({"timestamp", "points", "topic_id"}).
+-- Timestamps were written as UTC ISO strings; entries without one get the migration time.
+INSERT INTO "points_history_entries" ("id", "user_id", "points", "topic_id", "timestamp")
+SELECT
+    md5("user_dashboard_data"."user_id" || ':' || "history"."position"),
+    "user_dashboard_data"."user_id",
+    COALESCE(("history"."entry"->>'points')::INTEGER, 0),
+    "history"."entry"->>'topic_id',
+    COALESCE(("history"."entry"->>'timestamp')::TIMESTAMPTZ AT TIME ZONE 'UTC', CURRENT_TIMESTAMP)
+FROM "user_dashboard_data"
+CROSS JOIN LATERAL jsonb_array_elements(
+    CASE WHEN jsonb_typeof("user_dashboard_data"."points_history"::JSONB) = 'array'
+         THEN "user_dashboard_data"."points_history"::JSONB
+         ELSE '[]'::JSONB END
+) WITH ORDINALITY AS "history"("entry", "position");
+
+-- The JSON column is no longer written; empty it so the moved entries are not stored twice.
+UPDATE "user_dashboard_data" SET "points_history" = '[]';
@@ -0,0 +1,2 @@
+-- AlterTable
+ALTER TABLE "user_dashboard_data" ADD COLUMN     "snapshot_version" INTEGER NOT NULL DEFAULT 0;
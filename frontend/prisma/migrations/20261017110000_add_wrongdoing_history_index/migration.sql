@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "user_wrongdoing_questions_user_id_retested_correctly_timest_idx" ON "user_wrongdoing_questions"("user_id", "retested_correctly", "timestamp_marked_wrong");
@@ -0,0 +1,8 @@
+-- DropIndex
+DROP INDEX "user_wrongdoing_questions_user_id_idx";
+
+-- CreateIndex
+CREATE INDEX "questions_topic_id_created_at_idx" ON "questions"("topic_id", "created_at");
+
+-- CreateIndex
+CREATE INDEX "user_wrongdoing_questions_user_id_timestamp_marked_wrong_idx" ON "user_wrongdoing_questions"("user_id", "timestamp_marked_wrong");
@@ -0,0 +1,11 @@
+-- AlterTable
+ALTER TABLE "user_wrongdoing_questions" ADD COLUMN     "ease" DOUBLE PRECISION NOT NULL DEFAULT 2.5,
+ADD COLUMN     "interval_seconds" INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN     "next_due_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+ADD COLUMN     "repetitions" INTEGER NOT NULL DEFAULT 0;
+
+-- Existing entries become due in the order they were marked wrong, as retests used to serve them
+UPDATE "user_wrongdoing_questions" SET "next_due_at" = "timestamp_marked_wrong";
+
+-- CreateIndex
+CREATE INDEX "user_wrongdoing_questions_user_id_retested_correctly_next_d_idx" ON "user_wrongdoing_questions"("user_id", "retested_correctly", "next_due_at");
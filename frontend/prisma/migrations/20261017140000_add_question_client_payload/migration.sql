@@ -0,0 +1,26 @@
+-- AlterTable
+ALTER TABLE "questions" ADD COLUMN     "client_payload" TEXT;
+
+-- Backfill existing questions. The backend writes options as a JSON string, so unwrap it first;
+-- malformed options are skipped, as the backend does when it serializes a question. Rows left
+-- without a payload are serialized by the backend when it reads them.
+UPDATE "questions" SET "client_payload" = jsonb_build_object(
+    'id', "id",
+    'question_text', "question_text",
+    'options', COALESCE((
+        SELECT jsonb_agg(jsonb_build_object('id', "opt"->>'id', 'text', "opt"->>'text') ORDER BY "ord")
+        FROM jsonb_array_elements(
+            CASE jsonb_typeof("options"::jsonb)
+                WHEN 'string' THEN ("options"::jsonb #>> '{}')::jsonb
+                ELSE "options"::jsonb
+            END
+        ) WITH ORDINALITY AS "o"("opt", "ord")
+        WHERE jsonb_typeof("opt") = 'object' AND "opt" ? 'id' AND "opt" ? 'text'
+    ), '[]'::jsonb)
+)::text
+WHERE jsonb_typeof(
+    CASE jsonb_typeof("options"::jsonb)
+        WHEN 'string' THEN ("options"::jsonb #>> '{}')::jsonb
+        ELSE "options"::jsonb
+    END
+) = 'array';
@@ -13,14 +13,28 @@ export async function GET(request: Request) {
 
     try {
         // Fetch data from your FastAPI backend
+        const ifNoneMatch = request.headers.get('If-None-Match');
         const backendResponse = await fetch(`${process.env.BACKEND_API_URL}/api/dashboard`, { // Make sure BACKEND_API_URL is in .env
             method: 'GET',
             headers: {
                 'Content-Type': 'application/json',
                 'X-User-ID': userId, // Send user ID to backend
+                ...(ifNoneMatch ? { 'If-None-Match': ifNoneMatch } : {}),
             },
+            cache: 'no-store', // The browser keeps the copy; the backend decides with the ETag
         });
 
+        // Pass the backend's validators through so the browser can revalidate its cached dashboard
+        const cacheHeaders: Record<string, string> = {};
+        for (const name of ['ETag', 'Cache-Control']) {
+            const value = backendResponse.headers.get(name);
+            if (value) cacheHeaders[name] = value;
+        }
+
+        if (backendResponse.status === 304) {
+            return new NextResponse(null, { status: 304, headers: cacheHeaders });
+        }
+
         if (!backendResponse.ok) {
             const errorData = await backendResponse.json().catch(() => ({ detail: "Backend error" }));
             console.error("Backend API error for /dashboard:", errorData);
@@ -28,7 +42,7 @@ export async function GET(request: Request) {
         }
 
         const data = await backendResponse.json();
-        return NextResponse.json(data);
+        return NextResponse.json(data, { headers: cacheHeaders });
 
     } catch (error) {
         console.error("Error in /dashboard Next.js route:", error);